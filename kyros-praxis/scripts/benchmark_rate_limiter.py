@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Throughput Benchmark for the Redis Rate Limiter
+
+Compares the atomic GCRA Lua script used by the orchestrator's RateLimiter
+(async client, one round trip per check) with the previous implementation
+(synchronous GET+TTL pipeline followed by SET or INCR on the event loop).
+
+Usage:
+  # Against a local Redis
+  python scripts/benchmark_rate_limiter.py --redis-url redis://localhost:6379/15
+
+  # Against fakeredis (pip install "fakeredis[lua]"), no server needed
+  python scripts/benchmark_rate_limiter.py --fakeredis
+
+Each mode runs --concurrency tasks that together issue --checks rate limit
+checks spread over --clients distinct client IDs. Keys are written under a
+benchmark prefix and deleted afterwards.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from services.orchestrator.rate_limit import RedisGCRALimiter  # noqa: E402
+
+PREFIX = "bench:rate_limit:"
+
+
+def make_clients(args: argparse.Namespace):
+    """Return (async_client, sync_client) for the selected backend."""
+    if args.fakeredis:
+        import fakeredis
+        import fakeredis.aioredis
+
+        server = fakeredis.FakeServer()
+        return fakeredis.aioredis.FakeRedis(server=server), fakeredis.FakeRedis(server=server)
+    import redis
+    import redis.asyncio
+
+    return redis.asyncio.from_url(args.redis_url), redis.from_url(args.redis_url)
+
+
+def legacy_check(client, key: str, requests: int, window: int) -> bool:
+    """The previous GET+TTL pipeline followed by SET or INCR."""
+    with client.pipeline() as pipe:
+        pipe.get(key)
+        pipe.ttl(key)
+        current, ttl = pipe.execute()
+        if int(current or 0) == 0 or ttl == -1:
+            pipe.set(key, 1, ex=window)
+            pipe.execute()
+            return True
+        if int(current) >= requests:
+            return False
+        pipe.incr(key)
+        pipe.execute()
+        return True
+
+
+async def run_mode(mode: str, async_client, sync_client, args: argparse.Namespace) -> Dict[str, Any]:
+    """Run all checks in one mode and summarize latency and throughput."""
+    limiter = RedisGCRALimiter(async_client, args.requests, args.window, prefix=f"{PREFIX}{mode}:")
+    latencies: List[float] = []
+    admitted = 0
+    per_worker = args.checks // args.concurrency
+
+    async def worker(worker_id: int) -> None:
+        nonlocal admitted
+        for n in range(per_worker):
+            client_id = f"client-{(worker_id * per_worker + n) % args.clients}"
+            started = time.perf_counter()
+            if mode == "script":
+                allowed = (await limiter.check(client_id)).allowed
+            else:
+                allowed = legacy_check(sync_client, f"{PREFIX}{mode}:{client_id}", args.requests, args.window)
+                await asyncio.sleep(0)
+            latencies.append(time.perf_counter() - started)
+            admitted += allowed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "mode": mode,
+        "checks": len(latencies),
+        "admitted": admitted,
+        "throughput_cps": round(len(latencies) / elapsed, 1),
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies) * 1000, 3),
+            "p50": round(latencies[len(latencies) // 2] * 1000, 3),
+            "p99": round(latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))] * 1000, 3),
+        },
+    }
+
+
+async def main_async(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    async_client, sync_client = make_clients(args)
+    results = []
+    try:
+        for mode in args.modes:
+            print(f"Running {mode}...", file=sys.stderr)
+            results.append(await run_mode(mode, async_client, sync_client, args))
+    finally:
+        for key in sync_client.scan_iter(f"{PREFIX}*"):
+            sync_client.delete(key)
+        await async_client.aclose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the Redis rate limiter")
+    backend = parser.add_mutually_exclusive_group()
+    backend.add_argument("--redis-url", default="redis://localhost:6379/15", help="Redis server to use")
+    backend.add_argument("--fakeredis", action="store_true", help="Use an in-process fakeredis server")
+    parser.add_argument("--modes", nargs="+", choices=["script", "pipeline"], default=["pipeline", "script"])
+    parser.add_argument("--checks", type=int, default=20000, help="Total checks per mode")
+    parser.add_argument("--concurrency", type=int, default=100, help="Concurrent tasks")
+    parser.add_argument("--clients", type=int, default=1000, help="Distinct client IDs")
+    parser.add_argument("--requests", type=int, default=100, help="Limit per window")
+    parser.add_argument("--window", type=int, default=900, help="Window in seconds")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(main_async(args))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    else:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Polling Throughput Benchmark for the Collaborative Tasks API
+
+Simulates many clients polling GET /api/v1/collab/state/tasks concurrently and
+reports throughput and latency percentiles per concurrency level. Run it once
+against a build with the synchronous tasks router and once against the async
+one, then compare the two result files.
+
+Usage:
+  # Against a running orchestrator
+  python scripts/benchmark_tasks_polling.py --url http://localhost:8000 \\
+      --token "$TOKEN" --label async --output bench-async.json
+
+  # Compare two runs
+  python scripts/benchmark_tasks_polling.py --compare bench-sync.json bench-async.json
+
+Each poller sends requests back-to-back for --duration seconds, replaying the
+last ETag in If-None-Match like the frontend does, so both 200 and 304
+responses are exercised.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+DEFAULT_LEVELS = [100, 500, 1000]
+POLL_PATH = "/api/v1/collab/state/tasks"
+
+
+async def poller(client: httpx.AsyncClient, headers: Dict[str, str], deadline: float,
+                 latencies: List[float], errors: List[str]) -> None:
+    """Poll until the deadline, recording per-request latency."""
+    etag: Optional[str] = None
+    while time.perf_counter() < deadline:
+        request_headers = dict(headers)
+        if etag:
+            request_headers["If-None-Match"] = etag
+        started = time.perf_counter()
+        try:
+            response = await client.get(POLL_PATH, headers=request_headers)
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+            continue
+        latencies.append(time.perf_counter() - started)
+        if response.status_code == 200:
+            etag = response.headers.get("ETag", etag)
+        elif response.status_code != 304:
+            errors.append(str(response.status_code))
+
+
+async def run_level(url: str, token: str, concurrency: int, duration: float) -> Dict[str, Any]:
+    """Run one concurrency level and summarize it."""
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    latencies: List[float] = []
+    errors: List[str] = []
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30.0) as client:
+        deadline = time.perf_counter() + duration
+        started = time.perf_counter()
+        await asyncio.gather(*(poller(client, headers, deadline, latencies, errors)
+                               for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    def pct(p: float) -> float:
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": len(errors),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies) * 1000, 2) if latencies else 0.0,
+            "p50": round(pct(0.50), 2),
+            "p95": round(pct(0.95), 2),
+            "p99": round(pct(0.99), 2),
+        },
+    }
+
+
+def compare(before_path: Path, after_path: Path) -> None:
+    """Print a side-by-side comparison of two result files."""
+    before = json.loads(before_path.read_text())
+    after = json.loads(after_path.read_text())
+    after_by_level = {r["concurrency"]: r for r in after["results"]}
+    print(f"{'pollers':>8} {before['label']:>14} {after['label']:>14} {'speedup':>8} "
+          f"{'p99 before':>11} {'p99 after':>10}")
+    for r in before["results"]:
+        other = after_by_level.get(r["concurrency"])
+        if other is None:
+            continue
+        speedup = other["throughput_rps"] / r["throughput_rps"] if r["throughput_rps"] else float("inf")
+        print(f"{r['concurrency']:>8} {r['throughput_rps']:>10.1f} rps {other['throughput_rps']:>10.1f} rps "
+              f"{speedup:>7.2f}x {r['latency_ms']['p99']:>9.1f}ms {other['latency_ms']['p99']:>8.1f}ms")
+
+
+async def main_async(args: argparse.Namespace) -> Dict[str, Any]:
+    results = []
+    for level in args.levels:
+        print(f"Running {level} pollers for {args.duration}s...", file=sys.stderr)
+        result = await run_level(args.url, args.token, level, args.duration)
+        print(f"  {result['throughput_rps']} rps, p99 {result['latency_ms']['p99']} ms, "
+              f"{result['errors']} errors", file=sys.stderr)
+        results.append(result)
+    return {"label": args.label, "url": args.url, "duration": args.duration, "results": results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark concurrent polling of /collab/state/tasks")
+    parser.add_argument("--url", default="http://localhost:8000", help="Orchestrator base URL")
+    parser.add_argument("--token", default="", help="Bearer token for an existing user")
+    parser.add_argument("--levels", type=int, nargs="+", default=DEFAULT_LEVELS, help="Concurrent pollers")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per level")
+    parser.add_argument("--label", default="run", help="Name of this run in comparisons")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--compare", type=Path, nargs=2, metavar=("BEFORE", "AFTER"),
+                        help="Compare two result files instead of running")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    summary = asyncio.run(main_async(args))
+    if args.output:
+        args.output.write_text(json.dumps(summary, indent=2))
+    else:
+        print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
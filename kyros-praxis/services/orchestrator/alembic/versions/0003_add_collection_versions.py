@@ -0,0 +1,35 @@
+"""Add collection version counters
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Create collection_versions table
+    collection_versions = op.create_table('collection_versions',
+        sa.Column('name', sa.String(length=64), nullable=False),
+        sa.Column('epoch', sa.String(length=16), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('name')
+    )
+    # Seed the tasks counter so concurrent first writers only ever update it
+    op.bulk_insert(collection_versions, [
+        {'name': 'tasks', 'epoch': uuid.uuid4().hex[:16], 'version': 0},
+    ])
+
+
+def downgrade():
+    op.drop_table('collection_versions')
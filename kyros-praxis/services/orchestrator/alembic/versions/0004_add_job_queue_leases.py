@@ -0,0 +1,35 @@
+"""Add queue lease columns to jobs
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.add_column(sa.Column('lease_owner', sa.String(length=255), nullable=True))
+        batch_op.add_column(sa.Column('lease_expires_at', sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column('attempts', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('max_attempts', sa.Integer(), server_default='3', nullable=False))
+        batch_op.add_column(sa.Column('last_error', sa.String(length=1024), nullable=True))
+    op.create_index('ix_jobs_status_lease_expires_at', 'jobs', ['status', 'lease_expires_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_jobs_status_lease_expires_at', table_name='jobs')
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.drop_column('last_error')
+        batch_op.drop_column('max_attempts')
+        batch_op.drop_column('attempts')
+        batch_op.drop_column('lease_expires_at')
+        batch_op.drop_column('lease_owner')
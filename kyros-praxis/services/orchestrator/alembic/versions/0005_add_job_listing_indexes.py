@@ -0,0 +1,39 @@
+"""Add composite job listing indexes
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_jobs_status_priority_created_at', 'jobs',
+                    ['status', sa.text('priority DESC'), 'created_at', 'id'], unique=False, if_not_exists=True)
+    op.create_index('ix_jobs_priority_created_at', 'jobs',
+                    [sa.text('priority DESC'), 'created_at', 'id'], unique=False, if_not_exists=True)
+    op.create_index('ix_jobs_status_created_at', 'jobs', ['status', 'created_at', 'id'], unique=False, if_not_exists=True)
+    op.create_index('ix_jobs_created_at_id', 'jobs', ['created_at', 'id'], unique=False, if_not_exists=True)
+    # Superseded by the composite indexes above, which share their leading column.
+    # The jobs table may predate the migrations (create_all), hence the existence checks.
+    op.drop_index('ix_jobs_created_at', table_name='jobs', if_exists=True)
+    op.drop_index('ix_jobs_status', table_name='jobs', if_exists=True)
+    op.drop_index('ix_jobs_priority', table_name='jobs', if_exists=True)
+
+
+def downgrade():
+    op.create_index('ix_jobs_priority', 'jobs', ['priority'], unique=False, if_not_exists=True)
+    op.create_index('ix_jobs_status', 'jobs', ['status'], unique=False, if_not_exists=True)
+    op.create_index('ix_jobs_created_at', 'jobs', ['created_at'], unique=False, if_not_exists=True)
+    op.drop_index('ix_jobs_created_at_id', table_name='jobs', if_exists=True)
+    op.drop_index('ix_jobs_status_created_at', table_name='jobs', if_exists=True)
+    op.drop_index('ix_jobs_priority_created_at', table_name='jobs', if_exists=True)
+    op.drop_index('ix_jobs_status_priority_created_at', table_name='jobs', if_exists=True)
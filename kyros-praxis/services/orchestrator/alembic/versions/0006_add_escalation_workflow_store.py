@@ -0,0 +1,41 @@
+"""Add escalation workflow store tables
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('escalation_workflows',
+        sa.Column('workflow_id', sa.String(length=36), nullable=False),
+        sa.Column('state', sa.String(length=32), nullable=False),
+        sa.Column('outcome', sa.String(length=32), nullable=True),
+        sa.Column('priority', sa.String(length=16), server_default='normal', nullable=False),
+        sa.Column('data', sa.JSON(), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=False),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+        sa.PrimaryKeyConstraint('workflow_id')
+    )
+    op.create_index('ix_escalation_workflows_completed_at', 'escalation_workflows', ['completed_at'], unique=False)
+    op.create_table('escalation_counters',
+        sa.Column('name', sa.String(length=64), nullable=False),
+        sa.Column('value', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade():
+    op.drop_table('escalation_counters')
+    op.drop_index('ix_escalation_workflows_completed_at', table_name='escalation_workflows')
+    op.drop_table('escalation_workflows')
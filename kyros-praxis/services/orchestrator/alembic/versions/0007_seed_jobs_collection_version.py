@@ -0,0 +1,34 @@
+"""Seed the jobs collection version counter
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Seed the jobs counter so concurrent first writers only ever update it;
+    # it may already exist when a write created it before this migration ran
+    op.get_bind().execute(
+        sa.text(
+            "INSERT INTO collection_versions (name, epoch, version) "
+            "SELECT 'jobs', :epoch, 0 "
+            "WHERE NOT EXISTS (SELECT 1 FROM collection_versions WHERE name = 'jobs')"
+        ),
+        {'epoch': uuid.uuid4().hex[:16]},
+    )
+
+
+def downgrade():
+    op.execute("DELETE FROM collection_versions WHERE name = 'jobs'")
@@ -35,24 +35,25 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing_extensions import Self
 
 
-def parse_cors(v: Any) -> list[str] | str:
+def parse_str_list(v: Any) -> list[str] | str:
     """
-    Parse CORS origins from string or list.
+    Parse a list setting from a comma-separated string, JSON list or list.
     
-    This utility function parses CORS origins from either a comma-separated
-    string or a list, returning a standardized list format for further processing.
+    Comma-separated strings are split and stripped (empty items dropped);
+    JSON list strings and lists are returned unchanged for pydantic to parse.
+    Used for settings such as BACKEND_CORS_ORIGINS and ESCALATION_HIGH_RISK_FILES.
     
     Args:
         v (Any): Input value to parse (string or list)
         
     Returns:
-        Union[list[str], str]: Parsed CORS origins as list or original value
+        Union[list[str], str]: Parsed items as list or original value
         
     Raises:
         ValueError: If input cannot be parsed
     """
     if isinstance(v, str) and not v.startswith("["):
-        return [i.strip() for i in v.split(",")]
+        return [i.strip() for i in v.split(",") if i.strip()]
     elif isinstance(v, list | str):
         return v
     raise ValueError(v)
@@ -105,6 +106,9 @@ class Settings(BaseSettings):
     JWKS_URL: Optional[str] = None
     JWT_ISSUER: str = "kyros-praxis"
     JWT_AUDIENCE: str = "kyros-app"
+    AUTH_TOKEN_CACHE_SIZE: int = 1024  # Verified tokens cached by digest until they expire
+    AUTH_PRINCIPAL_CACHE_TTL: float = 30.0  # Seconds an authenticated user record is cached
+    AUTH_PRINCIPAL_CACHE_SIZE: int = 4096  # Maximum number of cached user records
     
     # Environment
     # Deployment environment configuration
@@ -117,7 +121,7 @@ class Settings(BaseSettings):
     # CORS
     # Cross-Origin Resource Sharing configuration
     BACKEND_CORS_ORIGINS: Annotated[
-        list[AnyUrl] | str, BeforeValidator(parse_cors)
+        list[AnyUrl] | str, BeforeValidator(parse_str_list)
     ] = []
     
     @computed_field  # type: ignore[prop-decorator]
@@ -182,6 +186,21 @@ class Settings(BaseSettings):
     # Direct database URL override (for alternative databases like SQLite)
     DATABASE_URL: Optional[str] = None
 
+    # Database engine tuning (see db_engine.py)
+    # Pool profile for PostgreSQL and other pooled servers
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_POOL_PRE_PING: bool = True
+    # Compiled statement cache entries per engine
+    DB_STATEMENT_CACHE_SIZE: int = 500
+    # PRAGMAs applied to every new SQLite connection
+    SQLITE_JOURNAL_MODE: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "OFF"] = "WAL"
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_MMAP_SIZE: int = 268435456  # 256 MiB
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def SQLALCHEMY_DATABASE_URI(self) -> PostgresDsn | str:
@@ -314,6 +333,55 @@ class Settings(BaseSettings):
     # Orchestrator ID for log file naming
     # Unique identifier for this orchestrator instance
     ORCH_ID: str = "o-glm"
+
+    # Orchestrator event streaming
+    # Per-key replay buffer, per-subscriber queue bound and slow-consumer policy
+    ORCH_EVENTS_BUFFER_SIZE: int = 1000
+    ORCH_EVENTS_QUEUE_SIZE: int = 256
+    ORCH_EVENTS_OVERFLOW: Literal["drop_oldest", "disconnect"] = "drop_oldest"
+    # Global budgets for the in-memory event store and idle-key expiry (seconds)
+    ORCH_EVENTS_MAX_KEYS: int = 10000
+    ORCH_EVENTS_MAX_TOTAL: int = 100000
+    ORCH_EVENTS_KEY_TTL: int = 3600
+
+    # Job queue
+    # Default visibility timeout of a claim (seconds), bounds on leases and claim size
+    JOB_LEASE_SECONDS: int = 60
+    JOB_MAX_LEASE_SECONDS: int = 3600
+    JOB_CLAIM_MAX: int = 100
+    # Longest time GET /jobs/{id}?wait= may hold a request open (seconds)
+    JOB_WAIT_MAX_SECONDS: float = 60.0
+
+    # Escalation workflows
+    # State backend ("sql" is shared by all workers), workflows run at once
+    # per process, workflows waiting to run per process (0 for unbounded) and
+    # retention of completed workflows (count and age in seconds)
+    ESCALATION_STORE: Literal["sql", "memory"] = "sql"
+    ESCALATION_MAX_CONCURRENT: int = 5
+    ESCALATION_QUEUE_MAX: int = 10000
+    ESCALATION_COMPLETED_MAX: int = 10000
+    ESCALATION_COMPLETED_TTL: int = 7 * 24 * 3600
+    # Project-specific high-risk file globs, added to the detector defaults
+    # (comma-separated or JSON list)
+    ESCALATION_HIGH_RISK_FILES: Annotated[list[str] | str, BeforeValidator(parse_str_list)] = []
+    # Detection and analysis results memoized for resubmitted tasks (0 to
+    # disable) and seconds they are reused
+    ESCALATION_ASSESSMENT_CACHE_SIZE: int = 1024
+    ESCALATION_ASSESSMENT_CACHE_TTL: float = 300.0
+    # Context analysis source metrics: cached files, optional persistence
+    # directory, processes parsing large batches (0 to parse in-process,
+    # default one less than the CPU count, at most 4) and uncached files in a
+    # batch needed to use them
+    CONTEXT_ANALYSIS_CACHE_SIZE: int = 4096
+    CONTEXT_ANALYSIS_CACHE_DIR: Optional[str] = None
+    CONTEXT_ANALYSIS_WORKERS: Optional[int] = None
+    CONTEXT_ANALYSIS_PARALLEL_MIN_FILES: int = 16
+    # Workspace import graph: root indexed for fan-in, depth, cycles and
+    # cross-service edges (unset disables the graph), optional JSON state file
+    # and minimum seconds between two workspace scans
+    CONTEXT_ANALYSIS_WORKSPACE_ROOT: Optional[str] = None
+    CONTEXT_ANALYSIS_GRAPH_STATE: Optional[str] = None
+    CONTEXT_ANALYSIS_GRAPH_REFRESH_SECONDS: float = 30.0
     
     # Rate Limiting Configuration
     # Rate limiting settings for security and performance
@@ -0,0 +1,288 @@
+"""
+In-Process Pub/Sub Broker for Orchestrator Events
+
+This module provides the fan-out broker behind orchestrator event streaming.
+Events published through ``log_orchestrator_event`` are appended to a bounded
+per-key ring buffer (for late joiners and the history endpoint) and pushed
+directly into the queue of every live subscriber of that key. The buffers live
+in an ``EventStore`` (event_store.py), which also bounds the number of keys and
+evicts idle ones.
+
+Compared to polling the shared event store on a timer, subscribers cost nothing
+while idle and receive an event as soon as it is published, not up to a polling
+interval later.
+
+KEY FEATURES:
+1. Ring Buffers: Per-key ``deque`` with a fixed maximum length, inside a store
+   with global key/event budgets and idle-key TTL eviction
+2. Push Delivery: Each subscriber owns an ``asyncio.Queue`` fed by ``publish``
+3. Thread Safety: Publishing from worker threads (sync route handlers) hops onto
+   the subscriber's event loop with ``call_soon_threadsafe``
+4. Backpressure: Bounded subscriber queues that either drop the oldest queued
+   event or disconnect the slow consumer
+5. Metrics: Subscriber counts, queue depths, drops and disconnects
+
+USAGE:
+    broker = EventBroker()
+    subscription = broker.subscribe("task-1")
+    broker.publish("task-1", {"event": "task_started"})
+    async for frame in subscription:
+        ...
+    broker.unsubscribe(subscription)
+"""
+
+import asyncio
+import json
+import threading
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Union
+
+try:
+    from .event_store import EventRecord, EventStore
+except ImportError:
+    from event_store import EventRecord, EventStore  # type: ignore
+
+# Overflow policies for subscriber queues
+DROP_OLDEST = "drop_oldest"
+DISCONNECT = "disconnect"
+
+_CLOSED = object()
+
+
+Event = Union[EventRecord, Dict[str, Any]]
+
+
+def _as_dict(event: Event) -> Dict[str, Any]:
+    return event.to_dict() if isinstance(event, EventRecord) else event
+
+
+def format_sse(event: Event) -> str:
+    """
+    Render an event as a Server-Sent Events data frame.
+
+    Args:
+        event (Event): Event record or payload dictionary
+
+    Returns:
+        str: SSE frame terminated by a blank line
+    """
+    return f"data: {json.dumps(_as_dict(event))}\n\n"
+
+
+class Subscription:
+    """
+    A single subscriber's view of one event key.
+
+    Frames are delivered through a bounded ``asyncio.Queue`` owned by the event
+    loop that created the subscription. Iterating the subscription yields SSE
+    frames until it is closed by the broker (slow consumer) or unsubscribed.
+
+    Attributes:
+        key (str): Task or run ID the subscription is attached to
+        backlog (List[str]): Frames buffered before the subscription was made
+        dropped (int): Frames discarded because the queue was full
+        closed (bool): Whether the broker disconnected this subscriber
+    """
+
+    __slots__ = ("key", "backlog", "dropped", "closed", "_queue", "_loop", "_thread_id", "_broker")
+
+    def __init__(self, broker: "EventBroker", key: str, backlog: List[str]):
+        self.key = key
+        self.backlog = backlog
+        self.dropped = 0
+        self.closed = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=broker.queue_size)
+        self._loop = asyncio.get_running_loop()
+        self._thread_id = threading.get_ident()
+        self._broker = broker
+
+    @property
+    def depth(self) -> int:
+        """Number of frames waiting to be consumed."""
+        return self._queue.qsize()
+
+    def offer(self, frame: str) -> None:
+        """
+        Hand a frame to the subscriber from any thread.
+
+        Args:
+            frame (str): SSE frame to deliver
+        """
+        if self.closed:
+            return
+        if threading.get_ident() == self._thread_id:
+            self._put(frame)
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._put, frame)
+
+    def _put(self, frame: Any) -> None:
+        if self.closed and frame is not _CLOSED:
+            return
+        try:
+            self._queue.put_nowait(frame)
+            return
+        except asyncio.QueueFull:
+            pass
+        if self._broker.overflow == DISCONNECT and frame is not _CLOSED:
+            self._broker._disconnect(self)
+            return
+        # Drop the oldest queued frame to make room
+        try:
+            self._queue.get_nowait()
+            self.dropped += 1
+            self._broker._dropped += 1
+        except asyncio.QueueEmpty:
+            pass
+        self._queue.put_nowait(frame)
+
+    def close(self) -> None:
+        """Close the subscription; iteration ends after the sentinel."""
+        if self.closed:
+            return
+        self.closed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(_CLOSED)
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        for frame in self.backlog:
+            yield frame
+        self.backlog = []
+        while True:
+            frame = await self._queue.get()
+            if frame is _CLOSED:
+                return
+            yield frame
+
+
+class EventBroker:
+    """
+    Fan-out broker with per-key ring buffers and push delivery.
+
+    Publishing is O(subscribers of the key) and never blocks: every
+    subscriber has its own bounded queue and the configured overflow policy
+    decides what happens when it is full.
+
+    Args:
+        buffer_size (int): Maximum events retained per key for replay
+        queue_size (int): Maximum undelivered frames per subscriber
+        overflow (str): ``drop_oldest`` or ``disconnect`` for slow consumers
+        store (Optional[EventStore]): Replay store (default: one sized by buffer_size)
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = 1000,
+        queue_size: int = 256,
+        overflow: str = DROP_OLDEST,
+        store: Optional[EventStore] = None,
+    ):
+        if overflow not in (DROP_OLDEST, DISCONNECT):
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.buffer_size = buffer_size
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.store = store if store is not None else EventStore(max_events_per_key=buffer_size)
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+        self._published = 0
+        self._dropped = 0
+        self._disconnected = 0
+
+    def publish(self, key: str, event: Event) -> None:
+        """
+        Store an event and push it to every subscriber of its key.
+
+        Safe to call from the event loop or from worker threads.
+
+        Args:
+            key (str): Task or run ID
+            event (Event): Event record or payload dictionary
+        """
+        with self._lock:
+            self.store.append(key, event, pinned=self._subscribers.__contains__)
+            self._published += 1
+            subscribers = list(self._subscribers.get(key, ()))
+        if not subscribers:
+            return
+        # Serialize once regardless of the number of subscribers
+        frame = format_sse(event)
+        for subscription in subscribers:
+            subscription.offer(frame)
+
+    def history(self, key: str) -> List[Dict[str, Any]]:
+        """
+        Return a copy of the buffered events for a key.
+
+        Args:
+            key (str): Task or run ID
+
+        Returns:
+            List[Dict[str, Any]]: Buffered events, oldest first
+        """
+        with self._lock:
+            return [_as_dict(e) for e in self.store.get(key)]
+
+    def subscribe(self, key: str, replay: bool = True) -> Subscription:
+        """
+        Subscribe to a key from the running event loop.
+
+        The buffer snapshot and the registration happen under the same lock,
+        so no event is either missed or delivered twice.
+
+        Args:
+            key (str): Task or run ID
+            replay (bool): Deliver buffered events before live ones
+
+        Returns:
+            Subscription: Async-iterable stream of SSE frames
+        """
+        with self._lock:
+            backlog = [format_sse(e) for e in self.store.get(key)] if replay else []
+            subscription = Subscription(self, key, backlog)
+            self._subscribers.setdefault(key, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Detach a subscription from the broker."""
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.key)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.key]
+
+    def _disconnect(self, subscription: Subscription) -> None:
+        """Drop a slow consumer. Runs on the subscriber's event loop."""
+        self._disconnected += 1
+        self.unsubscribe(subscription)
+        subscription.close()
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Return broker metrics for monitoring.
+
+        Returns:
+            Dict[str, Any]: Subscriber counts, queue depths, drop counters and
+                replay store usage/eviction stats
+        """
+        with self._lock:
+            self.store.expire(pinned=self._subscribers.__contains__)
+            subscriptions = [s for subs in self._subscribers.values() for s in subs]
+            store_stats = self.store.stats()
+            per_key = {key: len(subs) for key, subs in self._subscribers.items()}
+        depths = [s.depth for s in subscriptions]
+        return {
+            "published_total": self._published,
+            "buffered_keys": store_stats["keys"],
+            "buffered_events": store_stats["events"],
+            "store": store_stats,
+            "subscribers": len(subscriptions),
+            "subscribers_by_key": per_key,
+            "queue_depth_total": sum(depths),
+            "queue_depth_max": max(depths, default=0),
+            "queue_capacity": self.queue_size,
+            "dropped_total": self._dropped,
+            "disconnected_total": self._disconnected,
+            "overflow_policy": self.overflow,
+        }
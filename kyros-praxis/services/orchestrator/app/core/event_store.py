@@ -0,0 +1,229 @@
+"""
+Bounded In-Memory Store for Orchestrator Events
+
+This module provides the replay buffer behind the orchestrator event broker.
+Events are grouped by task/run ID, and every request handled by the service
+creates a new key (``RequestLoggingMiddleware`` logs with ``task_id=request_id``),
+so the store has to stay bounded in the number of keys as well as in the
+number of events per key.
+
+KEY FEATURES:
+1. Compact Records: ``EventRecord`` uses ``__slots__`` and stores the timestamp
+   as a float and the ID as an int; the public dict form is built on demand
+2. Per-Key Cap: Each key holds at most ``max_events_per_key`` records
+3. Global Budgets: At most ``max_keys`` keys and ``max_events`` records in total,
+   enforced by evicting least-recently-used keys
+4. Idle TTL: Keys that received no events for ``key_ttl`` seconds are evicted
+5. Stats: Counters for every kind of eviction, for monitoring
+
+Keys are kept in an ``OrderedDict`` in last-activity order, so both the LRU
+victim and the next key to expire are always at the head and every operation
+is amortized O(1). Expiry is checked on every append, so no background task
+is needed to reach a steady state.
+
+The store is not thread-safe on its own; ``EventBroker`` serializes access
+with its lock.
+"""
+
+import time
+import uuid
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+
+class EventRecord:
+    """
+    Compact representation of a single orchestrator event.
+
+    Attributes:
+        id (int): 128-bit random event identifier
+        event (str): Event type
+        created (float): UNIX timestamp of the event
+        task_id (Optional[str]): Task ID the event belongs to
+        run_id (Optional[str]): Run ID the event belongs to
+        fields (Optional[Dict[str, Any]]): Additional event fields
+    """
+
+    __slots__ = ("id", "event", "created", "task_id", "run_id", "fields")
+
+    def __init__(
+        self,
+        event: str,
+        task_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        fields: Optional[Dict[str, Any]] = None,
+        created: Optional[float] = None,
+    ):
+        self.id = uuid.uuid4().int
+        self.event = event
+        self.created = time.time() if created is None else created
+        self.task_id = task_id
+        self.run_id = run_id
+        self.fields = fields or None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Build the public dictionary form of the event.
+
+        Returns:
+            Dict[str, Any]: Event with id, event, timestamp, task_id, run_id and extra fields
+        """
+        data = {
+            'id': str(uuid.UUID(int=self.id)),
+            'event': self.event,
+            'timestamp': datetime.utcfromtimestamp(self.created).isoformat(),
+            'task_id': self.task_id,
+            'run_id': self.run_id,
+        }
+        if self.fields:
+            data.update(self.fields)
+        return data
+
+
+class _KeyBuffer:
+    """Events of a single key plus its last-activity time."""
+
+    __slots__ = ("events", "touched")
+
+    def __init__(self, maxlen: int, now: float):
+        self.events: Deque[Any] = deque(maxlen=maxlen)
+        self.touched = now
+
+
+class EventStore:
+    """
+    Per-key event buffers with key-count, total-size and idle-TTL bounds.
+
+    Args:
+        max_events_per_key (int): Maximum records kept per key
+        max_keys (int): Maximum number of keys kept
+        max_events (int): Maximum number of records kept across all keys
+        key_ttl (float): Seconds without new events after which a key is evicted
+        clock (Callable[[], float]): Monotonic clock, injectable for tests
+    """
+
+    def __init__(
+        self,
+        max_events_per_key: int = 1000,
+        max_keys: int = 10000,
+        max_events: int = 100000,
+        key_ttl: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_events_per_key = max_events_per_key
+        self.max_keys = max_keys
+        self.max_events = max_events
+        self.key_ttl = key_ttl
+        self._clock = clock
+        self._keys: "OrderedDict[str, _KeyBuffer]" = OrderedDict()
+        self._total = 0
+        self._evicted_ttl = 0
+        self._evicted_lru = 0
+        self._evicted_events = 0
+        self._trimmed_events = 0
+
+    def __len__(self) -> int:
+        return self._total
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._keys
+
+    def append(self, key: str, record: Any, pinned: Optional[Callable[[str], bool]] = None) -> None:
+        """
+        Add a record to a key, evicting other keys as needed to stay in budget.
+
+        Args:
+            key (str): Task or run ID
+            record (Any): Event record to store
+            pinned (Optional[Callable[[str], bool]]): Keys for which this returns
+                True are exempt from TTL expiry (e.g. keys with live subscribers)
+        """
+        now = self._clock()
+        self.expire(now, pinned)
+
+        buffer = self._keys.get(key)
+        if buffer is None:
+            buffer = self._keys[key] = _KeyBuffer(self.max_events_per_key, now)
+        else:
+            buffer.touched = now
+            self._keys.move_to_end(key)
+
+        if len(buffer.events) == buffer.events.maxlen:
+            self._trimmed_events += 1
+        else:
+            self._total += 1
+        buffer.events.append(record)
+
+        while len(self._keys) > self.max_keys or self._total > self.max_events:
+            victim, evicted = self._keys.popitem(last=False)
+            self._drop(evicted)
+            self._evicted_lru += 1
+            if victim == key:
+                break
+
+    def get(self, key: str) -> List[Any]:
+        """
+        Return a copy of the records stored for a key, oldest first.
+
+        Args:
+            key (str): Task or run ID
+
+        Returns:
+            List[Any]: Stored records (empty if the key is unknown or evicted)
+        """
+        buffer = self._keys.get(key)
+        return list(buffer.events) if buffer is not None else []
+
+    def expire(self, now: Optional[float] = None, pinned: Optional[Callable[[str], bool]] = None) -> int:
+        """
+        Evict keys that have been idle for longer than the TTL.
+
+        Args:
+            now (Optional[float]): Current clock value (default: read the clock)
+            pinned (Optional[Callable[[str], bool]]): Keys exempt from expiry
+
+        Returns:
+            int: Number of keys evicted
+        """
+        now = self._clock() if now is None else now
+        deadline = now - self.key_ttl
+        evicted = 0
+        while self._keys:
+            key, buffer = next(iter(self._keys.items()))
+            if buffer.touched > deadline:
+                break
+            if pinned is not None and pinned(key):
+                # Still being watched; treat as fresh activity
+                buffer.touched = now
+                self._keys.move_to_end(key)
+                continue
+            del self._keys[key]
+            self._drop(buffer)
+            self._evicted_ttl += 1
+            evicted += 1
+        return evicted
+
+    def _drop(self, buffer: _KeyBuffer) -> None:
+        self._total -= len(buffer.events)
+        self._evicted_events += len(buffer.events)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return store size and eviction counters.
+
+        Returns:
+            Dict[str, Any]: Current usage, configured budgets and eviction counts
+        """
+        return {
+            "keys": len(self._keys),
+            "events": self._total,
+            "max_keys": self.max_keys,
+            "max_events": self.max_events,
+            "max_events_per_key": self.max_events_per_key,
+            "key_ttl_seconds": self.key_ttl,
+            "evicted_keys_ttl": self._evicted_ttl,
+            "evicted_keys_lru": self._evicted_lru,
+            "evicted_events": self._evicted_events,
+            "trimmed_events": self._trimmed_events,
+        }
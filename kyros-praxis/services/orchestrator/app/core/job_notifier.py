@@ -0,0 +1,304 @@
+"""
+Job State Change Notifications
+
+This module provides the wait primitive behind long-polling ``GET /jobs/{id}?wait=30s``.
+Instead of re-issuing the request (and paying for authentication, a query and an ETag
+per poll), a client holds one request open; the handler registers a watch on the job
+and sleeps until a write path announces that the job changed or the timeout expires.
+
+KEY FEATURES:
+1. In-Process Hub: ``JobNotifier`` maps job IDs to the watches waiting on them;
+   ``notify`` wakes every watch of the given jobs and is O(watches woken)
+2. Thread Safety: Watches are woken with ``call_soon_threadsafe`` on the event loop
+   that created them, so notifying from worker threads is safe
+3. Cross-Process Delivery: On PostgreSQL, ``publish_job_changes`` also issues
+   ``pg_notify`` and ``PostgresJobListener`` relays notifications from other
+   workers into the local hub (LISTEN/NOTIFY)
+4. Metrics: Active watches, watched jobs, notifications and wake-ups
+
+Notifications carry only job IDs. A woken handler re-reads the job and compares
+ETags, so duplicate or spurious wake-ups (e.g. a change announced both locally and
+through LISTEN) cost one query and never produce a wrong response.
+
+USAGE:
+    notifier = get_job_notifier()
+    with notifier.watch(job_id) as watch:
+        ...  # read the job; if unchanged:
+        changed = await watch.wait(30)
+
+    # after committing a write
+    await publish_job_changes(session, [job_id])
+"""
+
+import asyncio
+import logging
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# LISTEN/NOTIFY channel shared by all orchestrator workers
+CHANNEL = "job_changes"
+
+# PostgreSQL limits NOTIFY payloads to 8000 bytes; UUIDs plus a separator are 37
+_IDS_PER_NOTIFY = 200
+
+_DURATION = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(ms|s|m)?\s*$")
+_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, None: 1.0}
+
+
+def parse_duration(value: str) -> float:
+    """
+    Parse a wait duration such as ``30s``, ``500ms``, ``2m`` or ``30``.
+
+    Args:
+        value (str): Duration; a bare number is taken as seconds
+
+    Returns:
+        float: Duration in seconds
+
+    Raises:
+        ValueError: If the value is not a non-negative duration
+    """
+    match = _DURATION.match(value)
+    if not match:
+        raise ValueError(f"Invalid duration: {value!r}")
+    return float(match.group(1)) * _UNIT_SECONDS[match.group(2)]
+
+
+class JobWatch:
+    """
+    A registration waiting for changes to one job.
+
+    Must be created on a running event loop. Use as a context manager (or call
+    ``close``) so the watch is removed from the notifier when the request ends.
+
+    Attributes:
+        job_id (str): Watched job ID
+    """
+
+    def __init__(self, notifier: "JobNotifier", job_id: str):
+        self.job_id = job_id
+        self._notifier = notifier
+        self._loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+
+    def _wake(self) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:
+            # Loop already closed; nobody is waiting any more
+            pass
+
+    async def wait(self, timeout: float) -> bool:
+        """
+        Wait until the job is announced as changed.
+
+        The watch is re-armed before returning, so it can be waited on again
+        after a spurious wake-up.
+
+        Args:
+            timeout (float): Maximum time to wait in seconds
+
+        Returns:
+            bool: True if a change was announced, False on timeout
+        """
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._event.clear()
+        return True
+
+    def close(self) -> None:
+        """Remove the watch from its notifier."""
+        self._notifier._remove(self)
+
+    def __enter__(self) -> "JobWatch":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class JobNotifier:
+    """
+    In-process hub waking watches when jobs change.
+
+    Write paths call ``notify`` after committing; long-poll handlers create a
+    watch before reading the job, so a change committed between the read and
+    the wait is not missed.
+    """
+
+    def __init__(self):
+        self._watches: Dict[str, Set[JobWatch]] = {}
+        self._lock = threading.Lock()
+        self._notifications = 0
+        self._woken = 0
+
+    def watch(self, job_id: str) -> JobWatch:
+        """
+        Register a watch for a job.
+
+        Args:
+            job_id (str): Job to watch
+
+        Returns:
+            JobWatch: Registered watch bound to the running event loop
+        """
+        watch = JobWatch(self, job_id)
+        with self._lock:
+            self._watches.setdefault(job_id, set()).add(watch)
+        return watch
+
+    def _remove(self, watch: JobWatch) -> None:
+        with self._lock:
+            watches = self._watches.get(watch.job_id)
+            if watches is None:
+                return
+            watches.discard(watch)
+            if not watches:
+                del self._watches[watch.job_id]
+
+    def notify(self, *job_ids: str) -> int:
+        """
+        Wake every watch of the given jobs.
+
+        Safe to call from the event loop or from worker threads.
+
+        Args:
+            *job_ids (str): IDs of jobs that changed
+
+        Returns:
+            int: Number of watches woken
+        """
+        with self._lock:
+            self._notifications += len(job_ids)
+            woken = [w for job_id in job_ids for w in self._watches.get(job_id, ())]
+            self._woken += len(woken)
+        for watch in woken:
+            watch._wake()
+        return len(woken)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return notifier metrics for monitoring.
+
+        Returns:
+            Dict[str, int]: Active watches, watched jobs and notification counters
+        """
+        with self._lock:
+            return {
+                "watches": sum(len(watches) for watches in self._watches.values()),
+                "watched_jobs": len(self._watches),
+                "notifications_total": self._notifications,
+                "woken_total": self._woken,
+            }
+
+
+_job_notifier = JobNotifier()
+
+
+def get_job_notifier() -> JobNotifier:
+    """
+    Get the process-wide job notifier.
+
+    Returns:
+        JobNotifier: Shared notifier instance
+    """
+    return _job_notifier
+
+
+def _chunks(job_ids: List[str]) -> Iterable[List[str]]:
+    for start in range(0, len(job_ids), _IDS_PER_NOTIFY):
+        yield job_ids[start:start + _IDS_PER_NOTIFY]
+
+
+async def publish_job_changes(session: Any, job_ids: Iterable[str]) -> None:
+    """
+    Announce committed job changes to waiting requests.
+
+    Wakes local watches immediately. On PostgreSQL the IDs are also sent with
+    ``pg_notify`` so watches in other worker processes are woken by their
+    ``PostgresJobListener``. Call this after the write has been committed.
+
+    Args:
+        session (AsyncSession): Session used for the write
+        job_ids (Iterable[str]): IDs of the jobs that changed
+    """
+    job_ids = list(dict.fromkeys(job_ids))
+    if not job_ids:
+        return
+    _job_notifier.notify(*job_ids)
+
+    if session.get_bind().dialect.name != "postgresql":
+        return
+    from sqlalchemy import text
+
+    try:
+        for chunk in _chunks(job_ids):
+            await session.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": CHANNEL, "payload": ",".join(chunk)},
+            )
+        await session.commit()
+    except Exception as e:
+        # The write is already committed; other workers fall back to their wait timeout
+        await session.rollback()
+        logger.warning(f"Failed to publish job change notification: {e}")
+
+
+class PostgresJobListener:
+    """
+    Relay ``job_changes`` notifications from PostgreSQL into a notifier.
+
+    Holds one dedicated connection from the async engine for the lifetime of
+    the process. Requires the asyncpg driver (``postgresql+asyncpg``); with
+    other drivers ``start`` logs a warning and only in-process notifications
+    are delivered.
+
+    Args:
+        engine (AsyncEngine): Async engine of the orchestrator database
+        notifier (Optional[JobNotifier]): Notifier to wake (default: the shared one)
+    """
+
+    def __init__(self, engine: Any, notifier: Optional[JobNotifier] = None):
+        self.engine = engine
+        self.notifier = notifier if notifier is not None else _job_notifier
+        self._connection: Any = None
+        self._driver_connection: Any = None
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        self.notifier.notify(*(job_id for job_id in payload.split(",") if job_id))
+
+    async def start(self) -> bool:
+        """
+        Open the listening connection and subscribe to the channel.
+
+        Returns:
+            bool: True if the listener is active
+        """
+        connection = await self.engine.connect()
+        raw = await connection.get_raw_connection()
+        driver_connection = raw.driver_connection
+        if not hasattr(driver_connection, "add_listener"):
+            await connection.close()
+            logger.warning("Job change LISTEN requires asyncpg; cross-worker long-poll wake-ups disabled")
+            return False
+        await driver_connection.add_listener(CHANNEL, self._on_notification)
+        self._connection = connection
+        self._driver_connection = driver_connection
+        logger.info(f"Listening for job changes on channel {CHANNEL}")
+        return True
+
+    async def stop(self) -> None:
+        """Unsubscribe and return the connection to the engine."""
+        if self._connection is None:
+            return
+        try:
+            await self._driver_connection.remove_listener(CHANNEL, self._on_notification)
+        finally:
+            await self._connection.close()
+            self._connection = None
+            self._driver_connection = None
@@ -10,7 +10,7 @@ The logging system includes:
 - Multiple log handlers (console, file) with rotation
 - Request context logging with tracing identifiers
 - Specialized orchestrator event logging for SSE consumption
-- In-memory event storage for real-time streaming
+- In-process pub/sub broker (event_broker.py) for push-based real-time streaming
 - Environment-specific configuration
 
 KEY FEATURES:
@@ -31,9 +31,6 @@ import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
-from collections import defaultdict
-import asyncio
-import uuid
 
 try:
     from .config import settings
@@ -45,11 +42,40 @@ except ImportError:
         PROJECT_NAME: str = "kyros-praxis"
     settings = FallbackSettings()
 
+try:
+    from .event_broker import EventBroker
+    from .event_store import EventRecord, EventStore
+except ImportError:
+    from event_broker import EventBroker  # type: ignore
+    from event_store import EventRecord, EventStore  # type: ignore
+
+
+# Global event broker for SSE streaming
+# Keeps a bounded ring buffer per task_id/run_id and pushes new events
+# straight into the queues of live subscribers. The store bounds the number
+# of keys and total events and expires idle keys, so memory reaches a steady
+# state even though every request logs under its own request ID.
+_event_broker = EventBroker(
+    buffer_size=getattr(settings, 'ORCH_EVENTS_BUFFER_SIZE', 1000),
+    queue_size=getattr(settings, 'ORCH_EVENTS_QUEUE_SIZE', 256),
+    overflow=getattr(settings, 'ORCH_EVENTS_OVERFLOW', 'drop_oldest'),
+    store=EventStore(
+        max_events_per_key=getattr(settings, 'ORCH_EVENTS_BUFFER_SIZE', 1000),
+        max_keys=getattr(settings, 'ORCH_EVENTS_MAX_KEYS', 10000),
+        max_events=getattr(settings, 'ORCH_EVENTS_MAX_TOTAL', 100000),
+        key_ttl=getattr(settings, 'ORCH_EVENTS_KEY_TTL', 3600),
+    ),
+)
 
-# Global event store for SSE streaming
-# Maps task_id/run_id to list of events for real-time streaming
-_orchestrator_events = defaultdict(list)  # task_id/run_id -> list of events
-_orchestrator_event_locks = defaultdict(asyncio.Lock)  # task_id/run_id -> lock
+
+def get_event_broker() -> EventBroker:
+    """
+    Get the process-wide orchestrator event broker.
+
+    Returns:
+        EventBroker: Broker used by log_orchestrator_event and the SSE endpoints
+    """
+    return _event_broker
 
 
 class StructuredFormatter(logging.Formatter):
@@ -413,9 +439,9 @@ def log_orchestrator_event(event: str, task_id: Optional[str] = None, run_id: Op
     and custom fields. Additionally, it stores events in an in-memory
     data structure for real-time Server-Sent Events (SSE) streaming.
     
-    The function supports filtering events by task ID or run ID and
-    includes memory management to prevent unbounded growth of the
-    event store.
+    The function supports filtering events by task ID or run ID. Stored
+    events are published to the event broker, which keeps a bounded ring
+    buffer per key and pushes the event to live subscribers immediately.
     
     Args:
         event (str): Event type (required for SSE event categorization)
@@ -442,21 +468,10 @@ def log_orchestrator_event(event: str, task_id: Optional[str] = None, run_id: Op
     # Store event for SSE streaming (if task_id or run_id provided)
     if task_id or run_id:
         key = task_id or run_id
-        event_data = {
-            'id': str(uuid.uuid4()),
-            'event': event,
-            'timestamp': datetime.utcnow().isoformat(),
-            'task_id': task_id,
-            'run_id': run_id,
-            **extra_fields
-        }
-        
-        # Store in memory for streaming
-        _orchestrator_events[key].append(event_data)
-        
-        # Keep only the last 1000 events per key to prevent memory issues
-        if len(_orchestrator_events[key]) > 1000:
-            _orchestrator_events[key] = _orchestrator_events[key][-1000:]
+        record = EventRecord(event, task_id=task_id, run_id=run_id, fields=extra_fields)
+
+        # Buffer and fan out to live subscribers
+        _event_broker.publish(key, record)
 
 
 async def get_orchestrator_events(task_id: Optional[str] = None, run_id: Optional[str] = None) -> list:
@@ -464,8 +479,7 @@ async def get_orchestrator_events(task_id: Optional[str] = None, run_id: Optiona
     Get orchestrator events for a specific task or run ID.
     
     This asynchronous function retrieves stored orchestrator events for
-    a specific task or run ID from the in-memory event store. It uses
-    async locks to ensure thread-safe access to the shared event data.
+    a specific task or run ID from the event broker's ring buffer.
     
     The function returns a copy of the event list to prevent external
     modification of the internal event store. If neither task_id nor
@@ -482,8 +496,7 @@ async def get_orchestrator_events(task_id: Optional[str] = None, run_id: Optiona
     if not key:
         return []
     
-    async with _orchestrator_event_locks[key]:
-        return list(_orchestrator_events.get(key, []))
+    return _event_broker.history(key)
 
 
 async def stream_orchestrator_events(task_id: Optional[str] = None, run_id: Optional[str] = None):
@@ -492,12 +505,12 @@ async def stream_orchestrator_events(task_id: Optional[str] = None, run_id: Opti
 
     This asynchronous generator function streams orchestrator events
     as Server-Sent Events (SSE) for real-time monitoring and visualization.
-    It first sends all existing events for the specified task or run ID,
-    then continuously polls for new events and streams them as they occur.
+    It first sends all buffered events for the specified task or run ID,
+    then yields new events as they are published.
 
-    The function uses async locks to ensure thread-safe access to the
-    shared event store and implements efficient polling with a 1-second
-    interval to balance responsiveness with resource usage.
+    The generator subscribes to the event broker, so it does no work while
+    idle and is woken directly by log_orchestrator_event. Slow consumers are
+    handled by the broker's overflow policy (drop oldest or disconnect).
 
     Args:
         task_id (Optional[str]): Task ID to filter events
@@ -509,27 +522,13 @@ async def stream_orchestrator_events(task_id: Optional[str] = None, run_id: Opti
     key = task_id or run_id
     if not key:
         return
-    
-    last_event_id = 0
-    async with _orchestrator_event_locks[key]:
-        events = list(_orchestrator_events.get(key, []))
-    
-    # Send initial events
-    for event in events:
-        yield f"data: {json.dumps(event)}\n\n"
-        last_event_id = max(last_event_id, len(events))
-    
-    # Keep streaming new events
-    while True:
-        await asyncio.sleep(1)  # Check for new events every second
-        async with _orchestrator_event_locks[key]:
-            events = list(_orchestrator_events.get(key, []))
-        
-        # Send new events
-        if len(events) > last_event_id:
-            for event in events[last_event_id:]:
-                yield f"data: {json.dumps(event)}\n\n"
-            last_event_id = len(events)
+
+    subscription = _event_broker.subscribe(key)
+    try:
+        async for frame in subscription:
+            yield frame
+    finally:
+        _event_broker.unsubscribe(subscription)
 
 
 # Setup logging on import
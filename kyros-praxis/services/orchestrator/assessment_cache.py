@@ -0,0 +1,373 @@
+"""
+Escalation Assessment Cache for the Kyros Orchestrator service.
+
+This module memoizes trigger detection (``EscalationDetector``) and context
+analysis (``ContextAnalyzer``) results, so agents resubmitting the same task
+during retries - to /v1/escalation/submit, /detect or /analyze - get the
+earlier assessment back instead of a full re-analysis.
+
+MODULE RESPONSIBILITIES:
+------------------------
+1. Task Fingerprints:
+   - Entries are keyed by a SHA-256 fingerprint of the normalized task
+     description (whitespace collapsed), the sorted file lists, the content
+     hashes of the given files and the task type
+   - The fingerprint also covers the configuration of the detector or
+     analyzer (and the workspace import graph generation), so results made
+     with another configuration are never returned
+
+2. Bounded Storage:
+   - LRU eviction beyond ``max_entries`` and expiry ``ttl_seconds`` after an
+     entry was computed
+
+3. Metrics:
+   - Hits, misses, expirations and evictions per kind ("detection",
+     "analysis"), exposed through ``stats()`` and the escalation statistics
+
+4. Batch Scoring:
+   - ``detect_batch()`` and ``analyze_batch()`` score many tasks through the
+     cache off the event loop, a chunk of tasks at a time, and yield each
+     result as soon as it is ready
+   - Before analyzing a chunk, its Python sources are parsed in one
+     SourceMetricsCache call, which fans large batches out to its process
+     pool; scoring itself holds the GIL, so with a pool two chunks are in
+     flight (the pool parses one while the other is scored) and without one
+     chunks run one after the other
+
+Cached results are shallow-copied on the way in and out: callers may set
+top-level fields (the workflow decision step updates ``should_escalate``) but
+must not modify nested values such as the trigger list.
+
+USAGE:
+    cache = AssessmentCache(EscalationDetector(), ContextAnalyzer())
+    assessment = cache.detect("Add JWT auth", ["auth.py"])
+    analysis = cache.analyze("Add JWT auth", ["auth.py"], {"auth.py": source})
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from .context_analysis import ContextAnalysisResult, ContextAnalyzer
+from .escalation_triggers import EscalationAssessment, EscalationDetector
+from .source_metrics import content_hash
+
+logger = logging.getLogger(__name__)
+
+# Defaults: cached assessments and their lifetime (seconds)
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 300.0
+
+KINDS = ("detection", "analysis")
+
+# Batch scoring: tasks per chunk
+DEFAULT_BATCH_CHUNK_SIZE = 16
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_description(task_description: str) -> str:
+    """Collapse whitespace runs and strip the ends of a task description"""
+    return _WHITESPACE.sub(" ", task_description).strip()
+
+
+def task_fingerprint(
+    task_description: str,
+    files_to_modify: List[str],
+    task_type: str = "implementation",
+    current_files: Optional[List[str]] = None,
+    file_contents: Optional[Dict[str, str]] = None,
+    config: str = "",
+) -> str:
+    """
+    Compute the cache key of a task.
+
+    Args:
+        task_description (str): Task description
+        files_to_modify (List[str]): Files the task modifies (order ignored)
+        task_type (str): Task type
+        current_files (Optional[List[str]]): Workspace files (order ignored)
+        file_contents (Optional[Dict[str, str]]): Contents by file path,
+            represented by their hashes
+        config (str): Identifier of the analysis configuration
+
+    Returns:
+        str: Hex digest
+    """
+    payload = [
+        normalize_description(task_description),
+        sorted(files_to_modify),
+        task_type,
+        sorted(current_files or []),
+        sorted((path, content_hash(content)) for path, content in (file_contents or {}).items()),
+        config,
+    ]
+    return hashlib.sha256(json.dumps(payload).encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class AssessmentCache:
+    """
+    TTL- and size-bounded LRU cache of detection and analysis results.
+
+    Thread-safe; analyses run outside the lock (two concurrent misses for the
+    same task may both compute it).
+
+    Args:
+        detector (EscalationDetector): Detector computing assessments on a miss
+        analyzer (ContextAnalyzer): Analyzer computing context analyses on a miss
+        max_entries (int): Maximum number of cached results (0 disables caching)
+        ttl_seconds (float): Lifetime of a cached result
+        clock (Callable[[], float]): Monotonic time source
+    """
+
+    def __init__(
+        self,
+        detector: EscalationDetector,
+        analyzer: ContextAnalyzer,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.detector = detector
+        self.analyzer = analyzer
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        # Fingerprint -> (expiry, kind, result)
+        self._entries: "OrderedDict[str, Tuple[float, str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {kind: {"hits": 0, "misses": 0, "expired": 0, "evicted": 0} for kind in KINDS}
+
+    def detect(
+        self,
+        task_description: str,
+        files_to_modify: List[str],
+        current_files: Optional[List[str]] = None,
+        task_type: str = "implementation",
+    ) -> EscalationAssessment:
+        """
+        Get the escalation assessment of a task, running detection on a miss.
+
+        Args:
+            task_description: Description of the task to perform
+            files_to_modify: Files the task modifies
+            current_files: Files in the current workspace
+            task_type: Type of task
+
+        Returns:
+            EscalationAssessment: Assessment (shallow copy)
+        """
+        key = "detection:" + task_fingerprint(
+            task_description, files_to_modify, task_type, current_files,
+            config=self.detector.config_fingerprint,
+        )
+        return self._get_or_compute(key, "detection", lambda: self.detector.analyze_task_context(
+            task_description=task_description,
+            files_to_modify=files_to_modify,
+            current_files=current_files or [],
+            task_type=task_type,
+        ))
+
+    def analyze(
+        self,
+        task_description: str,
+        files_to_modify: List[str],
+        file_contents: Optional[Dict[str, str]] = None,
+        task_type: str = "implementation",
+    ) -> ContextAnalysisResult:
+        """
+        Get the context analysis of a task, running the analysis on a miss.
+
+        Args:
+            task_description: Description of the task
+            files_to_modify: Files the task modifies
+            file_contents: File contents for analysis
+            task_type: Type of task
+
+        Returns:
+            ContextAnalysisResult: Analysis (shallow copy)
+        """
+        config = self.analyzer.config_fingerprint()
+        graph = self.analyzer.import_graph
+        if graph is not None:
+            # Dependency results depend on the workspace as well
+            graph.refresh()
+            config = f"{config}:{graph.generation}"
+        key = "analysis:" + task_fingerprint(
+            task_description, files_to_modify, task_type, file_contents=file_contents, config=config,
+        )
+        return self._get_or_compute(key, "analysis", lambda: self.analyzer.analyze_task_context(
+            task_description=task_description,
+            files_to_modify=files_to_modify,
+            file_contents=file_contents,
+            task_type=task_type,
+        ))
+
+    async def detect_batch(
+        self,
+        tasks: List[Dict[str, Any]],
+        concurrency: int = 1,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Detect escalation triggers for many tasks, yielding results as they complete.
+
+        Args:
+            tasks: Keyword arguments of detect() per task
+            concurrency: Chunks scored at once (detection holds the GIL)
+            chunk_size: Tasks per chunk
+
+        Yields:
+            Tuple[int, Any]: Task index and its EscalationAssessment, or the
+                exception raised while scoring it
+        """
+        def score(task: Dict[str, Any]) -> EscalationAssessment:
+            return self.detect(
+                task["task_description"],
+                task["files_to_modify"],
+                task.get("current_files"),
+                task.get("task_type", "implementation"),
+            )
+
+        async for item in self._score_batch(tasks, score, None, concurrency, chunk_size):
+            yield item
+
+    async def analyze_batch(
+        self,
+        tasks: List[Dict[str, Any]],
+        concurrency: Optional[int] = None,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Analyze the context of many tasks, yielding results as they complete.
+
+        Args:
+            tasks: Keyword arguments of analyze() per task
+            concurrency: Chunks analyzed at once (default: 2 if the metrics
+                cache has a process pool, else 1)
+            chunk_size: Tasks per chunk
+
+        Yields:
+            Tuple[int, Any]: Task index and its ContextAnalysisResult, or the
+                exception raised while analyzing it
+        """
+        def score(task: Dict[str, Any]) -> ContextAnalysisResult:
+            return self.analyze(
+                task["task_description"],
+                task["files_to_modify"],
+                task.get("file_contents"),
+                task.get("task_type", "implementation"),
+            )
+
+        def parse_sources(chunk: List[Dict[str, Any]]) -> None:
+            # Warm the metrics cache for the whole chunk in one call, so its
+            # uncached files are parsed together (in the process pool when
+            # there are enough of them)
+            sources = {
+                f"{index}:{path}": content
+                for index, task in enumerate(chunk)
+                for path, content in (task.get("file_contents") or {}).items()
+                if path.endswith(".py") and content and path in task["files_to_modify"]
+            }
+            if sources:
+                self.analyzer.metrics_cache.analyze_files(sources)
+
+        if concurrency is None:
+            concurrency = 2 if self.analyzer.metrics_cache.workers > 0 else 1
+        async for item in self._score_batch(tasks, score, parse_sources, concurrency, chunk_size):
+            yield item
+
+    async def _score_batch(
+        self,
+        tasks: List[Dict[str, Any]],
+        score: Callable[[Dict[str, Any]], Any],
+        prepare: Optional[Callable[[List[Dict[str, Any]]], None]],
+        concurrency: int,
+        chunk_size: int,
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """Score chunks of tasks on worker threads and yield (index, result or exception) as each task finishes"""
+        loop = asyncio.get_running_loop()
+        results: "asyncio.Queue[Tuple[int, Any]]" = asyncio.Queue()
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        def run_chunk(start: int, chunk: List[Dict[str, Any]]) -> None:
+            if prepare is not None:
+                try:
+                    prepare(chunk)
+                except Exception as e:
+                    # Tasks are still scored; each reports its own failure
+                    logger.warning(f"Could not parse the sources of a batch chunk: {e}")
+            for offset, task in enumerate(chunk):
+                try:
+                    result: Any = score(task)
+                except Exception as e:
+                    result = e
+                loop.call_soon_threadsafe(results.put_nowait, (start + offset, result))
+
+        async def schedule(start: int) -> None:
+            async with semaphore:
+                await asyncio.to_thread(run_chunk, start, tasks[start:start + chunk_size])
+
+        chunks = [asyncio.create_task(schedule(start)) for start in range(0, len(tasks), max(1, chunk_size))]
+        try:
+            for _ in range(len(tasks)):
+                yield await results.get()
+        finally:
+            for chunk in chunks:
+                chunk.cancel()
+
+    def _get_or_compute(self, key: str, kind: str, compute: Callable[[], Any]) -> Any:
+        counters = self._counters[kind]
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    counters["hits"] += 1
+                    return copy.copy(entry[2])
+                del self._entries[key]
+                counters["expired"] += 1
+            counters["misses"] += 1
+
+        result = compute()
+        if self.max_entries <= 0:
+            return result
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl_seconds, kind, copy.copy(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                _, (_, evicted_kind, _) = self._entries.popitem(last=False)
+                self._counters[evicted_kind]["evicted"] += 1
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache metrics for monitoring.
+
+        Returns:
+            Dict[str, Any]: Entry count, bounds and per-kind counters with hit rates
+        """
+        with self._lock:
+            per_kind = {}
+            for kind, counters in self._counters.items():
+                lookups = counters["hits"] + counters["misses"]
+                per_kind[kind] = {**counters, "hit_rate": counters["hits"] / lookups if lookups else 0.0}
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                **per_kind,
+            }
+
+    def clear(self) -> None:
+        """Drop all cached results"""
+        with self._lock:
+            self._entries.clear()
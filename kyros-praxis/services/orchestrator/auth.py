@@ -59,6 +59,7 @@ COMPONENTS:
 2. User Retrieval:
    - get_user(): Synchronous user retrieval
    - get_user_async(): Asynchronous user retrieval
+   - get_principal(): Cached user retrieval for authenticated requests
 
 3. Authentication Flow:
    - authenticate_user(): Complete user authentication
@@ -105,22 +106,26 @@ import os
 from datetime import datetime, timedelta
 from typing import Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
+from jose import jwt
 from passlib.context import CryptContext
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 
 try:
-    from .database import get_db
+    from .database import get_db_session
     from .models import User
     from .app.core.config import settings
+    from .auth_context import get_auth_context
+    from .principal_cache import get_principal_cache, snapshot, watch_user_model
 except Exception:  # Fallback when running module directly in container
-    from .database import get_db  # type: ignore
+    from .database import get_db_session  # type: ignore
     from .models import User  # type: ignore
     from .app.core.config import settings  # type: ignore
+    from .auth_context import get_auth_context  # type: ignore
+    from .principal_cache import get_principal_cache, snapshot, watch_user_model  # type: ignore
 
 # Use centralized configuration from settings
 SECRET_KEY = settings.SECRET_KEY
@@ -129,6 +134,9 @@ ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 JWT_ISSUER = settings.JWT_ISSUER
 JWT_AUDIENCE = settings.JWT_AUDIENCE
 
+# Drop cached principals when a user's role or active flag changes
+watch_user_model(User)
+
 # Password hashing context using bcrypt
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -273,6 +281,36 @@ async def get_user_async(db: AsyncSession, username: str) -> Optional[User]:
     return result.scalar_one_or_none()
 
 
+async def get_principal(db: AsyncSession, username: str) -> Optional[User]:
+    """
+    Retrieve the user behind an authenticated subject, using the principal cache.
+    
+    On a cache hit no query is issued and a fresh, session-less User instance
+    is built from the cached column values. On a miss the user is loaded with
+    get_user_async and cached for AUTH_PRINCIPAL_CACHE_TTL seconds.
+    
+    Args:
+        db (AsyncSession): Asynchronous database session
+        username (str): Token subject (username)
+        
+    Returns:
+        Optional[User]: User object if found, None otherwise
+        
+    Note:
+        Unknown users are not cached, so a user created after a failed
+        lookup is found on the next request.
+    """
+    cache = get_principal_cache()
+    values = cache.get(username)
+    if values is not None:
+        return User(**values)
+    generation = cache.generation
+    user = await get_user_async(db, username)
+    if user is not None:
+        cache.put(username, snapshot(user), generation)
+    return user
+
+
 def authenticate_user(db: Session, username: str, password: str) -> User | bool:
     """
     Authenticate a user by username and password.
@@ -352,16 +390,18 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db_session),
 ) -> User:
     """
     FastAPI dependency to get the current authenticated user from JWT token.
     
-    Decodes the JWT token from the Authorization header, validates it, and
-    retrieves the corresponding user from the database. This function serves
-    as a FastAPI dependency that can be used to protect routes requiring
-    authentication.
+    Reads the JWT token verified once per request by AuthContextMiddleware
+    (see auth_context.py) and retrieves the corresponding user through the
+    principal cache (see principal_cache.py), falling back to an asynchronous
+    database query. This function serves as a FastAPI dependency that can be used
+    to protect routes requiring authentication.
     
     Security Considerations:
     - Validates JWT token signature and claims
@@ -371,8 +411,9 @@ async def get_current_user(
     - Uses secure error handling to prevent information leakage
     
     Args:
+        request (Request): Incoming HTTP request carrying the auth context
         credentials (HTTPAuthorizationCredentials): Bearer token from Authorization header
-        db (Session): Database session dependency
+        db (AsyncSession): Asynchronous database session dependency
         
     Returns:
         User: Authenticated user object
@@ -390,24 +431,14 @@ async def get_current_user(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        # Check if credentials are provided
-        if credentials is None or not getattr(credentials, "credentials", None):
-            raise credentials_exception
-        payload = jwt.decode(
-            credentials.credentials,
-            SECRET_KEY,
-            algorithms=[ALGORITHM],
-            audience=JWT_AUDIENCE,
-            issuer=JWT_ISSUER,
-        )
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-        token_data = TokenData(username=username)
-    except JWTError:
+    # Check if credentials are provided
+    if credentials is None or not getattr(credentials, "credentials", None):
+        raise credentials_exception
+    auth = get_auth_context(request)
+    if not auth.authenticated or not auth.subject:
         raise credentials_exception
-    user = get_user(db, username=token_data.username)
+    token_data = TokenData(username=auth.subject)
+    user = await get_principal(db, token_data.username)
     if user is None:
         raise credentials_exception
     return user
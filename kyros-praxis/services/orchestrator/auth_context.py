@@ -0,0 +1,292 @@
+"""
+Request Authentication Context for the Kyros Orchestrator service.
+
+This module decodes and verifies the bearer token of a request exactly once and
+shares the result with every middleware and dependency that needs it. Before,
+a single authenticated request was JWT-verified four to six times (rate limit
+key function, security middleware client ID and CSRF checks, request logging,
+and the ``get_current_user`` dependencies).
+
+MODULE RESPONSIBILITIES:
+------------------------
+1. Token Verification:
+   - Signature, issuer and audience validation with the same rules as auth.py
+   - Expiration is evaluated separately, so consumers that only need the
+     subject of an expired token (rate limiting, logging) still get it
+
+2. Verified-Token Cache:
+   - Small LRU keyed by the SHA-256 digest of the token (raw tokens are never
+     kept as keys)
+   - Entries are dropped once the token expires, so a hot token is verified
+     once per lifetime instead of once per request
+
+3. Request Integration:
+   - ``AuthContextMiddleware``: ASGI middleware, registered outermost, that
+     stores an ``AuthContext`` in the request scope state
+   - ``get_auth_context()``: Accessor used by downstream consumers; resolves
+     the context on demand when the middleware did not run (e.g. unit tests)
+
+USAGE:
+    ctx = get_auth_context(request)
+    if ctx.authenticated:
+        user_id = ctx.subject
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from jose import JWTError, jwt
+
+try:
+    from .app.core.config import settings
+except ImportError:
+    from app.core.config import settings  # type: ignore
+
+# Key of the context in the request scope state (``request.state.auth``)
+STATE_KEY = "auth"
+
+# Default cache size and lifetime for tokens without an ``exp`` claim
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_MAX_AGE = 300.0
+
+
+class AuthContext:
+    """
+    Result of verifying a request's bearer token.
+
+    Attributes:
+        token (Optional[str]): Raw bearer token, if the request carried one
+        claims (Optional[Dict[str, Any]]): Claims of a token with a valid
+            signature, issuer and audience (possibly expired)
+        expired (bool): Whether the verified token is past its ``exp``
+    """
+
+    __slots__ = ("token", "claims", "expired")
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        claims: Optional[Dict[str, Any]] = None,
+        expired: bool = False,
+    ):
+        self.token = token
+        self.claims = claims
+        self.expired = expired
+
+    @property
+    def authenticated(self) -> bool:
+        """Whether the token is verified and not expired."""
+        return self.claims is not None and not self.expired
+
+    @property
+    def subject(self) -> Optional[str]:
+        """The ``sub`` claim of a verified token, expired or not."""
+        return self.claims.get("sub") if self.claims is not None else None
+
+    @property
+    def session_id(self) -> str:
+        """Session binding for CSRF tokens; empty unless authenticated."""
+        if not self.authenticated:
+            return ""
+        return self.claims.get("sub", "") or self.claims.get("session_id", "")
+
+
+ANONYMOUS = AuthContext()
+
+
+class TokenVerifier:
+    """
+    JWT verifier with an LRU cache of verified tokens.
+
+    Only tokens that pass signature, issuer and audience validation are
+    cached. Expired tokens are re-verified on every use and never cached.
+
+    Args:
+        secret (str): Signing secret
+        algorithm (str): Signing algorithm
+        issuer (str): Required ``iss`` claim
+        audience (str): Required ``aud`` claim
+        maxsize (int): Maximum number of cached tokens
+        max_age (float): Cache lifetime for tokens without ``exp``
+        clock (callable): Wall clock returning UNIX time, injectable for tests
+    """
+
+    def __init__(
+        self,
+        secret: str,
+        algorithm: str,
+        issuer: str,
+        audience: str,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        max_age: float = DEFAULT_MAX_AGE,
+        clock=time.time,
+    ):
+        self.secret = secret
+        self.algorithm = algorithm
+        self.issuer = issuer
+        self.audience = audience
+        self.maxsize = maxsize
+        self.max_age = max_age
+        self._clock = clock
+        self._cache: "OrderedDict[bytes, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def verify(self, token: str) -> AuthContext:
+        """
+        Verify a token, using the cache when possible.
+
+        Args:
+            token (str): Encoded JWT
+
+        Returns:
+            AuthContext: Context with claims, or without claims if the token
+                is invalid
+        """
+        digest = hashlib.sha256(token.encode()).digest()
+        now = self._clock()
+        with self._lock:
+            entry = self._cache.get(digest)
+            if entry is not None:
+                claims, valid_until = entry
+                if now < valid_until:
+                    self._cache.move_to_end(digest)
+                    self.hits += 1
+                    return AuthContext(token, claims)
+                del self._cache[digest]
+            self.misses += 1
+
+        try:
+            claims = jwt.decode(
+                token,
+                self.secret,
+                algorithms=[self.algorithm],
+                audience=self.audience,
+                issuer=self.issuer,
+                options={"verify_exp": False},
+            )
+        except JWTError:
+            return AuthContext(token)
+
+        exp = claims.get("exp")
+        valid_until = float(exp) if exp is not None else now + self.max_age
+        if now >= valid_until:
+            return AuthContext(token, claims, expired=True)
+
+        with self._lock:
+            self._cache[digest] = (claims, valid_until)
+            self._cache.move_to_end(digest)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return AuthContext(token, claims)
+
+    def clear(self) -> None:
+        """Drop all cached tokens."""
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return cache usage counters.
+
+        Returns:
+            Dict[str, int]: Cached entries, hits and misses
+        """
+        with self._lock:
+            return {"size": len(self._cache), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+
+_verifier: Optional[TokenVerifier] = None
+_verifier_lock = threading.Lock()
+
+
+def get_token_verifier() -> TokenVerifier:
+    """
+    Return the process-wide verifier configured from settings.
+
+    Returns:
+        TokenVerifier: Shared verifier instance
+    """
+    global _verifier
+    if _verifier is None:
+        with _verifier_lock:
+            if _verifier is None:
+                _verifier = TokenVerifier(
+                    secret=settings.SECRET_KEY,
+                    algorithm=settings.JWT_ALGORITHM,
+                    issuer=settings.JWT_ISSUER,
+                    audience=settings.JWT_AUDIENCE,
+                    maxsize=settings.AUTH_TOKEN_CACHE_SIZE,
+                )
+    return _verifier
+
+
+def _bearer_token(scope: Dict[str, Any]) -> Optional[str]:
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and token:
+                return token.strip()
+            return None
+    return None
+
+
+def resolve_auth_context(scope: Dict[str, Any], verifier: Optional[TokenVerifier] = None) -> AuthContext:
+    """
+    Return the auth context of an ASGI scope, verifying the token at most once.
+
+    Args:
+        scope (Dict[str, Any]): ASGI connection scope
+        verifier (Optional[TokenVerifier]): Verifier to use (default: shared one)
+
+    Returns:
+        AuthContext: Context stored in the scope state
+    """
+    state = scope.setdefault("state", {})
+    ctx = state.get(STATE_KEY)
+    if ctx is None:
+        token = _bearer_token(scope)
+        if token is None:
+            ctx = ANONYMOUS
+        else:
+            ctx = (verifier or get_token_verifier()).verify(token)
+        state[STATE_KEY] = ctx
+    return ctx
+
+
+def get_auth_context(request) -> AuthContext:
+    """
+    Return the auth context of a request.
+
+    Args:
+        request (Request): Incoming HTTP request or WebSocket
+
+    Returns:
+        AuthContext: Context resolved by ``AuthContextMiddleware`` or on demand
+    """
+    return resolve_auth_context(request.scope)
+
+
+class AuthContextMiddleware:
+    """
+    ASGI middleware that resolves the auth context before anything else runs.
+
+    Must be added last so that it is the outermost middleware.
+
+    Args:
+        app: Wrapped ASGI application
+        verifier (Optional[TokenVerifier]): Verifier to use (default: shared one)
+    """
+
+    def __init__(self, app, verifier: Optional[TokenVerifier] = None):
+        self.app = app
+        self.verifier = verifier
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] in ("http", "websocket"):
+            resolve_auth_context(scope, self.verifier)
+        await self.app(scope, receive, send)
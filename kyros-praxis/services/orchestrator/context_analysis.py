@@ -72,6 +72,8 @@ This module is a core component of the Kyros Orchestrator's hybrid AI model syst
 1. escalation_triggers.py: Provides initial trigger detection that feeds into context analysis
 2. escalation_workflow.py: Uses context analysis results to make final escalation decisions
 3. The analyzer works in conjunction with trigger detection to provide comprehensive assessment
+4. source_metrics.py: Parses each file once per content hash (cached across
+   analyses, optionally on disk) for the complexity and dependency analyses
 
 ESCALATION DECISION PROCESS:
 ----------------------------
@@ -129,7 +131,7 @@ See Also:
 - main.py: Main orchestrator application that integrates escalation decisions
 """
 
-import ast
+import hashlib
 import logging
 import re
 from dataclasses import dataclass
@@ -138,6 +140,9 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from collections import defaultdict, Counter
 
+from .import_graph import INTERNAL, UNRESOLVED, ImportGraph, classify_external, get_import_graph
+from .source_metrics import FileMetrics, SourceMetricsCache, get_source_metrics_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -257,9 +262,26 @@ class ContextAnalyzer:
     
     The analyzer uses thresholds and pattern matching to assess various dimensions
     and provides a confidence score with the escalation recommendation.
+    
+    Python files are parsed through a SourceMetricsCache: once per analysis,
+    and not at all when the same contents were analyzed before. With a
+    workspace ImportGraph, dependency analysis resolves imports against the
+    whole workspace and reports fan-in, depth and cycles.
+    
+    Args:
+        metrics_cache: Source metrics cache (default: the process-wide cache)
+        import_graph: Workspace import graph (default: the process-wide graph,
+            if a workspace root is configured)
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        metrics_cache: Optional[SourceMetricsCache] = None,
+        import_graph: Optional[ImportGraph] = None
+    ):
+        self.metrics_cache = metrics_cache if metrics_cache is not None else get_source_metrics_cache()
+        self.import_graph = import_graph if import_graph is not None else get_import_graph()
+        
         # Complexity thresholds
         self.complexity_thresholds = {
             "cyclomatic": {
@@ -348,8 +370,11 @@ class ContextAnalyzer:
             - Confidence score
             - Key factors influencing the decision
         """
+        # Parse each Python file once for the complexity and dependency analyses
+        file_metrics = self._file_metrics(files_to_modify, file_contents)
+        
         # Analyze code complexity
-        complexity_metrics = self._analyze_code_complexity(files_to_modify, file_contents)
+        complexity_metrics = self._analyze_code_complexity(files_to_modify, file_contents, file_metrics)
         
         # Analyze business impact
         business_impact = self._analyze_business_impact(task_description, files_to_modify)
@@ -358,7 +383,7 @@ class ContextAnalyzer:
         risk_metrics = self._assess_risks(task_description, files_to_modify, file_contents)
         
         # Analyze dependencies
-        dependencies = self._analyze_dependencies(files_to_modify, file_contents)
+        dependencies = self._analyze_dependencies(files_to_modify, file_contents, file_metrics)
         
         # Determine quality requirements
         quality_requirements = self._determine_quality_requirements(task_description, complexity_metrics)
@@ -384,10 +409,37 @@ class ContextAnalyzer:
             key_factors=key_factors
         )
     
-    def _analyze_code_complexity(
+    def config_fingerprint(self) -> str:
+        """Identify the thresholds and patterns in use, so cached analyses made with others are not reused"""
+        return hashlib.sha256(repr((
+            self.complexity_thresholds, self.business_impact_patterns, self.risk_patterns
+        )).encode()).hexdigest()
+    
+    def _file_metrics(
         self,
         files_to_modify: List[str],
         file_contents: Optional[Dict[str, str]] = None
+    ) -> Dict[str, FileMetrics]:
+        """Get cached or freshly parsed metrics of the Python files to modify that have contents"""
+        file_contents = file_contents or {}
+        sources = {
+            file_path: file_contents[file_path]
+            for file_path in files_to_modify
+            if file_path.endswith('.py') and file_contents.get(file_path)
+        }
+        file_metrics = {}
+        for file_path, metrics in self.metrics_cache.analyze_files(sources).items():
+            if metrics is None:
+                logger.warning(f"Could not parse {file_path}")
+            else:
+                file_metrics[file_path] = metrics
+        return file_metrics
+    
+    def _analyze_code_complexity(
+        self,
+        files_to_modify: List[str],
+        file_contents: Optional[Dict[str, str]] = None,
+        file_metrics: Optional[Dict[str, FileMetrics]] = None
     ) -> ComplexityMetrics:
         """Analyze code complexity metrics"""
         
@@ -397,41 +449,19 @@ class ContextAnalyzer:
         total_classes = 0
         all_dependencies = set()
         
-        file_contents = file_contents or {}
+        if file_metrics is None:
+            file_metrics = self._file_metrics(files_to_modify, file_contents)
         
-        for file_path in files_to_modify:
-            if file_path.endswith('.py'):
-                content = file_contents.get(file_path, "")
-                if content:
-                    try:
-                        # Parse Python code
-                        tree = ast.parse(content)
-                        
-                        # Count functions and classes
-                        functions = [node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
-                        classes = [node for node in ast.walk(tree) if isinstance(node, ast.ClassDef)]
-                        
-                        total_functions += len(functions)
-                        total_classes += len(classes)
-                        total_lines += len(content.splitlines())
-                        
-                        # Estimate cyclomatic complexity
-                        for node in ast.walk(tree):
-                            if isinstance(node, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
-                                total_cyclomatic += 1
-                        
-                        # Extract dependencies
-                        for node in ast.walk(tree):
-                            if isinstance(node, ast.Import):
-                                for alias in node.names:
-                                    all_dependencies.add(alias.name)
-                            elif isinstance(node, ast.ImportFrom):
-                                if node.module:
-                                    all_dependencies.add(node.module)
-                    
-                    except SyntaxError:
-                        logger.warning(f"Could not parse {file_path}")
-                        continue
+        for metrics in file_metrics.values():
+            total_functions += len(metrics.functions)
+            total_classes += len(metrics.classes)
+            total_lines += metrics.lines
+            
+            # Estimate cyclomatic complexity
+            total_cyclomatic += metrics.branches
+            
+            # Dependencies
+            all_dependencies.update(metrics.imports)
         
         # Calculate coupling and cohesion (simplified estimates)
         coupling_score = min(len(all_dependencies) / max(len(files_to_modify), 1), 1.0)
@@ -623,7 +653,8 @@ class ContextAnalyzer:
     def _analyze_dependencies(
         self,
         files_to_modify: List[str],
-        file_contents: Optional[Dict[str, str]] = None
+        file_contents: Optional[Dict[str, str]] = None,
+        file_metrics: Optional[Dict[str, FileMetrics]] = None
     ) -> DependencyAnalysis:
         """Analyze code dependencies"""
         
@@ -631,42 +662,83 @@ class ContextAnalyzer:
         external_deps = set()
         cross_service_deps = set()
         
-        file_contents = file_contents or {}
+        if file_metrics is None:
+            file_metrics = self._file_metrics(files_to_modify, file_contents)
+        
+        graph = self.import_graph
+        if graph is None:
+            return self._analyze_dependencies_locally(files_to_modify, file_metrics)
         
+        graph.refresh()
+        module_paths = {}
         for file_path in files_to_modify:
-            if file_path.endswith('.py'):
-                content = file_contents.get(file_path, "")
-                if content:
-                    try:
-                        tree = ast.parse(content)
-                        
-                        # Extract imports
-                        for node in ast.walk(tree):
-                            if isinstance(node, ast.Import):
-                                for alias in node.names:
-                                    if alias.name.startswith(('.', '..')):
-                                        # Relative import - internal dependency
-                                        internal_deps.add(alias.name)
-                                    else:
-                                        # Check if it's a known external package
-                                        if self._is_external_package(alias.name):
-                                            external_deps.add(alias.name)
-                                        else:
-                                            internal_deps.add(alias.name)
-                            
-                            elif isinstance(node, ast.ImportFrom):
-                                if node.module:
-                                    if node.module.startswith(('.', '..')):
-                                        internal_deps.add(node.module)
-                                    else:
-                                        if self._is_external_package(node.module):
-                                            external_deps.add(node.module)
-                                        else:
-                                            internal_deps.add(node.module)
-                    
-                    except SyntaxError:
-                        logger.warning(f"Could not parse {file_path}")
-                        continue
+            module = graph.module_for_path(file_path)
+            if module is not None:
+                module_paths[file_path] = module
+        modules = list(module_paths.values())
+        
+        # Imports of the given contents, resolved against the workspace; files
+        # without contents use the imports indexed from disk
+        resolved = []
+        for file_path, metrics in file_metrics.items():
+            importer = graph.module_for_path(file_path)
+            if importer is None:
+                continue
+            resolved.extend(graph.resolve_import(importer, name) for name in metrics.imports)
+        for file_path, module in module_paths.items():
+            if file_path not in file_metrics:
+                resolved.extend(graph.resolved_imports(module))
+        
+        for kind, name in resolved:
+            if kind == INTERNAL:
+                internal_deps.add(name)
+            elif kind == UNRESOLVED:
+                if not name.startswith('.') and self._is_external_package(name):
+                    external_deps.add(name)
+                else:
+                    internal_deps.add(name)
+            else:
+                external_deps.add(name)
+        
+        for importer, imported in graph.cross_service_edges(modules):
+            cross_service_deps.add(imported if importer in modules else importer)
+        
+        dependents = set()
+        for module in modules:
+            dependents |= graph.dependents(module)
+        
+        return DependencyAnalysis(
+            internal_dependencies=sorted(internal_deps),
+            external_dependencies=sorted(external_deps),
+            cross_service_dependencies=sorted(cross_service_deps),
+            circular_dependencies=graph.cycles(modules),
+            critical_dependencies=sorted(cross_service_deps),  # Cross-service deps are critical
+            dependency_depth=max((graph.depth(module) for module in modules), default=0),
+            fan_out=len(internal_deps) + len(external_deps),
+            fan_in=len(dependents - set(modules))
+        )
+    
+    def _analyze_dependencies_locally(
+        self,
+        files_to_modify: List[str],
+        file_metrics: Dict[str, FileMetrics]
+    ) -> DependencyAnalysis:
+        """Analyze dependencies from the imports of the given files only (no workspace graph)"""
+        
+        internal_deps = set()
+        external_deps = set()
+        cross_service_deps = set()
+        
+        for metrics in file_metrics.values():
+            for module in metrics.imports:
+                if module.startswith('.'):
+                    # Relative import - internal dependency
+                    internal_deps.add(module)
+                elif self._is_external_package(module):
+                    # Known external package
+                    external_deps.add(module)
+                else:
+                    internal_deps.add(module)
         
         # Check for cross-service dependencies
         for file_path in files_to_modify:
@@ -688,14 +760,21 @@ class ContextAnalyzer:
         )
     
     def _is_external_package(self, module_name: str) -> bool:
-        """Check if a module is an external package"""
-        # Simplified check - in real implementation would use package registry
-        external_indicators = [
-            'os', 'sys', 'json', 'requests', 'numpy', 'pandas', 'django', 'flask',
-            'fastapi', 'sqlalchemy', 'pytest', 'uvicorn', 'pydantic', 'asyncio',
-            'aiohttp', 'httpx', 'redis', 'psycopg2', 'boto3', 'tensorflow', 'torch'
-        ]
-        return any(indicator in module_name.lower() for indicator in external_indicators)
+        """
+        Check if a module is an external package.
+        
+        The top-level package is looked up in the standard library and the
+        installed distributions, then in well-known packages that may not be
+        installed in this environment.
+        """
+        if classify_external(module_name):
+            return True
+        external_indicators = {
+            'requests', 'numpy', 'pandas', 'django', 'flask', 'fastapi', 'sqlalchemy',
+            'pytest', 'uvicorn', 'pydantic', 'aiohttp', 'httpx', 'redis', 'psycopg2',
+            'boto3', 'tensorflow', 'torch'
+        }
+        return module_name.split('.')[0] in external_indicators
     
     def _determine_quality_requirements(
         self,
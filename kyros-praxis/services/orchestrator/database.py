@@ -14,6 +14,7 @@ MODULE RESPONSIBILITIES:
    - Creates synchronous and asynchronous SQLAlchemy engines
    - Configures database URLs from environment variables
    - Sets up connection parameters for different database types (SQLite, PostgreSQL, etc.)
+     through the tuned engine factory in db_engine.py
 
 2. Session Management:
    - Creates session factories for both sync and async operations
@@ -67,9 +68,11 @@ ENVIRONMENT VARIABLES:
 - DATABASE_URL: Synchronous database connection URL (default: sqlite:///orchestrator.db)
 - ASYNC_DATABASE_URL: Asynchronous database connection URL (default: sqlite+aiosqlite:///orchestrator.db)
 - SQL_ECHO: Enable SQL query logging (default: false)
+- DB_POOL_*, DB_STATEMENT_CACHE_SIZE, SQLITE_*: Engine tuning, see app/core/config.py
 
 See Also:
 --------
+- db_engine.py: Engine factory, backend tuning profiles and pool metrics
 - models.py: Database models for jobs, events, tasks, and users
 - main.py: FastAPI application that uses database dependencies
 - auth.py: Authentication module that depends on database access
@@ -78,10 +81,14 @@ See Also:
 import os
 from pathlib import Path
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 
+try:
+    from .db_engine import build_async_engine, build_engine
+except ImportError:
+    from db_engine import build_async_engine, build_engine  # type: ignore
+
 # Ensure a stable absolute path for the local SQLite file regardless of CWD
 _db_path = Path(__file__).resolve().parent / "orchestrator.db"
 DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{_db_path}")
@@ -90,17 +97,10 @@ ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", f"sqlite+aiosqlite:///{_db_
 # Enable SQL query logging based on environment variable
 SQL_ECHO = os.getenv("SQL_ECHO", "false").lower() in {"1", "true", "yes"}
 
-# Configure database connection parameters
-_sync_kwargs = {"echo": SQL_ECHO}
-_async_kwargs = {"echo": SQL_ECHO}
-if DATABASE_URL.startswith("sqlite:///"):
-    _sync_kwargs["connect_args"] = {"check_same_thread": False}
-if ASYNC_DATABASE_URL.startswith("sqlite+aiosqlite"):
-    _async_kwargs["connect_args"] = {"check_same_thread": False}
-
-# Create synchronous and asynchronous database engines
-engine = create_engine(DATABASE_URL, **_sync_kwargs)
-async_engine = create_async_engine(ASYNC_DATABASE_URL, **_async_kwargs)
+# Create synchronous and asynchronous database engines; pool sizing and SQLite
+# PRAGMAs come from the per-backend profiles in db_engine.py
+engine = build_engine(DATABASE_URL, name="sync", echo=SQL_ECHO)
+async_engine = build_async_engine(ASYNC_DATABASE_URL, name="async", echo=SQL_ECHO)
 
 # Create session factories for both sync and async operations
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
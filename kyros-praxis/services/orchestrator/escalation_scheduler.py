@@ -0,0 +1,238 @@
+"""
+Escalation Workflow Scheduler for the Kyros Orchestrator service.
+
+This module runs escalation workflows on a bounded pool of asyncio workers fed
+by a priority queue. ``EscalationEngine`` (escalation_workflow.py) submits
+every new workflow here instead of rejecting requests above a fixed number of
+active workflows or spawning an unsupervised task per request, so bursts of
+agent traffic are queued and drained at the pool's pace.
+
+KEY FEATURES:
+1. Bounded Worker Pool: ``workers`` tasks run workflows; the rest wait in the queue
+2. Priority Queue: ``critical`` before ``high`` before ``normal`` before ``low``,
+   first come first served within a priority
+3. Deadlines: Each workflow must finish within its ``timeout_seconds`` from
+   submission (time spent queued included); overdue workflows are cancelled
+   and reported to ``on_timeout``
+4. Cancellation: Queued workflows are dropped when they reach the front of
+   the queue; running ones are cancelled immediately
+5. Metrics: Queue depth (total and per priority), running workflows, queue
+   wait times and completion/timeout/cancellation counters
+
+USAGE:
+    scheduler = EscalationScheduler(run_workflow, workers=5, on_timeout=mark_timed_out)
+    scheduler.submit(workflow)
+    scheduler.stats()
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Queue order of request priorities; unknown priorities are treated as normal
+PRIORITY_RANKS = {"critical": 0, "high": 1, "normal": 2, "low": 3}
+DEFAULT_RANK = PRIORITY_RANKS["normal"]
+
+
+class SchedulerFull(Exception):
+    """Raised when the scheduler queue is at capacity"""
+
+
+def priority_rank(priority: str) -> int:
+    """
+    Return the queue rank of a request priority (lower runs first).
+
+    Args:
+        priority (str): Request priority (critical, high, normal, low)
+
+    Returns:
+        int: Queue rank
+    """
+    return PRIORITY_RANKS.get(str(priority).lower(), DEFAULT_RANK)
+
+
+class EscalationScheduler:
+    """
+    Priority-queued, bounded worker pool for escalation workflows.
+
+    Workers are started on the first submission, on the running event loop.
+
+    Args:
+        runner (Callable): Coroutine function executing one workflow
+        workers (int): Number of workflows run concurrently
+        max_queue (int): Maximum number of queued workflows (0 for unbounded)
+        on_timeout (Optional[Callable]): Coroutine function called with a
+            workflow whose deadline passed
+        clock (Callable[[], float]): Monotonic time source
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[Any], Awaitable[None]],
+        workers: int = 5,
+        max_queue: int = 10000,
+        on_timeout: Optional[Callable[[Any], Awaitable[None]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.runner = runner
+        self.workers = workers
+        self.max_queue = max_queue
+        self.on_timeout = on_timeout
+        self.clock = clock
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._workers: Set[asyncio.Task] = set()
+        self._sequence = itertools.count()
+        self._queued: Dict[str, int] = {}
+        self._running: Dict[str, asyncio.Task] = {}
+        self._submitted = 0
+        self._started = 0
+        self._completed = 0
+        self._timed_out = 0
+        self._cancelled = 0
+        self._waits = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def _ensure_started(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.PriorityQueue()
+        while len(self._workers) < self.workers:
+            worker = asyncio.create_task(self._work())
+            self._workers.add(worker)
+            worker.add_done_callback(self._workers.discard)
+
+    def full(self) -> bool:
+        """Return True if a submission would be rejected with SchedulerFull"""
+        return bool(self.max_queue) and len(self._queued) >= self.max_queue
+
+    def submit(self, workflow: Any) -> None:
+        """
+        Queue a workflow by its request priority.
+
+        Args:
+            workflow (EscalationWorkflow): Workflow to run
+
+        Raises:
+            SchedulerFull: If ``max_queue`` workflows are already queued
+        """
+        if self.full():
+            raise SchedulerFull("Escalation queue is full")
+        self._ensure_started()
+        rank = priority_rank(workflow.request.priority)
+        deadline = self.clock() + workflow.request.timeout_seconds
+        self._queued[workflow.workflow_id] = rank
+        self._queue.put_nowait((rank, next(self._sequence), self.clock(), deadline, workflow))
+        self._submitted += 1
+
+    def cancel(self, workflow_id: str) -> bool:
+        """
+        Cancel a queued or running workflow.
+
+        Args:
+            workflow_id (str): Workflow ID
+
+        Returns:
+            bool: True if the workflow was queued or running here
+        """
+        if self._queued.pop(workflow_id, None) is not None:
+            self._cancelled += 1
+            return True
+        task = self._running.get(workflow_id)
+        if task is not None:
+            task.cancel()
+            return True
+        return False
+
+    async def _work(self) -> None:
+        while True:
+            rank, _, enqueued_at, deadline, workflow = await self._queue.get()
+            try:
+                if self._queued.pop(workflow.workflow_id, None) is None:
+                    continue  # cancelled while queued
+                self._record_wait(self.clock() - enqueued_at)
+                await self._run(workflow, deadline)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, workflow: Any, deadline: float) -> None:
+        remaining = deadline - self.clock()
+        if remaining > 0:
+            self._started += 1
+            task = asyncio.create_task(self.runner(workflow))
+            self._running[workflow.workflow_id] = task
+            try:
+                done, _ = await asyncio.wait({task}, timeout=remaining)
+            except asyncio.CancelledError:
+                # Scheduler shutdown: stop the workflow with its worker
+                task.cancel()
+                raise
+            finally:
+                self._running.pop(workflow.workflow_id, None)
+            if done:
+                if task.cancelled():
+                    self._cancelled += 1
+                else:
+                    self._completed += 1
+                    if task.exception() is not None:
+                        logger.error(f"Escalation workflow {workflow.workflow_id} raised: {task.exception()}")
+                return
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        self._timed_out += 1
+        logger.warning(f"Escalation workflow {workflow.workflow_id} exceeded its deadline")
+        if self.on_timeout is not None:
+            try:
+                await self.on_timeout(workflow)
+            except Exception as e:
+                logger.error(f"Timeout handler failed for {workflow.workflow_id}: {e}")
+
+    def _record_wait(self, seconds: float) -> None:
+        self._waits += 1
+        self._wait_total += seconds
+        if seconds > self._wait_max:
+            self._wait_max = seconds
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return scheduler metrics for monitoring.
+
+        Returns:
+            Dict[str, Any]: Queue depths, running workflows, counters and
+                queue wait statistics in milliseconds
+        """
+        names = {rank: name for name, rank in PRIORITY_RANKS.items()}
+        depth_by_priority = Counter(names[rank] for rank in self._queued.values())
+        return {
+            "workers": self.workers,
+            "running": len(self._running),
+            "queue_depth": len(self._queued),
+            "queue_depth_by_priority": {name: depth_by_priority.get(name, 0) for name in PRIORITY_RANKS},
+            "queue_capacity": self.max_queue,
+            "submitted_total": self._submitted,
+            "started_total": self._started,
+            "completed_total": self._completed,
+            "timed_out_total": self._timed_out,
+            "cancelled_total": self._cancelled,
+            "wait": {
+                "count": self._waits,
+                "mean_ms": round(self._wait_total * 1000 / self._waits, 3) if self._waits else 0.0,
+                "max_ms": round(self._wait_max * 1000, 3),
+            },
+        }
+
+    async def shutdown(self) -> None:
+        """Stop the workers, cancelling running workflows; queued workflows are dropped."""
+        workers = list(self._workers)
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._queue = None
+        self._queued.clear()
@@ -0,0 +1,308 @@
+"""
+Escalation Workflow State Store for the Kyros Orchestrator service.
+
+This module provides the pluggable state backend of ``EscalationEngine``
+(escalation_workflow.py). Workflow snapshots and engine counters live in the
+store instead of per-process dictionaries, so with several uvicorn workers a
+status lookup or statistics request can be answered by any worker, and
+completed workflows survive restarts without growing memory without bound.
+
+MODULE RESPONSIBILITIES:
+------------------------
+1. Workflow Snapshots:
+   - Save the serialized workflow (``EscalationWorkflow.to_dict()``) at every
+     state transition; a workflow is active until it has a ``completed_at``
+   - Terminal snapshots are final: a save of an active snapshot over a
+     completed one (e.g. a workflow cancelled by another worker) is rejected,
+     which tells the owning worker to stop
+
+2. Shared Counters:
+   - Request, escalation, completion and failure counters incremented
+     atomically in the backend and aggregated across workers
+
+3. Retention:
+   - Completed workflows are kept for at most ``completed_ttl`` seconds and
+     at most ``max_completed`` of them (newest kept); active workflows are
+     never pruned
+
+BACKENDS:
+---------
+- InMemoryWorkflowStore: Process-local, for tests and single-worker setups
+- SQLWorkflowStore: ``escalation_workflows`` and ``escalation_counters``
+  tables (Alembic revision 0006), shared by every worker using the database
+
+USAGE:
+    store = create_workflow_store()  # backend selected by ESCALATION_STORE
+    engine = EscalationEngine(store=store)
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from .repositories import escalations as escalations_repo
+    HAVE_SQL_STORE = True
+except ImportError:
+    escalations_repo = None
+    HAVE_SQL_STORE = False
+
+# Completed workflows retained by default: count and age (seconds)
+DEFAULT_MAX_COMPLETED = 10000
+DEFAULT_COMPLETED_TTL = 7 * 24 * 3600
+
+
+def _completed_at(record: Dict[str, Any]) -> Optional[datetime]:
+    value = record.get("completed_at")
+    return datetime.fromisoformat(value) if value else None
+
+
+class WorkflowStore(ABC):
+    """
+    Backend holding escalation workflow snapshots and engine counters.
+
+    Snapshots are the JSON-compatible dictionaries produced by
+    ``EscalationWorkflow.to_dict()``.
+
+    Args:
+        max_completed (int): Maximum number of completed workflows retained
+        completed_ttl (float): Seconds a completed workflow is retained
+    """
+
+    def __init__(self, max_completed: int = DEFAULT_MAX_COMPLETED, completed_ttl: float = DEFAULT_COMPLETED_TTL):
+        self.max_completed = max_completed
+        self.completed_ttl = completed_ttl
+
+    def _cutoff(self, now: Optional[datetime] = None) -> datetime:
+        return (now or datetime.utcnow()) - timedelta(seconds=self.completed_ttl)
+
+    @abstractmethod
+    async def save(self, record: Dict[str, Any]) -> bool:
+        """
+        Insert or update a workflow snapshot.
+
+        Args:
+            record (Dict[str, Any]): Workflow snapshot
+
+        Returns:
+            bool: False if the stored workflow is already completed and the
+                snapshot was not written
+        """
+
+    @abstractmethod
+    async def get(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a workflow snapshot.
+
+        Args:
+            workflow_id (str): Workflow ID
+
+        Returns:
+            Optional[Dict[str, Any]]: Snapshot, or None if unknown or pruned
+        """
+
+    @abstractmethod
+    async def list_active(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        List snapshots of workflows that have not completed, oldest first.
+
+        Args:
+            limit (int): Maximum number of snapshots
+
+        Returns:
+            List[Dict[str, Any]]: Active workflow snapshots
+        """
+
+    @abstractmethod
+    async def count(self) -> Dict[str, int]:
+        """
+        Count stored workflows.
+
+        Returns:
+            Dict[str, int]: ``active`` and ``completed`` (retained) counts
+        """
+
+    @abstractmethod
+    async def incr(self, name: str, amount: int = 1) -> None:
+        """
+        Atomically increment a shared counter.
+
+        Args:
+            name (str): Counter name (e.g. "total_requests")
+            amount (int): Increment
+        """
+
+    @abstractmethod
+    async def counters(self) -> Dict[str, int]:
+        """
+        Return all shared counters.
+
+        Returns:
+            Dict[str, int]: Counter values by name
+        """
+
+    @abstractmethod
+    async def prune(self, now: Optional[datetime] = None) -> int:
+        """
+        Apply the retention policy to completed workflows.
+
+        Args:
+            now (Optional[datetime]): Current time (default: utcnow)
+
+        Returns:
+            int: Number of workflows removed
+        """
+
+
+class InMemoryWorkflowStore(WorkflowStore):
+    """
+    Process-local workflow store.
+
+    Completed workflows are kept in completion order, so the count bound is
+    enforced on every completion in O(1) and the age bound by popping from
+    the oldest end.
+    """
+
+    def __init__(self, max_completed: int = DEFAULT_MAX_COMPLETED, completed_ttl: float = DEFAULT_COMPLETED_TTL):
+        super().__init__(max_completed, completed_ttl)
+        self._active: Dict[str, Dict[str, Any]] = {}
+        self._completed: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+
+    async def save(self, record: Dict[str, Any]) -> bool:
+        workflow_id = record["workflow_id"]
+        if workflow_id in self._completed:
+            return False
+        if _completed_at(record) is None:
+            self._active[workflow_id] = record
+            return True
+        self._active.pop(workflow_id, None)
+        self._completed[workflow_id] = record
+        while len(self._completed) > self.max_completed:
+            self._completed.popitem(last=False)
+        return True
+
+    async def get(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        record = self._active.get(workflow_id)
+        if record is not None:
+            return record
+        record = self._completed.get(workflow_id)
+        if record is not None and _completed_at(record) < self._cutoff():
+            return None
+        return record
+
+    async def list_active(self, limit: int = 100) -> List[Dict[str, Any]]:
+        return sorted(self._active.values(), key=lambda record: record["started_at"])[:limit]
+
+    async def count(self) -> Dict[str, int]:
+        await self.prune()
+        return {"active": len(self._active), "completed": len(self._completed)}
+
+    async def incr(self, name: str, amount: int = 1) -> None:
+        self._counters[name] = self._counters.get(name, 0) + amount
+
+    async def counters(self) -> Dict[str, int]:
+        return dict(self._counters)
+
+    async def prune(self, now: Optional[datetime] = None) -> int:
+        cutoff = self._cutoff(now)
+        removed = 0
+        while self._completed:
+            oldest = next(iter(self._completed.values()))
+            if _completed_at(oldest) >= cutoff:
+                break
+            self._completed.popitem(last=False)
+            removed += 1
+        return removed
+
+
+class SQLWorkflowStore(WorkflowStore):
+    """
+    Workflow store backed by the orchestrator database.
+
+    Every operation uses a short-lived session from ``session_factory``.
+    Pruning runs after every ``prune_every`` completions saved by this
+    process, so no background task is needed.
+
+    Args:
+        session_factory (Callable): Factory returning an ``AsyncSession``
+            (e.g. ``database.AsyncSessionLocal``)
+        max_completed (int): Maximum number of completed workflows retained
+        completed_ttl (float): Seconds a completed workflow is retained
+        prune_every (int): Completions between retention passes
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        max_completed: int = DEFAULT_MAX_COMPLETED,
+        completed_ttl: float = DEFAULT_COMPLETED_TTL,
+        prune_every: int = 100,
+    ):
+        if not HAVE_SQL_STORE:
+            raise RuntimeError("SQLWorkflowStore requires SQLAlchemy")
+        super().__init__(max_completed, completed_ttl)
+        self.session_factory = session_factory
+        self.prune_every = prune_every
+        self._completions = 0
+
+    async def save(self, record: Dict[str, Any]) -> bool:
+        async with self.session_factory() as session:
+            saved = await escalations_repo.save_workflow(session, record)
+        if saved and record.get("completed_at"):
+            self._completions += 1
+            if self._completions % self.prune_every == 0:
+                await self.prune()
+        return saved
+
+    async def get(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        async with self.session_factory() as session:
+            return await escalations_repo.get_workflow(session, workflow_id, self._cutoff())
+
+    async def list_active(self, limit: int = 100) -> List[Dict[str, Any]]:
+        async with self.session_factory() as session:
+            return await escalations_repo.list_active_workflows(session, limit)
+
+    async def count(self) -> Dict[str, int]:
+        async with self.session_factory() as session:
+            return await escalations_repo.count_workflows(session, self._cutoff())
+
+    async def incr(self, name: str, amount: int = 1) -> None:
+        async with self.session_factory() as session:
+            await escalations_repo.incr_counter(session, name, amount)
+
+    async def counters(self) -> Dict[str, int]:
+        async with self.session_factory() as session:
+            return await escalations_repo.get_counters(session)
+
+    async def prune(self, now: Optional[datetime] = None) -> int:
+        async with self.session_factory() as session:
+            return await escalations_repo.prune_workflows(session, self._cutoff(now), self.max_completed)
+
+
+def create_workflow_store() -> WorkflowStore:
+    """
+    Create the workflow store selected by ``ESCALATION_STORE``.
+
+    ``sql`` uses the orchestrator database (shared by all workers) and
+    ``memory`` a process-local store.
+
+    Returns:
+        WorkflowStore: Configured store
+    """
+    try:
+        from .app.core.config import settings
+    except ImportError:
+        from app.core.config import settings  # type: ignore
+
+    options = {
+        "max_completed": settings.ESCALATION_COMPLETED_MAX,
+        "completed_ttl": settings.ESCALATION_COMPLETED_TTL,
+    }
+    if settings.ESCALATION_STORE == "memory":
+        return InMemoryWorkflowStore(**options)
+
+    from .database import AsyncSessionLocal
+
+    return SQLWorkflowStore(AsyncSessionLocal, **options)
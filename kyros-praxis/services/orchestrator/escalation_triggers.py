@@ -84,12 +84,14 @@ HYBRID MODEL SYSTEM:
 ESCALATION DETECTION PROCESS:
 ----------------------------
 1. Task Description Analysis:
-   - Scan for security, architecture, and complexity keywords
+   - Scan for security, architecture, and complexity keywords in a single
+     pass of one compiled pattern (whole-word prefix matching)
    - Identify high-risk patterns and indicators
    - Evaluate task type and requirements
 
 2. File Pattern Analysis:
-   - Examine files to be modified for risk patterns
+   - Examine files to be modified for risk patterns (high-risk globs compiled
+     once into a single matcher, extensible per project)
    - Identify high-risk file types and locations
    - Detect cross-service and multi-file changes
 
@@ -148,12 +150,13 @@ See Also:
 - main.py: Main orchestrator application that integrates escalation triggers
 """
 
+import hashlib
+import json
 import logging
 import re
 from dataclasses import dataclass
 from enum import Enum
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -188,6 +191,31 @@ class EscalationReason(Enum):
     MIGRATION_STRATEGY = "migration_strategy"  # Migration planning and execution
 
 
+class FileRisk(Enum):
+    """Risk labels of files touched by a task"""
+    
+    HIGH = "high"            # Matches a high-risk file glob
+    SENSITIVE = "sensitive"  # Security-related path (auth, security, crypto)
+    NORMAL = "normal"        # No risk indicators
+
+
+# Globs of files whose modification warrants escalation; projects add their
+# own with the ESCALATION_HIGH_RISK_FILES setting
+DEFAULT_HIGH_RISK_FILES = [
+    "**/auth*.py",
+    "**/security*.py",
+    "**/encryption*.py",
+    "**/database*.py",
+    "**/schema*.py",
+    "**/migration*.py",
+    "**/config*.py",
+    "**/settings*.py"
+]
+
+# Path fragments marking security-sensitive files
+SECURITY_PATH_KEYWORDS = ["auth", "security", "crypt", "encrypt"]
+
+
 class EscalationPriority(Enum):
     """Priority levels for escalation triggers"""
     
@@ -224,6 +252,204 @@ class EscalationAssessment:
     risk_assessment: Optional[str] = None
 
 
+class KeywordMatcher:
+    """
+    Single-pass matcher for named groups of keywords.
+    
+    All keywords of all groups are compiled into one regular expression
+    shaped as a prefix tree (alternatives share their common prefixes, so
+    the engine does not retry every keyword at every position), and a text
+    is scanned once however many groups and keywords there are.
+    
+    A keyword matches at the start of a word and may be followed by more
+    letters, so stems keep matching their inflections ("encrypt" matches
+    "encryption") while keywords inside other words do not ("key" does not
+    match "monkey"). Underscores and other non-alphanumeric characters
+    separate words ("user_auth" matches "auth").
+    
+    Args:
+        groups: Keyword lists by group name
+    """
+    
+    def __init__(self, groups: Dict[str, List[str]]):
+        self.groups = {name: list(keywords) for name, keywords in groups.items()}
+        
+        # Position of every keyword in each group containing it, to report
+        # hits in the group's declared order
+        self._positions: Dict[str, List[Tuple[str, int]]] = {}
+        for name, keywords in self.groups.items():
+            for index, keyword in enumerate(keywords):
+                self._positions.setdefault(keyword.lower(), []).append((name, index))
+        
+        # A match is the longest keyword at its position; shorter keywords
+        # matching there are prefixes of it
+        keywords = list(self._positions)
+        self._prefixes = {
+            keyword: [other for other in keywords if keyword.startswith(other)]
+            for keyword in keywords
+        }
+        self.pattern = re.compile(f"(?<![^\\W_])(?:{self._trie_pattern(keywords) or '(?!)'})")
+    
+    @classmethod
+    def _trie_pattern(cls, keywords: Iterable[str]) -> str:
+        """Build a regular expression matching the longest of the keywords, factored by common prefixes"""
+        trie: Dict[str, Any] = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        return cls._node_pattern(trie)
+    
+    @classmethod
+    def _node_pattern(cls, node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + cls._node_pattern(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # Greedy optional continuation: prefer the longer keyword
+        return f"(?:{pattern})?" if "" in node else pattern
+    
+    def match(self, text: str) -> Dict[str, List[str]]:
+        """
+        Find the keywords of every group occurring in a text.
+        
+        Args:
+            text: Text to scan
+            
+        Returns:
+            Dict[str, List[str]]: Matched keywords (each once, in declared
+                order) by group name, for groups with at least one match
+        """
+        found: Set[str] = set()
+        for keyword in self.pattern.findall(text.lower()):
+            found.update(self._prefixes[keyword])
+        
+        hits: Dict[str, List[Tuple[int, str]]] = {}
+        for keyword in found:
+            for name, index in self._positions[keyword]:
+                hits.setdefault(name, []).append((index, self.groups[name][index]))
+        return {name: [keyword for _, keyword in sorted(matched)] for name, matched in hits.items()}
+
+
+def _glob_to_regex(glob: str) -> str:
+    """Translate a glob to a regular expression where ``*`` and ``?`` stay within one path segment"""
+    parts = []
+    segments = glob.split("/")
+    for position, segment in enumerate(segments):
+        last = position == len(segments) - 1
+        if segment == "**":
+            parts.append(".*" if last else "(?:[^/]*/)*")
+            continue
+        index = 0
+        while index < len(segment):
+            char = segment[index]
+            if char == "*":
+                parts.append("[^/]*")
+            elif char == "?":
+                parts.append("[^/]")
+            elif char == "[" and segment.find("]", index + 2) != -1:
+                # Character class; a "]" right after "[" is a member
+                end = segment.find("]", index + 2)
+                body = segment[index + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                parts.append("[" + body.replace("\\", "\\\\") + "]")
+                index = end
+            else:
+                parts.append(re.escape(char))
+            index += 1
+        if not last:
+            parts.append("/")
+    return "".join(parts)
+
+
+def _normalize_path(path: str) -> str:
+    path = path.replace("\\", "/")
+    while path.startswith("./"):
+        path = path[2:]
+    return path
+
+
+class GlobMatcher:
+    """
+    Matcher for a set of file globs compiled into one regular expression.
+    
+    ``*`` and ``?`` match within one path segment and ``**`` matches any
+    number of directories (including none). Globs starting with ``/`` are
+    anchored at the project root; other globs match the end of a path at a
+    segment boundary, like ``PurePath.match`` (``config/*.py`` matches
+    ``app/config/base.py``). Globs without a directory part (``*.py`` or
+    ``**/auth*.py``) only look at the file name, so they are combined into a
+    separate expression matched against the last path segment. Matching is
+    case-insensitive (globs and paths are lower-cased, which is much faster
+    than a case-insensitive expression) and accepts Windows separators.
+    
+    Args:
+        patterns: Glob patterns
+    """
+    
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = [pattern for pattern in patterns if pattern]
+        name_globs, path_globs = [], []
+        for pattern in self.patterns:
+            pattern = pattern.lower()
+            anchored = pattern.startswith("/") and not pattern.startswith("/**/")
+            body = pattern.lstrip("/")
+            if anchored:
+                path_globs.append(_glob_to_regex(body))
+                continue
+            while body.startswith("**/"):
+                body = body[3:]
+            if "/" in body:
+                path_globs.append("(?:[^/]*/)*" + _glob_to_regex(body))
+            else:
+                name_globs.append(_glob_to_regex(body))
+        self._name_pattern = self._combine(name_globs)
+        self._path_pattern = self._combine(path_globs)
+    
+    @staticmethod
+    def _combine(expressions: List[str]) -> re.Pattern:
+        return re.compile("|".join(f"(?:{expression})" for expression in expressions) or "(?!)")
+    
+    def match(self, path: str) -> bool:
+        """
+        Check whether a path matches any of the globs.
+        
+        Args:
+            path: File path, relative to the project root
+            
+        Returns:
+            bool: True if at least one glob matches
+        """
+        path = _normalize_path(path).lower()
+        return (
+            self._name_pattern.fullmatch(path.rpartition("/")[2]) is not None
+            or self._path_pattern.fullmatch(path) is not None
+        )
+    
+    def filter(self, paths: Iterable[str]) -> List[str]:
+        """
+        Select the paths matching any of the globs.
+        
+        Args:
+            paths: File paths
+            
+        Returns:
+            List[str]: Matching paths, in input order
+        """
+        return [path for path in paths if self.match(path)]
+
+
+def _project_high_risk_files() -> List[str]:
+    """Return the project's extra high-risk globs (ESCALATION_HIGH_RISK_FILES), if configured"""
+    try:
+        from .app.core.config import settings
+    except ImportError:
+        return []
+    return [pattern for pattern in settings.ESCALATION_HIGH_RISK_FILES if pattern]
+
+
 class EscalationDetector:
     """
     Detects when tasks should be escalated to Claude 4.1 Opus.
@@ -237,6 +463,14 @@ class EscalationDetector:
     The detector uses pattern matching, keyword analysis, and file path
     examination to identify escalation triggers with associated confidence
     scores. It then makes a recommendation based on the collected evidence.
+    All keyword lists are compiled into one KeywordMatcher and the high-risk
+    file globs into one GlobMatcher at construction (call compile_patterns()
+    after changing them), so a task description is scanned once per analysis
+    and each file path is matched once against all globs.
+    
+    Args:
+        high_risk_files: High-risk file globs (default: DEFAULT_HIGH_RISK_FILES
+            plus the project's ESCALATION_HIGH_RISK_FILES setting)
     
     The hybrid model system consists of:
     - GLM-4.5: Junior AI model for routine tasks (cost-effective)
@@ -255,7 +489,7 @@ class EscalationDetector:
     - Multiple medium priority triggers with moderate confidence (>60%) escalate
     """
     
-    def __init__(self):
+    def __init__(self, high_risk_files: Optional[List[str]] = None):
         # Security-sensitive patterns
         self.security_patterns = {
             "auth": ["auth", "login", "password", "token", "jwt", "oauth", "session"],
@@ -286,19 +520,78 @@ class EscalationDetector:
         }
         
         # High-risk file patterns
-        self.high_risk_files = [
-            "**/auth*.py",
-            "**/security*.py",
-            "**/encryption*.py",
-            "**/database*.py",
-            "**/schema*.py",
-            "**/migration*.py",
-            "**/config*.py",
-            "**/settings*.py"
-        ]
+        if high_risk_files is None:
+            high_risk_files = DEFAULT_HIGH_RISK_FILES + _project_high_risk_files()
+        self.high_risk_files = list(high_risk_files)
+        
+        # Security-sensitive path fragments
+        self.security_path_keywords = list(SECURITY_PATH_KEYWORDS)
         
         # Critical file extensions
         self.critical_extensions = {".py", ".js", ".ts", ".go", ".java", ".rs", ".cpp", ".h"}
+        
+        # Complex task indicators
+        self.complexity_indicators = [
+            "complex", "difficult", "challenging", "intricate", "sophisticated",
+            "restructure", "redesign", "rewrite", "rearchitecture", "reimplement"
+        ]
+        
+        # Algorithmic complexity keywords
+        self.algorithm_keywords = ["algorithm", "optimization", "efficiency", "complexity", "big_o"]
+        
+        # Direct security mentions
+        self.security_direct_keywords = [
+            "security", "vulnerability", "exploit", "breach", "attack", "threat",
+            "secure", "unsafe", "risk", "protect", "defend"
+        ]
+        
+        self.compile_patterns()
+    
+    def compile_patterns(self) -> None:
+        """Compile all keyword lists and file globs into the detector's matchers (call again after changing them)"""
+        groups = {}
+        for prefix, patterns in (
+            ("security", self.security_patterns),
+            ("architecture", self.architecture_patterns),
+            ("performance", self.performance_patterns),
+            ("quality", self.quality_patterns),
+        ):
+            for category, keywords in patterns.items():
+                groups[f"{prefix}.{category}"] = keywords
+        groups["complexity"] = self.complexity_indicators
+        groups["algorithm"] = self.algorithm_keywords
+        groups["security_direct"] = self.security_direct_keywords
+        self.keyword_matcher = KeywordMatcher(groups)
+        
+        self.file_matcher = GlobMatcher(self.high_risk_files)
+        self._security_path_pattern = re.compile(
+            "|".join(re.escape(keyword.lower()) for keyword in self.security_path_keywords) or "(?!)"
+        )
+        
+        # Identifies this configuration, so cached assessments made with
+        # another one are not reused
+        self.config_fingerprint = hashlib.sha256(json.dumps(
+            [groups, self.high_risk_files, self.security_path_keywords, sorted(self.critical_extensions)]
+        ).encode()).hexdigest()
+    
+    def classify_paths(self, paths: Iterable[str]) -> List[FileRisk]:
+        """
+        Label the risk of each path.
+        
+        Args:
+            paths: File paths, relative to the project root
+            
+        Returns:
+            List[FileRisk]: HIGH for paths matching a high-risk glob, SENSITIVE
+                for other security-related paths and NORMAL otherwise, in the
+                order of the paths
+        """
+        match = self.file_matcher.match
+        sensitive = self._security_path_pattern.search
+        return [
+            FileRisk.HIGH if match(path) else FileRisk.SENSITIVE if sensitive(path.lower()) else FileRisk.NORMAL
+            for path in paths
+        ]
     
     def analyze_task_context(
         self,
@@ -353,31 +646,82 @@ class EscalationDetector:
         - Multiple medium priority triggers with moderate confidence (>60%) result in escalation
         - All other tasks are handled by the junior model (GLM-4.5)
         """
+        return self._analyze(
+            task_description,
+            files_to_modify,
+            current_files,
+            task_type,
+            self.keyword_matcher.match(task_description)
+        )
+    
+    def analyze_many(self, tasks: Iterable[Dict[str, Any]]) -> List[EscalationAssessment]:
+        """
+        Analyze a batch of tasks.
+        
+        Equivalent to calling analyze_task_context() for every task, but each
+        distinct task description is scanned only once per batch.
+        
+        Args:
+            tasks: Keyword arguments of analyze_task_context() per task
+                (task_description and files_to_modify required,
+                current_files and task_type optional)
+                
+        Returns:
+            List[EscalationAssessment]: Assessments in the order of the tasks
+        """
+        keyword_hits: Dict[str, Dict[str, List[str]]] = {}
+        assessments = []
+        for task in tasks:
+            description = task["task_description"]
+            hits = keyword_hits.get(description)
+            if hits is None:
+                hits = keyword_hits[description] = self.keyword_matcher.match(description)
+            assessments.append(self._analyze(
+                description,
+                task["files_to_modify"],
+                task.get("current_files") or [],
+                task.get("task_type", "implementation"),
+                hits
+            ))
+        return assessments
+    
+    def _analyze(
+        self,
+        task_description: str,
+        files_to_modify: List[str],
+        current_files: List[str],
+        task_type: str,
+        hits: Dict[str, List[str]]
+    ) -> EscalationAssessment:
+        """Run the analysis steps with precomputed keyword hits"""
         triggers = []
         
         # 1. Analyze task description for escalation keywords
-        triggers.extend(self._analyze_task_keywords(task_description))
+        triggers.extend(self._analyze_task_keywords(task_description, hits))
         
         # 2. Analyze files for escalation patterns
         triggers.extend(self._analyze_file_patterns(files_to_modify, current_files))
         
         # 3. Analyze task complexity
-        triggers.extend(self._analyze_complexity(task_description, files_to_modify))
+        triggers.extend(self._analyze_complexity(task_description, files_to_modify, hits))
         
         # 4. Analyze security and compliance aspects
-        triggers.extend(self._analyze_security_aspects(task_description, files_to_modify))
+        triggers.extend(self._analyze_security_aspects(task_description, files_to_modify, hits))
         
         # Calculate overall escalation decision
         return self._make_escalation_decision(triggers, task_type)
     
-    def _analyze_task_keywords(self, task_description: str) -> List[EscalationTrigger]:
+    def _analyze_task_keywords(
+        self, task_description: str, hits: Optional[Dict[str, List[str]]] = None
+    ) -> List[EscalationTrigger]:
         """Analyze task description for escalation-triggering keywords"""
         triggers = []
-        desc_lower = task_description.lower()
+        if hits is None:
+            hits = self.keyword_matcher.match(task_description)
         
         # Security escalation triggers
         for category, keywords in self.security_patterns.items():
-            matches = [kw for kw in keywords if kw in desc_lower]
+            matches = hits.get(f"security.{category}", [])
             if matches:
                 if category in ["auth", "encryption"]:
                     triggers.append(EscalationTrigger(
@@ -400,7 +744,7 @@ class EscalationDetector:
         
         # Architecture escalation triggers
         for category, keywords in self.architecture_patterns.items():
-            matches = [kw for kw in keywords if kw in desc_lower]
+            matches = hits.get(f"architecture.{category}", [])
             if len(matches) >= 2:  # Multiple architecture keywords
                 triggers.append(EscalationTrigger(
                     reason=EscalationReason.ARCHITECTURAL_DECISION,
@@ -413,7 +757,7 @@ class EscalationDetector:
         
         # Performance escalation triggers
         for category, keywords in self.performance_patterns.items():
-            matches = [kw for kw in keywords if kw in desc_lower]
+            matches = hits.get(f"performance.{category}", [])
             if matches:
                 if "optimization" in matches or "performance" in matches:
                     triggers.append(EscalationTrigger(
@@ -441,11 +785,7 @@ class EscalationDetector:
         triggers = []
         
         # Check for high-risk files
-        high_risk_matches = []
-        for file_path in files_to_modify:
-            for pattern in self.high_risk_files:
-                if Path(file_path).match(pattern):
-                    high_risk_matches.append(file_path)
+        high_risk_matches = self.file_matcher.filter(files_to_modify)
         
         if high_risk_matches:
             triggers.append(EscalationTrigger(
@@ -486,18 +826,16 @@ class EscalationDetector:
         
         return triggers
     
-    def _analyze_complexity(self, task_description: str, files_to_modify: List[str]) -> List[EscalationTrigger]:
+    def _analyze_complexity(
+        self, task_description: str, files_to_modify: List[str], hits: Optional[Dict[str, List[str]]] = None
+    ) -> List[EscalationTrigger]:
         """Analyze task complexity for escalation triggers"""
         triggers = []
+        if hits is None:
+            hits = self.keyword_matcher.match(task_description)
         
         # Complex task indicators
-        complexity_indicators = [
-            "complex", "difficult", "challenging", "intricate", "sophisticated",
-            "restructure", "redesign", "rewrite", "rearchitecture", "reimplement"
-        ]
-        
-        desc_lower = task_description.lower()
-        complexity_matches = [ind for ind in complexity_indicators if ind in desc_lower]
+        complexity_matches = hits.get("complexity", [])
         
         if complexity_matches:
             triggers.append(EscalationTrigger(
@@ -509,8 +847,7 @@ class EscalationDetector:
             ))
         
         # Algorithmic complexity
-        algorithm_keywords = ["algorithm", "optimization", "efficiency", "complexity", "big_o"]
-        algo_matches = [kw for kw in algorithm_keywords if kw in desc_lower]
+        algo_matches = hits.get("algorithm", [])
         
         if algo_matches:
             triggers.append(EscalationTrigger(
@@ -523,18 +860,16 @@ class EscalationDetector:
         
         return triggers
     
-    def _analyze_security_aspects(self, task_description: str, files_to_modify: List[str]) -> List[EscalationTrigger]:
+    def _analyze_security_aspects(
+        self, task_description: str, files_to_modify: List[str], hits: Optional[Dict[str, List[str]]] = None
+    ) -> List[EscalationTrigger]:
         """Analyze security aspects for escalation triggers"""
         triggers = []
+        if hits is None:
+            hits = self.keyword_matcher.match(task_description)
         
         # Direct security mentions
-        security_direct_keywords = [
-            "security", "vulnerability", "exploit", "breach", "attack", "threat",
-            "secure", "unsafe", "risk", "protect", "defend"
-        ]
-        
-        desc_lower = task_description.lower()
-        security_matches = [kw for kw in security_direct_keywords if kw in desc_lower]
+        security_matches = hits.get("security_direct", [])
         
         if security_matches:
             triggers.append(EscalationTrigger(
@@ -547,7 +882,7 @@ class EscalationDetector:
         
         # Check for file content analysis (would need actual file content in real implementation)
         for file_path in files_to_modify:
-            if any(sec_keyword in file_path.lower() for sec_keyword in ["auth", "security", "crypt", "encrypt"]):
+            if self._security_path_pattern.search(file_path.lower()):
                 triggers.append(EscalationTrigger(
                     reason=EscalationReason.CRITICAL_SECURITY,
                     priority=EscalationPriority.HIGH,
@@ -107,7 +107,8 @@ INTEGRATION WITH OTHER MODULES:
 - escalation_triggers.py: Provides initial escalation trigger detection
 - context_analysis.py: Delivers detailed context analysis for decision making
 - main.py: Exposes escalation endpoints and integrates with orchestrator
-- models.py: May use models for workflow persistence (future enhancement)
+- escalation_store.py: Workflow state backend shared across workers (SQL or in-memory)
+- escalation_scheduler.py: Priority queue and bounded worker pool running the workflows
 
 USAGE EXAMPLE:
 --------------
@@ -119,13 +120,13 @@ workflow = await submit_escalation(
     priority="high"
 )
 
-# Check workflow status
-status = get_escalation_status(workflow.workflow_id)
+# Check workflow status (answered from the shared store by any worker)
+status = await get_escalation_status(workflow.workflow_id)
 if status.outcome == EscalationOutcome.SUCCESS:
     print("Escalation completed successfully")
 
 # Get statistics
-stats = get_escalation_stats()
+stats = await get_escalation_stats()
 print(f"Total escalations: {stats['escalated']}")
 
 See Also:
@@ -135,28 +136,28 @@ See Also:
 - main.py: Main orchestrator application that exposes escalation endpoints
 """
 
-import asyncio
 import json
 import logging
 import time
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields, is_dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union, Callable
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, Callable, get_args, get_origin, get_type_hints
 from uuid import uuid4
 
 from .escalation_triggers import (
     EscalationDetector,
     EscalationAssessment,
-    EscalationTrigger,
-    should_escalate_task
+    EscalationTrigger
 )
 from .context_analysis import (
     ContextAnalyzer,
-    ContextAnalysisResult,
-    analyze_task_context
+    ContextAnalysisResult
 )
+from .assessment_cache import DEFAULT_MAX_ENTRIES, DEFAULT_TTL_SECONDS, AssessmentCache
+from .escalation_store import InMemoryWorkflowStore, WorkflowStore, create_workflow_store
+from .escalation_scheduler import EscalationScheduler, SchedulerFull
 
 logger = logging.getLogger(__name__)
 
@@ -204,6 +205,45 @@ class EscalationRequest:
     metadata: Dict[str, Any]
 
 
+def _encode(value: Any) -> Any:
+    """Convert dataclasses, enums and datetimes to JSON-compatible values."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: _encode(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    return value
+
+
+def _decode(hint: Any, value: Any) -> Any:
+    """Rebuild a value of the annotated type from its _encode() form."""
+    if value is None:
+        return None
+    origin = get_origin(hint)
+    args = get_args(hint)
+    if origin is Union:
+        return _decode(next(arg for arg in args if arg is not type(None)), value)
+    if origin is list:
+        return [_decode(args[0], item) for item in value] if args else list(value)
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            return tuple(_decode(args[0], item) for item in value)
+        return tuple(_decode(arg, item) for arg, item in zip(args, value))
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        return hint(value)
+    if hint is datetime:
+        return datetime.fromisoformat(value)
+    if is_dataclass(hint):
+        hints = get_type_hints(hint)
+        return hint(**{f.name: _decode(hints[f.name], value[f.name]) for f in fields(hint) if f.name in value})
+    return value
+
+
 @dataclass
 class EscalationWorkflow:
     """Complete escalation workflow instance"""
@@ -214,35 +254,28 @@ class EscalationWorkflow:
     current_step: int
     total_steps: int
     steps_completed: List[str]
+    retry_count: int
+    max_retries: int
+    started_at: datetime
+    execution_log: List[Dict[str, Any]]
     assessment: Optional[EscalationAssessment] = None
     context_analysis: Optional[ContextAnalysisResult] = None
     outcome: Optional[EscalationOutcome] = None
     error_message: Optional[str] = None
-    retry_count: int
-    max_retries: int
-    started_at: datetime
     completed_at: Optional[datetime] = None
-    execution_log: List[Dict[str, Any]]
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization"""
-        return {
-            "workflow_id": self.workflow_id,
-            "request": asdict(self.request),
-            "state": self.state.value,
-            "current_step": self.current_step,
-            "total_steps": self.total_steps,
-            "steps_completed": self.steps_completed,
-            "assessment": asdict(self.assessment) if self.assessment else None,
-            "context_analysis": asdict(self.context_analysis) if self.context_analysis else None,
-            "outcome": self.outcome.value if self.outcome else None,
-            "error_message": self.error_message,
-            "retry_count": self.retry_count,
-            "max_retries": self.max_retries,
-            "started_at": self.started_at.isoformat(),
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "execution_log": self.execution_log
-        }
+        """Convert to a JSON-compatible dictionary for serialization"""
+        return _encode(self)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EscalationWorkflow":
+        """Rebuild a workflow from the output of to_dict()"""
+        return _decode(cls, data)
+
+
+class WorkflowCancelled(Exception):
+    """Raised inside a running workflow whose stored state was finalized elsewhere"""
 
 
 class EscalationEngine:
@@ -258,33 +291,69 @@ class EscalationEngine:
     The engine handles workflow state management, concurrency control,
     error handling, retries, and statistics tracking. It provides a complete
     automation solution for the hybrid AI model system.
+    
+    Workflow snapshots and statistics counters are kept in a WorkflowStore
+    (escalation_store.py). With a shared store, any worker can answer status
+    and statistics requests for workflows run by another worker. Each worker
+    only keeps the workflows it is running itself in memory.
+    
+    Submitted workflows are run by an EscalationScheduler
+    (escalation_scheduler.py): at most ``max_concurrent_workflows`` run at
+    once in this process, the rest wait in a queue ordered by request
+    priority, and a workflow still unfinished ``timeout_seconds`` after
+    submission is cancelled with outcome TIMEOUT.
+    
+    Args:
+        store: Workflow state backend (default: a process-local in-memory store)
+        max_concurrent_workflows: Size of the worker pool running workflows
+        max_queued_workflows: Maximum number of workflows waiting to run
+            (0 for unbounded)
+        assessment_cache_size: Detection and analysis results memoized for
+            resubmitted tasks (0 to disable)
+        assessment_cache_ttl: Seconds a memoized result is reused
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        store: Optional[WorkflowStore] = None,
+        max_concurrent_workflows: int = 5,
+        max_queued_workflows: int = 10000,
+        assessment_cache_size: int = DEFAULT_MAX_ENTRIES,
+        assessment_cache_ttl: float = DEFAULT_TTL_SECONDS,
+    ):
         self.detector = EscalationDetector()
         self.context_analyzer = ContextAnalyzer()
         
-        # Workflow storage (in-memory for now, could be database-backed)
+        # Detection and analysis results of recently seen tasks, shared with
+        # the /detect and /analyze endpoints
+        self.assessment_cache = AssessmentCache(
+            self.detector,
+            self.context_analyzer,
+            max_entries=assessment_cache_size,
+            ttl_seconds=assessment_cache_ttl,
+        )
+        
+        # Shared workflow snapshots and counters; queued and running
+        # workflows of this process
+        self.store = store if store is not None else InMemoryWorkflowStore()
         self.active_workflows: Dict[str, EscalationWorkflow] = {}
-        self.completed_workflows: Dict[str, EscalationWorkflow] = {}
         
         # Configuration
-        self.max_concurrent_workflows = 5
+        self.max_concurrent_workflows = max_concurrent_workflows
         self.default_timeout = 300  # 5 minutes
         self.max_retries = 3
         
+        # Worker pool executing workflows in priority order
+        self.scheduler = EscalationScheduler(
+            self._execute_workflow,
+            workers=max_concurrent_workflows,
+            max_queue=max_queued_workflows,
+            on_timeout=self._handle_timeout,
+        )
+        
         # Event handlers
         self.escalation_handlers: Dict[str, Callable] = {}
         self.completion_handlers: Dict[str, Callable] = {}
-        
-        # Statistics
-        self.stats = {
-            "total_requests": 0,
-            "escalated": 0,
-            "completed": 0,
-            "failed": 0,
-            "fallback_used": 0
-        }
     
     async def submit_escalation_request(
         self,
@@ -300,14 +369,10 @@ class EscalationEngine:
         """
         Submit a new escalation request to the workflow engine.
         
-        This method creates a new escalation workflow and begins processing
-        the request through the automated escalation pipeline. It performs
-        initial validation, creates workflow tracking structures, and starts
-        the asynchronous execution process.
-        
-        The method checks concurrency limits and creates a comprehensive
-        EscalationRequest object with all necessary parameters before
-        initializing the workflow execution.
+        This method creates a new escalation workflow and queues it for the
+        automated escalation pipeline. It performs initial validation, creates
+        workflow tracking structures, and hands the workflow to the scheduler,
+        which runs it once a worker is free (higher priorities first).
         
         Args:
             task_description: Description of the task to be performed,
@@ -321,9 +386,9 @@ class EscalationEngine:
             requester: Identifier for who requested the escalation (user, system,
                 automated process, etc.)
             priority: Priority level of the request (low, normal, high, critical)
-                which may affect processing order or resource allocation
-            timeout_seconds: Custom timeout for the workflow execution
-                (defaults to engine's default_timeout setting)
+                which determines its position in the scheduler queue
+            timeout_seconds: Custom deadline for the workflow, counted from
+                submission (defaults to engine's default_timeout setting)
             metadata: Optional dictionary of additional metadata that may
                 be useful for the workflow execution or auditing
             
@@ -332,12 +397,12 @@ class EscalationEngine:
             which can be used to track status and retrieve results
             
         Raises:
-            Exception: If maximum concurrent workflows limit is reached
+            SchedulerFull: If the scheduler queue is at capacity
         """
         
-        # Check concurrency limit
-        if len(self.active_workflows) >= self.max_concurrent_workflows:
-            raise Exception("Maximum concurrent workflows reached")
+        # Reject before storing anything when the queue cannot take the workflow
+        if self.scheduler.full():
+            raise SchedulerFull("Escalation queue is full")
         
         # Create request
         request = EscalationRequest(
@@ -372,12 +437,6 @@ class EscalationEngine:
             execution_log=[]
         )
         
-        # Store workflow
-        self.active_workflows[workflow.workflow_id] = workflow
-        
-        # Update statistics
-        self.stats["total_requests"] += 1
-        
         # Log workflow creation
         workflow.execution_log.append({
             "timestamp": datetime.utcnow().isoformat(),
@@ -386,32 +445,56 @@ class EscalationEngine:
             "message": f"Escalation workflow created: {workflow.workflow_id}"
         })
         
+        # Store workflow
+        self.active_workflows[workflow.workflow_id] = workflow
+        await self.store.save(workflow.to_dict())
+        
+        # Update statistics
+        await self.store.incr("total_requests")
+        
         logger.info(f"Created escalation workflow {workflow.workflow_id}")
         
-        # Start workflow execution
-        asyncio.create_task(self._execute_workflow(workflow))
+        # Queue workflow execution
+        try:
+            self.scheduler.submit(workflow)
+        except SchedulerFull as e:
+            # Queue filled up by concurrent submissions while storing
+            await self._handle_workflow_error(workflow, e)
+            raise
         
         return workflow
     
+    async def _checkpoint(self, workflow: EscalationWorkflow) -> None:
+        """Persist the workflow; stop if it was finalized elsewhere (e.g. cancelled by another worker)"""
+        if not await self.store.save(workflow.to_dict()):
+            raise WorkflowCancelled(workflow.workflow_id)
+    
+    async def _finish(self, workflow: EscalationWorkflow) -> None:
+        """Persist the final state and release the workflow from this process"""
+        self.active_workflows.pop(workflow.workflow_id, None)
+        await self.store.save(workflow.to_dict())
+    
     async def _execute_workflow(self, workflow: EscalationWorkflow) -> None:
         """Execute the escalation workflow"""
         try:
             # Step 1: Detect escalation triggers
             await self._step_detection(workflow)
+            await self._checkpoint(workflow)
             
             # Step 2: Analyze context
             await self._step_analysis(workflow)
+            await self._checkpoint(workflow)
             
             # Step 3: Make escalation decision
             await self._step_decision(workflow)
+            await self._checkpoint(workflow)
             
             # Step 4: Execute escalation (if needed)
             if workflow.assessment and workflow.assessment.should_escalate:
                 await self._step_escalation(workflow)
+                await self._checkpoint(workflow)
             else:
-                # Mark as completed with no escalation needed
-                workflow.state = WorkflowState.COMPLETED
-                workflow.completed_at = datetime.utcnow()
+                # No escalation needed; the workflow completes after execution and validation
                 workflow.outcome = EscalationOutcome.SUCCESS
                 workflow.execution_log.append({
                     "timestamp": datetime.utcnow().isoformat(),
@@ -422,6 +505,7 @@ class EscalationEngine:
             
             # Step 5: Execute task (with appropriate model)
             await self._step_execution(workflow)
+            await self._checkpoint(workflow)
             
             # Step 6: Validate results
             await self._step_validation(workflow)
@@ -433,14 +517,16 @@ class EscalationEngine:
             if workflow.outcome is None:
                 workflow.outcome = EscalationOutcome.SUCCESS
             
-            self.stats["completed"] += 1
+            await self.store.incr("completed")
             
             # Move to completed workflows
-            self.completed_workflows[workflow.workflow_id] = workflow
-            del self.active_workflows[workflow.workflow_id]
+            await self._finish(workflow)
             
             logger.info(f"Completed escalation workflow {workflow.workflow_id} with outcome {workflow.outcome.value}")
             
+        except WorkflowCancelled:
+            self.active_workflows.pop(workflow.workflow_id, None)
+            logger.info(f"Stopped escalation workflow {workflow.workflow_id}: finalized by another worker")
         except Exception as e:
             logger.error(f"Error in workflow {workflow.workflow_id}: {str(e)}")
             await self._handle_workflow_error(workflow, e)
@@ -451,7 +537,7 @@ class EscalationEngine:
         workflow.current_step = 1
         
         try:
-            assessment = should_escalate_task(
+            assessment = self.assessment_cache.detect(
                 task_description=workflow.request.task_description,
                 files_to_modify=workflow.request.files_to_modify,
                 current_files=workflow.request.current_files,
@@ -488,7 +574,7 @@ class EscalationEngine:
             # Using empty dict for now
             file_contents = {}
             
-            context_analysis = analyze_task_context(
+            context_analysis = self.assessment_cache.analyze(
                 task_description=workflow.request.task_description,
                 files_to_modify=workflow.request.files_to_modify,
                 file_contents=file_contents,
@@ -543,7 +629,7 @@ class EscalationEngine:
             assessment.should_escalate = should_escalate
             
             if should_escalate:
-                self.stats["escalated"] += 1
+                await self.store.incr("escalated")
             
             workflow.steps_completed.append("decision")
             
@@ -683,47 +769,69 @@ class EscalationEngine:
         workflow.completed_at = datetime.utcnow()
         workflow.outcome = EscalationOutcome.FAILED
         
-        self.stats["failed"] += 1
+        await self.store.incr("failed")
         
         # Move to completed workflows
-        self.completed_workflows[workflow.workflow_id] = workflow
-        del self.active_workflows[workflow.workflow_id]
+        await self._finish(workflow)
         
         logger.error(f"Workflow {workflow.workflow_id} failed: {str(error)}")
     
-    def get_workflow_status(self, workflow_id: str) -> Optional[EscalationWorkflow]:
-        """Get the current status of a workflow"""
-        return self.active_workflows.get(workflow_id) or self.completed_workflows.get(workflow_id)
+    async def _handle_timeout(self, workflow: EscalationWorkflow) -> None:
+        """Finalize a workflow cancelled by the scheduler at its deadline"""
+        workflow.state = WorkflowState.FAILED
+        workflow.error_message = f"Workflow exceeded its timeout of {workflow.request.timeout_seconds} seconds"
+        workflow.completed_at = datetime.utcnow()
+        workflow.outcome = EscalationOutcome.TIMEOUT
+        
+        await self.store.incr("timed_out")
+        await self._finish(workflow)
+        
+        logger.warning(f"Workflow {workflow.workflow_id} timed out")
     
-    def get_active_workflows(self) -> List[EscalationWorkflow]:
-        """Get all active workflows"""
-        return list(self.active_workflows.values())
+    async def get_workflow_status(self, workflow_id: str) -> Optional[EscalationWorkflow]:
+        """Get the current status of a workflow, including workflows run by other workers"""
+        workflow = self.active_workflows.get(workflow_id)
+        if workflow is not None:
+            return workflow
+        record = await self.store.get(workflow_id)
+        return EscalationWorkflow.from_dict(record) if record is not None else None
     
-    def get_workflow_statistics(self) -> Dict[str, Any]:
-        """Get workflow statistics"""
+    async def get_active_workflows(self, limit: int = 100) -> List[EscalationWorkflow]:
+        """Get active workflows of all workers, oldest first"""
+        return [EscalationWorkflow.from_dict(record) for record in await self.store.list_active(limit)]
+    
+    async def get_workflow_statistics(self) -> Dict[str, Any]:
+        """Get workflow statistics aggregated across workers, plus this worker's scheduler and cache metrics"""
+        stats = {"total_requests": 0, "escalated": 0, "completed": 0, "failed": 0, "timed_out": 0, "fallback_used": 0}
+        stats.update(await self.store.counters())
+        counts = await self.store.count()
         return {
-            **self.stats,
-            "active_workflows": len(self.active_workflows),
-            "completed_workflows": len(self.completed_workflows),
-            "success_rate": self.stats["completed"] / max(self.stats["total_requests"], 1)
+            **stats,
+            "active_workflows": counts["active"],
+            "completed_workflows": counts["completed"],
+            "success_rate": stats["completed"] / max(stats["total_requests"], 1),
+            "scheduler": self.scheduler.stats(),
+            "assessment_cache": self.assessment_cache.stats(),
         }
     
-    def cancel_workflow(self, workflow_id: str) -> bool:
-        """Cancel a running workflow"""
-        if workflow_id in self.active_workflows:
-            workflow = self.active_workflows[workflow_id]
-            workflow.state = WorkflowState.FAILED
-            workflow.completed_at = datetime.utcnow()
-            workflow.outcome = EscalationOutcome.CANCELLED
-            
-            # Move to completed
-            self.completed_workflows[workflow_id] = workflow
-            del self.active_workflows[workflow_id]
-            
-            logger.info(f"Cancelled workflow {workflow_id}")
-            return True
+    async def cancel_workflow(self, workflow_id: str) -> bool:
+        """Cancel a queued or running workflow, whichever worker is running it"""
+        workflow = await self.get_workflow_status(workflow_id)
+        if workflow is None or workflow.completed_at is not None:
+            return False
+        
+        workflow.state = WorkflowState.FAILED
+        workflow.completed_at = datetime.utcnow()
+        workflow.outcome = EscalationOutcome.CANCELLED
         
-        return False
+        # Move to completed; a worker running the workflow stops at its next checkpoint
+        if not await self.store.save(workflow.to_dict()):
+            return False
+        self.active_workflows.pop(workflow_id, None)
+        self.scheduler.cancel(workflow_id)
+        
+        logger.info(f"Cancelled workflow {workflow_id}")
+        return True
 
 
 # Global escalation engine instance
@@ -734,7 +842,17 @@ def get_escalation_engine() -> EscalationEngine:
     """Get the global escalation engine instance"""
     global _escalation_engine
     if _escalation_engine is None:
-        _escalation_engine = EscalationEngine()
+        try:
+            from .app.core.config import settings
+        except ImportError:
+            from app.core.config import settings  # type: ignore
+        _escalation_engine = EscalationEngine(
+            store=create_workflow_store(),
+            max_concurrent_workflows=settings.ESCALATION_MAX_CONCURRENT,
+            max_queued_workflows=settings.ESCALATION_QUEUE_MAX,
+            assessment_cache_size=settings.ESCALATION_ASSESSMENT_CACHE_SIZE,
+            assessment_cache_ttl=settings.ESCALATION_ASSESSMENT_CACHE_TTL,
+        )
     return _escalation_engine
 
 
@@ -778,7 +896,7 @@ async def submit_escalation(
     )
 
 
-def get_escalation_status(workflow_id: str) -> Optional[EscalationWorkflow]:
+async def get_escalation_status(workflow_id: str) -> Optional[EscalationWorkflow]:
     """
     Get the current status of an escalation workflow.
     
@@ -793,10 +911,10 @@ def get_escalation_status(workflow_id: str) -> Optional[EscalationWorkflow]:
         EscalationWorkflow instance if found, None otherwise
     """
     engine = get_escalation_engine()
-    return engine.get_workflow_status(workflow_id)
+    return await engine.get_workflow_status(workflow_id)
 
 
-def get_escalation_stats() -> Dict[str, Any]:
+async def get_escalation_stats() -> Dict[str, Any]:
     """
     Get statistics about the escalation engine's operation.
     
@@ -808,4 +926,4 @@ def get_escalation_stats() -> Dict[str, Any]:
         Dictionary containing various statistics about the escalation engine
     """
     engine = get_escalation_engine()
-    return engine.get_workflow_statistics()
\ No newline at end of file
+    return await engine.get_workflow_statistics()
\ No newline at end of file
@@ -0,0 +1,773 @@
+"""
+Segmented, indexed event log for the Kyros Orchestrator service.
+
+This module implements the storage engine behind the ``/events`` router. Events
+are stored as newline-delimited JSON, exactly as before, but the log is split
+into rolling segments and each segment carries a sidecar offset index so that
+appends and seeks no longer depend on the size of the history.
+
+MODULE RESPONSIBILITIES:
+------------------------
+1. Append Path:
+   - O(1) appends that never re-read existing data
+   - Monotonically increasing sequence numbers for every event
+   - Sequence-number ETags maintained incrementally on append
+   - Batched fsync (every N appends or every T seconds, whichever comes first)
+
+2. Segment Management:
+   - The active segment keeps the configured file name (e.g. ``events.jsonl``)
+     so existing tooling that reads the file directly keeps working
+   - When the active segment exceeds ``segment_bytes`` it is sealed by renaming
+     it to ``<stem>.<base_seq>.jsonl`` and a fresh active segment is started
+   - Optional retention of the newest ``retain_segments`` sealed segments
+
+3. Live Following:
+   - EventLogWatcher wakes tailing subscribers as soon as an event is appended,
+     either in-process (append listeners) or by another process (inotify via
+     watchfiles when installed, size polling otherwise)
+
+4. Offset Index:
+   - Every segment has a ``<segment>.idx`` sidecar with a fixed-size header
+     followed by one 8-byte file position per event
+   - Seeking to sequence ``n`` is a bisect over segment bases plus one index read
+   - Missing or short indexes (legacy logs, crashes) are rebuilt on open
+
+INDEX FORMAT:
+-------------
+    header: magic (8 bytes) | base_seq (uint64) | epoch (uint64)
+    body:   position (uint64) per event, big-endian
+
+The ``epoch`` is chosen randomly when a log directory is first created and is
+carried over to every new segment. It is part of the ETag so that a wiped and
+recreated log never produces an ETag that collides with an older one.
+
+USAGE EXAMPLE:
+--------------
+    log = get_event_log(Path("/data/events"), "events.jsonl")
+    seq = log.append({"event": "task_created", "target": "task-1"})
+    for seq, event in log.read(after=seq - 10):
+        print(seq, event)
+
+See Also:
+--------
+- routers/events.py: HTTP API that appends to and tails this log
+"""
+
+import asyncio
+import bisect
+import json
+import os
+import secrets
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from watchfiles import awatch
+    HAVE_WATCHFILES = True
+except ImportError:
+    awatch = None
+    HAVE_WATCHFILES = False
+
+INDEX_MAGIC = b"KYEVIDX2"
+_HEADER = struct.Struct(">8sQQ")
+_ENTRY = struct.Struct(">Q")
+
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024  # 64MB
+DEFAULT_FSYNC_EVERY = 64
+DEFAULT_FSYNC_INTERVAL = 1.0  # seconds
+DEFAULT_POLL_INTERVAL = 0.5  # seconds, used when watchfiles is unavailable
+
+
+def parse_event_line(raw: bytes) -> List[Dict[str, Any]]:
+    """
+    Parse one stored line into event dictionaries.
+
+    Older writers occasionally concatenated JSON objects without a newline, so
+    a single line may hold several events separated by ``}{``. Malformed
+    fragments are skipped rather than failing the whole read.
+
+    Args:
+        raw (bytes): Raw line read from a segment file
+
+    Returns:
+        List[Dict[str, Any]]: Decoded events (usually exactly one)
+    """
+    text = raw.decode("utf-8", errors="replace").strip()
+    if not text:
+        return []
+    events = []
+    for part in _split_events(text):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            events.append(json.loads(part))
+        except Exception:
+            # Skip malformed segment
+            continue
+    return events
+
+
+def _split_events(text: str) -> List[str]:
+    """Split a line into its ``}{``-joined events, keeping single events whole."""
+    if "}{" not in text:
+        return [text]
+    try:
+        # A lone event whose string values contain "}{"
+        json.loads(text)
+        return [text]
+    except ValueError:
+        return text.replace("}{", "}\n{").splitlines()
+
+
+def _event_starts(line: bytes) -> List[int]:
+    """Return the offset of every event within a line, matching parse_event_line."""
+    if b"}{" not in line:
+        return [0]
+    try:
+        json.loads(line)
+        return [0]
+    except ValueError:
+        pass
+    starts = [0]
+    at = line.find(b"}{")
+    while at != -1:
+        starts.append(at + 1)
+        at = line.find(b"}{", at + 1)
+    return starts
+
+
+class _Segment:
+    """
+    A single log segment together with its in-memory offset index.
+
+    Attributes:
+        path (Path): Path of the segment data file
+        base_seq (int): Sequence number of the first event in the segment
+        positions (List[int]): Byte position of each event within the file
+        size (int): Number of bytes of complete lines in the data file
+    """
+
+    __slots__ = ("path", "base_seq", "positions", "size")
+
+    def __init__(self, path: Path, base_seq: int, positions: List[int], size: int):
+        self.path = path
+        self.base_seq = base_seq
+        self.positions = positions
+        self.size = size
+
+    @property
+    def index_path(self) -> Path:
+        return index_path_for(self.path)
+
+    @property
+    def next_seq(self) -> int:
+        return self.base_seq + len(self.positions)
+
+
+def index_path_for(segment_path: Path) -> Path:
+    """Return the sidecar index path for a segment data file."""
+    return segment_path.with_name(segment_path.name + ".idx")
+
+
+def _scan_positions(path: Path, start: int = 0) -> Tuple[List[int], int]:
+    """
+    Scan a data file from ``start`` and return the start of every event.
+
+    Each complete line normally holds one event; legacy lines with several
+    ``}{``-joined events get one position per event so that every event has
+    its own sequence number. A trailing line without a newline (torn write)
+    is not included and the returned size stops before it, so it can be
+    truncated by the caller.
+    """
+    positions: List[int] = []
+    pos = start
+    with open(path, "rb") as f:
+        f.seek(start)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            if line.strip():
+                positions.extend(pos + offset for offset in _event_starts(line))
+            pos += len(line)
+    return positions, pos
+
+
+def _read_index(path: Path) -> Optional[Tuple[int, int, List[int]]]:
+    """Read an index file, returning ``(base_seq, epoch, positions)`` or None."""
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    if len(data) < _HEADER.size:
+        return None
+    magic, base_seq, epoch = _HEADER.unpack_from(data)
+    if magic != INDEX_MAGIC:
+        return None
+    body = data[_HEADER.size:]
+    count = len(body) // _ENTRY.size
+    positions = list(struct.unpack(f">{count}Q", body[: count * _ENTRY.size]))
+    return base_seq, epoch, positions
+
+
+def _write_index(path: Path, base_seq: int, epoch: int, positions: List[int]) -> None:
+    """Atomically (re)write an index file."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(INDEX_MAGIC, base_seq, epoch))
+        f.write(struct.pack(f">{len(positions)}Q", *positions))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class EventLog:
+    """
+    Append-only, segmented event log with sidecar offset indexes.
+
+    All public methods are thread-safe. Appends take a short lock, write one
+    line to the active segment and one entry to its index, and only fsync
+    when the batching thresholds are reached. Reads do not hold the lock
+    while doing I/O; they snapshot the segment list and positions and then
+    read through their own file handles.
+
+    Args:
+        directory (Path): Directory holding the segment files
+        filename (str): Name of the active segment (default: events.jsonl)
+        segment_bytes (int): Size at which the active segment is sealed
+        fsync_every (int): Fsync after this many unsynced appends
+        fsync_interval (float): Maximum seconds an append stays unsynced; a
+            background timer flushes a trailing batch that no later append does
+        retain_segments (Optional[int]): Sealed segments to keep (None keeps all)
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        filename: str = "events.jsonl",
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        fsync_every: int = DEFAULT_FSYNC_EVERY,
+        fsync_interval: float = DEFAULT_FSYNC_INTERVAL,
+        retain_segments: Optional[int] = None,
+    ):
+        self.directory = Path(directory)
+        self.filename = filename
+        self.segment_bytes = segment_bytes
+        self.fsync_every = max(1, fsync_every)
+        self.fsync_interval = fsync_interval
+        self.retain_segments = retain_segments
+
+        self._lock = threading.Lock()
+        self._segments: List[_Segment] = []
+        self._bases: List[int] = []
+        self._data_file = None
+        self._index_file = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._sync_timer: Optional[threading.Timer] = None
+        self._listeners: List[Callable[[int], None]] = []
+        self.epoch = 0
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._open()
+
+    # ------------------------------------------------------------------
+    # Opening and recovery
+    # ------------------------------------------------------------------
+
+    @property
+    def active_path(self) -> Path:
+        return self.directory / self.filename
+
+    def _sealed_name(self, base_seq: int) -> str:
+        stem, dot, suffix = self.filename.rpartition(".")
+        if not dot:
+            return f"{self.filename}.{base_seq:012d}"
+        return f"{stem}.{base_seq:012d}.{suffix}"
+
+    def _sealed_paths(self) -> List[Tuple[int, Path]]:
+        stem, dot, suffix = self.filename.rpartition(".")
+        found = []
+        for path in self.directory.iterdir():
+            name = path.name
+            if path == self.active_path or name.endswith(".idx") or name.endswith(".tmp"):
+                continue
+            if dot:
+                prefix, tail = f"{stem}.", f".{suffix}"
+            else:
+                prefix, tail = f"{self.filename}.", ""
+            if not (name.startswith(prefix) and name.endswith(tail)):
+                continue
+            middle = name[len(prefix): len(name) - len(tail) if tail else None]
+            if middle.isdigit():
+                found.append((int(middle), path))
+        return sorted(found)
+
+    def _load_segment(self, path: Path, base_seq: int) -> _Segment:
+        """Load a segment, rebuilding its index if it is missing or stale."""
+        index = _read_index(index_path_for(path))
+        size = path.stat().st_size if path.exists() else 0
+        if index is not None and index[0] == base_seq:
+            _, epoch, positions = index
+            self.epoch = self.epoch or epoch
+            # Discard entries pointing past the data (truncated file)
+            del positions[bisect.bisect_left(positions, size):]
+            # Index may lag the data after a crash; scan only the tail
+            start = 0
+            if positions:
+                with open(path, "rb") as f:
+                    f.seek(positions[-1])
+                    start = positions[-1] + len(f.readline())
+            tail, end = _scan_positions(path, start) if size > start else ([], start)
+            if tail or end != size:
+                positions.extend(tail)
+                _write_index(index_path_for(path), base_seq, self.epoch, positions)
+            return _Segment(path, base_seq, positions, end)
+
+        positions, end = _scan_positions(path) if size else ([], 0)
+        if not self.epoch:
+            self.epoch = secrets.randbits(63)
+        _write_index(index_path_for(path), base_seq, self.epoch, positions)
+        return _Segment(path, base_seq, positions, end)
+
+    def _open(self) -> None:
+        next_base = 0
+        for base_seq, path in self._sealed_paths():
+            segment = self._load_segment(path, base_seq)
+            self._segments.append(segment)
+            next_base = segment.next_seq
+
+        active_index = _read_index(index_path_for(self.active_path))
+        active_base = active_index[0] if active_index else next_base
+        if not self.active_path.exists():
+            self.active_path.touch()
+        active = self._load_segment(self.active_path, active_base)
+
+        # Drop a torn trailing write so the next append starts on a fresh line
+        if self.active_path.stat().st_size != active.size:
+            with open(self.active_path, "r+b") as f:
+                f.truncate(active.size)
+
+        self._segments.append(active)
+        self._bases = [s.base_seq for s in self._segments]
+        self._open_active_files()
+
+    def _open_active_files(self) -> None:
+        self._data_file = open(self.active_path, "ab")
+        self._index_file = open(index_path_for(self.active_path), "ab")
+
+    # ------------------------------------------------------------------
+    # Append path
+    # ------------------------------------------------------------------
+
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest retained event."""
+        return self._segments[0].base_seq
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number that the next appended event will receive."""
+        return self._segments[-1].next_seq
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the newest event, or -1 if the log is empty."""
+        return self.next_seq - 1
+
+    @property
+    def etag(self) -> str:
+        """
+        ETag identifying the current state of the log.
+
+        The log is append-only, so the epoch plus the next sequence number
+        uniquely identifies its contents without hashing any data.
+        """
+        return f'"{self.epoch:x}-{self.next_seq}"'
+
+    def append(self, event: Dict[str, Any]) -> int:
+        """
+        Append an event and return its sequence number.
+
+        Args:
+            event (Dict[str, Any]): JSON-serializable event payload
+
+        Returns:
+            int: Sequence number assigned to the event
+        """
+        line = (json.dumps(event) + "\n").encode("utf-8")
+        with self._lock:
+            self._catch_up_locked()
+            active = self._segments[-1]
+            if active.positions and active.size + len(line) > self.segment_bytes:
+                self._roll()
+                active = self._segments[-1]
+
+            seq = active.next_seq
+            self._data_file.write(line)
+            self._index_file.write(_ENTRY.pack(active.size))
+            # Flush to the OS so concurrent readers observe the event
+            self._data_file.flush()
+            self._index_file.flush()
+            active.positions.append(active.size)
+            active.size += len(line)
+
+            self._unsynced += 1
+            now = time.monotonic()
+            if self._unsynced >= self.fsync_every or now - self._last_sync >= self.fsync_interval:
+                self._sync_locked(now)
+            elif self._sync_timer is None:
+                # Sync this batch within fsync_interval even if no append follows
+                self._sync_timer = threading.Timer(self.fsync_interval, self._timed_sync)
+                self._sync_timer.daemon = True
+                self._sync_timer.start()
+
+        for listener in list(self._listeners):
+            try:
+                listener(seq)
+            except Exception:
+                # A broken listener must never fail an append
+                pass
+        return seq
+
+    def add_listener(self, listener: Callable[[int], None]) -> None:
+        """
+        Register a callback invoked with the sequence number of every append.
+
+        Listeners run on the appending thread after the lock is released, so
+        they must be cheap and thread-safe (e.g. ``loop.call_soon_threadsafe``).
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[int], None]) -> None:
+        """Unregister a callback added with add_listener()."""
+        try:
+            self._listeners.remove(listener)
+        except ValueError:
+            pass
+
+    def _catch_up_locked(self) -> None:
+        """
+        Index lines appended to the active segment by other writers.
+
+        Collaboration tooling (the collab MCP server, ``scripts/state_update.py``)
+        appends to ``events.jsonl`` directly. Comparing the file size with our
+        own bookkeeping is a single ``fstat``; only the foreign bytes are scanned.
+        """
+        active = self._segments[-1]
+        if os.fstat(self._data_file.fileno()).st_size <= active.size:
+            return
+        positions, end = _scan_positions(active.path, active.size)
+        if positions:
+            self._index_file.write(struct.pack(f">{len(positions)}Q", *positions))
+            self._index_file.flush()
+            active.positions.extend(positions)
+        active.size = end
+
+    def refresh(self) -> None:
+        """Pick up events appended to the active segment by other processes."""
+        with self._lock:
+            if self._data_file is not None:
+                self._catch_up_locked()
+
+    def _sync_locked(self, now: Optional[float] = None) -> None:
+        if self._unsynced:
+            os.fsync(self._data_file.fileno())
+            os.fsync(self._index_file.fileno())
+        self._unsynced = 0
+        self._last_sync = now if now is not None else time.monotonic()
+
+    def _timed_sync(self) -> None:
+        with self._lock:
+            self._sync_timer = None
+            if self._data_file is not None:
+                self._sync_locked()
+
+    def sync(self) -> None:
+        """Force any batched appends to stable storage."""
+        with self._lock:
+            self._sync_locked()
+
+    def _roll(self) -> None:
+        """Seal the active segment and start a new one. Caller holds the lock."""
+        self._sync_locked()
+        self._data_file.close()
+        self._index_file.close()
+
+        active = self._segments[-1]
+        sealed_path = self.directory / self._sealed_name(active.base_seq)
+        os.replace(index_path_for(active.path), index_path_for(sealed_path))
+        os.replace(active.path, sealed_path)
+        active.path = sealed_path
+
+        new_base = active.next_seq
+        self.active_path.touch()
+        _write_index(index_path_for(self.active_path), new_base, self.epoch, [])
+        self._segments.append(_Segment(self.active_path, new_base, [], 0))
+        self._bases.append(new_base)
+        self._open_active_files()
+        self._apply_retention()
+
+    def _apply_retention(self) -> None:
+        if self.retain_segments is None:
+            return
+        while len(self._segments) - 1 > self.retain_segments:
+            oldest = self._segments.pop(0)
+            self._bases.pop(0)
+            for path in (oldest.path, oldest.index_path):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+
+    def close(self) -> None:
+        """Flush pending appends and close the active segment."""
+        with self._lock:
+            if self._data_file is None:
+                return
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+            self._sync_locked()
+            self._data_file.close()
+            self._index_file.close()
+            self._data_file = None
+            self._index_file = None
+
+    # ------------------------------------------------------------------
+    # Read path
+    # ------------------------------------------------------------------
+
+    def _snapshot(self) -> List[Tuple[_Segment, int]]:
+        with self._lock:
+            if self._data_file is not None:
+                self._catch_up_locked()
+            return [(s, len(s.positions)) for s in self._segments]
+
+    def _open_segment(self, segment: _Segment):
+        # Open under the lock so a concurrent roll cannot rename the file
+        # between resolving its path and opening it
+        with self._lock:
+            try:
+                return open(segment.path, "rb")
+            except FileNotFoundError:
+                return None
+
+    def read(self, after: int = -1, limit: Optional[int] = None) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Lazily iterate events with a sequence number greater than ``after``.
+
+        The iterator seeks straight to the first requested event using the
+        offset index and streams events from there, so memory use is bounded
+        by a single line regardless of how much history exists. Events
+        appended after the call starts are not included; call again with the
+        last seen sequence number to continue.
+
+        Args:
+            after (int): Only yield events with ``seq > after`` (default: all)
+            limit (Optional[int]): Maximum number of events to yield
+
+        Yields:
+            Tuple[int, Dict[str, Any]]: ``(seq, event)`` pairs in log order
+        """
+        start = max(after + 1, 0)
+        remaining = limit
+        snapshot = self._snapshot()
+        bases = [segment.base_seq for segment, _ in snapshot]
+        i = max(bisect.bisect_right(bases, start) - 1, 0)
+
+        for segment, count in snapshot[i:]:
+            first = max(start - segment.base_seq, 0)
+            if first >= count:
+                continue
+            f = self._open_segment(segment)
+            if f is None:
+                # Segment removed by retention while we were reading
+                continue
+            with f:
+                positions = segment.positions
+                f.seek(positions[first])
+                for offset in range(first, count):
+                    if offset + 1 < len(positions):
+                        # Bounded by the next event, which may share the line
+                        raw = f.read(positions[offset + 1] - positions[offset])
+                    else:
+                        raw = f.readline()
+                    events = parse_event_line(raw)
+                    if not events:
+                        # Malformed legacy fragment; its sequence number stays unused
+                        continue
+                    yield segment.base_seq + offset, events[0]
+                    if remaining is not None:
+                        remaining -= 1
+                        if remaining <= 0:
+                            return
+
+
+class EventLogWatcher:
+    """
+    Asyncio-side change notifier for an EventLog.
+
+    Subscribers call wait() with the last sequence number they have seen and
+    are woken as soon as a newer event exists. Two sources feed the watcher:
+
+    - In-process appends, through an EventLog listener that hops onto the
+      event loop with ``call_soon_threadsafe`` (no latency, no I/O)
+    - Appends from other processes, detected with inotify via ``watchfiles``
+      when it is installed, or by polling the active segment's size otherwise
+
+    The background watch task only runs while at least one subscriber exists,
+    and a single task serves every subscriber of the same log.
+
+    Args:
+        log (EventLog): Log to watch
+        poll_interval (float): Polling period when watchfiles is unavailable
+    """
+
+    def __init__(self, log: EventLog, poll_interval: float = DEFAULT_POLL_INTERVAL):
+        self.log = log
+        self.poll_interval = poll_interval
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._changed = asyncio.Event()
+        self._subscribers = 0
+        self._task: Optional[asyncio.Task] = None
+        self._stop: Optional[asyncio.Event] = None
+
+    @property
+    def subscribers(self) -> int:
+        return self._subscribers
+
+    def _notify(self, *_: Any) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def _on_append(self, seq: int) -> None:
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._notify)
+
+    async def _watch(self) -> None:
+        last = self.log.next_seq
+        if HAVE_WATCHFILES:
+            async for _ in awatch(self.log.directory, watch_filter=None, debounce=50, stop_event=self._stop):
+                await asyncio.to_thread(self.log.refresh)
+                if self.log.next_seq != last:
+                    last = self.log.next_seq
+                    self._notify()
+            return
+        while not self._stop.is_set():
+            await asyncio.sleep(self.poll_interval)
+            await asyncio.to_thread(self.log.refresh)
+            if self.log.next_seq != last:
+                last = self.log.next_seq
+                self._notify()
+
+    def subscribe(self) -> None:
+        """Register a subscriber, starting the watch task if needed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # asyncio primitives are bound to the loop that first uses them
+            self._loop = loop
+            self._changed = asyncio.Event()
+            self._task = None
+        self._subscribers += 1
+        if self._task is None or self._task.done():
+            self._stop = asyncio.Event()
+            self.log.add_listener(self._on_append)
+            self._task = asyncio.create_task(self._watch())
+
+    def unsubscribe(self) -> None:
+        """Drop a subscriber, stopping the watch task when none are left."""
+        self._subscribers = max(self._subscribers - 1, 0)
+        if self._subscribers == 0 and self._task is not None:
+            self.log.remove_listener(self._on_append)
+            # Both awatch and the polling loop exit once the stop event is set
+            self._stop.set()
+            self._task = None
+
+    async def wait(self, after: int, timeout: float) -> bool:
+        """
+        Wait until an event newer than ``after`` exists or the timeout expires.
+
+        Args:
+            after (int): Last sequence number the caller has seen
+            timeout (float): Maximum seconds to wait
+
+        Returns:
+            bool: True if newer events are available, False on timeout
+        """
+        changed = self._changed
+        if self.log.last_seq > after:
+            return True
+        try:
+            await asyncio.wait_for(changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.log.last_seq > after
+
+
+_watchers: Dict[EventLog, EventLogWatcher] = {}
+
+
+def get_watcher(log: EventLog) -> EventLogWatcher:
+    """
+    Return the shared EventLogWatcher for a log.
+
+    Must be called from the event loop. The polling interval for
+    environments without watchfiles is read from EVENTS_TAIL_POLL_INTERVAL.
+    """
+    watcher = _watchers.get(log)
+    if watcher is None:
+        watcher = EventLogWatcher(
+            log, poll_interval=float(os.getenv("EVENTS_TAIL_POLL_INTERVAL", DEFAULT_POLL_INTERVAL))
+        )
+        _watchers[log] = watcher
+    return watcher
+
+
+_logs: Dict[Path, EventLog] = {}
+_logs_lock = threading.Lock()
+
+
+def get_event_log(directory: Path, filename: str = "events.jsonl") -> EventLog:
+    """
+    Return the process-wide ``EventLog`` for a directory and file name.
+
+    Logs are cached per resolved path so every request shares one set of open
+    file handles and one in-memory index. Tuning parameters are read from the
+    environment the first time a log is opened:
+
+    - EVENTS_SEGMENT_BYTES: Segment roll size in bytes
+    - EVENTS_FSYNC_EVERY: Appends per fsync batch
+    - EVENTS_FSYNC_INTERVAL: Maximum seconds between fsyncs
+    - EVENTS_RETAIN_SEGMENTS: Number of sealed segments to keep
+
+    Args:
+        directory (Path): Directory holding the segment files
+        filename (str): Name of the active segment
+
+    Returns:
+        EventLog: Shared event log instance
+    """
+    key = (Path(directory) / filename).resolve()
+    log = _logs.get(key)
+    if log is not None:
+        return log
+    with _logs_lock:
+        log = _logs.get(key)
+        if log is None:
+            retain = os.getenv("EVENTS_RETAIN_SEGMENTS")
+            log = EventLog(
+                Path(directory),
+                filename,
+                segment_bytes=int(os.getenv("EVENTS_SEGMENT_BYTES", DEFAULT_SEGMENT_BYTES)),
+                fsync_every=int(os.getenv("EVENTS_FSYNC_EVERY", DEFAULT_FSYNC_EVERY)),
+                fsync_interval=float(os.getenv("EVENTS_FSYNC_INTERVAL", DEFAULT_FSYNC_INTERVAL)),
+                retain_segments=int(retain) if retain else None,
+            )
+            _logs[key] = log
+    return log
@@ -0,0 +1,655 @@
+"""
+Workspace Import Graph for the Kyros Orchestrator context analysis.
+
+This module maintains the module import graph of a workspace so
+``ContextAnalyzer`` (context_analysis.py) can report real fan-in, dependency
+depth, import cycles and cross-service edges for the files a task modifies,
+instead of looking only at the imports of those files.
+
+MODULE RESPONSIBILITIES:
+------------------------
+1. Incremental Indexing:
+   - The first refresh parses every Python file of the workspace (through the
+     shared SourceMetricsCache, so large workspaces fan out to its process pool)
+   - Later refreshes stat the files and only re-read those whose mtime or
+     size changed, and only re-parse those whose content hash changed
+   - Refreshes are throttled (``refresh_interval``) and the index can be
+     persisted to a JSON state file, so restarts skip the initial parse
+
+2. Import Resolution:
+   - Relative imports are resolved against the importing package
+   - Absolute imports resolve to workspace modules by exact name, or by
+     dotted suffix for service-local imports (``from app.core.config import``
+     inside services/orchestrator), preferring the candidate closest to the
+     importer
+   - Other imports are classified as standard library or third party from
+     ``sys.stdlib_module_names`` and the installed distribution metadata
+     (``importlib.metadata.packages_distributions()``)
+
+3. Queries:
+   - Dependencies, dependents and fan-in from forward and reverse adjacency
+   - Dependency depth and cycles from strongly connected components, computed
+     with an iterative Tarjan pass over the nodes reachable from the queried
+     modules and memoized until the graph changes
+   - Cross-service edges (``services/<name>/...`` modules importing or
+     imported by another service)
+
+USAGE:
+    graph = ImportGraph("/path/to/workspace", state_path="/var/cache/kyros/imports.json")
+    graph.refresh()
+    module = graph.module_for_path("services/orchestrator/auth.py")
+    graph.fan_in(module), graph.depth(module), graph.cycles([module])
+"""
+
+import importlib.metadata
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .source_metrics import SourceMetricsCache, content_hash, get_source_metrics_cache
+
+logger = logging.getLogger(__name__)
+
+# Bump when the persisted state format changes
+STATE_VERSION = 1
+
+# Directories never indexed
+SKIPPED_DIRECTORIES = {"node_modules", "__pycache__", "venv", "site-packages", "build", "dist"}
+
+# Import kinds returned by ImportGraph.resolve_import
+INTERNAL = "internal"
+STDLIB = "stdlib"
+THIRD_PARTY = "third_party"
+UNRESOLVED = "unresolved"
+
+
+@lru_cache(maxsize=1)
+def installed_distributions() -> Dict[str, List[str]]:
+    """Return the installed distributions providing each top-level import name"""
+    try:
+        return importlib.metadata.packages_distributions()
+    except Exception as e:
+        logger.warning(f"Could not read installed distribution metadata: {e}")
+        return {}
+
+
+def classify_external(name: str) -> Optional[str]:
+    """
+    Classify a module outside the workspace by its top-level package.
+
+    Args:
+        name (str): Absolute module name
+
+    Returns:
+        Optional[str]: STDLIB, THIRD_PARTY (installed distribution) or None
+            if unknown
+    """
+    top_level = name.split(".")[0]
+    if top_level in sys.stdlib_module_names or top_level in sys.builtin_module_names:
+        return STDLIB
+    if top_level in installed_distributions():
+        return THIRD_PARTY
+    return None
+
+
+def service_of(module: str) -> Optional[str]:
+    """Return the service a module belongs to (``services.<name>....``), if any"""
+    parts = module.split(".")
+    for index, part in enumerate(parts[:-1]):
+        if part == "services":
+            return parts[index + 1]
+    return None
+
+
+class ImportGraph:
+    """
+    Incrementally maintained import graph of the Python modules under a root.
+
+    Module names are the dotted paths relative to the root
+    (``services/orchestrator/auth.py`` is ``services.orchestrator.auth`` and a
+    package ``__init__.py`` is named after its directory). Thread-safe.
+
+    Args:
+        root (str): Workspace root
+        metrics_cache (Optional[SourceMetricsCache]): Cache used to parse files
+            (default: the process-wide cache)
+        state_path (Optional[str]): JSON file persisting the index (None to disable)
+        refresh_interval (float): Minimum seconds between two workspace scans
+        clock (Callable[[], float]): Monotonic time source
+    """
+
+    def __init__(
+        self,
+        root: str,
+        metrics_cache: Optional[SourceMetricsCache] = None,
+        state_path: Optional[str] = None,
+        refresh_interval: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.root = Path(root).resolve()
+        self.metrics_cache = metrics_cache if metrics_cache is not None else get_source_metrics_cache()
+        self.state_path = Path(state_path) if state_path else None
+        self.refresh_interval = refresh_interval
+        self.clock = clock
+        self._lock = threading.RLock()
+        self._last_refresh: Optional[float] = None
+
+        # Indexed files by relative path: mtime_ns, size, hash and raw imports
+        self._files: Dict[str, Dict[str, Any]] = {}
+        # Module name -> (relative path, is package)
+        self._modules: Dict[str, Tuple[str, bool]] = {}
+        # Dotted suffix -> modules ending with it, for service-local imports
+        self._suffixes: Dict[str, Set[str]] = {}
+        # Resolved imports per module, forward and reverse internal edges
+        self._resolved: Dict[str, List[Tuple[str, str]]] = {}
+        self._out: Dict[str, Set[str]] = {}
+        self._in: Dict[str, Set[str]] = {}
+        # Modules with at least one unresolved import
+        self._unresolved: Set[str] = set()
+        # Every dotted prefix of the absolute names a module imports -> the
+        # importing modules, so adding a module re-resolves only the importers
+        # that may now bind to it
+        self._wanted: Dict[str, Set[str]] = {}
+        self._wants: Dict[str, Set[str]] = {}
+
+        # Incremented whenever edges may have changed, so results derived
+        # from the graph can be cached against it
+        self.generation = 0
+
+        # Strongly connected components memoized until the graph changes
+        self._scc_of: Dict[str, int] = {}
+        self._scc_members: List[List[str]] = []
+        self._scc_depth: List[int] = []
+
+        self._load_state()
+
+    # Indexing
+
+    def module_for_path(self, path: str) -> Optional[str]:
+        """
+        Return the module name of a Python file.
+
+        Args:
+            path (str): File path, absolute or relative to the root
+
+        Returns:
+            Optional[str]: Module name, or None for non-Python files and
+                paths outside the root
+        """
+        if not path.endswith(".py"):
+            return None
+        candidate = Path(path.replace("\\", "/"))
+        if candidate.is_absolute():
+            try:
+                candidate = candidate.resolve().relative_to(self.root)
+            except ValueError:
+                return None
+        parts = [part for part in candidate.with_suffix("").parts if part not in ("", ".")]
+        if ".." in parts:
+            return None
+        if parts and parts[-1] == "__init__":
+            parts = parts[:-1]
+        return ".".join(parts) or None
+
+    def _walk(self) -> Iterable[Path]:
+        for directory, subdirectories, files in os.walk(self.root):
+            subdirectories[:] = [
+                name for name in subdirectories
+                if not name.startswith(".") and name not in SKIPPED_DIRECTORIES
+            ]
+            for name in files:
+                if name.endswith(".py"):
+                    yield Path(directory) / name
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        Bring the graph up to date with the workspace.
+
+        Args:
+            force (bool): Scan even if the last scan is more recent than
+                ``refresh_interval``
+
+        Returns:
+            int: Number of files added, changed or removed
+        """
+        with self._lock:
+            now = self.clock()
+            if not force and self._last_refresh is not None and now - self._last_refresh < self.refresh_interval:
+                return 0
+            self._last_refresh = now
+
+            seen: Set[str] = set()
+            changed: Dict[str, str] = {}
+            stats: Dict[str, os.stat_result] = {}
+            touched = False
+            for path in self._walk():
+                relative = path.relative_to(self.root).as_posix()
+                seen.add(relative)
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entry = self._files.get(relative)
+                if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                    continue
+                try:
+                    content = path.read_text(encoding="utf-8", errors="replace")
+                except OSError:
+                    continue
+                if entry and entry["hash"] == content_hash(content):
+                    entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                    touched = True
+                    continue
+                changed[relative] = content
+                stats[relative] = stat
+
+            removed = [relative for relative in self._files if relative not in seen]
+            metrics = self.metrics_cache.analyze_files(changed)
+            for relative in removed:
+                self._remove_file(relative)
+            for relative, content in changed.items():
+                stat = stats[relative]
+                self._set_file(relative, {
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "hash": content_hash(content),
+                    "imports": metrics[relative].imports if metrics[relative] is not None else [],
+                })
+
+            updates = len(changed) + len(removed)
+            if updates or touched:
+                self._save_state()
+            if updates:
+                logger.info(f"Import graph updated: {updates} files changed, {len(self._modules)} modules")
+            return updates
+
+    def _set_file(self, relative: str, entry: Dict[str, Any]) -> None:
+        module = self.module_for_path(relative)
+        new_module = module is not None and module not in self._modules
+        self._files[relative] = entry
+        if module is None:
+            return
+        self._modules[module] = (relative, relative.endswith("__init__.py"))
+        if new_module:
+            parts = module.split(".")
+            for start in range(len(parts)):
+                self._suffixes.setdefault(".".join(parts[start:]), set()).add(module)
+        self._resolve_module(module)
+        if new_module:
+            # Imports resolved before this module existed may bind to it now
+            affected: Set[str] = set()
+            for start in range(len(parts)):
+                affected |= self._wanted.get(".".join(parts[start:]), set())
+            for importer in affected - {module}:
+                self._resolve_module(importer)
+        self._invalidate()
+
+    def _remove_file(self, relative: str) -> None:
+        self._files.pop(relative, None)
+        module = self.module_for_path(relative)
+        if module is None or self._modules.get(module, (None,))[0] != relative:
+            return
+        del self._modules[module]
+        parts = module.split(".")
+        for start in range(len(parts)):
+            suffix = ".".join(parts[start:])
+            self._suffixes[suffix].discard(module)
+            if not self._suffixes[suffix]:
+                del self._suffixes[suffix]
+        for target in self._out.pop(module, set()):
+            self._in.get(target, set()).discard(module)
+        self._resolved.pop(module, None)
+        self._unresolved.discard(module)
+        self._set_wants(module, set())
+        for importer in list(self._in.pop(module, set())):
+            self._resolve_module(importer)
+        self._invalidate()
+
+    def _resolve_module(self, module: str) -> None:
+        relative, _ = self._modules[module]
+        names = self._files[relative]["imports"]
+        resolved = [self.resolve_import(module, name) for name in names]
+        wants: Set[str] = set()
+        for name in names:
+            absolute = self._absolute(module, name)
+            if absolute:
+                parts = absolute.split(".")
+                wants.update(".".join(parts[:end]) for end in range(1, len(parts) + 1))
+        self._set_wants(module, wants)
+        targets = {target for kind, target in resolved if kind == INTERNAL}
+        for target in self._out.get(module, set()) - targets:
+            self._in.get(target, set()).discard(module)
+        for target in targets:
+            self._in.setdefault(target, set()).add(module)
+        self._out[module] = targets
+        self._resolved[module] = resolved
+        if any(kind == UNRESOLVED for kind, _ in resolved):
+            self._unresolved.add(module)
+        else:
+            self._unresolved.discard(module)
+
+    def _set_wants(self, module: str, wants: Set[str]) -> None:
+        previous = self._wants.pop(module, set())
+        for name in previous - wants:
+            self._wanted[name].discard(module)
+            if not self._wanted[name]:
+                del self._wanted[name]
+        for name in wants - previous:
+            self._wanted.setdefault(name, set()).add(module)
+        if wants:
+            self._wants[module] = wants
+
+    def _invalidate(self) -> None:
+        self.generation += 1
+        self._scc_of.clear()
+        self._scc_members.clear()
+        self._scc_depth.clear()
+
+    # Resolution
+
+    def _find(self, name: str) -> Optional[str]:
+        """Return the longest prefix of a dotted name that is a known module"""
+        parts = name.split(".")
+        for end in range(len(parts), 0, -1):
+            candidate = ".".join(parts[:end])
+            if candidate in self._modules:
+                return candidate
+        return None
+
+    def _absolute(self, importer: str, name: str) -> Optional[str]:
+        """Return the absolute name of an import (None for relative imports beyond the top package)"""
+        if not name.startswith("."):
+            return name
+        level = len(name) - len(name.lstrip("."))
+        is_package = self._modules.get(importer, ("", False))[1]
+        package = importer.split(".") if is_package else importer.split(".")[:-1]
+        if level - 1 > len(package):
+            return None
+        package = package[:len(package) - (level - 1)]
+        return ".".join(package + ([name[level:]] if name[level:] else [])) or None
+
+    def resolve_import(self, importer: str, name: str) -> Tuple[str, str]:
+        """
+        Resolve an import of a module.
+
+        Args:
+            importer (str): Importing module
+            name (str): Imported name as recorded by source_metrics (relative
+                imports keep their leading dots)
+
+        Returns:
+            Tuple[str, str]: Kind (INTERNAL, STDLIB, THIRD_PARTY or UNRESOLVED)
+                and the resolved module, or the imported name if not internal
+        """
+        with self._lock:
+            if name.startswith("."):
+                target = self._absolute(importer, name)
+                module = self._find(target) if target else None
+                return (INTERNAL, module) if module else (UNRESOLVED, name)
+
+            module = self._find(name)
+            if module:
+                return INTERNAL, module
+            external = classify_external(name)
+            if external:
+                return external, name
+            module = self._find_by_suffix(importer, name)
+            if module:
+                return INTERNAL, module
+            return UNRESOLVED, name
+
+    def _find_by_suffix(self, importer: str, name: str) -> Optional[str]:
+        parts = name.split(".")
+        importer_parts = importer.split(".")
+        for end in range(len(parts), 0, -1):
+            candidates = self._suffixes.get(".".join(parts[:end]))
+            if candidates:
+                def shared_prefix(candidate: str) -> int:
+                    count = 0
+                    for left, right in zip(candidate.split("."), importer_parts):
+                        if left != right:
+                            break
+                        count += 1
+                    return count
+                return max(sorted(candidates), key=shared_prefix)
+        return None
+
+    # Queries
+
+    def dependencies(self, module: str) -> Set[str]:
+        """Return the workspace modules a module imports"""
+        with self._lock:
+            return set(self._out.get(module, ()))
+
+    def dependents(self, module: str) -> Set[str]:
+        """Return the workspace modules importing a module"""
+        with self._lock:
+            return set(self._in.get(module, ()))
+
+    def fan_in(self, module: str) -> int:
+        """Return the number of workspace modules importing a module"""
+        with self._lock:
+            return len(self._in.get(module, ()))
+
+    def resolved_imports(self, module: str) -> List[Tuple[str, str]]:
+        """Return the resolved imports (kind, name) of a module"""
+        with self._lock:
+            return list(self._resolved.get(module, ()))
+
+    def depth(self, module: str) -> int:
+        """
+        Return the length of the longest import chain starting at a module.
+
+        Modules in a cycle count as one step.
+
+        Args:
+            module (str): Module name
+
+        Returns:
+            int: 0 for modules without workspace dependencies
+        """
+        with self._lock:
+            if module not in self._modules:
+                return 0
+            self._explore(module)
+            return self._scc_depth[self._scc_of[module]]
+
+    def cycles(self, modules: Iterable[str]) -> List[Tuple[str, str]]:
+        """
+        Return the import edges forming cycles through any of the modules.
+
+        Args:
+            modules (Iterable[str]): Module names
+
+        Returns:
+            List[Tuple[str, str]]: (importer, imported) edges inside the
+                strongly connected components of the modules, sorted
+        """
+        with self._lock:
+            edges: Set[Tuple[str, str]] = set()
+            done: Set[int] = set()
+            for module in modules:
+                if module not in self._modules:
+                    continue
+                self._explore(module)
+                component = self._scc_of[module]
+                if component in done:
+                    continue
+                done.add(component)
+                members = self._scc_members[component]
+                if len(members) == 1 and module not in self._out.get(module, ()):
+                    continue
+                for member in members:
+                    for target in self._out.get(member, ()):
+                        if self._scc_of.get(target) == component:
+                            edges.add((member, target))
+            return sorted(edges)
+
+    def cross_service_edges(self, modules: Iterable[str]) -> List[Tuple[str, str]]:
+        """
+        Return the import edges between services touching any of the modules.
+
+        Args:
+            modules (Iterable[str]): Module names
+
+        Returns:
+            List[Tuple[str, str]]: (importer, imported) edges whose ends belong
+                to different services, sorted
+        """
+        with self._lock:
+            edges: Set[Tuple[str, str]] = set()
+            for module in modules:
+                service = service_of(module)
+                if service is None:
+                    continue
+                for target in self._out.get(module, ()):
+                    if service_of(target) not in (None, service):
+                        edges.add((module, target))
+                for importer in self._in.get(module, ()):
+                    if service_of(importer) not in (None, service):
+                        edges.add((importer, module))
+            return sorted(edges)
+
+    def _explore(self, start: str) -> None:
+        """Assign strongly connected components and depths to the nodes reachable from start (Tarjan)"""
+        if start in self._scc_of:
+            return
+        index: Dict[str, int] = {start: 0}
+        low: Dict[str, int] = {start: 0}
+        stack = [start]
+        on_stack = {start}
+        work = [(start, iter(self._out.get(start, ())))]
+        while work:
+            node, edges = work[-1]
+            advanced = False
+            for target in edges:
+                if target in self._scc_of:
+                    continue  # component finished earlier
+                if target not in index:
+                    index[target] = low[target] = len(index)
+                    stack.append(target)
+                    on_stack.add(target)
+                    work.append((target, iter(self._out.get(target, ()))))
+                    advanced = True
+                    break
+                if target in on_stack:
+                    low[node] = min(low[node], index[target])
+            if advanced:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] != index[node]:
+                continue
+            members = []
+            while True:
+                member = stack.pop()
+                on_stack.discard(member)
+                members.append(member)
+                if member == node:
+                    break
+            component = len(self._scc_members)
+            for member in members:
+                self._scc_of[member] = component
+            # Components are finished sinks first, so every dependency outside
+            # this component already has its depth
+            depth = 0
+            for member in members:
+                for target in self._out.get(member, ()):
+                    other = self._scc_of[target]
+                    if other != component:
+                        depth = max(depth, self._scc_depth[other] + 1)
+            self._scc_members.append(members)
+            self._scc_depth.append(depth)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return graph metrics for monitoring.
+
+        Returns:
+            Dict[str, Any]: File, module and edge counts
+        """
+        with self._lock:
+            return {
+                "root": str(self.root),
+                "files": len(self._files),
+                "modules": len(self._modules),
+                "edges": sum(len(targets) for targets in self._out.values()),
+                "modules_with_unresolved_imports": len(self._unresolved),
+                "generation": self.generation,
+            }
+
+    # Persistence
+
+    def _load_state(self) -> None:
+        if self.state_path is None:
+            return
+        try:
+            state = json.loads(self.state_path.read_text())
+        except (OSError, ValueError):
+            return
+        if state.get("version") != STATE_VERSION or state.get("root") != str(self.root):
+            return
+        files = state.get("files", {})
+        for relative, entry in files.items():
+            self._files[relative] = entry
+            module = self.module_for_path(relative)
+            if module is not None:
+                self._modules[module] = (relative, relative.endswith("__init__.py"))
+                parts = module.split(".")
+                for start in range(len(parts)):
+                    self._suffixes.setdefault(".".join(parts[start:]), set()).add(module)
+        for module in self._modules:
+            self._resolve_module(module)
+        logger.info(f"Loaded import graph state: {len(self._modules)} modules")
+
+    def _save_state(self) -> None:
+        if self.state_path is None:
+            return
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.state_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"version": STATE_VERSION, "root": str(self.root), "files": self._files}, f)
+            os.replace(tmp, self.state_path)
+        except OSError as e:
+            logger.warning(f"Could not persist import graph state: {e}")
+
+
+_graph: Optional[ImportGraph] = None
+_graph_lock = threading.Lock()
+
+
+def get_import_graph() -> Optional[ImportGraph]:
+    """
+    Get the process-wide workspace import graph, configured from settings.
+
+    Uses CONTEXT_ANALYSIS_WORKSPACE_ROOT (the graph is disabled when unset),
+    CONTEXT_ANALYSIS_GRAPH_STATE and CONTEXT_ANALYSIS_GRAPH_REFRESH_SECONDS.
+
+    Returns:
+        Optional[ImportGraph]: Shared graph, or None if not configured
+    """
+    global _graph
+    with _graph_lock:
+        if _graph is None:
+            try:
+                from .app.core.config import settings
+            except ImportError:
+                return None
+            if not settings.CONTEXT_ANALYSIS_WORKSPACE_ROOT:
+                return None
+            _graph = ImportGraph(
+                settings.CONTEXT_ANALYSIS_WORKSPACE_ROOT,
+                state_path=settings.CONTEXT_ANALYSIS_GRAPH_STATE,
+                refresh_interval=settings.CONTEXT_ANALYSIS_GRAPH_REFRESH_SECONDS,
+            )
+        return _graph
@@ -146,9 +146,10 @@ try:
     )
     from .oauth2 import OAuth2Manager, RefreshTokenRequest, initialize_default_providers
     from .database import get_db
-    from .routers import events, jobs, tasks, agents
+    from .routers import events, jobs, queue, tasks, agents
     from .app.core.config import settings
     from .security_middleware import setup_security, SecurityConfig
+    from .auth_context import AuthContextMiddleware, get_auth_context
 except Exception:  # Fallback when running module directly in container (/app)
     from .auth import (  # type: ignore
         User,
@@ -161,9 +162,10 @@ except Exception:  # Fallback when running module directly in container (/app)
     )
     from .oauth2 import OAuth2Manager, RefreshTokenRequest, initialize_default_providers  # type: ignore
     from .database import get_db  # type: ignore
-    from .routers import events, jobs, tasks, agents  # type: ignore
+    from .routers import events, jobs, queue, tasks, agents  # type: ignore
     from .app.core.config import settings  # type: ignore
     from .security_middleware import setup_security, SecurityConfig  # type: ignore
+    from .auth_context import AuthContextMiddleware, get_auth_context  # type: ignore
 
 # Use the API_V1_STR from settings
 API_V1_STR = settings.API_V1_STR
@@ -212,28 +214,45 @@ async def startup_event():
         logger.error(f"Failed to initialize OAuth2 providers: {e}")
 
 
+# Relays job change notifications from other workers (PostgreSQL only)
+_job_listener = None
+
+
+@app.on_event("startup")
+async def start_job_listener():
+    """Listen for job changes announced by other workers so long-polls wake promptly."""
+    global _job_listener
+    try:
+        from .database import async_engine
+        from .app.core.job_notifier import PostgresJobListener
+
+        if async_engine.dialect.name != "postgresql":
+            return
+        listener = PostgresJobListener(async_engine)
+        if await listener.start():
+            _job_listener = listener
+    except Exception as e:
+        # Long-polls still wake for local changes and time out for remote ones
+        logger.error(f"Failed to start job change listener: {e}")
+
+
+@app.on_event("shutdown")
+async def stop_job_listener():
+    """Release the job change listener connection."""
+    if _job_listener is not None:
+        await _job_listener.stop()
+
+
 # Setup rate limiting with SlowAPI
 if HAVE_SLOWAPI:
     # Create limiter with JWT-aware key function
     def jwt_limiter_key_func(request):
         """Rate limiting key function that uses JWT user ID when available."""
-        try:
-            # Try to extract user ID from JWT token
-            auth_header = request.headers.get("Authorization")
-            if auth_header and auth_header.startswith("Bearer "):
-                from jose import jwt
-                token = auth_header.split(" ")[1]
-                payload = jwt.decode(
-                    token,
-                    settings.SECRET_KEY,
-                    algorithms=[settings.JWT_ALGORITHM],
-                    options={"verify_exp": False}  # Don't verify expiration for rate limiting
-                )
-                user_id = payload.get("sub")
-                if user_id:
-                    return f"user:{user_id}"
-        except Exception:
-            pass
+        # Reuse the token verified by AuthContextMiddleware; expired tokens
+        # still identify the user for rate limiting
+        user_id = get_auth_context(request).subject
+        if user_id:
+            return f"user:{user_id}"
 
         # Fall back to IP address
         return f"ip:{get_remote_address(request)}"
@@ -357,9 +376,15 @@ except Exception:  # Fallback when running module directly
         # If middleware directory doesn't exist, skip logging middleware
         pass
 
+# Resolve the request's auth context once, before any other middleware.
+# Added last so it is the outermost layer; rate limiting, security checks,
+# request logging and the auth dependencies all read it from request.state.
+app.add_middleware(AuthContextMiddleware)
+
 # API v1 routers (mount once at /api/v1; routers define their own paths)
 # Mount all API routers with appropriate tags for OpenAPI documentation
 app.include_router(jobs.router, prefix=f"{API_V1_STR}")
+app.include_router(queue.router, prefix=f"{API_V1_STR}")
 app.include_router(tasks.router, prefix=f"{API_V1_STR}")
 app.include_router(events.router, prefix=f"{API_V1_STR}")
 app.include_router(agents.router, prefix=f"{API_V1_STR}")
@@ -393,6 +418,14 @@ except Exception:  # Fallback when running module directly
     from .routers import role_examples  # type: ignore
 app.include_router(role_examples.router, prefix=f"{API_V1_STR}", tags=["role-examples"])
 
+# Include escalation router; it carries its own /v1/escalation prefix, which is
+# where clients and the docs expect it, and every endpoint requires a user
+try:
+    from .routers import escalation
+except Exception:  # Fallback when running module directly
+    from .routers import escalation  # type: ignore
+app.include_router(escalation.router, dependencies=[Depends(get_current_user)])
+
 # events router included above
 
 
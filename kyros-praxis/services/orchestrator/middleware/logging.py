@@ -17,6 +17,11 @@ from typing import Callable
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
+try:
+    from ..auth_context import get_auth_context
+except ImportError:
+    from auth_context import get_auth_context  # type: ignore
+
 try:
     from ..app.core.logging import get_request_logger, log_orchestrator_event
 except ImportError:
@@ -218,9 +223,9 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         """
         Extract user ID from JWT token if present.
         
-        Attempts to extract the user ID from the Authorization header if it
-        contains a valid JWT token. This allows for user-specific logging
-        and monitoring.
+        Reads the user ID from the request's auth context, which holds the
+        JWT verified once by AuthContextMiddleware. This allows for
+        user-specific logging and monitoring.
         
         Args:
             request (Request): The incoming HTTP request
@@ -228,25 +233,9 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         Returns:
             str: The user ID from the JWT token, or 'anonymous' if not available
         """
-        try:
-            auth_header = request.headers.get("Authorization")
-            if auth_header and auth_header.startswith("Bearer "):
-                # Basic JWT parsing to extract user ID
-                # In production, you'd want more robust parsing
-                import jwt
-                try:
-                    from ..app.core.config import settings
-                    token = auth_header.split(" ")[1]
-                    payload = jwt.decode(
-                        token,
-                        settings.SECRET_KEY,
-                        algorithms=[settings.JWT_ALGORITHM],
-                        options={"verify_exp": False}  # Don't verify expiration for logging
-                    )
-                    return payload.get("sub", "unknown")
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        # Expired tokens still identify the user for logging
+        auth = get_auth_context(request)
+        if auth.claims is not None:
+            return auth.subject or "unknown"
 
         return "anonymous"
\ No newline at end of file
@@ -23,6 +23,7 @@ MODULE RESPONSIBILITIES:
    - Event: System event logging and audit trail
    - Task: Collaborative work item management
    - User: Authentication and authorization
+   - EscalationWorkflowRecord / EscalationCounter: Shared escalation workflow state
 
 3. Database Integration:
    - Inherits from AsyncAttrs for async relationship loading
@@ -41,6 +42,8 @@ ENTITY MODELS:
    - Tracks lifecycle from pending to completed/failed
    - Includes priority levels for scheduling
    - Stores metadata as JSON for flexibility
+   - Carries queue lease state (owner, expiry, attempts) for claim/lease
+     dispatch; jobs that exhaust their attempts are dead-lettered
 
 2. Event Model:
    - Captures system events for audit and monitoring
@@ -58,6 +61,10 @@ ENTITY MODELS:
    - Implements role-based access control
    - Supports account activation/deactivation
 
+5. CollectionVersion Model:
+   - Per-collection change counter bumped on every write
+   - Backs cheap collection ETags for conditional GETs
+
 DATABASE ARCHITECTURE:
 ----------------------
 The models use a common Base class that provides:
@@ -84,7 +91,7 @@ INTEGRATION WITH OTHER MODULES:
 - database.py: Uses models to create tables and define ORM mapping
 - auth.py: Uses User model for authentication operations
 - main.py: Exposes models through API endpoints
-- escalation_workflow.py: May use models for workflow tracking (future)
+- escalation_workflow.py: Persists workflow state through escalation_store.py
 
 USAGE EXAMPLES:
 ---------------
@@ -156,15 +163,25 @@ class Job(Base):
         updated_at (datetime): Timestamp when the job was last updated
         started_at (datetime, optional): Timestamp when the job started processing
         completed_at (datetime, optional): Timestamp when the job completed processing
+        lease_owner (str, optional): Worker currently holding the job's queue lease
+        lease_expires_at (datetime, optional): When the lease lapses and the job becomes claimable again
+        attempts (int): Number of times the job has been claimed
+        max_attempts (int): Attempts after which a failing job is dead-lettered
+        last_error (str, optional): Error reported by the last failed attempt
     
     Relationships:
         - Events can be associated with jobs through event payloads
         - Tasks may be associated with jobs through metadata or external references
     
     Indexes:
-        - ix_jobs_created_at: For querying jobs by creation time
-        - ix_jobs_status: For querying jobs by status
-        - ix_jobs_priority: For prioritized job scheduling
+        - ix_jobs_status_priority_created_at: For listing and claiming jobs of a status by priority
+        - ix_jobs_priority_created_at: For listing all jobs by priority
+        - ix_jobs_status_created_at: For listing jobs of a status by creation time
+        - ix_jobs_created_at_id: For listing all jobs by creation time
+        - ix_jobs_status_lease_expires_at: For finding running jobs with lapsed leases
+        
+        The listing indexes end with the primary key so keyset pages in each
+        sort order of ``GET /jobs`` are read in index order without a sort.
     """
     __tablename__ = "jobs"
 
@@ -198,11 +215,24 @@ class Job(Base):
     # Timestamp when the job completed processing
     completed_at = Column(DateTime, nullable=True)
     
+    # Worker holding the queue lease and when the lease lapses
+    lease_owner = Column(String(255), nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+    
+    # Claims so far, and the number after which a failing job is dead-lettered
+    attempts = Column(Integer, nullable=False, server_default="0")
+    max_attempts = Column(Integer, nullable=False, server_default="3")
+    
+    # Error reported by the last failed attempt
+    last_error = Column(String(1024), nullable=True)
+    
     # Database indexes for improved query performance
     __table_args__ = (
-        Index("ix_jobs_created_at", "created_at"),
-        Index("ix_jobs_status", "status"),
-        Index("ix_jobs_priority", "priority"),
+        Index("ix_jobs_status_priority_created_at", "status", priority.desc(), "created_at", "id"),
+        Index("ix_jobs_priority_created_at", priority.desc(), "created_at", "id"),
+        Index("ix_jobs_status_created_at", "status", "created_at", "id"),
+        Index("ix_jobs_created_at_id", "created_at", "id"),
+        Index("ix_jobs_status_lease_expires_at", "status", "lease_expires_at"),
     )
 
 
@@ -300,6 +330,82 @@ class Task(Base):
     __table_args__ = (Index("ix_tasks_created_at", "created_at"),)
 
 
+class CollectionVersion(Base):
+    """
+    Change counter for a collection of rows.
+    
+    Repositories bump the counter of a collection in the same transaction as
+    every insert, update or delete on it. List endpoints derive their ETag
+    from the counter, so a conditional GET can be answered with 304 Not
+    Modified by reading a single row instead of the whole collection.
+    
+    Attributes:
+        name (str): Collection name (e.g. "tasks")
+        epoch (str): Random value set when the counter is created, so ETags
+            from a previous database never match after a reset
+        version (int): Number of changes made to the collection
+    """
+    __tablename__ = "collection_versions"
+
+    # Collection name
+    name = Column(String(64), primary_key=True)
+    
+    # Random epoch distinguishing counters across database resets
+    epoch = Column(String(16), nullable=False, default=lambda: uuid4().hex[:16])
+    
+    # Number of changes made to the collection
+    version = Column(Integer, nullable=False, default=0)
+
+
+class EscalationWorkflowRecord(Base):
+    """
+    Snapshot of an escalation workflow (escalation_store.SQLWorkflowStore).
+    
+    The full workflow is stored as JSON; the columns next to it are the
+    fields the store filters on. A workflow is active while ``completed_at``
+    is NULL, and completed rows are never updated again.
+    
+    Attributes:
+        workflow_id (str): Unique identifier for the workflow (UUID)
+        state (str): Workflow state (e.g. analyzing, completed, failed)
+        outcome (str, optional): Final outcome once completed
+        priority (str): Request priority (low, normal, high, critical)
+        data (dict): Serialized workflow (``EscalationWorkflow.to_dict()``)
+        started_at (datetime): When the workflow was created
+        completed_at (datetime, optional): When the workflow reached a final state
+        updated_at (datetime): When the snapshot was last written
+    
+    Indexes:
+        - ix_escalation_workflows_completed_at: For active lookups and retention pruning
+    """
+    __tablename__ = "escalation_workflows"
+
+    workflow_id = Column(String(36), primary_key=True)
+    state = Column(String(32), nullable=False)
+    outcome = Column(String(32), nullable=True)
+    priority = Column(String(16), nullable=False, server_default="normal")
+    data = Column(JSON, nullable=False)
+    started_at = Column(DateTime, nullable=False)
+    completed_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    __table_args__ = (Index("ix_escalation_workflows_completed_at", "completed_at"),)
+
+
+class EscalationCounter(Base):
+    """
+    Escalation engine counter shared by all workers.
+    
+    Attributes:
+        name (str): Counter name (e.g. "total_requests", "escalated")
+        value (int): Counter value
+    """
+    __tablename__ = "escalation_counters"
+
+    name = Column(String(64), primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+
+
 class User(Base):
     """
     User model representing authenticated users of the system.
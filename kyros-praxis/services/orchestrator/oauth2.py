@@ -68,11 +68,13 @@ try:
     from .models import User, RefreshToken, OAuthProvider, UserOAuth
     from .database import get_db
     from .auth import create_access_token, SECRET_KEY
+    from .principal_cache import get_principal_cache
     from .app.core.config import settings
 except ImportError:  # Fallback when running module directly
     from .models import User, RefreshToken, OAuthProvider, UserOAuth  # type: ignore
     from .database import get_db  # type: ignore
     from .auth import create_access_token, SECRET_KEY  # type: ignore
+    from .principal_cache import get_principal_cache  # type: ignore
     from app.core.config import settings  # type: ignore
 
 
@@ -436,6 +438,7 @@ class OAuth2Manager:
         if db_token:
             db_token.revoked_at = datetime.now()  # Use timezone-naive
             db.commit()
+            get_principal_cache().invalidate(user_id=db_token.user_id)
             return True
         
         return False
@@ -448,6 +451,12 @@ class OAuth2Manager:
         """Revoke all tokens in a token family (for security)."""
         now = datetime.now()  # Use timezone-naive
         
+        owners = [
+            row.user_id for row in db.query(RefreshToken.user_id).filter(
+                RefreshToken.token_family == token_family
+            ).distinct()
+        ]
+        
         result = db.query(RefreshToken).filter(
             RefreshToken.token_family == token_family,
             RefreshToken.revoked_at.is_(None)
@@ -456,6 +465,11 @@ class OAuth2Manager:
         })
         
         db.commit()
+        
+        # Force the next request of the affected users to reload their principal
+        cache = get_principal_cache()
+        for user_id in owners:
+            cache.invalidate(user_id=user_id)
         return result
     
     async def cleanup_expired_tokens(self, db: Session) -> int:
@@ -0,0 +1,251 @@
+"""
+Authenticated Principal Cache for the Kyros Orchestrator service.
+
+This module caches the user record behind an authenticated subject so that
+``get_current_user`` does not issue a ``SELECT ... WHERE username = ?`` on
+every request. Polling clients authenticate many times per minute with the
+same token; with the cache they cost one database round trip per TTL instead
+of one per request.
+
+MODULE RESPONSIBILITIES:
+------------------------
+1. Principal Caching:
+   - Column snapshots of ``User`` rows keyed by subject (username)
+   - Short TTL and bounded LRU size
+   - Every hit returns a fresh transient ``User`` so requests never share ORM
+     instances
+
+2. Invalidation:
+   - ``invalidate()`` by subject or user ID, ``clear()`` for everything
+   - ``watch_user_model()`` registers SQLAlchemy listeners that invalidate a
+     user when its ``role`` or ``active`` column changes or the row is deleted
+   - Bulk ``UPDATE``/``DELETE`` statements against the user table (e.g.
+     ``query(User).update(...)``) bypass mapper listeners and the affected
+     rows are unknown, so they clear the whole cache
+   - ``OAuth2Manager.revoke_token_family`` and ``revoke_refresh_token``
+     invalidate the owners of the revoked tokens
+
+3. Race Protection:
+   - A generation counter is bumped on every invalidation; a lookup that
+     started before an invalidation does not store its (possibly stale) result
+
+USAGE:
+    cache = get_principal_cache()
+    values = cache.get("alice")
+    if values is None:
+        generation = cache.generation
+        user = await get_user_async(db, "alice")
+        cache.put("alice", snapshot(user), generation)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+try:
+    from .app.core.config import settings
+except ImportError:
+    from app.core.config import settings  # type: ignore
+
+# Columns whose changes affect authorization decisions
+WATCHED_COLUMNS = ("role", "active")
+
+
+class PrincipalCache:
+    """
+    TTL/LRU cache of user column snapshots keyed by subject.
+
+    Args:
+        ttl (float): Seconds a cached principal stays valid
+        maxsize (int): Maximum number of cached principals
+        clock (callable): Monotonic clock, injectable for tests
+    """
+
+    def __init__(self, ttl: float = 30.0, maxsize: int = 4096, clock=time.monotonic):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._by_id: Dict[Any, str] = {}
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, subject: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached column values of a principal.
+
+        Args:
+            subject (str): Token subject (username)
+
+        Returns:
+            Optional[Dict[str, Any]]: Column values, or None on a miss
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(subject)
+            if entry is not None:
+                values, expires_at = entry
+                if now < expires_at:
+                    self._entries.move_to_end(subject)
+                    self.hits += 1
+                    return values
+                self._remove(subject)
+            self.misses += 1
+            return None
+
+    def put(self, subject: str, values: Dict[str, Any], generation: int) -> bool:
+        """
+        Cache a principal loaded from the database.
+
+        Args:
+            subject (str): Token subject (username)
+            values (Dict[str, Any]): Column values of the user row
+            generation (int): Value of ``generation`` read before the lookup
+
+        Returns:
+            bool: False if an invalidation happened since and nothing was stored
+        """
+        with self._lock:
+            if generation != self.generation:
+                return False
+            self._remove(subject)
+            self._entries[subject] = (values, self._clock() + self.ttl)
+            user_id = values.get("id")
+            if user_id is not None:
+                self._by_id[user_id] = subject
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+            return True
+
+    def invalidate(self, subject: Optional[str] = None, user_id: Any = None) -> None:
+        """
+        Drop a principal by subject and/or user ID.
+
+        Args:
+            subject (Optional[str]): Token subject (username)
+            user_id (Any): Primary key of the user
+        """
+        with self._lock:
+            self.generation += 1
+            self.invalidations += 1
+            if user_id is not None:
+                by_id = self._by_id.get(user_id)
+                if by_id is not None:
+                    self._remove(by_id)
+            if subject is not None:
+                self._remove(subject)
+
+    def clear(self) -> None:
+        """Drop all cached principals."""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self._by_id.clear()
+
+    def _remove(self, subject: str) -> None:
+        entry = self._entries.pop(subject, None)
+        if entry is not None:
+            user_id = entry[0].get("id")
+            if self._by_id.get(user_id) == subject:
+                del self._by_id[user_id]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache usage counters.
+
+        Returns:
+            Dict[str, Any]: Size, TTL, hits, misses and invalidations
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+            }
+
+
+def snapshot(instance: Any) -> Dict[str, Any]:
+    """
+    Copy the column values of an ORM instance.
+
+    Args:
+        instance (Any): Loaded ORM instance
+
+    Returns:
+        Dict[str, Any]: Column attribute values keyed by attribute name
+    """
+    return {attr.key: getattr(instance, attr.key) for attr in inspect(instance).mapper.column_attrs}
+
+
+_cache: Optional[PrincipalCache] = None
+_cache_lock = threading.Lock()
+# User models registered through watch_user_model()
+_watched_models: set = set()
+
+
+def get_principal_cache() -> PrincipalCache:
+    """
+    Return the process-wide principal cache configured from settings.
+
+    Returns:
+        PrincipalCache: Shared cache instance
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = PrincipalCache(
+                    ttl=settings.AUTH_PRINCIPAL_CACHE_TTL,
+                    maxsize=settings.AUTH_PRINCIPAL_CACHE_SIZE,
+                )
+    return _cache
+
+
+def watch_user_model(model: Any) -> None:
+    """
+    Invalidate cached principals when watched user columns change.
+
+    Registers ``after_update`` and ``after_delete`` mapper listeners on the
+    user model, plus a session-wide ``do_orm_execute`` listener for bulk
+    statements, which do not emit mapper events. Safe to call more than once.
+
+    Args:
+        model (Any): User ORM class with ``id`` and ``username`` columns
+    """
+    if event.contains(model, "after_update", _after_user_update):
+        return
+    event.listen(model, "after_update", _after_user_update)
+    event.listen(model, "after_delete", _after_user_delete)
+    _watched_models.add(model)
+    if not event.contains(Session, "do_orm_execute", _on_bulk_user_write):
+        event.listen(Session, "do_orm_execute", _on_bulk_user_write)
+
+
+def _after_user_update(mapper, connection, target) -> None:
+    state = inspect(target)
+    changed = any(state.attrs[name].history.has_changes() for name in WATCHED_COLUMNS if name in state.attrs)
+    renamed = "username" in state.attrs and state.attrs.username.history.has_changes()
+    if changed or renamed:
+        get_principal_cache().invalidate(subject=target.username, user_id=target.id)
+
+
+def _after_user_delete(mapper, connection, target) -> None:
+    get_principal_cache().invalidate(subject=target.username, user_id=target.id)
+
+
+def _on_bulk_user_write(orm_execute_state) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ in _watched_models:
+        get_principal_cache().clear()
@@ -0,0 +1,506 @@
+"""
+Rate Limiting Engine for the Kyros Orchestrator service.
+
+This module implements the distributed rate limiting used by ``RateLimiter`` in
+security_middleware.py. The check-and-increment runs as one atomic Lua script
+on the Redis server, so each request costs a single non-blocking round trip
+through an async Redis client instead of the GET/TTL pipeline followed by a
+SET or INCR. Concurrent requests from the same client can no longer both read
+the old count and both be admitted.
+
+MODULE RESPONSIBILITIES:
+------------------------
+1. GCRA (Generic Cell Rate Algorithm):
+   - One Redis key per client holding its theoretical arrival time (TAT)
+   - Sustained rate of ``requests`` per ``window`` with up to
+     ``requests + burst`` requests admitted back to back
+   - The Redis server clock is used so that all workers agree on "now"
+   - Keys expire as soon as the client's bucket is full again
+
+2. In-Process Limiting:
+   - ``LocalGCRALimiter`` applies the same algorithm in memory in O(1) per
+     check, storing a single TAT float per client
+   - The client table is a bounded LRU; ``sweep()`` drops clients whose
+     allowance is fully restored, which is indistinguishable from having no
+     entry; callers run it periodically in the background
+
+3. Pre-Admission Leases:
+   - ``LeaseCache`` takes a client's allowance from Redis in batches (leases)
+     and spends it locally, so only lease renewals reach Redis
+   - Clients Redis rejected are cached with their retry time and rejected
+     locally with no network I/O until then
+
+4. Failure Handling:
+   - ``CircuitBreaker`` stops calling Redis after consecutive failures and
+     lets a single trial call through once the reset timeout has elapsed
+   - Callers fall back to an in-process limiter while the breaker is open,
+     instead of paying a failing network call on every request
+
+DECISIONS:
+----------
+Every check returns a ``RateLimitDecision`` carrying the remaining allowance
+and the reset and retry delays, so rejected requests can be answered without
+a second round trip for the TTL.
+
+USAGE:
+    limiter = RedisGCRALimiter(redis.asyncio.from_url(url), requests=100, window=900)
+    leases = LeaseCache(limiter, lease_size=10)
+    decision = leases.check_local("user:alice") or await leases.renew("user:alice")
+    if not decision.allowed:
+        retry_in = decision.retry_after
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+# KEYS[1]: client key
+# ARGV[1]: emission interval in milliseconds (window / requests)
+# ARGV[2]: capacity in requests (requests + burst)
+# ARGV[3]: requests wanted by this call; fewer are granted if fewer are available
+# Returns {granted, remaining, retry_after_ms, reset_after_ms}
+GCRA_SCRIPT = """
+pcall(redis.replicate_commands)
+local interval = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local wanted = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + tonumber(clock[2]) / 1000
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if tat == nil or tat < now then
+    tat = now
+end
+local limit = capacity * interval
+local available = math.floor((limit - (tat - now)) / interval + 0.000001)
+local granted = math.min(wanted, available)
+if granted < 1 then
+    return {0, 0, math.ceil(tat + interval - now - limit), math.ceil(tat - now)}
+end
+local new_tat = tat + granted * interval
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil(new_tat - now))
+return {granted, available - granted, 0, math.ceil(new_tat - now)}
+"""
+
+
+class RateLimitDecision(NamedTuple):
+    """
+    Outcome of a rate limit check.
+
+    Attributes:
+        allowed (bool): Whether the request is admitted
+        remaining (int): Requests that could still be admitted right now
+        retry_after (float): Seconds until the next request would be admitted (0 if allowed)
+        reset_after (float): Seconds until the client's full allowance is restored
+    """
+
+    allowed: bool
+    remaining: int
+    retry_after: float
+    reset_after: float
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for a remote dependency.
+
+    Closed: every call goes through. After ``failure_threshold`` consecutive
+    failures the breaker opens and ``allow_request()`` returns False until
+    ``reset_timeout`` seconds have passed; then a single trial call is let
+    through (half-open). Its success closes the breaker, its failure opens it
+    again for another ``reset_timeout``.
+
+    Args:
+        failure_threshold (int): Consecutive failures that open the breaker
+        reset_timeout (float): Seconds the breaker stays open before a trial call
+        clock (callable): Monotonic clock, injectable for tests
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.state = self.CLOSED
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a call to the dependency should be attempted.
+
+        Returns:
+            bool: False while the breaker is open or a half-open trial is in flight
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful call and close the breaker."""
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            self.state = self.CLOSED
+
+    def record_failure(self) -> bool:
+        """
+        Record a failed call.
+
+        Returns:
+            bool: True if this failure opened the breaker
+        """
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                opened = self.state != self.OPEN
+                self.state = self.OPEN
+                self._opened_at = self._clock()
+                return opened
+            return False
+
+
+# Float tolerance so that exactly ``capacity`` back-to-back requests are admitted
+_EPSILON = 1e-6
+
+
+class LocalGCRALimiter:
+    """
+    In-process GCRA limiter with a bounded, LRU-evicted client table.
+
+    Each client costs one float (its theoretical arrival time) and every
+    operation is O(1) apart from ``sweep()``. When the table is full the least
+    recently seen client is evicted, which restores its full allowance, so
+    ``maxsize`` should exceed the number of clients active within one window.
+
+    Args:
+        requests (int): Sustained requests allowed per window
+        window (float): Window length in seconds
+        burst (int): Additional requests that may be admitted back to back
+        maxsize (int): Maximum number of tracked clients
+        clock (callable): Monotonic clock, injectable for tests
+    """
+
+    def __init__(self, requests: int, window: float, burst: int = 0, maxsize: int = 100_000, clock=time.monotonic):
+        self.capacity = requests + burst
+        self.interval = window / requests
+        self.limit = self.capacity * self.interval
+        self.maxsize = maxsize
+        self._clock = clock
+        self._tats: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.swept = 0
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+    def check(self, client_id: str, cost: int = 1) -> RateLimitDecision:
+        """
+        Check and consume ``cost`` requests from a client's allowance.
+
+        Args:
+            client_id (str): Unique identifier for the client
+            cost (int): Number of requests to consume
+
+        Returns:
+            RateLimitDecision: Outcome of the check
+        """
+        now = self._clock()
+        with self._lock:
+            tat = max(self._tats.get(client_id, now), now)
+            new_tat = tat + cost * self.interval
+            if new_tat - now > self.limit + _EPSILON:
+                return RateLimitDecision(
+                    allowed=False,
+                    remaining=self._remaining(tat - now),
+                    retry_after=new_tat - now - self.limit,
+                    reset_after=tat - now,
+                )
+            self._tats[client_id] = new_tat
+            self._tats.move_to_end(client_id)
+            while len(self._tats) > self.maxsize:
+                self._tats.popitem(last=False)
+                self.evictions += 1
+            return RateLimitDecision(True, self._remaining(new_tat - now), 0.0, new_tat - now)
+
+    def _remaining(self, debt: float) -> int:
+        return max(0, int((self.limit - debt) / self.interval + _EPSILON))
+
+    def reset_after(self, client_id: str) -> float:
+        """
+        Return the seconds until a client's full allowance is restored.
+
+        Args:
+            client_id (str): Unique identifier for the client
+
+        Returns:
+            float: Seconds until reset (0 for unknown clients)
+        """
+        tat = self._tats.get(client_id)
+        return max(0.0, tat - self._clock()) if tat is not None else 0.0
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """
+        Drop clients whose allowance is fully restored.
+
+        Args:
+            now (Optional[float]): Current clock value (defaults to the clock)
+
+        Returns:
+            int: Number of clients removed
+        """
+        now = self._clock() if now is None else now
+        with self._lock:
+            idle = [client_id for client_id, tat in self._tats.items() if tat <= now]
+            for client_id in idle:
+                del self._tats[client_id]
+            self.swept += len(idle)
+        return len(idle)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return client table counters.
+
+        Returns:
+            Dict[str, Any]: Size, bound, LRU evictions and swept clients
+        """
+        return {
+            "clients": len(self._tats),
+            "maxsize": self.maxsize,
+            "evictions": self.evictions,
+            "swept": self.swept,
+        }
+
+
+class RedisGCRALimiter:
+    """
+    Distributed GCRA limiter evaluated atomically on a Redis server.
+
+    Args:
+        client: ``redis.asyncio`` client (or any client exposing ``register_script``)
+        requests (int): Sustained requests allowed per window
+        window (float): Window length in seconds
+        burst (int): Additional requests that may be admitted back to back
+        prefix (str): Key prefix for client buckets
+    """
+
+    def __init__(self, client: Any, requests: int, window: float, burst: int = 0, prefix: str = "rate_limit:gcra:"):
+        self.client = client
+        self.capacity = requests + burst
+        self.interval_ms = window * 1000 / requests
+        self.prefix = prefix
+        self._script = client.register_script(GCRA_SCRIPT)
+
+    async def check(self, client_id: str) -> RateLimitDecision:
+        """
+        Atomically check and consume one request of a client's allowance.
+
+        Args:
+            client_id (str): Unique identifier for the client
+
+        Returns:
+            RateLimitDecision: Outcome of the check
+
+        Raises:
+            Exception: Any Redis client error; callers decide how to fall back
+        """
+        return (await self.acquire(client_id, 1))[1]
+
+    async def acquire(self, client_id: str, tokens: int) -> Tuple[int, RateLimitDecision]:
+        """
+        Atomically take up to ``tokens`` requests of a client's allowance.
+
+        Args:
+            client_id (str): Unique identifier for the client
+            tokens (int): Requests wanted; fewer are granted when fewer are available
+
+        Returns:
+            Tuple[int, RateLimitDecision]: Requests granted, and the decision for the first of them
+
+        Raises:
+            Exception: Any Redis client error; callers decide how to fall back
+        """
+        granted, remaining, retry_after_ms, reset_after_ms = await self._script(
+            keys=[self.prefix + client_id], args=[self.interval_ms, self.capacity, tokens]
+        )
+        granted = int(granted)
+        return granted, RateLimitDecision(
+            allowed=granted > 0,
+            remaining=max(0, int(remaining)),
+            retry_after=int(retry_after_ms) / 1000,
+            reset_after=int(reset_after_ms) / 1000,
+        )
+
+
+class LeaseCache:
+    """
+    Worker-local pre-admission cache in front of ``RedisGCRALimiter``.
+
+    Instead of one Redis round trip per request, a worker takes a lease of
+    up to ``lease_size`` requests of a client's allowance in a single script
+    call and admits requests from it locally. Clients Redis has rejected are
+    remembered until their retry time, so they are rejected with no network
+    I/O at all.
+
+    Leased requests are charged in Redis when the lease is taken, so the
+    distributed limit is never exceeded; requests left in an expired or
+    evicted lease are forfeited, which only makes the limit stricter. The
+    lease size is capped at a quarter of the client's capacity so that a few
+    workers holding leases cannot starve the others.
+
+    Args:
+        remote (RedisGCRALimiter): Distributed limiter that grants leases
+        lease_size (int): Requests taken per lease
+        lease_ttl (float): Seconds a lease may be spent before it is discarded
+        maxsize (int): Maximum number of leased and blocked clients, each (LRU-evicted)
+        clock (callable): Monotonic clock, injectable for tests
+    """
+
+    def __init__(
+        self,
+        remote: RedisGCRALimiter,
+        lease_size: int = 10,
+        lease_ttl: float = 5.0,
+        maxsize: int = 100_000,
+        clock=time.monotonic,
+    ):
+        self.remote = remote
+        self.lease_size = max(1, min(lease_size, remote.capacity // 4))
+        self.lease_ttl = lease_ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        # client -> [tokens, lease expiry, remote remaining, remote reset time]
+        self._leases: "OrderedDict[str, list]" = OrderedDict()
+        # client -> (retry time, reset time)
+        self._blocked: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self.local_hits = 0
+        self.local_rejections = 0
+        self.renewals = 0
+
+    def check_local(self, client_id: str) -> Optional[RateLimitDecision]:
+        """
+        Decide a request from local state only.
+
+        Args:
+            client_id (str): Unique identifier for the client
+
+        Returns:
+            Optional[RateLimitDecision]: The decision, or None if a lease must be renewed
+        """
+        now = self._clock()
+        blocked = self._blocked.get(client_id)
+        if blocked is not None:
+            retry_at, reset_at = blocked
+            if now < retry_at:
+                self.local_rejections += 1
+                return RateLimitDecision(False, 0, retry_at - now, max(0.0, reset_at - now))
+            del self._blocked[client_id]
+
+        lease = self._leases.get(client_id)
+        if lease is None:
+            return None
+        tokens, expires_at, remote_remaining, reset_at = lease
+        if tokens <= 0 or now >= expires_at:
+            del self._leases[client_id]
+            return None
+        lease[0] = tokens - 1
+        self._leases.move_to_end(client_id)
+        self.local_hits += 1
+        return RateLimitDecision(True, lease[0] + remote_remaining, 0.0, max(0.0, reset_at - now))
+
+    async def renew(self, client_id: str) -> RateLimitDecision:
+        """
+        Take a new lease from Redis and decide the current request from it.
+
+        Args:
+            client_id (str): Unique identifier for the client
+
+        Returns:
+            RateLimitDecision: Decision for the current request
+
+        Raises:
+            Exception: Any Redis client error; callers decide how to fall back
+        """
+        granted, decision = await self.remote.acquire(client_id, self.lease_size)
+        self.renewals += 1
+        now = self._clock()
+        if not decision.allowed:
+            self._leases.pop(client_id, None)
+            self._store(self._blocked, client_id, (now + decision.retry_after, now + decision.reset_after))
+            return decision
+
+        lease = self._leases.get(client_id)
+        if lease is not None and now < lease[1]:
+            # Concurrent renewals for the same client add up
+            granted += lease[0]
+        self._store(self._leases, client_id, [granted - 1, now + self.lease_ttl, decision.remaining,
+                                              now + decision.reset_after])
+        return RateLimitDecision(True, granted - 1 + decision.remaining, 0.0, decision.reset_after)
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """
+        Drop expired leases and block entries.
+
+        Args:
+            now (Optional[float]): Current clock value (defaults to the clock)
+
+        Returns:
+            int: Number of entries removed
+        """
+        now = self._clock() if now is None else now
+        expired = [client_id for client_id, lease in self._leases.items() if now >= lease[1]]
+        for client_id in expired:
+            del self._leases[client_id]
+        unblocked = [client_id for client_id, (retry_at, _) in self._blocked.items() if now >= retry_at]
+        for client_id in unblocked:
+            del self._blocked[client_id]
+        return len(expired) + len(unblocked)
+
+    def _store(self, table: "OrderedDict[str, Any]", client_id: str, value: Any) -> None:
+        table[client_id] = value
+        table.move_to_end(client_id)
+        while len(table) > self.maxsize:
+            table.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return lease cache counters.
+
+        Returns:
+            Dict[str, Any]: Table sizes, lease size, local decisions and renewals
+        """
+        return {
+            "leased_clients": len(self._leases),
+            "blocked_clients": len(self._blocked),
+            "lease_size": self.lease_size,
+            "local_hits": self.local_hits,
+            "local_rejections": self.local_rejections,
+            "renewals": self.renewals,
+        }
+
+
+def header_seconds(seconds: float) -> int:
+    """
+    Round a delay up to whole seconds for ``X-RateLimit-Reset``/``Retry-After`` headers.
+
+    Args:
+        seconds (float): Delay in seconds
+
+    Returns:
+        int: Delay in whole seconds, never negative
+    """
+    return max(0, math.ceil(seconds))
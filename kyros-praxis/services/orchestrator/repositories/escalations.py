@@ -0,0 +1,135 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, func, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import EscalationCounter, EscalationWorkflowRecord
+
+
+def _parse(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _columns(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "state": record["state"],
+        "outcome": record.get("outcome"),
+        "priority": record["request"]["priority"],
+        "data": record,
+        "started_at": _parse(record["started_at"]),
+        "completed_at": _parse(record.get("completed_at")),
+        "updated_at": datetime.utcnow(),
+    }
+
+
+async def save_workflow(session: AsyncSession, record: Dict[str, Any]) -> bool:
+    # Update while still active; completed rows are final, so a snapshot from a
+    # worker that has not seen a cancellation is rejected instead of reviving it
+    values = _columns(record)
+    try:
+        result = await session.execute(
+            update(EscalationWorkflowRecord)
+            .where(
+                EscalationWorkflowRecord.workflow_id == record["workflow_id"],
+                EscalationWorkflowRecord.completed_at.is_(None),
+            )
+            .values(**values)
+        )
+        if result.rowcount == 0:
+            await session.execute(insert(EscalationWorkflowRecord).values(workflow_id=record["workflow_id"], **values))
+        await session.commit()
+        return True
+    except IntegrityError:
+        # The row exists and is completed
+        await session.rollback()
+        return False
+    except Exception:
+        await session.rollback()
+        raise
+
+
+async def get_workflow(session: AsyncSession, workflow_id: str, completed_after: datetime) -> Optional[Dict[str, Any]]:
+    result = await session.execute(
+        select(EscalationWorkflowRecord.data).where(
+            EscalationWorkflowRecord.workflow_id == workflow_id,
+            or_(
+                EscalationWorkflowRecord.completed_at.is_(None),
+                EscalationWorkflowRecord.completed_at >= completed_after,
+            ),
+        )
+    )
+    return result.scalar_one_or_none()
+
+
+async def list_active_workflows(session: AsyncSession, limit: int = 100) -> List[Dict[str, Any]]:
+    result = await session.execute(
+        select(EscalationWorkflowRecord.data)
+        .where(EscalationWorkflowRecord.completed_at.is_(None))
+        .order_by(EscalationWorkflowRecord.started_at)
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+async def count_workflows(session: AsyncSession, completed_after: datetime) -> Dict[str, int]:
+    result = await session.execute(
+        select(
+            func.count().filter(EscalationWorkflowRecord.completed_at.is_(None)),
+            func.count().filter(EscalationWorkflowRecord.completed_at >= completed_after),
+        )
+    )
+    active, completed = result.one()
+    return {"active": active, "completed": completed}
+
+
+async def incr_counter(session: AsyncSession, name: str, amount: int = 1) -> None:
+    try:
+        result = await session.execute(
+            update(EscalationCounter)
+            .where(EscalationCounter.name == name)
+            .values(value=EscalationCounter.value + amount)
+        )
+        if result.rowcount == 0:
+            session.add(EscalationCounter(name=name, value=amount))
+        await session.commit()
+    except IntegrityError:
+        # Another worker created the counter first
+        await session.rollback()
+        await incr_counter(session, name, amount)
+    except Exception:
+        await session.rollback()
+        raise
+
+
+async def get_counters(session: AsyncSession) -> Dict[str, int]:
+    result = await session.execute(select(EscalationCounter.name, EscalationCounter.value))
+    return {row.name: row.value for row in result.all()}
+
+
+async def prune_workflows(session: AsyncSession, completed_before: datetime, max_completed: int) -> int:
+    # Age bound first, then keep only the newest max_completed completions
+    try:
+        result = await session.execute(
+            delete(EscalationWorkflowRecord).where(EscalationWorkflowRecord.completed_at < completed_before)
+        )
+        removed = result.rowcount
+        boundary = await session.execute(
+            select(EscalationWorkflowRecord.completed_at)
+            .where(EscalationWorkflowRecord.completed_at.is_not(None))
+            .order_by(EscalationWorkflowRecord.completed_at.desc())
+            .offset(max_completed)
+            .limit(1)
+        )
+        oldest_kept = boundary.scalar_one_or_none()
+        if oldest_kept is not None:
+            result = await session.execute(
+                delete(EscalationWorkflowRecord).where(EscalationWorkflowRecord.completed_at <= oldest_kept)
+            )
+            removed += result.rowcount
+        await session.commit()
+        return removed
+    except Exception:
+        await session.rollback()
+        raise
@@ -1,9 +1,24 @@
-from typing import List
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import uuid4
 
-from sqlalchemy import select
+from sqlalchemy import and_, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import Event, Job
+from .versions import bump_collection_version
+
+COLLECTION = "jobs"
+
+# Sort orders for list_jobs_page as (column, descending) keys. Each ends with the
+# primary key so the order is total, and each matches a composite index with and
+# without a status filter (ix_jobs_[status_]priority_created_at,
+# ix_jobs_[status_]created_at).
+SORTS: Dict[str, Tuple[Tuple[Any, bool], ...]] = {
+    "priority": ((Job.priority, True), (Job.created_at, False), (Job.id, False)),
+    "created_at": ((Job.created_at, False), (Job.id, False)),
+    "-created_at": ((Job.created_at, True), (Job.id, True)),
+}
 
 
 async def get_jobs(session: AsyncSession) -> List[Job]:
@@ -11,6 +26,57 @@ async def get_jobs(session: AsyncSession) -> List[Job]:
     return result.scalars().all()
 
 
+def _after(keys: Sequence[Tuple[Any, bool]], values: Sequence[Any]):
+    # Rows strictly after `values` in the (mixed-direction) key order. The leading
+    # non-strict bound on the first key lets the index seek to the cursor instead
+    # of scanning from the start.
+    first, descending = keys[0]
+    seek = first <= values[0] if descending else first >= values[0]
+    branches = []
+    for index, (column, descending) in enumerate(keys):
+        equal = [key == value for (key, _), value in zip(keys[:index], values[:index])]
+        branches.append(and_(*equal, column < values[index] if descending else column > values[index]))
+    return and_(seek, or_(*branches))
+
+
+def jobs_page_query(
+    status: Optional[str] = None,
+    sort: str = "priority",
+    after: Optional[Sequence[Any]] = None,
+    limit: int = 100,
+    offset: int = 0,
+):
+    keys = SORTS[sort]
+    query = select(Job)
+    if status is not None:
+        query = query.where(Job.status == status)
+    if after is not None:
+        query = query.where(_after(keys, after))
+    query = query.order_by(*(column.desc() if descending else column for column, descending in keys))
+    if offset:
+        query = query.offset(offset)
+    # One extra row tells whether another page follows
+    return query.limit(limit + 1)
+
+
+def page_key(job: Job, sort: str = "priority") -> List[Any]:
+    return [getattr(job, column.key) for column, _ in SORTS[sort]]
+
+
+async def list_jobs_page(
+    session: AsyncSession,
+    status: Optional[str] = None,
+    sort: str = "priority",
+    after: Optional[Sequence[Any]] = None,
+    limit: int = 100,
+    offset: int = 0,
+) -> Tuple[List[Job], bool]:
+    # Keyset pagination in one of SORTS; `after` is page_key() of the last row seen
+    result = await session.execute(jobs_page_query(status, sort, after, limit, offset))
+    jobs = result.scalars().all()
+    return jobs[:limit], len(jobs) > limit
+
+
 async def create_job(session: AsyncSession, name: str) -> Job:
     job = Job(name=name)
     session.add(job)
@@ -23,6 +89,49 @@ async def create_job(session: AsyncSession, name: str) -> Job:
         raise
 
 
+async def create_jobs(session: AsyncSession, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # One multi-row INSERT (executemany) and one commit for the whole batch
+    now = datetime.utcnow()
+    rows = [
+        {
+            "id": str(uuid4()),
+            "name": item["name"],
+            "description": item.get("description"),
+            "status": "pending",
+            "priority": item.get("priority", 0),
+            "created_at": now,
+            "updated_at": now,
+        }
+        for item in items
+    ]
+    try:
+        await session.execute(insert(Job), rows)
+        await bump_collection_version(session, COLLECTION)
+        await session.commit()
+        return rows
+    except Exception:
+        await session.rollback()
+        raise
+
+
+async def get_job_rows(session: AsyncSession, job_ids: List[str]) -> Dict[str, Any]:
+    result = await session.execute(
+        select(Job.id, Job.name, Job.status, Job.created_at, Job.updated_at).where(Job.id.in_(job_ids))
+    )
+    return {row.id: row for row in result.all()}
+
+
+async def update_job_statuses(session: AsyncSession, changes: List[Dict[str, Any]]) -> None:
+    # ORM bulk UPDATE by primary key: one executemany for the whole batch
+    try:
+        await session.execute(update(Job), changes)
+        await bump_collection_version(session, COLLECTION)
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+
+
 async def add_event(session: AsyncSession, event_type: str, payload: dict) -> Event:
     event = Event(type=event_type, payload=payload)
     session.add(event)
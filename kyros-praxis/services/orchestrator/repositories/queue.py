@@ -0,0 +1,201 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import and_, case, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import Job
+from .versions import bump_collection_version
+
+COLLECTION = "jobs"
+
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+DEAD = "dead"
+
+# Optimistic claim rounds on backends without SKIP LOCKED
+CLAIM_ROUNDS = 3
+
+
+def _claimable(now: datetime):
+    return or_(
+        Job.status == PENDING,
+        and_(Job.status == RUNNING, Job.lease_expires_at < now),
+    )
+
+
+def _claim_values(worker_id: str, now: datetime, lease_seconds: float) -> dict:
+    return {
+        "status": RUNNING,
+        "lease_owner": worker_id,
+        "lease_expires_at": now + timedelta(seconds=lease_seconds),
+        "attempts": Job.attempts + 1,
+        "started_at": func.coalesce(Job.started_at, now),
+        "updated_at": now,
+    }
+
+
+async def reap_expired_leases(session: AsyncSession, now: Optional[datetime] = None) -> int:
+    # Lapsed leases of jobs without attempts left go to the dead letter state
+    now = now or datetime.utcnow()
+    result = await session.execute(
+        update(Job)
+        .where(Job.status == RUNNING, Job.lease_expires_at < now, Job.attempts >= Job.max_attempts)
+        .values(status=DEAD, lease_owner=None, lease_expires_at=None,
+                last_error="Lease expired on final attempt", updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+async def claim_jobs(session: AsyncSession, worker_id: str, limit: int, lease_seconds: float) -> List[Job]:
+    now = datetime.utcnow()
+    try:
+        reaped = await reap_expired_leases(session, now)
+        if (await session.connection()).dialect.name == "postgresql":
+            claimed_ids = await _claim_skip_locked(session, worker_id, limit, lease_seconds, now)
+        else:
+            claimed_ids = await _claim_optimistic(session, worker_id, limit, lease_seconds, now)
+        if claimed_ids or reaped:
+            await bump_collection_version(session, COLLECTION)
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    if not claimed_ids:
+        return []
+    # Rows already in the identity map still hold their pre-claim lease state
+    result = await session.execute(
+        select(Job)
+        .where(Job.id.in_(claimed_ids))
+        .order_by(Job.priority.desc(), Job.created_at)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalars().all()
+
+
+async def _claim_skip_locked(
+    session: AsyncSession, worker_id: str, limit: int, lease_seconds: float, now: datetime
+) -> List[str]:
+    # Rows locked by concurrent claimers are skipped instead of waited on
+    candidates = (
+        select(Job.id)
+        .where(_claimable(now))
+        .order_by(Job.priority.desc(), Job.created_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    result = await session.execute(
+        update(Job)
+        .where(Job.id.in_(candidates))
+        .values(**_claim_values(worker_id, now, lease_seconds))
+        .returning(Job.id)
+        .execution_options(synchronize_session=False)
+    )
+    return list(result.scalars().all())
+
+
+async def _claim_optimistic(
+    session: AsyncSession, worker_id: str, limit: int, lease_seconds: float, now: datetime
+) -> List[str]:
+    # Compare-and-set per candidate: the claim only applies while the row is
+    # still claimable, so a job taken by another worker updates zero rows
+    claimed: List[str] = []
+    for _ in range(CLAIM_ROUNDS):
+        wanted = limit - len(claimed)
+        query = select(Job.id).where(_claimable(now)).order_by(Job.priority.desc(), Job.created_at).limit(wanted)
+        if claimed:
+            query = query.where(Job.id.notin_(claimed))
+        result = await session.execute(query)
+        candidates = list(result.scalars().all())
+        for job_id in candidates:
+            updated = await session.execute(
+                update(Job)
+                .where(Job.id == job_id, _claimable(now))
+                .values(**_claim_values(worker_id, now, lease_seconds))
+                .execution_options(synchronize_session=False)
+            )
+            if updated.rowcount == 1:
+                claimed.append(job_id)
+        if len(claimed) >= limit or len(candidates) < wanted:
+            break
+    return claimed
+
+
+async def _update_leased(session: AsyncSession, job_id: str, worker_id: str, **values) -> Optional[Job]:
+    try:
+        result = await session.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == RUNNING, Job.lease_owner == worker_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            # Nothing was written; end the transaction without expiring loaded objects
+            await session.commit()
+            return None
+        if "status" in values:
+            await bump_collection_version(session, COLLECTION)
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    return await session.get(Job, job_id, populate_existing=True)
+
+
+async def extend_lease(session: AsyncSession, job_id: str, worker_id: str, lease_seconds: float) -> Optional[Job]:
+    now = datetime.utcnow()
+    return await _update_leased(
+        session, job_id, worker_id, lease_expires_at=now + timedelta(seconds=lease_seconds)
+    )
+
+
+async def complete_job(session: AsyncSession, job_id: str, worker_id: str) -> Optional[Job]:
+    now = datetime.utcnow()
+    return await _update_leased(
+        session, job_id, worker_id,
+        status=COMPLETED, completed_at=now, updated_at=now, lease_owner=None, lease_expires_at=None,
+    )
+
+
+async def fail_job(
+    session: AsyncSession, job_id: str, worker_id: str, error: Optional[str], retry: bool = True
+) -> Optional[Job]:
+    # Retryable failures go back to pending until attempts are exhausted
+    now = datetime.utcnow()
+    status = case((Job.attempts < Job.max_attempts, PENDING), else_=DEAD) if retry else DEAD
+    return await _update_leased(
+        session, job_id, worker_id,
+        status=status, last_error=(error or "")[:1024] or None, updated_at=now,
+        lease_owner=None, lease_expires_at=None,
+    )
+
+
+async def list_dead_jobs(session: AsyncSession, limit: int = 100) -> List[Job]:
+    result = await session.execute(
+        select(Job).where(Job.status == DEAD).order_by(Job.updated_at.desc()).limit(limit)
+    )
+    return result.scalars().all()
+
+
+async def requeue_job(session: AsyncSession, job_id: str) -> Optional[Job]:
+    now = datetime.utcnow()
+    try:
+        result = await session.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == DEAD)
+            .values(status=PENDING, attempts=0, last_error=None, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            # Nothing was written; end the transaction without expiring loaded objects
+            await session.commit()
+            return None
+        await bump_collection_version(session, COLLECTION)
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    return await session.get(Job, job_id, populate_existing=True)
@@ -0,0 +1,71 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import Task
+from .versions import bump_collection_version
+
+COLLECTION = "tasks"
+
+
+async def list_tasks(session: AsyncSession) -> List[Task]:
+    result = await session.execute(select(Task).order_by(Task.created_at, Task.id))
+    return result.scalars().all()
+
+
+async def list_tasks_page(
+    session: AsyncSession, after: Optional[Tuple[datetime, str]] = None, limit: int = 100
+) -> Tuple[List[Task], bool]:
+    # Keyset pagination on (created_at, id), served by ix_tasks_created_at
+    query = select(Task).order_by(Task.created_at, Task.id).limit(limit + 1)
+    if after is not None:
+        created_at, task_id = after
+        query = query.where(
+            or_(Task.created_at > created_at, and_(Task.created_at == created_at, Task.id > task_id))
+        )
+    result = await session.execute(query)
+    tasks = result.scalars().all()
+    return tasks[:limit], len(tasks) > limit
+
+
+async def get_task(session: AsyncSession, task_id: str) -> Optional[Task]:
+    return await session.get(Task, task_id)
+
+
+async def create_task(session: AsyncSession, title: str, description: Optional[str] = None) -> Task:
+    task = Task(title=title, description=description)
+    session.add(task)
+    try:
+        await bump_collection_version(session, COLLECTION)
+        await session.commit()
+        await session.refresh(task)
+        return task
+    except Exception:
+        await session.rollback()
+        raise
+
+
+async def update_task(session: AsyncSession, task: Task, title: str, description: Optional[str]) -> Task:
+    task.title = title
+    task.description = description
+    task.version = Task.version + 1
+    try:
+        await bump_collection_version(session, COLLECTION)
+        await session.commit()
+        await session.refresh(task)
+        return task
+    except Exception:
+        await session.rollback()
+        raise
+
+
+async def delete_task(session: AsyncSession, task: Task) -> None:
+    await session.delete(task)
+    try:
+        await bump_collection_version(session, COLLECTION)
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
@@ -0,0 +1,49 @@
+from typing import Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import CollectionVersion
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE
+_UPSERT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+
+async def get_collection_version(session: AsyncSession, name: str) -> Tuple[str, int]:
+    result = await session.execute(
+        select(CollectionVersion.epoch, CollectionVersion.version).where(CollectionVersion.name == name)
+    )
+    row = result.first()
+    return (row.epoch, row.version) if row is not None else ("0", 0)
+
+
+async def bump_collection_version(session: AsyncSession, name: str) -> None:
+    insert = _UPSERT_INSERTS.get((await session.connection()).dialect.name)
+    if insert is not None:
+        # Single upsert, so concurrent first writers cannot race on the primary key
+        statement = insert(CollectionVersion).values(name=name, version=1)
+        await session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[CollectionVersion.name],
+                set_={"version": CollectionVersion.version + 1},
+            )
+        )
+        return
+
+    increment = (
+        update(CollectionVersion)
+        .where(CollectionVersion.name == name)
+        .values(version=CollectionVersion.version + 1)
+    )
+    result = await session.execute(increment)
+    if result.rowcount:
+        return
+    try:
+        async with session.begin_nested():
+            session.add(CollectionVersion(name=name, version=1))
+    except IntegrityError:
+        # Another transaction created the row first
+        await session.execute(increment)
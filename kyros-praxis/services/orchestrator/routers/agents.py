@@ -9,19 +9,18 @@ consistency with secured routes.
 from typing import List, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 try:
     from ..database import get_db_session
     from ..models import User
-    from ..auth import JWT_ISSUER, JWT_AUDIENCE, SECRET_KEY, ALGORITHM
+    from ..auth_context import get_auth_context
 except ImportError:  # pragma: no cover
     from services.orchestrator.database import get_db_session  # type: ignore
     from services.orchestrator.models import User  # type: ignore
-    from services.orchestrator.auth import JWT_ISSUER, JWT_AUDIENCE, SECRET_KEY, ALGORITHM  # type: ignore
+    from services.orchestrator.auth_context import get_auth_context  # type: ignore
 
-from jose import jwt, JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(prefix="/agents", tags=["agents"])
@@ -29,13 +28,15 @@ oauth2_scheme = HTTPBearer(auto_error=False)
 
 
 async def get_current_user_async(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(oauth2_scheme),
     session: AsyncSession = Depends(get_db_session),  # noqa: F401
 ):
     """Validate JWT and return a dummy user object for auth gatekeeping.
 
     This does not look up the user in DB to keep the stub minimal, but
-    verifies the token structure to avoid accepting random strings.
+    relies on the token verified by the request's auth context to avoid
+    accepting random strings.
     """
     from fastapi import status
 
@@ -48,18 +49,9 @@ async def get_current_user_async(
     if credentials is None or not getattr(credentials, "credentials", None):
         raise credentials_exception
 
-    try:
-        payload = jwt.decode(
-            credentials.credentials,
-            SECRET_KEY,
-            algorithms=[ALGORITHM],
-            audience=JWT_AUDIENCE,
-            issuer=JWT_ISSUER,
-        )
-        username: str = payload.get("sub")
-        if not username:
-            raise credentials_exception
-    except JWTError:
+    auth = get_auth_context(request)
+    username = auth.subject
+    if not auth.authenticated or not username:
         raise credentials_exception
 
     # Return a minimal user-like object
@@ -21,43 +21,53 @@ ENDPOINTS:
 4. POST /v1/escalation/validate - Validate an escalation trigger
 5. POST /v1/escalation/analyze - Analyze task context for escalation decision
 6. POST /v1/escalation/detect - Detect escalation triggers for a task
-7. GET /v1/escalation/health - Health check for the escalation system
-8. DELETE /v1/escalation/workflow/{workflow_id} - Cancel a running escalation workflow
+7. POST /v1/escalation/detect:batch - Detect escalation triggers for many tasks (NDJSON stream)
+8. POST /v1/escalation/analyze:batch - Analyze the context of many tasks (NDJSON stream)
+9. GET /v1/escalation/health - Health check for the escalation system
+10. DELETE /v1/escalation/workflow/{workflow_id} - Cancel a running escalation workflow
+
+main.py mounts the router at the application root and requires an authenticated
+user (``get_current_user``) for every endpoint.
 """
 
+import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
-from .escalation_triggers import (
+from ..escalation_triggers import (
     EscalationDetector,
-    EscalationAssessment,
-    should_escalate_task
+    EscalationAssessment
 )
-from .context_analysis import (
+from ..context_analysis import (
     ContextAnalyzer,
-    ContextAnalysisResult,
-    analyze_task_context
+    ContextAnalysisResult
 )
-from .escalation_workflow import (
+from ..escalation_workflow import (
     EscalationEngine,
+    get_escalation_engine,
     submit_escalation,
     get_escalation_status,
     get_escalation_stats
 )
-from .trigger_validation import (
+from ..escalation_scheduler import SchedulerFull
+from ..trigger_validation import (
     TriggerValidator,
     validate_escalation_trigger,
     get_validation_statistics
 )
-from .database import get_db
+from ..database import get_db
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/v1/escalation", tags=["escalation"])
 
+# Maximum number of tasks in a batch request
+MAX_BATCH_SIZE = 1000
+
 
 # Request/Response Models
 class EscalationRequest(BaseModel):
@@ -114,6 +124,73 @@ class AnalysisResponse(BaseModel):
     key_factors: List[str]
 
 
+class DetectionBatchItem(EscalationRequest):
+    id: Optional[str] = Field(None, description="Client identifier echoed in the task's result line")
+
+
+class DetectionBatchRequest(BaseModel):
+    tasks: List[DetectionBatchItem] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class AnalysisBatchItem(AnalysisRequest):
+    id: Optional[str] = Field(None, description="Client identifier echoed in the task's result line")
+
+
+class AnalysisBatchRequest(BaseModel):
+    tasks: List[AnalysisBatchItem] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+def _detection_result(assessment: EscalationAssessment) -> Dict[str, Any]:
+    """Build the response body of a trigger detection."""
+    return {
+        "should_escalate": assessment.should_escalate,
+        "confidence": assessment.confidence,
+        "recommended_model": assessment.recommended_model,
+        "fallback_model": assessment.fallback_model,
+        "primary_reason": assessment.primary_reason,
+        "triggers": [
+            {
+                "reason": trigger.reason.value,
+                "priority": trigger.priority.value,
+                "description": trigger.description,
+                "confidence": trigger.confidence
+            }
+            for trigger in assessment.triggers
+        ],
+        "cost_impact_estimate": assessment.cost_impact_estimate,
+        "risk_assessment": assessment.risk_assessment
+    }
+
+
+def _analysis_result(context_analysis: ContextAnalysisResult) -> AnalysisResponse:
+    """Build the response body of a context analysis."""
+    return AnalysisResponse(
+        complexity_level=context_analysis.overall_complexity.value,
+        business_impact=context_analysis.business_impact.overall_impact.value,
+        risk_level=context_analysis.risk_assessment.overall_risk.value,
+        overall_recommendation=context_analysis.escalation_recommendation,
+        confidence_score=context_analysis.confidence_score,
+        key_factors=context_analysis.key_factors
+    )
+
+
+async def _stream_batch(
+    items: List[Any],
+    results: AsyncIterator[Any],
+    render: Callable[[Any], Dict[str, Any]],
+    what: str
+) -> AsyncIterator[bytes]:
+    """Serialize batch results as NDJSON, one line per task in completion order."""
+    async for index, result in results:
+        line: Dict[str, Any] = {"index": index, "id": items[index].id}
+        if isinstance(result, Exception):
+            logger.error(f"Error {what} batch task {index}: {str(result)}")
+            line.update(code=500, error=f"Failed {what}: {str(result)}")
+        else:
+            line.update(code=200, result=render(result))
+        yield (json.dumps(line) + "\n").encode()
+
+
 # API Endpoints
 @router.post("/submit", response_model=EscalationResponse)
 async def submit_escalation_request(request: EscalationRequest):
@@ -157,6 +234,7 @@ async def submit_escalation_request(request: EscalationRequest):
     Raises:
         HTTPException: If there's an error processing the escalation request
             - 400: Invalid request parameters
+            - 503: Escalation queue is full
             - 500: Internal server error during escalation processing
     """
     try:
@@ -183,6 +261,8 @@ async def submit_escalation_request(request: EscalationRequest):
             message=f"Escalation request submitted successfully"
         )
     
+    except SchedulerFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
     except Exception as e:
         logger.error(f"Error submitting escalation request: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to submit escalation request: {str(e)}")
@@ -196,6 +276,8 @@ async def get_escalation_workflow_status(workflow_id: str):
     Returns the current state, progress, and results of an escalation workflow.
     This endpoint provides detailed information about the escalation process,
     including the workflow state, execution progress, and final outcome.
+    Workflows are read from the shared workflow store, so any worker can
+    answer for workflows started on another worker or before a restart.
     
     Args:
         workflow_id (str): The unique identifier of the escalation workflow
@@ -221,7 +303,7 @@ async def get_escalation_workflow_status(workflow_id: str):
             - 500: Internal server error during status retrieval
     """
     try:
-        workflow = get_escalation_status(workflow_id)
+        workflow = await get_escalation_status(workflow_id)
         
         if not workflow:
             raise HTTPException(status_code=404, detail="Workflow not found")
@@ -256,7 +338,7 @@ async def get_escalation_system_statistics():
     Returns comprehensive statistics about the escalation system performance.
     """
     try:
-        escalation_stats = get_escalation_stats()
+        escalation_stats = await get_escalation_stats()
         validation_stats = get_validation_statistics()
         
         return {
@@ -282,7 +364,7 @@ async def validate_escalation_trigger(request: ValidationRequest):
     try:
         # For now, we'll create a simple trigger from the request data
         # In a real implementation, this would be more sophisticated
-        from .escalation_triggers import EscalationTrigger, EscalationReason
+        from ..escalation_triggers import EscalationTrigger, EscalationReason
         
         # Create trigger (simplified for demo)
         trigger = EscalationTrigger(
@@ -324,22 +406,15 @@ async def analyze_task_context(request: AnalysisRequest):
     business impact, and risk factors to inform escalation decisions.
     """
     try:
-        # Perform context analysis
-        context_analysis = analyze_task_context(
+        # Perform context analysis (memoized for resubmitted tasks)
+        context_analysis = get_escalation_engine().assessment_cache.analyze(
             task_description=request.task_description,
             files_to_modify=request.files_to_modify,
             file_contents=request.file_contents,
             task_type=request.task_type
         )
         
-        return AnalysisResponse(
-            complexity_level=context_analysis.overall_complexity.value,
-            business_impact=context_analysis.business_impact.overall_impact.value,
-            risk_level=context_analysis.risk_assessment.overall_risk.value,
-            overall_recommendation=context_analysis.escalation_recommendation,
-            confidence_score=context_analysis.confidence_score,
-            key_factors=context_analysis.key_factors
-        )
+        return _analysis_result(context_analysis)
     
     except Exception as e:
         logger.error(f"Error analyzing task context: {str(e)}")
@@ -355,38 +430,80 @@ async def detect_escalation_triggers(request: EscalationRequest):
     escalation to Claude 4.1 Opus.
     """
     try:
-        # Perform trigger detection
-        assessment = should_escalate_task(
+        # Perform trigger detection (memoized for resubmitted tasks)
+        assessment = get_escalation_engine().assessment_cache.detect(
             task_description=request.task_description,
             files_to_modify=request.files_to_modify,
             current_files=request.current_files,
             task_type=request.task_type
         )
         
-        return {
-            "should_escalate": assessment.should_escalate,
-            "confidence": assessment.confidence,
-            "recommended_model": assessment.recommended_model,
-            "fallback_model": assessment.fallback_model,
-            "primary_reason": assessment.primary_reason,
-            "triggers": [
-                {
-                    "reason": trigger.reason.value,
-                    "priority": trigger.priority.value,
-                    "description": trigger.description,
-                    "confidence": trigger.confidence
-                }
-                for trigger in assessment.triggers
-            ],
-            "cost_impact_estimate": assessment.cost_impact_estimate,
-            "risk_assessment": assessment.risk_assessment
-        }
+        return _detection_result(assessment)
     
     except Exception as e:
         logger.error(f"Error detecting escalation triggers: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to detect escalation triggers: {str(e)}")
 
 
+@router.post("/detect:batch")
+async def detect_escalation_triggers_batch(batch: DetectionBatchRequest):
+    """
+    Detect escalation triggers for many tasks
+    
+    Replaces one /detect call per task of a plan. Tasks are scored in
+    chunks off the event loop through the assessment cache, and the response
+    is streamed as NDJSON, one line per task as soon as it is scored (not in request
+    order); ``index`` is the task's position in the request and ``id`` the
+    identifier it was given:
+    
+        {"index": 3, "id": "step-4", "code": 200, "result": {...same as /detect...}}
+        {"index": 0, "id": "step-1", "code": 500, "error": "..."}
+    
+    Args:
+        batch (DetectionBatchRequest): Tasks (1 to MAX_BATCH_SIZE)
+        
+    Returns:
+        StreamingResponse: NDJSON result lines
+    """
+    cache = get_escalation_engine().assessment_cache
+    results = cache.detect_batch([item.model_dump() for item in batch.tasks])
+    return StreamingResponse(
+        _stream_batch(batch.tasks, results, _detection_result, "detecting escalation triggers"),
+        media_type="application/x-ndjson"
+    )
+
+
+@router.post("/analyze:batch")
+async def analyze_task_context_batch(batch: AnalysisBatchRequest):
+    """
+    Analyze the context of many tasks
+    
+    Replaces one /analyze call per task of a plan. Tasks are analyzed in
+    chunks through the assessment cache; the Python sources of a chunk are
+    parsed together, in the source metrics process pool when it is enabled,
+    which parses the next chunk while the current one is scored. The
+    response is streamed as NDJSON in completion order, like /detect:batch,
+    with /analyze response bodies as results.
+    
+    Args:
+        batch (AnalysisBatchRequest): Tasks (1 to MAX_BATCH_SIZE)
+        
+    Returns:
+        StreamingResponse: NDJSON result lines
+    """
+    cache = get_escalation_engine().assessment_cache
+    results = cache.analyze_batch([item.model_dump() for item in batch.tasks])
+    return StreamingResponse(
+        _stream_batch(
+            batch.tasks,
+            results,
+            lambda analysis: _analysis_result(analysis).model_dump(),
+            "analyzing task context"
+        ),
+        media_type="application/x-ndjson"
+    )
+
+
 @router.get("/health")
 async def escalation_health_check():
     """
@@ -397,7 +514,7 @@ async def escalation_health_check():
     try:
         # Check if escalation engine is available
         try:
-            stats = get_escalation_stats()
+            stats = await get_escalation_stats()
             engine_status = "healthy"
         except Exception:
             engine_status = "unhealthy"
@@ -437,7 +554,7 @@ async def cancel_escalation_workflow(workflow_id: str):
     """
     try:
         engine = get_escalation_engine()
-        success = engine.cancel_workflow(workflow_id)
+        success = await engine.cancel_workflow(workflow_id)
         
         if not success:
             raise HTTPException(status_code=404, detail="Workflow not found or already completed")
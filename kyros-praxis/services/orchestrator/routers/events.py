@@ -20,6 +20,10 @@ Key Features:
 - Support for both continuous streaming and one-time event retrieval
 - Heartbeat mechanism for persistent connections
 - ETag-based caching for efficient data transfer
+- Segmented, indexed storage (see event_log.py) so appends are O(1) and
+  tails seek directly to an offset instead of loading the whole backlog
+- Resumable live tails: SSE ids are log sequence numbers, reconnects honor
+  Last-Event-ID, and new events are pushed as soon as they are appended
 
 ENDPOINTS:
 1. POST /events - Append a new event to the events log
@@ -27,13 +31,13 @@ ENDPOINTS:
 """
 
 import asyncio
-import hashlib
 import json
 import os
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
-from fastapi import APIRouter, Depends, Request, Response
+from fastapi import APIRouter, Depends, Header, Request, Response
 from pydantic import BaseModel
 from starlette.responses import StreamingResponse
 
@@ -41,19 +45,40 @@ try:
     # When running as a package (e.g., tests in monorepo)
     from ..auth import get_current_user
     from ..app.core.logging import log_orchestrator_event
+    from ..event_log import EventLog, get_event_log, get_watcher
 except ImportError:
     # Fallbacks when running module directly from the service directory
     try:
         from .auth import get_current_user  # type: ignore
         from .app.core.logging import log_orchestrator_event  # type: ignore
+        from .event_log import EventLog, get_event_log, get_watcher  # type: ignore
     except Exception:  # pragma: no cover
         # Fallback when running from repo root
         from services.orchestrator.auth import get_current_user  # type: ignore
         from services.orchestrator.app.core.logging import log_orchestrator_event  # type: ignore
+        from services.orchestrator.event_log import EventLog, get_event_log, get_watcher  # type: ignore
 
 # Create the API router for event endpoints
 router = APIRouter(prefix="/events", tags=["events"])
 
+# Number of backlog events read from disk per batch when tailing
+TAIL_BATCH_SIZE = 256
+
+# Idle seconds between heartbeat comments on live tails
+TAIL_HEARTBEAT_SECONDS = 30
+
+
+def _get_log() -> EventLog:
+    """
+    Resolve the shared event log for the configured events directory.
+
+    Paths are env-driven for testability and resolved on each call so tests
+    can point EVENTS_DIR at a temporary directory; the log itself is cached
+    per path by get_event_log().
+    """
+    events_dir = Path(os.getenv("EVENTS_DIR", Path(__file__).parent.parent.parent.parent / "collaboration/events"))
+    return get_event_log(events_dir, os.getenv("EVENTS_FILE", "events.jsonl"))
+
 
 class EventCreate(BaseModel):
     """
@@ -80,8 +105,9 @@ def append_event(
     This endpoint appends a new event to the event log file, which is used for
     tracking important occurrences in the system for audit, monitoring, and
     collaboration purposes. The event includes a timestamp, event type, actor
-    (authenticated user), target, and optional details. The endpoint computes
-    and returns an ETag for the entire events file to support caching.
+    (authenticated user), target, and optional details. The returned ETag
+    identifies the state of the whole log; it is derived from the log's
+    sequence number, so computing it does not depend on the log size.
     
     Args:
         event (EventCreate): Event data to append including event type, target, and details
@@ -94,12 +120,6 @@ def append_event(
     Raises:
         HTTPException: If file operations fail or authentication fails
     """
-    # Use env-driven paths for testability
-    events_dir = Path(os.getenv("EVENTS_DIR", Path(__file__).parent.parent.parent.parent / "collaboration/events"))
-    events_file = events_dir / os.getenv("EVENTS_FILE", "events.jsonl")
-    if not events_dir.exists():
-        events_dir.mkdir(parents=True)
-    
     event_data = {
         "ts": datetime.now().isoformat(),
         "event": event.event,
@@ -107,15 +127,10 @@ def append_event(
         "target": event.target,
         "details": event.details,
     }
-    
-    with open(events_file, "a") as f:
-        f.write(json.dumps(event_data) + "\n")
-    
-    # Compute ETag for the entire file
-    with open(events_file, "rb") as f:
-        content = f.read()
-    etag = hashlib.sha256(content).hexdigest()
-    response.headers["ETag"] = f'"{etag}"'
+
+    log = _get_log()
+    log.append(event_data)
+    response.headers["ETag"] = log.etag
     
     # Log orchestrator event
     log_orchestrator_event(
@@ -133,6 +148,8 @@ def append_event(
 async def events_tail(
     request: Request,
     once: bool = False,
+    since: Optional[int] = None,
+    last_event_id: Optional[str] = Header(default=None, alias="Last-Event-ID"),
     current_user=Depends(get_current_user),
  ):
     """
@@ -142,11 +159,22 @@ async def events_tail(
     for real-time monitoring and collaboration. It first sends the backlog of
     existing events, then optionally continues streaming new events as they occur.
     The endpoint supports both one-time streaming (with 'once' parameter) and
-    continuous streaming with periodic heartbeat messages.
+    continuous streaming with periodic heartbeat messages. The backlog is read
+    lazily in small batches using the log's offset index, so only events after
+    the resume position are touched and the whole history is never held in memory.
+
+    Every event carries its log sequence number as the SSE ``id`` field. Browsers
+    resend the last one in the ``Last-Event-ID`` header when they reconnect, and
+    the stream resumes right after it instead of replaying the backlog. The
+    header takes precedence over 'since' because EventSource reconnects reuse the
+    original URL. In live mode new events are pushed as soon as they are appended,
+    whether by this process or by another writer of the same log file.
     
     Args:
         request (Request): FastAPI request object
         once (bool): Whether to stream only once (backlog only) or keep connection alive (default: False)
+        since (Optional[int]): Only stream events with a sequence number greater than this
+        last_event_id (Optional[str]): SSE Last-Event-ID header sent on reconnect
         current_user: Authenticated user (from get_current_user dependency)
         
     Returns:
@@ -155,39 +183,50 @@ async def events_tail(
     Raises:
         HTTPException: If file operations fail or authentication fails
     """
-    # Use env-driven paths for testability
-    events_dir = Path(os.getenv("EVENTS_DIR", Path(__file__).parent.parent.parent.parent / "collaboration/events"))
-    events_file = events_dir / os.getenv("EVENTS_FILE", "events.jsonl")
-    events = []
-    if events_file.exists():
-        with open(events_file, "r") as f:
-            for line in f:
-                raw = line.strip()
-                if not raw:
-                    continue
-                # Support concatenated JSON objects without newline by splitting on '}{'
-                normalized = raw.replace('}{', '}\n{')
-                for part in normalized.splitlines():
-                    part = part.strip()
-                    if not part:
-                        continue
-                    try:
-                        events.append(json.loads(part))
-                    except Exception:
-                        # Skip malformed segment
-                        continue
+    log = _get_log()
+    start = -1 if since is None else since
+    if last_event_id is not None:
+        try:
+            start = int(last_event_id)
+        except ValueError:
+            # Not one of our ids; fall back to 'since'
+            pass
+    backlog_end = log.last_seq
+
+    async def send_until(after: int, upto: int):
+        # Stream events in (after, upto], one index-seeked batch at a time
+        while after < upto:
+            batch = await asyncio.to_thread(
+                lambda: list(log.read(after=after, limit=min(TAIL_BATCH_SIZE, upto - after)))
+            )
+            if not batch:
+                return
+            for seq, ev in batch:
+                yield seq, f"id: {seq}\ndata: {json.dumps(ev)}\n\n"
+            after = batch[-1][0]
 
     async def event_generator():
         # send backlog first
-        for ev in events:
-            yield f"data: {json.dumps(ev)}\n\n"
+        after = start
+        async for seq, chunk in send_until(after, backlog_end):
+            after = seq
+            yield chunk
         if once:
             return
-        # keep-alive loop
-        while True:
-            await asyncio.sleep(30)
-            # comment line per SSE spec
-            yield ": heartbeat\n\n"
+        # then follow the log, with a heartbeat whenever it stays idle
+        watcher = get_watcher(log)
+        watcher.subscribe()
+        try:
+            while not await request.is_disconnected():
+                if not await watcher.wait(after, TAIL_HEARTBEAT_SECONDS):
+                    # comment line per SSE spec
+                    yield ": heartbeat\n\n"
+                    continue
+                async for seq, chunk in send_until(after, log.last_seq):
+                    after = seq
+                    yield chunk
+        finally:
+            watcher.unsubscribe()
 
     headers = {
         "Cache-Control": "no-cache",
@@ -199,7 +238,8 @@ async def events_tail(
     log_orchestrator_event(
         event="events_streamed",
         user_id=current_user.id,
-        event_count=len(events),
+        event_count=max(backlog_end - start, 0),
+        resume_from=start,
         stream_once=once
     )
     
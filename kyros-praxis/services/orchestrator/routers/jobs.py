@@ -21,6 +21,7 @@ Job Lifecycle:
 3. Completed - Job has finished successfully
 4. Failed - Job encountered an error during processing
 5. Cancelled - Job was manually cancelled
+6. Dead - Job exhausted its queue attempts and was dead-lettered (see routers/queue.py)
 
 Key Features:
 - Full CRUD operations for job management
@@ -32,17 +33,32 @@ Key Features:
 
 ENDPOINTS:
 1. POST /jobs - Create a new job
-2. GET /jobs - List jobs with optional filtering
+2. GET /jobs - List jobs with optional filtering, sort order and keyset cursors
 3. GET /jobs/{job_id} - Retrieve a specific job
 4. PUT /jobs/{job_id}/status - Update job status
 5. DELETE /jobs/{job_id} - Delete a job
+6. POST /jobs:batch - Create many jobs in one transaction
+7. PATCH /jobs/status:batch - Update the status of many jobs in one transaction
+
+``GET /jobs/{job_id}?wait=30s`` long-polls: with an ETag the request is held
+until the job changes (every write path announces changes through
+app/core/job_notifier.py) or the wait expires.
+
+Batch endpoints validate every item, write all valid items with a single
+multi-row statement and commit once, and stream one NDJSON result line per
+item (with its own status code and ETag) so large batches are not buffered.
 """
 
+import base64
+import json
+import time
+from contextlib import nullcontext
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Response, BackgroundTasks, Header
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, BackgroundTasks, Header, Query
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -52,10 +68,14 @@ from sqlalchemy import select, delete
 from ..database import get_db_session
 from ..models import Job, User
 from ..utils.validation import JobCreate, validate_job_input
-from ..utils import generate_etag
+from ..utils.etag import collection_etag, etag_matches, query_stamp, resource_etag
+from ..repositories import jobs as jobs_repo
+from ..repositories.versions import bump_collection_version, get_collection_version
+from ..app.core.config import settings
+from ..app.core.job_notifier import get_job_notifier, parse_duration, publish_job_changes
 from ..app.core.logging import log_orchestrator_event
-
-from jose import jwt
+from ..auth import get_principal
+from ..auth_context import get_auth_context
 
 # Create the API router for job endpoints
 router = APIRouter(prefix="/jobs", tags=["jobs"])
@@ -63,6 +83,12 @@ router = APIRouter(prefix="/jobs", tags=["jobs"])
 # HTTP Bearer authentication scheme for JWT tokens
 oauth2_scheme = HTTPBearer(auto_error=False)
 
+# Change counter bumped on every write; backs the GET /jobs ETag
+JOBS_COLLECTION = jobs_repo.COLLECTION
+
+# Maximum number of items in one batch request
+MAX_BATCH_SIZE = 1000
+
 
 # Async authentication functions
 async def get_user_async(session: AsyncSession, username: str) -> Optional[User]:
@@ -84,16 +110,19 @@ async def get_user_async(session: AsyncSession, username: str) -> Optional[User]
 
 
 async def get_current_user_async(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(oauth2_scheme),
     session: AsyncSession = Depends(get_db_session),
 ):
     """
     FastAPI dependency to get the current authenticated user from JWT token asynchronously.
     
-    Decodes the JWT token from the Authorization header, validates it, and
-    retrieves the corresponding user from the database using asynchronous operations.
+    Reads the JWT token verified once per request by the auth context and
+    retrieves the corresponding user through the principal cache, falling
+    back to an asynchronous database query.
     
     Args:
+        request (Request): Incoming HTTP request carrying the auth context
         credentials (HTTPAuthorizationCredentials): Bearer token from Authorization header
         session (AsyncSession): Asynchronous database session dependency
         
@@ -103,33 +132,22 @@ async def get_current_user_async(
     Raises:
         HTTPException: If token is missing, invalid, or user not found (401 Unauthorized)
     """
-    from ..auth import JWT_ISSUER, JWT_AUDIENCE, SECRET_KEY, ALGORITHM
     from fastapi import HTTPException, status
-    from jose import JWTError
 
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        # Check if credentials are provided
-        if credentials is None or not getattr(credentials, "credentials", None):
-            raise credentials_exception
-        payload = jwt.decode(
-            credentials.credentials,
-            SECRET_KEY,
-            algorithms=[ALGORITHM],
-            audience=JWT_AUDIENCE,
-            issuer=JWT_ISSUER,
-        )
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-    except JWTError:
+    # Check if credentials are provided
+    if credentials is None or not getattr(credentials, "credentials", None):
+        raise credentials_exception
+    auth = get_auth_context(request)
+    username = auth.subject
+    if not auth.authenticated or username is None:
         raise credentials_exception
 
-    user = await get_user_async(session, username)
+    user = await get_principal(session, username)
     if user is None:
         raise credentials_exception
     return user
@@ -152,6 +170,7 @@ async def _create_job(session: AsyncSession, title: str):
     # Map Day-1 JobCreate.title -> Job.name
     job = Job(name=title)
     session.add(job)
+    await bump_collection_version(session, JOBS_COLLECTION)
     await session.commit()
     await session.refresh(job)
     
@@ -178,6 +197,18 @@ class JobStatus(str, Enum):
     COMPLETED = "completed"
     FAILED = "failed"
     CANCELLED = "cancelled"
+    DEAD = "dead"
+
+
+class JobSort(str, Enum):
+    """
+    Sort orders for listing jobs.
+    
+    Ties are broken by job ID, so every order is total and pages are stable.
+    """
+    PRIORITY = "priority"  # highest priority first, then oldest first
+    CREATED_AT = "created_at"  # oldest first
+    CREATED_AT_DESC = "-created_at"  # newest first
 
 
 class JobCreate(BaseModel):
@@ -213,6 +244,84 @@ class JobResponse(BaseModel):
     updated_at: Optional[datetime] = None
 
 
+class JobBatchCreate(BaseModel):
+    """
+    Request model for creating many jobs at once.
+    
+    Items are validated one by one with ``validate_job_input`` so that an
+    invalid item is reported in its result line instead of failing the batch.
+    Each item takes a ``title`` and optional ``description`` and ``priority``.
+    """
+
+    jobs: List[Dict[str, Any]] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class JobStatusChange(BaseModel):
+    """
+    A single status change in a batch status update.
+    
+    ``if_match`` optionally carries the job's last known ETag; the change is
+    rejected with 412 if the job has been modified since.
+    """
+
+    id: str
+    status: JobStatus
+    if_match: Optional[str] = None
+
+
+class JobStatusBatch(BaseModel):
+    """Request model for updating the status of many jobs at once."""
+
+    updates: List[JobStatusChange] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+def _encode_cursor(job: Any, sort: JobSort) -> str:
+    """Encode the keyset position of a job in a sort order as an opaque cursor."""
+    key = [value.isoformat() if isinstance(value, datetime) else value for value in jobs_repo.page_key(job, sort.value)]
+    raw = json.dumps([sort.value, *key], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort: JobSort) -> List[Any]:
+    """Decode a cursor produced by _encode_cursor for the same sort order."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, *key = json.loads(base64.urlsafe_b64decode(padded))
+        columns = [column.key for column, _ in jobs_repo.SORTS[sort.value]]
+        if cursor_sort != sort.value or len(key) != len(columns):
+            raise ValueError("cursor does not match the sort order")
+        return [
+            datetime.fromisoformat(value) if column == "created_at"
+            else int(value) if column == "priority"
+            else str(value)
+            for column, value in zip(columns, key)
+        ]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _job_result(index: int, code: int, job: Any) -> Dict[str, Any]:
+    """Build the result line of a batch item that was written."""
+    return {
+        "index": index,
+        "code": code,
+        "etag": resource_etag("job", job["id"], updated_at=job["updated_at"]),
+        "job": JobResponse(
+            id=job["id"],
+            name=job["name"],
+            status=JobStatus(job["status"]),
+            created_at=job["created_at"],
+            updated_at=job["updated_at"],
+        ).model_dump(mode="json"),
+    }
+
+
+async def _stream_results(results: Iterable[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """Serialize batch results as NDJSON, one line per item."""
+    for result in results:
+        yield (json.dumps(result) + "\n").encode()
+
+
 @router.post("/", response_model=JobResponse, status_code=201, summary="Create a new job", description="Create a new job with the specified parameters and return the created job details")
 async def create_job(
     job: JobCreate,
@@ -272,16 +381,16 @@ async def create_job(
         name=db_job.name,
         status=JobStatus.PENDING,
         created_at=db_job.created_at,
+        updated_at=db_job.updated_at,
     )
 
-    # Generate ETag for the response
-    etag = generate_etag(job_response.model_dump())
-    response.headers["ETag"] = etag
+    # Derive the ETag from the row's update timestamp
+    response.headers["ETag"] = resource_etag("job", db_job.id, updated_at=db_job.updated_at)
 
     return job_response
 
 
-@router.get("/", response_model=List[JobResponse], summary="List jobs", description="List jobs with optional filtering by status and pagination support")
+@router.get("/", response_model=List[JobResponse], summary="List jobs", description="List jobs with optional filtering by status, sort order and keyset pagination")
 async def list_jobs(
     skip: int = 0,
     limit: int = 100,
@@ -290,6 +399,8 @@ async def list_jobs(
     current_user: User = Depends(get_current_user_async),
     response: Response = None,
     if_none_match: Optional[str] = Header(default=None, alias="If-None-Match"),
+    sort: JobSort = Query(default=JobSort.PRIORITY, description="Sort order: priority, created_at or -created_at"),
+    cursor: Optional[str] = Query(default=None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
 ):
     """
     List jobs with optional filtering by status.
@@ -299,6 +410,12 @@ async def list_jobs(
     ETag-based caching to reduce bandwidth usage and improve performance for
     clients that poll this endpoint frequently.
     
+    Jobs are returned in a deterministic ``sort`` order (ties broken by ID).
+    Pages are keyset-paginated: when more jobs follow, the ``X-Next-Cursor``
+    header carries a cursor for the next page, which is read from the
+    matching composite index without skipping rows, so deep pages cost the
+    same as the first. ``skip`` still works but is O(skip).
+    
     Args:
         skip (int): Number of jobs to skip for pagination (default: 0)
         limit (int): Maximum number of jobs to return (default: 100, max: 1000)
@@ -307,6 +424,8 @@ async def list_jobs(
         current_user (User): Authenticated user (from get_current_user_async dependency)
         response (Response): HTTP response object for setting headers
         if_none_match (Optional[str]): Client's ETag for conditional requests (If-None-Match header)
+        sort (JobSort): Sort order of the listing (default: priority)
+        cursor (Optional[str]): Position after which to continue listing
         
     Returns:
         List[JobResponse]: List of job details matching the query criteria
@@ -318,23 +437,37 @@ async def list_jobs(
             
     Raises:
         HTTPException: If database operation encounters an error
+            - 400: Malformed cursor, or a cursor from another sort order
             - 401: Authentication failed
             - 500: Internal server error during job listing
     """
-    query = select(Job)
-    if status:
-        query = query.where(Job.status == status)
-    query = query.offset(skip).limit(limit)
-    
-    result = await db.execute(query)
-    jobs = result.scalars().all()
+    after = _decode_cursor(cursor, sort) if cursor else None
+    limit = min(max(limit, 1), 1000)
+    skip = max(skip, 0)
+    status_filter = status.value if status else None
+
+    # Answer conditional requests from the collection version and the requested page alone
+    epoch, version = await get_collection_version(db, JOBS_COLLECTION)
+    page = query_stamp(status=status_filter, sort=sort.value, cursor=cursor, skip=skip, limit=limit)
+    etag = collection_etag("jobs", epoch, version, page)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    jobs, has_more = await jobs_repo.list_jobs_page(
+        db,
+        status=status_filter,
+        sort=sort.value,
+        after=after,
+        limit=limit,
+        offset=skip,
+    )
     
     # Log orchestrator event
     log_orchestrator_event(
         event="jobs_listed",
         user_id=current_user.id,
         count=len(jobs),
-        filter_status=status.value if status else None
+        filter_status=status_filter
     )
     
     job_responses = [
@@ -348,30 +481,30 @@ async def list_jobs(
         for job in jobs
     ]
 
-    # Generate ETag for the response
-    response_data = [job.model_dump() for job in job_responses]
-    etag = generate_etag(response_data)
-
-    # Handle conditional requests
-    if if_none_match:
-        # Remove quotes from ETag for comparison
-        client_etag = if_none_match.strip('"')
-        server_etag = etag.strip('"')
-        if client_etag == server_etag:
-            response.status_code = 304
-            return []
-
-    # Set ETag header
+    # Set ETag and pagination headers
     response.headers["ETag"] = etag
+    if has_more:
+        response.headers["X-Next-Cursor"] = _encode_cursor(jobs[-1], sort)
 
     return job_responses
 
 
+async def _load_job(db: AsyncSession, job_id: str) -> Optional[Job]:
+    result = await db.execute(
+        select(Job).where(Job.id == job_id).execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
+
 @router.get("/{job_id}", response_model=JobResponse, summary="Get job by ID", description="Retrieve a specific job by its unique identifier")
 async def get_job(
     job_id: str,
     db: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user_async),
+    response: Response = None,
+    if_none_match: Optional[str] = Header(default=None, alias="If-None-Match"),
+    wait: Optional[str] = Query(default=None, description="Long-poll: hold the request up to this long (e.g. 30s) until the job changes"),
+    if_none_match_param: Optional[str] = Query(default=None, alias="if-none-match"),
 ):
     """
     Get a specific job by ID.
@@ -379,21 +512,56 @@ async def get_job(
     This endpoint retrieves the details of a specific job identified by its
     unique ID. If the job does not exist, it returns a 404 Not Found error.
     The endpoint logs both successful retrievals and not-found attempts for
-    audit and monitoring purposes.
+    audit and monitoring purposes. It supports conditional GET requests with
+    an ETag derived from the job's update timestamp.
+    
+    With ``wait`` and an ETag (If-None-Match header or ``if-none-match``
+    query parameter), the request is held open while the job still matches
+    the ETag: it returns 200 as soon as the job changes, 404 if it is
+    deleted, or 304 when the wait (capped at JOB_WAIT_MAX_SECONDS) expires.
+    No database connection is held while waiting.
     
     Args:
         job_id (str): ID of the job to retrieve
         db (AsyncSession): Asynchronous database session dependency
         current_user (User): Authenticated user (from get_current_user_async dependency)
+        response (Response): HTTP response object for setting headers
+        if_none_match (Optional[str]): Client's ETag for conditional requests (If-None-Match header)
+        wait (Optional[str]): Maximum time to wait for a change (e.g. "30s", "500ms")
+        if_none_match_param (Optional[str]): Client's ETag as a query parameter
         
     Returns:
         JobResponse: Job details including ID, name, status, and timestamps
         
     Raises:
-        HTTPException: If the job is not found (status code 404)
+        HTTPException: If the job is not found (404) or ``wait`` is malformed (400)
     """
-    result = await db.execute(select(Job).where(Job.id == job_id))
-    job = result.scalar_one_or_none()
+    if_none_match = if_none_match or if_none_match_param
+    timeout = 0.0
+    if wait is not None:
+        try:
+            timeout = min(parse_duration(wait), settings.JOB_WAIT_MAX_SECONDS)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    if not if_none_match:
+        timeout = 0.0
+
+    with get_job_notifier().watch(job_id) if timeout else nullcontext() as watch:
+        # The watch is registered before the read, so a change committed
+        # between the read and the wait still wakes this request
+        job = await _load_job(db, job_id)
+        deadline = time.monotonic() + timeout
+        while job is not None and timeout and etag_matches(
+            if_none_match, resource_etag("job", job.id, updated_at=job.updated_at)
+        ):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # End the read transaction so the pooled connection is released while waiting
+            await db.commit()
+            if not await watch.wait(remaining):
+                break
+            job = await _load_job(db, job_id)
     
     if not job:
         # Log orchestrator event
@@ -414,6 +582,12 @@ async def get_job(
         status=job.status
     )
     
+    etag = resource_etag("job", job.id, updated_at=job.updated_at)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    if response is not None:
+        response.headers["ETag"] = etag
+    
     return JobResponse(
         id=job.id,
         name=job.name,
@@ -429,6 +603,7 @@ async def update_job_status(
     status: JobStatus,
     db: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user_async),
+    response: Response = None,
 ):
     """
     Update the status of a job.
@@ -443,6 +618,7 @@ async def update_job_status(
         status (JobStatus): New status for the job (pending, running, completed, failed, cancelled)
         db (AsyncSession): Asynchronous database session dependency
         current_user (User): Authenticated user (from get_current_user_async dependency)
+        response (Response): HTTP response object for setting headers
         
     Returns:
         JobResponse: Updated job details including new status and updated timestamp
@@ -468,8 +644,10 @@ async def update_job_status(
     # Update the job status
     job.status = status.value
     job.updated_at = datetime.utcnow()
+    await bump_collection_version(db, JOBS_COLLECTION)
     await db.commit()
     await db.refresh(job)
+    await publish_job_changes(db, [job.id])
     
     # Log orchestrator event
     log_orchestrator_event(
@@ -481,6 +659,9 @@ async def update_job_status(
         new_status=status.value
     )
     
+    if response is not None:
+        response.headers["ETag"] = resource_etag("job", job.id, updated_at=job.updated_at)
+    
     return JobResponse(
         id=job.id,
         name=job.name,
@@ -490,6 +671,133 @@ async def update_job_status(
     )
 
 
+@router.post(":batch", summary="Create jobs in bulk", description="Create many jobs in one transaction and stream a result line per item")
+async def create_jobs_batch(
+    batch: JobBatchCreate,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user_async),
+):
+    """
+    Create many jobs in one request.
+    
+    Every item is validated with ``validate_job_input``; all valid items are
+    inserted with a single multi-row INSERT and committed together, so a
+    batch costs one round trip and one commit instead of one per job. The
+    response is streamed as NDJSON with one line per item, in request order:
+    
+        {"index": 0, "code": 201, "etag": "...", "job": {...}}
+        {"index": 1, "code": 422, "error": "..."}
+    
+    Args:
+        batch (JobBatchCreate): Jobs to create (1 to MAX_BATCH_SIZE items)
+        db (AsyncSession): Asynchronous database session dependency
+        current_user (User): Authenticated user (from get_current_user_async dependency)
+        
+    Returns:
+        StreamingResponse: NDJSON result lines
+        
+    Raises:
+        HTTPException: If the request body is malformed or too large (422)
+    """
+    valid: List[Dict[str, Any]] = []
+    errors: Dict[int, str] = {}
+    for index, item in enumerate(batch.jobs):
+        try:
+            validated = validate_job_input(item)
+            if len(validated.title) > 255:
+                raise ValueError("Invalid job input: title is longer than 255 characters")
+        except ValueError as e:
+            errors[index] = str(e)
+            continue
+        valid.append({"name": validated.title, "description": validated.description, "priority": validated.priority})
+
+    rows = await jobs_repo.create_jobs(db, valid) if valid else []
+
+    log_orchestrator_event(
+        event="jobs_batch_created",
+        user_id=current_user.id,
+        count=len(rows),
+        rejected=len(errors),
+    )
+
+    def results() -> Iterable[Dict[str, Any]]:
+        created = iter(rows)
+        for index in range(len(batch.jobs)):
+            if index in errors:
+                yield {"index": index, "code": 422, "error": errors[index]}
+            else:
+                yield _job_result(index, 201, next(created))
+
+    return StreamingResponse(_stream_results(results()), media_type="application/x-ndjson")
+
+
+@router.patch("/status:batch", summary="Update job statuses in bulk", description="Update the status of many jobs in one transaction and stream a result line per item")
+async def update_job_statuses_batch(
+    batch: JobStatusBatch,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user_async),
+):
+    """
+    Update the status of many jobs in one request.
+    
+    The affected jobs are loaded with one query, and all applicable changes
+    are written with a single bulk UPDATE and committed together. Each item
+    gets a result line, in request order:
+    
+    - 200 with the new ETag when the status was updated
+    - 404 when the job does not exist
+    - 409 when the same job appears again later in the batch
+    - 412 when ``if_match`` does not match the job's current ETag
+    
+    Args:
+        batch (JobStatusBatch): Status changes (1 to MAX_BATCH_SIZE items)
+        db (AsyncSession): Asynchronous database session dependency
+        current_user (User): Authenticated user (from get_current_user_async dependency)
+        
+    Returns:
+        StreamingResponse: NDJSON result lines
+    """
+    existing = await jobs_repo.get_job_rows(db, list({change.id for change in batch.updates}))
+
+    last_index = {change.id: index for index, change in enumerate(batch.updates)}
+    now = datetime.utcnow()
+    outcomes: List[Dict[str, Any]] = []
+    changes: List[Dict[str, Any]] = []
+    for index, change in enumerate(batch.updates):
+        row = existing.get(change.id)
+        if row is None:
+            outcomes.append({"index": index, "code": 404, "error": "Job not found"})
+        elif last_index[change.id] != index:
+            outcomes.append({"index": index, "code": 409, "error": "Job updated again later in the batch"})
+        elif change.if_match and not etag_matches(
+            change.if_match, resource_etag("job", row.id, updated_at=row.updated_at)
+        ):
+            outcomes.append({"index": index, "code": 412, "error": "Job was modified"})
+        else:
+            job = {"id": row.id, "name": row.name, "status": change.status.value,
+                   "created_at": row.created_at, "updated_at": now}
+            outcomes.append({"index": index, "code": 200, "job": job})
+            changes.append({"id": row.id, "status": change.status.value, "updated_at": now})
+
+    if changes:
+        await jobs_repo.update_job_statuses(db, changes)
+        await publish_job_changes(db, [change["id"] for change in changes])
+
+    log_orchestrator_event(
+        event="jobs_batch_status_updated",
+        user_id=current_user.id,
+        count=len(changes),
+        rejected=len(outcomes) - len(changes),
+    )
+
+    def results() -> Iterable[Dict[str, Any]]:
+        for outcome in outcomes:
+            job = outcome.pop("job", None)
+            yield _job_result(outcome["index"], 200, job) if job is not None else outcome
+
+    return StreamingResponse(_stream_results(results()), media_type="application/x-ndjson")
+
+
 @router.delete("/{job_id}", summary="Delete a job", description="Delete a specific job by its unique identifier")
 async def delete_job(
     job_id: str,
@@ -533,7 +841,9 @@ async def delete_job(
     
     # Delete the job
     await db.execute(delete(Job).where(Job.id == job_id))
+    await bump_collection_version(db, JOBS_COLLECTION)
     await db.commit()
+    await publish_job_changes(db, [job_id])
     
     # Log orchestrator event
     log_orchestrator_event(
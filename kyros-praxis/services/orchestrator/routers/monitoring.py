@@ -26,9 +26,10 @@ ENDPOINTS:
 1. GET /monitoring/health - Comprehensive health check
 2. GET /monitoring/metrics - System and application metrics
 3. GET /monitoring/database/health - Database health check
-4. GET /monitoring/logs/recent - Recent application logs
-5. GET /monitoring/performance - Application performance metrics
-6. GET /monitoring/dependencies - External dependency health checks
+4. GET /monitoring/database/pool - Connection pool checkout and wait metrics
+5. GET /monitoring/logs/recent - Recent application logs
+6. GET /monitoring/performance - Application performance metrics
+7. GET /monitoring/dependencies - External dependency health checks
 """
 
 import time
@@ -42,10 +43,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 try:
     from ..database import get_db
+    from ..db_engine import get_pool_metrics
     from ..app.core.config import settings
 except ImportError:
     # Fallback for environments where config is not available
     from ..database import get_db  # type: ignore
+    from ..db_engine import get_pool_metrics  # type: ignore
     try:
         from app.core.config import settings
     except ImportError:
@@ -335,6 +338,26 @@ async def database_health_check(db: AsyncSession = Depends(get_db) if get_db els
         }
 
 
+@router.get("/database/pool", summary="Database pool metrics", description="Return connection pool checkout, checkin and wait metrics for each database engine")
+async def database_pool_metrics():
+    """
+    Database connection pool metrics endpoint.
+
+    Reports, per engine, the connect/checkout/checkin/invalidation counters,
+    the time spent waiting for a pooled connection, and the current pool
+    gauges. Rising wait times with ``checkedout`` at ``size + overflow`` mean
+    the pool is undersized for the load (see ``DB_POOL_SIZE`` and
+    ``DB_MAX_OVERFLOW``).
+
+    Returns:
+        dict: Pool metrics keyed by engine name
+    """
+    return {
+        "engines": get_pool_metrics(),
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+
+
 @router.get("/logs/recent", summary="Get recent application logs", description="Retrieve recent application log entries for debugging and monitoring")
 async def recent_logs(lines: int = 50):
     """
@@ -29,6 +29,7 @@ Key Features:
 ENDPOINTS:
 1. GET /orchestrator/events/stream - Stream orchestrator events as Server-Sent Events
 2. GET /orchestrator/events - Get orchestrator events for a specific task or run
+3. GET /orchestrator/events/metrics - Event broker subscriber and queue metrics
 """
 
 import asyncio
@@ -48,11 +49,11 @@ except ImportError:
 try:
     # When running as a package (e.g., tests in monorepo)
     from ..auth import get_current_user
-    from ..app.core.logging import stream_orchestrator_events
+    from ..app.core.logging import get_event_broker, stream_orchestrator_events
 except ImportError:
     # Fallback when running module directly
     from services.orchestrator.auth import get_current_user  # type: ignore
-    from services.orchestrator.app.core.logging import stream_orchestrator_events  # type: ignore
+    from services.orchestrator.app.core.logging import get_event_broker, stream_orchestrator_events  # type: ignore
 
 # Create the API router for orchestrator event endpoints
 router = APIRouter()
@@ -144,4 +145,22 @@ async def get_events(
         return {"error": "Either task_id or run_id must be provided"}
         
     events = await get_orchestrator_events(task_id=task_id, run_id=run_id)
-    return {"events": events}
\ No newline at end of file
+    return {"events": events}
+
+@router.get("/orchestrator/events/metrics", summary="Orchestrator event broker metrics", description="Return subscriber counts, queue depths and drop counters for orchestrator event streaming")
+async def get_event_metrics(current_user=Depends(get_current_user)):
+    """
+    Get orchestrator event broker metrics.
+    
+    This endpoint reports the state of the in-process event broker that backs
+    the streaming endpoint: how many subscribers are attached (overall and per
+    key), how many frames are waiting in their queues, and how many frames were
+    dropped or subscribers disconnected because they could not keep up.
+    
+    Args:
+        current_user: Authenticated user (from get_current_user dependency)
+        
+    Returns:
+        dict: Broker metrics
+    """
+    return get_event_broker().metrics()
@@ -0,0 +1,322 @@
+"""
+Job Queue API Router Module
+
+This module provides the dispatch side of job management in the Kyros Orchestrator service.
+Instead of polling ``GET /jobs?status=pending`` and racing each other for the same rows,
+workers dequeue jobs with an atomic claim that hands each job to exactly one worker under
+a time-limited lease.
+
+Queue Semantics:
+- Claims take the highest-priority, oldest claimable jobs first
+- A claimed job is ``running`` and leased to the claiming worker until ``lease_expires_at``
+  (visibility timeout); workers extend the lease with heartbeats while they work
+- A job whose lease lapses becomes claimable again and counts as a failed attempt
+- Failed jobs are retried until ``max_attempts`` claims have been made, then dead-lettered
+  (status ``dead``); dead jobs can be inspected and requeued
+
+Claiming uses ``SELECT ... FOR UPDATE SKIP LOCKED`` on PostgreSQL, so concurrent workers
+never block on each other's rows, and a per-row compare-and-set update on SQLite.
+
+ENDPOINTS:
+1. POST /queue/claim - Claim up to N jobs by priority
+2. POST /queue/jobs/{job_id}/heartbeat - Extend the lease of a claimed job
+3. POST /queue/jobs/{job_id}/complete - Mark a claimed job completed
+4. POST /queue/jobs/{job_id}/fail - Report a failed attempt (retry or dead-letter)
+5. GET /queue/dead - List dead-lettered jobs
+6. POST /queue/dead/{job_id}/requeue - Move a dead-lettered job back to pending
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Response
+from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..app.core.config import settings
+from ..app.core.job_notifier import publish_job_changes
+from ..app.core.logging import log_orchestrator_event
+from ..database import get_db_session
+from ..models import Job, User
+from ..repositories import queue as queue_repo
+from ..utils.etag import resource_etag
+from .jobs import get_current_user_async
+
+# Create the API router for queue endpoints
+router = APIRouter(prefix="/queue", tags=["queue"])
+
+
+class ClaimRequest(BaseModel):
+    """
+    Request model for claiming jobs.
+
+    ``worker_id`` identifies the lease holder in heartbeats and completions;
+    it should be unique per worker process.
+    """
+
+    worker_id: str = Field(..., min_length=1, max_length=255)
+    limit: int = Field(1, ge=1, description="Maximum number of jobs to claim")
+    lease_seconds: Optional[int] = Field(None, ge=1, description="Visibility timeout (defaults to JOB_LEASE_SECONDS)")
+
+
+class LeaseRequest(BaseModel):
+    """Request model for lease heartbeats and completions."""
+
+    worker_id: str = Field(..., min_length=1, max_length=255)
+    lease_seconds: Optional[int] = Field(None, ge=1)
+
+
+class FailRequest(BaseModel):
+    """
+    Request model for reporting a failed attempt.
+
+    With ``retry`` the job returns to pending while it has attempts left;
+    without it the job is dead-lettered immediately.
+    """
+
+    worker_id: str = Field(..., min_length=1, max_length=255)
+    error: Optional[str] = Field(None, max_length=1024)
+    retry: bool = True
+
+
+class QueuedJobResponse(BaseModel):
+    """Job details including queue lease state."""
+
+    id: str
+    name: str
+    status: str
+    priority: int
+    attempts: int
+    max_attempts: int
+    lease_owner: Optional[str] = None
+    lease_expires_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
+def _to_response(job: Job) -> QueuedJobResponse:
+    return QueuedJobResponse(
+        id=job.id,
+        name=job.name,
+        status=job.status,
+        priority=job.priority or 0,
+        attempts=job.attempts or 0,
+        max_attempts=job.max_attempts,
+        lease_owner=job.lease_owner,
+        lease_expires_at=job.lease_expires_at,
+        last_error=job.last_error,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+    )
+
+
+def _lease_seconds(requested: Optional[int]) -> int:
+    return min(requested or settings.JOB_LEASE_SECONDS, settings.JOB_MAX_LEASE_SECONDS)
+
+
+def _lease_lost(job_id: str) -> HTTPException:
+    return HTTPException(status_code=409, detail=f"Job {job_id} is not leased to this worker")
+
+
+@router.post("/claim", response_model=List[QueuedJobResponse], summary="Claim jobs", description="Atomically claim up to N jobs by priority under a visibility-timeout lease")
+async def claim_jobs(
+    claim: ClaimRequest,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user_async),
+):
+    """
+    Claim the next jobs from the queue.
+
+    Returns up to ``limit`` jobs, highest priority first and oldest first
+    within a priority, each leased to ``worker_id`` for ``lease_seconds``.
+    Jobs whose lease lapsed on their final attempt are dead-lettered first.
+    An empty list means the queue has nothing claimable.
+
+    Args:
+        claim (ClaimRequest): Worker ID, batch size and visibility timeout
+        db (AsyncSession): Asynchronous database session dependency
+        current_user (User): Authenticated user (from get_current_user_async dependency)
+
+    Returns:
+        List[QueuedJobResponse]: Claimed jobs with their lease state
+    """
+    limit = min(claim.limit, settings.JOB_CLAIM_MAX)
+    jobs = await queue_repo.claim_jobs(db, claim.worker_id, limit, _lease_seconds(claim.lease_seconds))
+    await publish_job_changes(db, [job.id for job in jobs])
+
+    log_orchestrator_event(
+        event="jobs_claimed",
+        user_id=current_user.id,
+        worker_id=claim.worker_id,
+        count=len(jobs),
+    )
+    return [_to_response(job) for job in jobs]
+
+
+@router.post("/jobs/{job_id}/heartbeat", response_model=QueuedJobResponse, summary="Extend a job lease", description="Extend the visibility timeout of a job claimed by this worker")
+async def heartbeat(
+    job_id: str,
+    lease: LeaseRequest,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user_async),
+):
+    """
+    Extend the lease of a claimed job.
+
+    The new expiry is ``lease_seconds`` from now. Fails with 409 if the job
+    is no longer running under this worker's lease (for example because the
+    lease lapsed and another worker claimed it).
+
+    Args:
+        job_id (str): ID of the claimed job
+        lease (LeaseRequest): Worker ID and lease duration
+        db (AsyncSession): Asynchronous database session dependency
+        current_user (User): Authenticated user (from get_current_user_async dependency)
+
+    Returns:
+        QueuedJobResponse: Job with its extended lease
+
+    Raises:
+        HTTPException: If the worker does not hold the lease (409)
+    """
+    job = await queue_repo.extend_lease(db, job_id, lease.worker_id, _lease_seconds(lease.lease_seconds))
+    if job is None:
+        raise _lease_lost(job_id)
+    return _to_response(job)
+
+
+@router.post("/jobs/{job_id}/complete", response_model=QueuedJobResponse, summary="Complete a claimed job", description="Mark a job claimed by this worker as completed")
+async def complete(
+    job_id: str,
+    lease: LeaseRequest,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user_async),
+    response: Response = None,
+):
+    """
+    Mark a claimed job as completed and release its lease.
+
+    Args:
+        job_id (str): ID of the claimed job
+        lease (LeaseRequest): Worker ID holding the lease
+        db (AsyncSession): Asynchronous database session dependency
+        current_user (User): Authenticated user (from get_current_user_async dependency)
+        response (Response): HTTP response object for setting headers
+
+    Returns:
+        QueuedJobResponse: Completed job
+
+    Raises:
+        HTTPException: If the worker does not hold the lease (409)
+    """
+    job = await queue_repo.complete_job(db, job_id, lease.worker_id)
+    if job is None:
+        raise _lease_lost(job_id)
+    await publish_job_changes(db, [job.id])
+
+    log_orchestrator_event(
+        event="job_completed",
+        task_id=job.id,
+        user_id=current_user.id,
+        worker_id=lease.worker_id,
+        attempts=job.attempts,
+    )
+    if response is not None:
+        response.headers["ETag"] = resource_etag("job", job.id, updated_at=job.updated_at)
+    return _to_response(job)
+
+
+@router.post("/jobs/{job_id}/fail", response_model=QueuedJobResponse, summary="Fail a claimed job", description="Report a failed attempt; the job is retried or dead-lettered")
+async def fail(
+    job_id: str,
+    failure: FailRequest,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user_async),
+    response: Response = None,
+):
+    """
+    Report a failed attempt of a claimed job.
+
+    The lease is released. The job goes back to ``pending`` if ``retry`` is
+    set and it has attempts left, otherwise it is dead-lettered.
+
+    Args:
+        job_id (str): ID of the claimed job
+        failure (FailRequest): Worker ID, error message and retry flag
+        db (AsyncSession): Asynchronous database session dependency
+        current_user (User): Authenticated user (from get_current_user_async dependency)
+        response (Response): HTTP response object for setting headers
+
+    Returns:
+        QueuedJobResponse: Job after the failure was recorded
+
+    Raises:
+        HTTPException: If the worker does not hold the lease (409)
+    """
+    job = await queue_repo.fail_job(db, job_id, failure.worker_id, failure.error, retry=failure.retry)
+    if job is None:
+        raise _lease_lost(job_id)
+    await publish_job_changes(db, [job.id])
+
+    log_orchestrator_event(
+        event="job_dead_lettered" if job.status == queue_repo.DEAD else "job_attempt_failed",
+        task_id=job.id,
+        user_id=current_user.id,
+        worker_id=failure.worker_id,
+        attempts=job.attempts,
+        error=failure.error,
+    )
+    if response is not None:
+        response.headers["ETag"] = resource_etag("job", job.id, updated_at=job.updated_at)
+    return _to_response(job)
+
+
+@router.get("/dead", response_model=List[QueuedJobResponse], summary="List dead-lettered jobs", description="List jobs that exhausted their attempts, most recent first")
+async def list_dead(
+    limit: int = 100,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user_async),
+):
+    """
+    List dead-lettered jobs.
+
+    Args:
+        limit (int): Maximum number of jobs to return (default: 100, max: 1000)
+        db (AsyncSession): Asynchronous database session dependency
+        current_user (User): Authenticated user (from get_current_user_async dependency)
+
+    Returns:
+        List[QueuedJobResponse]: Dead-lettered jobs with their last error
+    """
+    jobs = await queue_repo.list_dead_jobs(db, min(max(limit, 1), 1000))
+    return [_to_response(job) for job in jobs]
+
+
+@router.post("/dead/{job_id}/requeue", response_model=QueuedJobResponse, summary="Requeue a dead-lettered job", description="Move a dead-lettered job back to pending with its attempts reset")
+async def requeue(
+    job_id: str,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user_async),
+):
+    """
+    Move a dead-lettered job back to the queue.
+
+    Args:
+        job_id (str): ID of the dead-lettered job
+        db (AsyncSession): Asynchronous database session dependency
+        current_user (User): Authenticated user (from get_current_user_async dependency)
+
+    Returns:
+        QueuedJobResponse: Requeued job
+
+    Raises:
+        HTTPException: If the job does not exist or is not dead-lettered (404)
+    """
+    job = await queue_repo.requeue_job(db, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Dead-lettered job not found")
+    await publish_job_changes(db, [job.id])
+
+    log_orchestrator_event(event="job_requeued", task_id=job.id, user_id=current_user.id)
+    return _to_response(job)
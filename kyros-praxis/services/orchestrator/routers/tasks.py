@@ -14,7 +14,7 @@ Collaborative tasks enable:
 - Conditional request handling for reduced bandwidth
 
 The router implements best practices for API design including:
-- Synchronous database operations
+- Asynchronous database operations
 - Proper error handling
 - Authentication and authorization
 - Input validation
@@ -32,42 +32,80 @@ Task Management Features:
 
 ENDPOINTS:
 1. POST /collab/tasks - Create a new collaborative task
-2. GET /collab/state/tasks - List all collaborative tasks
+2. GET /collab/state/tasks - List collaborative tasks (keyset-paginated)
 3. GET /collab/tasks/{task_id} - Retrieve a specific task
 4. PUT /collab/tasks/{task_id} - Update a specific task
 5. DELETE /collab/tasks/{task_id} - Delete a task
 """
 
-import hashlib
+import base64
 import json
-from typing import Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, Header, Response
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 try:
     # When running as a package (e.g., tests in monorepo)
     from ..auth import User, get_current_user
-    from ..database import get_db
-    from ..models import Task
+    from ..database import get_db_session
+    from ..repositories import tasks as tasks_repo
+    from ..repositories.versions import get_collection_version
     from ..utils.validation import TaskCreate, validate_task_input
     from ..app.core.logging import log_orchestrator_event
+    from ..utils.etag import collection_etag, etag_matches, query_stamp, resource_etag
 except ImportError:
     # Fallback when running module directly
     from services.orchestrator.auth import User, get_current_user  # type: ignore
-    from services.orchestrator.database import get_db  # type: ignore
-    from services.orchestrator.models import Task  # type: ignore
+    from services.orchestrator.database import get_db_session  # type: ignore
+    from services.orchestrator.repositories import tasks as tasks_repo  # type: ignore
+    from services.orchestrator.repositories.versions import get_collection_version  # type: ignore
     from services.orchestrator.utils.validation import TaskCreate, validate_task_input  # type: ignore
     from services.orchestrator.app.core.logging import log_orchestrator_event  # type: ignore
+    from services.orchestrator.utils.etag import collection_etag, etag_matches, query_stamp, resource_etag  # type: ignore
 
 # Create the API router for task endpoints
 router = APIRouter(prefix="/collab", tags=["collab"])
 
+# Page sizes for GET /collab/state/tasks
+DEFAULT_PAGE_SIZE = 500
+MAX_PAGE_SIZE = 1000
+
+# Pages with more items than this are streamed instead of rendered at once
+STREAM_THRESHOLD = 100
+
+
+def _encode_cursor(task) -> str:
+    """Encode the keyset position of a task as an opaque cursor."""
+    raw = json.dumps([task.created_at.isoformat(), task.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a cursor produced by _encode_cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, task_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), str(task_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def _stream_page(items: List[dict], next_cursor: Optional[str]) -> AsyncIterator[bytes]:
+    """Serialize a page of tasks as JSON one item at a time."""
+    yield b'{"kind":"tasks","items":['
+    for index, item in enumerate(items):
+        chunk = json.dumps(item)
+        yield (chunk if index == 0 else "," + chunk).encode()
+    yield ('],"next_cursor":' + json.dumps(next_cursor) + "}").encode()
+
 
 @router.post("/tasks", summary="Create a new collaborative task", description="Create a new collaborative task with the specified parameters and return the created task details")
-def create_task(
+async def create_task(
     task: TaskCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user),
     response: Response = None,
 ):
@@ -81,7 +119,7 @@ def create_task(
     
     Args:
         task (TaskCreate): Task creation parameters including title and description
-        db (Session): Database session dependency
+        db (AsyncSession): Asynchronous database session dependency
         current_user (User): Authenticated user (from get_current_user dependency)
         response (Response): FastAPI response object for setting headers and status codes
         
@@ -92,10 +130,7 @@ def create_task(
         HTTPException: If input validation fails or database operation encounters an error
     """
     validated_input = validate_task_input(task.model_dump())
-    db_task = Task(**validated_input.model_dump())
-    db.add(db_task)
-    db.commit()
-    db.refresh(db_task)
+    db_task = await tasks_repo.create_task(db, validated_input.title, validated_input.description)
     
     task_dict = {
         "id": db_task.id,
@@ -114,54 +149,66 @@ def create_task(
         description=db_task.description
     )
     
-    canonical = json.dumps(task_dict, sort_keys=True)
-    etag = hashlib.sha256(canonical.encode()).hexdigest()
+    etag = resource_etag("task", db_task.id, version=db_task.version)
     if response is not None:
         response.status_code = 201
-        response.headers["ETag"] = f'"{etag}"'
+        response.headers["ETag"] = etag
         response.headers["Location"] = f"/collab/tasks/{task_dict['id']}"
     return task_dict
 
 
-@router.get("/state/tasks", summary="List all collaborative tasks", description="List all collaborative tasks with support for conditional requests and ETag-based caching")
-def list_tasks(
-    db: Session = Depends(get_db),
+@router.get("/state/tasks", summary="List all collaborative tasks", description="List collaborative tasks page by page with support for conditional requests and ETag-based caching")
+async def list_tasks(
+    db: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user),
     response: Response = None,
     if_none_match: Optional[str] = Header(default=None, alias="If-None-Match"),
+    cursor: Optional[str] = Query(default=None, description="Opaque cursor from next_cursor of the previous page"),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Maximum tasks per page"),
 ):
     """
-    List all collaborative tasks.
+    List collaborative tasks.
     
-    This endpoint retrieves a list of all collaborative tasks from the orchestrator system.
-    It implements ETag-based caching to reduce bandwidth usage and improve performance for
-    clients that poll this endpoint frequently. The endpoint supports conditional GET requests
-    using the If-None-Match header.
+    This endpoint retrieves collaborative tasks ordered by creation time, using keyset
+    pagination on (created_at, id). It is the most polled endpoint of the service, so the
+    ETag is derived from the tasks collection version counter (bumped on every write) and
+    the requested page instead of the rows: a conditional GET that matches is answered with
+    304 Not Modified after reading a single row. Large pages are streamed as they are serialized.
     
     Args:
-        db (Session): Database session dependency
+        db (AsyncSession): Asynchronous database session dependency
         current_user (User): Authenticated user (from get_current_user dependency)
         response (Response): FastAPI response object for setting headers and status codes
         if_none_match (Optional[str]): Client's ETag for conditional requests (If-None-Match header)
+        cursor (Optional[str]): Position after which to continue listing
+        limit (int): Maximum number of tasks to return
         
     Returns:
-        dict: Dictionary containing task list with "kind" and "items" keys
+        dict: Dictionary with "kind", "items" and "next_cursor" keys (null on the last page)
         
     Raises:
-        HTTPException: If database operation encounters an error
+        HTTPException: If the cursor is malformed (400) or a database operation fails
     """
-    tasks = db.query(Task).all()
-    items = []
-    for t in tasks:
-        items.append(
-            {
-                "id": t.id,
-                "title": t.title,
-                "description": t.description,
-                "version": t.version,
-                "created_at": t.created_at.isoformat(),
-            }
-        )
+    after = _decode_cursor(cursor) if cursor else None
+
+    epoch, version = await get_collection_version(db, tasks_repo.COLLECTION)
+    etag = collection_etag("tasks", epoch, version, query_stamp(cursor=cursor, limit=limit))
+    if etag_matches(if_none_match, etag):
+        log_orchestrator_event(event="tasks_listed", user_id=current_user.id, not_modified=True)
+        return Response(status_code=304, headers={"ETag": etag})
+
+    tasks, has_more = await tasks_repo.list_tasks_page(db, after=after, limit=limit)
+    items = [
+        {
+            "id": t.id,
+            "title": t.title,
+            "description": t.description,
+            "version": t.version,
+            "created_at": t.created_at.isoformat(),
+        }
+        for t in tasks
+    ]
+    next_cursor = _encode_cursor(tasks[-1]) if has_more else None
     
     # Log orchestrator event
     log_orchestrator_event(
@@ -169,27 +216,23 @@ def list_tasks(
         user_id=current_user.id,
         count=len(items)
     )
-    
-    canonical = json.dumps(items, sort_keys=True)
-    etag = hashlib.sha256(canonical.encode()).hexdigest()
 
-    quoted = f'"{etag}"'
-    # Conditional GET support
-    if if_none_match:
-        # handle multiple ETags in header, quoted or unquoted
-        candidates = [v.strip() for v in if_none_match.split(",")]
-        if etag in candidates or quoted in candidates:
-            return Response(status_code=304)
+    if len(items) > STREAM_THRESHOLD:
+        return StreamingResponse(
+            _stream_page(items, next_cursor),
+            media_type="application/json",
+            headers={"ETag": etag},
+        )
 
     if response is not None:
-        response.headers["ETag"] = quoted
-    return {"kind": "tasks", "items": items}
+        response.headers["ETag"] = etag
+    return {"kind": "tasks", "items": items, "next_cursor": next_cursor}
 
 
 @router.get("/tasks/{task_id}", summary="Get a specific task by ID", description="Retrieve a specific collaborative task by its unique identifier with ETag-based caching support")
-def get_task(
-    task_id: int,
-    db: Session = Depends(get_db),
+async def get_task(
+    task_id: str,
+    db: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user),
     response: Response = None,
     if_none_match: Optional[str] = Header(default=None, alias="If-None-Match"),
@@ -204,8 +247,8 @@ def get_task(
     using the If-None-Match header.
     
     Args:
-        task_id (int): ID of the task to retrieve
-        db (Session): Database session dependency
+        task_id (str): ID of the task to retrieve
+        db (AsyncSession): Asynchronous database session dependency
         current_user (User): Authenticated user (from get_current_user dependency)
         response (Response): FastAPI response object for setting headers and status codes
         if_none_match (Optional[str]): Client's ETag for conditional requests (If-None-Match header)
@@ -216,7 +259,7 @@ def get_task(
     Raises:
         HTTPException: If the task is not found (status code 404)
     """
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await tasks_repo.get_task(db, task_id)
     
     if not task:
         # Log orchestrator event
@@ -244,27 +287,21 @@ def get_task(
         title=task.title
     )
     
-    canonical = json.dumps(task_dict, sort_keys=True)
-    etag = hashlib.sha256(canonical.encode()).hexdigest()
-
-    quoted = f'"{etag}"'
+    etag = resource_etag("task", task.id, version=task.version)
     # Conditional GET support
-    if if_none_match:
-        # handle multiple ETags in header, quoted or unquoted
-        candidates = [v.strip() for v in if_none_match.split(",")]
-        if etag in candidates or quoted in candidates:
-            return Response(status_code=304)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
 
     if response is not None:
-        response.headers["ETag"] = quoted
+        response.headers["ETag"] = etag
     return task_dict
 
 
 @router.put("/tasks/{task_id}", summary="Update a specific task by ID", description="Update a specific collaborative task by its unique identifier and return the updated task details")
-def update_task(
-    task_id: int,
+async def update_task(
+    task_id: str,
     task: TaskCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user),
     response: Response = None,
 ):
@@ -278,9 +315,9 @@ def update_task(
     caching purposes.
     
     Args:
-        task_id (int): ID of the task to update
+        task_id (str): ID of the task to update
         task (TaskCreate): Updated task data including title and description
-        db (Session): Database session dependency
+        db (AsyncSession): Asynchronous database session dependency
         current_user (User): Authenticated user (from get_current_user dependency)
         response (Response): FastAPI response object for setting headers
         
@@ -290,7 +327,7 @@ def update_task(
     Raises:
         HTTPException: If the task is not found (status code 404)
     """
-    db_task = db.query(Task).filter(Task.id == task_id).first()
+    db_task = await tasks_repo.get_task(db, task_id)
     
     if not db_task:
         # Log orchestrator event
@@ -308,11 +345,9 @@ def update_task(
     
     # Update task
     validated_input = validate_task_input(task.model_dump())
-    db_task.title = validated_input.title
-    db_task.description = validated_input.description
-    db_task.version += 1
-    db.commit()
-    db.refresh(db_task)
+    db_task = await tasks_repo.update_task(
+        db, db_task, validated_input.title, validated_input.description
+    )
     
     task_dict = {
         "id": db_task.id,
@@ -333,17 +368,15 @@ def update_task(
         new_description=db_task.description
     )
     
-    canonical = json.dumps(task_dict, sort_keys=True)
-    etag = hashlib.sha256(canonical.encode()).hexdigest()
     if response is not None:
-        response.headers["ETag"] = f'"{etag}"'
+        response.headers["ETag"] = resource_etag("task", db_task.id, version=db_task.version)
     return task_dict
 
 
 @router.delete("/tasks/{task_id}", summary="Delete a specific task by ID", description="Delete a specific collaborative task by its unique identifier")
-def delete_task(
-    task_id: int,
-    db: Session = Depends(get_db),
+async def delete_task(
+    task_id: str,
+    db: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user),
     response: Response = None,
 ):
@@ -356,8 +389,8 @@ def delete_task(
     both successful deletions and not-found attempts for audit and monitoring purposes.
     
     Args:
-        task_id (int): ID of the task to delete
-        db (Session): Database session dependency
+        task_id (str): ID of the task to delete
+        db (AsyncSession): Asynchronous database session dependency
         current_user (User): Authenticated user (from get_current_user dependency)
         response (Response): FastAPI response object for setting status codes
         
@@ -367,7 +400,7 @@ def delete_task(
     Raises:
         HTTPException: If the task is not found (status code 404)
     """
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await tasks_repo.get_task(db, task_id)
     
     if not task:
         # Log orchestrator event
@@ -383,8 +416,7 @@ def delete_task(
     task_title = task.title
     
     # Delete task
-    db.delete(task)
-    db.commit()
+    await tasks_repo.delete_task(db, task)
     
     # Log orchestrator event
     log_orchestrator_event(
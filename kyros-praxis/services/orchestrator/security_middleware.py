@@ -32,7 +32,7 @@ MODULE RESPONSIBILITIES:
    - Request/response processing for security enforcement
 
 4. Component Security Features:
-   - RateLimiter: Token bucket-style rate limiter with Redis/in-memory backends
+   - RateLimiter: GCRA rate limiter with Redis/in-memory backends (see rate_limit.py)
    - CSRFProtection: Cryptographically secure CSRF token generation/validation
    - JWTAuthentication: JWT token creation and verification utilities
 
@@ -46,9 +46,10 @@ SECURITY FEATURES:
    - Validation for state-changing HTTP methods
 
 2. Rate Limiting:
-   - Token bucket-style rate limiting algorithm
-   - Redis backend for distributed rate limiting
-   - In-memory fallback for single-instance deployments
+   - GCRA rate limiting evaluated by one atomic Lua script on Redis
+   - Async Redis client; allowance leased in batches and spent locally
+   - Rejected clients cached locally until their retry time
+   - In-memory fallback behind a circuit breaker when Redis fails
    - Per-client rate limiting based on user ID or IP
    - Configurable request limits and time windows
 
@@ -80,9 +81,9 @@ COMPONENTS:
    - Environment-specific security parameter tuning
 
 2. RateLimiter:
-   - Token bucket-style rate limiter implementation
+   - GCRA rate limiter implementation (engine in rate_limit.py)
    - Redis backend for distributed deployments
-   - In-memory fallback for local development
+   - In-memory fallback for local development and Redis outages
 
 3. CSRFProtection:
    - Cryptographically secure CSRF token generation
@@ -149,6 +150,7 @@ See Also:
 - main.py: Main application that uses security configuration
 """
 
+import asyncio
 import time
 import secrets
 import hashlib
@@ -156,7 +158,6 @@ import hmac
 import base64
 from typing import Optional, Dict, Any, Callable
 from datetime import datetime, timedelta
-from collections import defaultdict
 import logging
 
 from fastapi import Request, Response, HTTPException, status
@@ -167,6 +168,17 @@ from starlette.responses import JSONResponse
 import jwt
 from pydantic import BaseModel
 
+try:
+    from .auth_context import get_auth_context
+    from .rate_limit import (
+        CircuitBreaker, LeaseCache, LocalGCRALimiter, RateLimitDecision, RedisGCRALimiter, header_seconds
+    )
+except ImportError:
+    from auth_context import get_auth_context  # type: ignore
+    from rate_limit import (  # type: ignore
+        CircuitBreaker, LeaseCache, LocalGCRALimiter, RateLimitDecision, RedisGCRALimiter, header_seconds
+    )
+
 logger = logging.getLogger(__name__)
 
 
@@ -206,6 +218,13 @@ class SecurityConfig(BaseModel):
         environment (str): Application environment (default: "local")
         csp_report_uri (Optional[str]): URI for CSP violation reports
         redis_url (Optional[str]): Redis connection URL for distributed rate limiting
+        rate_limit_redis_timeout (float): Socket timeout for Redis rate limit calls (default: 0.25)
+        rate_limit_breaker_threshold (int): Consecutive Redis failures before falling back (default: 3)
+        rate_limit_breaker_reset (float): Seconds before Redis is retried after falling back (default: 30)
+        rate_limit_max_clients (int): Clients tracked by the in-memory limiter (default: 100000)
+        rate_limit_sweep_interval (float): Seconds between sweeps of idle in-memory clients (default: 60)
+        rate_limit_lease_size (int): Requests leased from Redis per round trip (default: 10)
+        rate_limit_lease_ttl (float): Seconds a lease may be spent locally (default: 5)
     """
     # JWT configuration
     jwt_secret: str
@@ -236,6 +255,16 @@ class SecurityConfig(BaseModel):
     environment: str = "local"
     csp_report_uri: Optional[str] = None
     redis_url: Optional[str] = None
+    # Redis call timeout and circuit breaker for distributed rate limiting
+    rate_limit_redis_timeout: float = 0.25
+    rate_limit_breaker_threshold: int = 3
+    rate_limit_breaker_reset: float = 30.0
+    # Bound and sweep interval of the in-memory client table
+    rate_limit_max_clients: int = 100_000
+    rate_limit_sweep_interval: float = 60.0
+    # Requests leased from Redis per round trip and how long a lease lasts
+    rate_limit_lease_size: int = 10
+    rate_limit_lease_ttl: float = 5.0
 
     @property
     def effective_rate_limit_requests(self) -> int:
@@ -257,10 +286,14 @@ class RateLimiter:
     """
     Rate limiting implementation with Redis backend and in-memory fallback.
     
-    Implements a token bucket-style rate limiter that can use Redis for
-    distributed rate limiting or fall back to in-memory storage for
-    single-instance deployments. This provides protection against abuse
-    and helps ensure fair usage of the service.
+    Uses the GCRA engine in rate_limit.py for distributed rate limiting:
+    the check-and-increment runs as a single atomic Lua script through an
+    async Redis client. Each worker leases a batch of a client's allowance
+    per script call and admits requests from the lease locally, and caches
+    rejected clients until their retry time, so most requests cause no
+    Redis round trip. When Redis fails, a circuit breaker stops further
+    Redis calls for a while and requests are checked against the in-memory
+    limiter instead.
     
     Security Considerations:
     - Uses client identification to track request rates
@@ -268,122 +301,116 @@ class RateLimiter:
     - Provides configurable limits to balance security and usability
     - Uses atomic operations for thread safety
     
-    The rate limiter tracks requests per client ID and enforces limits
-    based on a sliding window algorithm. It can identify clients by
+    The rate limiter tracks requests per client ID and admits up to
+    ``requests + burst`` requests back to back, replenishing the allowance
+    at ``requests`` per ``window``. It can identify clients by
     authenticated user ID or IP address.
     """
 
-    def __init__(self, requests: int = 100, window: int = 900, burst: int = 0, redis_url: Optional[str] = None):
+    def __init__(
+        self,
+        requests: int = 100,
+        window: int = 900,
+        burst: int = 0,
+        redis_url: Optional[str] = None,
+        redis_timeout: float = 0.25,
+        breaker_threshold: int = 3,
+        breaker_reset: float = 30.0,
+        max_clients: int = 100_000,
+        sweep_interval: float = 60.0,
+        lease_size: int = 10,
+        lease_ttl: float = 5.0,
+    ):
         """
         Initialize the rate limiter.
         
         Sets up the rate limiter with the specified parameters and
-        attempts to connect to Redis if a URL is provided.
+        creates an async Redis client if a URL is provided. Connectivity
+        is not checked here; the circuit breaker handles an unavailable
+        Redis on the first requests.
         
         Args:
             requests (int): Maximum number of requests allowed in the window
             window (int): Time window in seconds
             burst (int): Additional burst capacity above the base rate (0 = no burst)
             redis_url (Optional[str]): Redis connection URL, if available
+            redis_timeout (float): Socket timeout in seconds for Redis calls
+            breaker_threshold (int): Consecutive Redis failures before falling back
+            breaker_reset (float): Seconds before Redis is tried again after falling back
+            max_clients (int): Maximum clients tracked by the in-memory limiter (LRU-evicted)
+            sweep_interval (float): Seconds between background sweeps of idle in-memory clients
+            lease_size (int): Requests of a client's allowance leased from Redis per round trip
+            lease_ttl (float): Seconds a lease may be spent before it is discarded
         """
         self.requests = requests
         self.window = window
         self.burst = burst
         self.redis_url = redis_url
         self.redis_client = None
-        self.fallback_clients: Dict[str, list] = defaultdict(list)
-
-        # Try to initialize Redis client
+        self.redis_limiter: Optional[RedisGCRALimiter] = None
+        self.leases: Optional[LeaseCache] = None
+        self.breaker = CircuitBreaker(failure_threshold=breaker_threshold, reset_timeout=breaker_reset)
+        self.local_limiter = LocalGCRALimiter(requests, window, burst, maxsize=max_clients)
+        self.sweep_interval = sweep_interval
+        self._sweeper: Optional[asyncio.Task] = None
+
+        # Try to initialize the async Redis client
         if redis_url:
             try:
-                import redis
-                self.redis_client = redis.from_url(redis_url)
-                # Test connection
-                self.redis_client.ping()
-                logger.info("Rate limiter connected to Redis")
+                import redis.asyncio as aioredis
+                self.redis_client = aioredis.from_url(
+                    redis_url, socket_timeout=redis_timeout, socket_connect_timeout=redis_timeout
+                )
+                self.redis_limiter = RedisGCRALimiter(self.redis_client, requests, window, burst)
+                self.leases = LeaseCache(self.redis_limiter, lease_size, lease_ttl, maxsize=max_clients)
+                logger.info("Rate limiter using Redis")
             except Exception as e:
-                logger.warning(f"Failed to connect to Redis, falling back to in-memory: {e}")
+                logger.warning(f"Failed to create Redis client, falling back to in-memory: {e}")
                 self.redis_client = None
+                self.redis_limiter = None
+                self.leases = None
         else:
             logger.warning("Redis URL not configured, using in-memory rate limiting")
 
-    def is_allowed(self, client_id: str) -> bool:
-        """
-        Check if a client is within the rate limit.
-        
-        Determines if the specified client is allowed to make another
-        request based on the current rate limit configuration.
-        
-        Args:
-            client_id (str): Unique identifier for the client
-            
-        Returns:
-            bool: True if the client is allowed, False if rate limited
-        """
-        if self.redis_client:
-            return self._is_allowed_redis(client_id)
-        else:
-            return self._is_allowed_memory(client_id)
-
-    def _is_allowed_redis(self, client_id: str) -> bool:
+    async def check(self, client_id: str) -> RateLimitDecision:
         """
-        Check rate limit using Redis for distributed rate limiting.
+        Check and consume one request of a client's allowance.
         
-        Uses Redis atomic operations to ensure thread-safe rate limiting
-        across multiple application instances. This is essential for
-        horizontally scaled deployments.
+        Requests are first decided from the worker's lease and rejection
+        cache; Redis is only called to renew a lease, while the circuit
+        breaker is closed. Otherwise the in-memory limiter decides. The
+        decision includes the reset time, so no further lookup is needed
+        to answer a rejected request.
         
         Args:
             client_id (str): Unique identifier for the client
             
         Returns:
-            bool: True if the client is allowed, False if rate limited
-        """
-        key = f"rate_limit:{client_id}"
+            RateLimitDecision: Outcome of the check
+        """
+        self._ensure_sweeper()
+        if self.leases is not None:
+            decision = self.leases.check_local(client_id)
+            if decision is not None:
+                return decision
+        if self.leases is not None and self.breaker.allow_request():
+            try:
+                decision = await self.leases.renew(client_id)
+            except Exception as e:
+                if self.breaker.record_failure():
+                    logger.error(f"Redis rate limiting failed, using in-memory limiter for "
+                                 f"{self.breaker.reset_timeout}s: {e}")
+            else:
+                self.breaker.record_success()
+                return decision
+        return self.local_limiter.check(client_id)
 
-        try:
-            # Use Redis pipeline for atomic operations
-            with self.redis_client.pipeline() as pipe:
-                # Get current count and TTL
-                pipe.get(key)
-                pipe.ttl(key)
-
-                results = pipe.execute()
-                current_count = int(results[0] or 0)
-                ttl = results[1]
-
-                # If key doesn't exist or expired, set new count
-                if current_count == 0 or ttl == -1:
-                    pipe.set(key, 1, ex=self.window)
-                    pipe.execute()
-                    return True
-
-                # Check if limit exceeded (including burst capacity)
-                total_allowance = self.requests + self.burst
-                if current_count >= total_allowance:
-                    return False
-
-                # Increment count
-                pipe.incr(key)
-                pipe.execute()
-                return True
-
-        except Exception as e:
-            logger.error(f"Redis rate limiting failed, falling back to in-memory: {e}")
-            return self._is_allowed_memory(client_id)
-
-    def _is_allowed_memory(self, client_id: str) -> bool:
+    def is_allowed(self, client_id: str) -> bool:
         """
-        Fallback in-memory rate limiting implementation.
+        Check if a client is within the rate limit of this process.
         
-        Used when Redis is not available or fails to connect. Maintains
-        rate limiting state in memory, which works for single-instance
-        deployments but not for distributed systems.
-        
-        Security Considerations:
-        - Not suitable for horizontally scaled deployments
-        - State is lost when the application restarts
-        - Vulnerable to memory exhaustion attacks with many unique clients
+        Synchronous check against the in-memory limiter only; use
+        ``check()`` for the distributed limit.
         
         Args:
             client_id (str): Unique identifier for the client
@@ -391,66 +418,28 @@ class RateLimiter:
         Returns:
             bool: True if the client is allowed, False if rate limited
         """
-        now = time.time()
+        return self.local_limiter.check(client_id).allowed
 
-        # Clean old entries
-        self.fallback_clients[client_id] = [
-            timestamp for timestamp in self.fallback_clients[client_id]
-            if now - timestamp < self.window
-        ]
+    def _ensure_sweeper(self) -> None:
+        """Start the background sweep of idle clients on the running loop."""
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.get_running_loop().create_task(self._sweep_loop())
 
-        # Check limit (including burst capacity)
-        total_allowance = self.requests + self.burst
-        if len(self.fallback_clients[client_id]) >= total_allowance:
-            return False
-
-        # Add current request
-        self.fallback_clients[client_id].append(now)
-        return True
+    async def _sweep_loop(self) -> None:
+        """Drop idle in-memory clients and expired leases every ``sweep_interval`` seconds."""
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            self.local_limiter.sweep()
+            if self.leases is not None:
+                self.leases.sweep()
 
     def get_reset_time(self, client_id: str) -> int:
         """
         Get time until rate limit resets for a client.
         
-        Calculates how many seconds remain until the rate limit
-        window resets for the specified client.
-        
-        Args:
-            client_id (str): Unique identifier for the client
-            
-        Returns:
-            int: Seconds until rate limit resets
-        """
-        if self.redis_client:
-            return self._get_reset_time_redis(client_id)
-        else:
-            return self._get_reset_time_memory(client_id)
-
-    def _get_reset_time_redis(self, client_id: str) -> int:
-        """
-        Get reset time from Redis.
-        
-        Queries Redis to determine when the rate limit window
-        will reset for the specified client.
-        
-        Args:
-            client_id (str): Unique identifier for the client
-            
-        Returns:
-            int: Seconds until rate limit resets
-        """
-        try:
-            key = f"rate_limit:{client_id}"
-            ttl = self.redis_client.ttl(key)
-            return max(0, ttl)
-        except Exception:
-            return self._get_reset_time_memory(client_id)
-
-    def _get_reset_time_memory(self, client_id: str) -> int:
-        """
-        Get reset time from memory.
-        
-        Calculates the reset time based on in-memory rate limiting data.
+        Returns how many seconds remain until the client's full allowance
+        is restored in the in-memory limiter. Distributed checks return
+        the reset time with their decision.
         
         Args:
             client_id (str): Unique identifier for the client
@@ -458,11 +447,7 @@ class RateLimiter:
         Returns:
             int: Seconds until rate limit resets
         """
-        if not self.fallback_clients[client_id]:
-            return 0
-
-        oldest = min(self.fallback_clients[client_id])
-        return int(oldest + self.window - time.time())
+        return header_seconds(self.local_limiter.reset_after(client_id))
 
 
 class CSRFProtection:
@@ -632,7 +617,14 @@ class SecurityMiddleware(BaseHTTPMiddleware):
             requests=config.effective_rate_limit_requests,
             window=config.effective_rate_limit_window,
             burst=config.effective_rate_limit_burst,
-            redis_url=config.redis_url
+            redis_url=config.redis_url,
+            redis_timeout=config.rate_limit_redis_timeout,
+            breaker_threshold=config.rate_limit_breaker_threshold,
+            breaker_reset=config.rate_limit_breaker_reset,
+            max_clients=config.rate_limit_max_clients,
+            sweep_interval=config.rate_limit_sweep_interval,
+            lease_size=config.rate_limit_lease_size,
+            lease_ttl=config.rate_limit_lease_ttl,
         )
         self.csrf = CSRFProtection(config.csrf_secret)
         self.bearer = HTTPBearer(auto_error=False)
@@ -670,8 +662,9 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         if self.config.rate_limit_enabled:
             client_id = self.get_client_id(request)
             
-            if not self.rate_limiter.is_allowed(client_id):
-                reset_time = self.rate_limiter.get_reset_time(client_id)
+            decision = await self.rate_limiter.check(client_id)
+            if not decision.allowed:
+                reset_time = header_seconds(decision.retry_after)
                 return JSONResponse(
                     status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                     content={"detail": "Rate limit exceeded"},
@@ -701,20 +694,8 @@ class SecurityMiddleware(BaseHTTPMiddleware):
                     if not csrf_token:
                         csrf_token = request.cookies.get(self.config.csrf_cookie_name)
                     
-                    # Extract session ID for validation
-                    session_id = ""
-                    auth = request.headers.get("Authorization")
-                    if auth and auth.startswith("Bearer "):
-                        try:
-                            token = auth.split(" ")[1]
-                            payload = jwt.decode(
-                                token,
-                                self.config.jwt_secret,
-                                algorithms=[self.config.jwt_algorithm]
-                            )
-                            session_id = payload.get('sub', '') or payload.get('session_id', '')
-                        except jwt.PyJWTError:
-                            pass
+                    # Session ID the CSRF token is bound to
+                    session_id = get_auth_context(request).session_id
 
                     if not self.csrf.validate_token(csrf_token, session_id=session_id):
                         return JSONResponse(
@@ -740,20 +721,8 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         
         # Generate CSRF token for GET requests
         if request.method == "GET" and self.config.csrf_enabled:
-            # Extract session ID from JWT for binding
-            session_id = ""
-            auth = request.headers.get("Authorization")
-            if auth and auth.startswith("Bearer "):
-                try:
-                    token = auth.split(" ")[1]
-                    payload = jwt.decode(
-                        token,
-                        self.config.jwt_secret,
-                        algorithms=[self.config.jwt_algorithm]
-                    )
-                    session_id = payload.get('sub', '') or payload.get('session_id', '')
-                except jwt.PyJWTError:
-                    pass
+            # Bind to the session ID of the already verified JWT
+            session_id = get_auth_context(request).session_id
 
             csrf_token = self.csrf.generate_token(session_id)
             response.set_cookie(
@@ -781,19 +750,10 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         Returns:
             str: Client identifier string
         """
-        # Try to get authenticated user ID
-        auth = request.headers.get("Authorization")
-        if auth and auth.startswith("Bearer "):
-            try:
-                token = auth.split(" ")[1]
-                payload = jwt.decode(
-                    token,
-                    self.config.jwt_secret,
-                    algorithms=[self.config.jwt_algorithm]
-                )
-                return f"user:{payload.get('sub', 'unknown')}"
-            except jwt.PyJWTError:
-                pass
+        # Try to get authenticated user ID from the request's auth context
+        auth = get_auth_context(request)
+        if auth.authenticated:
+            return f"user:{auth.subject or 'unknown'}"
         
         # Fall back to IP address
         forwarded = request.headers.get("X-Forwarded-For")
@@ -806,9 +766,9 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         """
         Check if request has a valid JWT token.
         
-        Validates the JWT token in the Authorization header to determine
-        if this is an authenticated API request that should bypass CSRF
-        protection.
+        Uses the JWT verified once per request by the auth context to
+        determine if this is an authenticated API request that should
+        bypass CSRF protection.
         
         Args:
             request (Request): Incoming HTTP request
@@ -816,20 +776,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         Returns:
             bool: True if request has valid JWT, False otherwise
         """
-        auth = request.headers.get("Authorization")
-        if not auth or not auth.startswith("Bearer "):
-            return False
-        
-        try:
-            token = auth.split(" ")[1]
-            jwt.decode(
-                token,
-                self.config.jwt_secret,
-                algorithms=[self.config.jwt_algorithm]
-            )
-            return True
-        except jwt.PyJWTError:
-            return False
+        return get_auth_context(request).authenticated
     
     def get_csp_header(self) -> str:
         """
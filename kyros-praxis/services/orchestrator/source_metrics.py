@@ -0,0 +1,367 @@
+"""
+Source File Metrics for the Kyros Orchestrator context analysis.
+
+This module extracts the per-file facts ``ContextAnalyzer`` (context_analysis.py)
+needs from Python source - functions, classes, branch points and imports - in
+a single parse and a single visitor pass, and caches them by content hash so
+unchanged files are never re-parsed across escalation requests.
+
+MODULE RESPONSIBILITIES:
+------------------------
+1. Single-Pass Extraction:
+   - One ``ast.parse`` and one visitor pass per file, collecting everything
+     the complexity and dependency analyses use
+
+2. Content-Hash Cache:
+   - LRU cache keyed by the SHA-256 of the file contents, shared by all
+     analyses in the process (``get_source_metrics_cache()``)
+   - Optional persistence to a directory, so restarts and other workers
+     reuse earlier results
+   - Files that do not parse are cached too
+
+3. Parallel Analysis:
+   - Batches with many uncached files are parsed in a ``ProcessPoolExecutor``
+     (parsing holds the GIL, so threads would not help); small batches are
+     parsed in-process where the pool's overhead would dominate
+   - Pool processes are spawned rather than forked, so they do not inherit
+     the server's threads and event loop
+
+USAGE:
+    cache = get_source_metrics_cache()
+    metrics = cache.analyze_files({"auth.py": source})  # path -> FileMetrics or None
+"""
+
+import ast
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump when FileMetrics or the extraction changes, to ignore persisted entries
+METRICS_VERSION = 1
+
+# Default size of the process pool: leave one CPU to the server
+DEFAULT_WORKERS = min(4, (os.cpu_count() or 1) - 1)
+
+# Control flow nodes counted as branch points
+BRANCH_NODES = (ast.If, ast.While, ast.For, ast.AsyncFor, ast.ExceptHandler)
+
+_MISSING = object()
+
+
+@dataclass
+class FileMetrics:
+    """Facts extracted from one Python source file"""
+
+    lines: int
+    functions: List[str] = field(default_factory=list)
+    classes: List[str] = field(default_factory=list)
+    branches: int = 0
+    # Imported modules; relative imports keep their leading dots (".models")
+    imports: List[str] = field(default_factory=list)
+
+
+class _MetricsVisitor(ast.NodeVisitor):
+    """Collects FileMetrics fields in one traversal"""
+
+    def __init__(self):
+        self.functions: List[str] = []
+        self.classes: List[str] = []
+        self.branches = 0
+        self.imports: List[str] = []
+
+    def generic_visit(self, node: ast.AST) -> None:
+        if isinstance(node, BRANCH_NODES):
+            self.branches += 1
+        super().generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.functions.append(node.name)
+        self.generic_visit(node)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.classes.append(node.name)
+        self.generic_visit(node)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        self.imports.extend(alias.name for alias in node.names)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        prefix = "." * (node.level or 0)
+        if node.module:
+            self.imports.append(prefix + node.module)
+        elif prefix:
+            # "from . import models" imports the sibling module
+            self.imports.extend(prefix + alias.name for alias in node.names)
+
+
+def analyze_source(content: str) -> Optional[FileMetrics]:
+    """
+    Extract metrics from Python source.
+
+    Args:
+        content (str): Source code
+
+    Returns:
+        Optional[FileMetrics]: Metrics, or None if the source does not parse
+    """
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        return None
+    visitor = _MetricsVisitor()
+    visitor.visit(tree)
+    return FileMetrics(
+        lines=len(content.splitlines()),
+        functions=visitor.functions,
+        classes=visitor.classes,
+        branches=visitor.branches,
+        imports=visitor.imports,
+    )
+
+
+def content_hash(content: str) -> str:
+    """Return the cache key of file contents"""
+    return hashlib.sha256(content.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class SourceMetricsCache:
+    """
+    Content-hash keyed LRU cache of FileMetrics.
+
+    Thread-safe; parsing happens outside the lock. With ``directory`` set,
+    every computed entry is also written there (one JSON file per hash,
+    written atomically) and misses are looked up there before parsing.
+
+    Args:
+        max_entries (int): Maximum number of entries kept in memory
+        directory (Optional[str]): Directory persisting entries (None to disable)
+        workers (int): Processes used for large batches (0 to always parse in-process)
+        parallel_min_files (int): Uncached files in a batch needed to use the process pool
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        directory: Optional[str] = None,
+        workers: int = 0,
+        parallel_min_files: int = 16,
+    ):
+        self.max_entries = max_entries
+        self.directory = Path(directory) if directory else None
+        self.workers = workers
+        self.parallel_min_files = parallel_min_files
+        self._entries: "OrderedDict[str, Optional[FileMetrics]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._parallel_batches = 0
+
+    def _lookup(self, key: str) -> Any:
+        with self._lock:
+            metrics = self._entries.get(key, _MISSING)
+            if metrics is not _MISSING:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return metrics
+        metrics = self._load(key)
+        if metrics is not _MISSING:
+            with self._lock:
+                self._disk_hits += 1
+            self._remember(key, metrics)
+        return metrics
+
+    def _remember(self, key: str, metrics: Optional[FileMetrics]) -> None:
+        with self._lock:
+            self._entries[key] = metrics
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _store(self, key: str, metrics: Optional[FileMetrics]) -> None:
+        self._remember(key, metrics)
+        self._save(key, metrics)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _load(self, key: str) -> Any:
+        if self.directory is None:
+            return _MISSING
+        try:
+            data = json.loads(self._path(key).read_text())
+        except (OSError, ValueError):
+            return _MISSING
+        if data.get("version") != METRICS_VERSION:
+            return _MISSING
+        return FileMetrics(**data["metrics"]) if data["metrics"] is not None else None
+
+    def _save(self, key: str, metrics: Optional[FileMetrics]) -> None:
+        if self.directory is None:
+            return
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            record = {"version": METRICS_VERSION, "metrics": asdict(metrics) if metrics is not None else None}
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(record, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Could not persist source metrics {key}: {e}")
+
+    def analyze(self, content: str) -> Optional[FileMetrics]:
+        """
+        Get the metrics of one file's contents, parsing only on a cache miss.
+
+        Args:
+            content (str): Source code
+
+        Returns:
+            Optional[FileMetrics]: Metrics, or None if the source does not parse
+        """
+        key = content_hash(content)
+        metrics = self._lookup(key)
+        if metrics is _MISSING:
+            with self._lock:
+                self._misses += 1
+            metrics = analyze_source(content)
+            self._store(key, metrics)
+        return metrics
+
+    def analyze_files(self, file_contents: Dict[str, str]) -> Dict[str, Optional[FileMetrics]]:
+        """
+        Get the metrics of several files, parsing cache misses in parallel when there are many.
+
+        Args:
+            file_contents (Dict[str, str]): Source code by file path
+
+        Returns:
+            Dict[str, Optional[FileMetrics]]: Metrics (None if unparsable) by file path
+        """
+        results: Dict[str, Optional[FileMetrics]] = {}
+        pending: Dict[str, Tuple[str, List[str]]] = {}
+        for path, content in file_contents.items():
+            key = content_hash(content)
+            if key in pending:
+                pending[key][1].append(path)
+                continue
+            metrics = self._lookup(key)
+            if metrics is _MISSING:
+                pending[key] = (content, [path])
+            else:
+                results[path] = metrics
+
+        if pending:
+            with self._lock:
+                self._misses += len(pending)
+            keys = list(pending)
+            computed = self._parse_many([pending[key][0] for key in keys])
+            for key, metrics in zip(keys, computed):
+                self._store(key, metrics)
+                for path in pending[key][1]:
+                    results[path] = metrics
+        return results
+
+    def _parse_many(self, contents: List[str]) -> List[Optional[FileMetrics]]:
+        if self.workers > 0 and len(contents) >= self.parallel_min_files:
+            try:
+                executor = self._get_executor()
+                chunksize = max(1, len(contents) // (self.workers * 4))
+                computed = list(executor.map(analyze_source, contents, chunksize=chunksize))
+                with self._lock:
+                    self._parallel_batches += 1
+                return computed
+            except Exception as e:
+                logger.warning(f"Parallel source analysis failed, parsing in-process: {e}")
+        return [analyze_source(content) for content in contents]
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache metrics for monitoring.
+
+        Returns:
+            Dict[str, Any]: Entry count and hit/miss counters
+        """
+        with self._lock:
+            lookups = self._hits + self._disk_hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_rate": (self._hits + self._disk_hits) / lookups if lookups else 0.0,
+                "parallel_batches": self._parallel_batches,
+                "persistent": self.directory is not None,
+            }
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (persisted entries are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def shutdown(self) -> None:
+        """Stop the process pool, if started"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+_cache: Optional[SourceMetricsCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_source_metrics_cache() -> SourceMetricsCache:
+    """
+    Get the process-wide source metrics cache, configured from settings.
+
+    Uses CONTEXT_ANALYSIS_CACHE_SIZE, CONTEXT_ANALYSIS_CACHE_DIR,
+    CONTEXT_ANALYSIS_WORKERS and CONTEXT_ANALYSIS_PARALLEL_MIN_FILES; the
+    defaults apply when settings are unavailable.
+
+    Returns:
+        SourceMetricsCache: Shared cache
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            try:
+                from .app.core.config import settings
+            except ImportError:
+                _cache = SourceMetricsCache(workers=DEFAULT_WORKERS)
+            else:
+                _cache = SourceMetricsCache(
+                    max_entries=settings.CONTEXT_ANALYSIS_CACHE_SIZE,
+                    directory=settings.CONTEXT_ANALYSIS_CACHE_DIR,
+                    workers=(
+                        settings.CONTEXT_ANALYSIS_WORKERS
+                        if settings.CONTEXT_ANALYSIS_WORKERS is not None
+                        else DEFAULT_WORKERS
+                    ),
+                    parallel_min_files=settings.CONTEXT_ANALYSIS_PARALLEL_MIN_FILES,
+                )
+        return _cache
@@ -1,11 +1,14 @@
+import json
+from datetime import datetime
+
 import pytest
 from fastapi.testclient import TestClient
 
 from services.orchestrator.auth import pwd_context
 from services.orchestrator.database import get_db
 from services.orchestrator.main import app
-from services.orchestrator.models import Base, User
-from services.orchestrator.utils.etag import generate_etag
+from services.orchestrator.models import Base, Job, User
+from services.orchestrator.utils.etag import resource_etag
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
@@ -102,7 +105,9 @@ def test_create_job_contract(client, test_db):
     assert "id" in data
     assert "status" in data
 
-    expected_etag = generate_etag(data)
+    expected_etag = resource_etag(
+        "job", data["id"], updated_at=datetime.fromisoformat(data["updated_at"])
+    )
     assert response.headers["ETag"] == expected_etag
 
 
@@ -128,5 +133,55 @@ def test_list_jobs_contract(client, test_db):
     data = response.json()
     assert isinstance(data, list)  # Should return a list of jobs
 
-    expected_etag = generate_etag(data)
-    assert response.headers["ETag"] == expected_etag
+    etag = response.headers["ETag"]
+    cached = client.get(
+        "/api/v1/jobs",
+        headers={"Authorization": f"Bearer {token}", "X-API-Key": "ci-key", "If-None-Match": etag},
+    )
+    assert cached.status_code == 304
+
+
+def test_batch_create_and_status_update_contract(client, test_db):
+    if not test_db.query(User).filter(User.username == "jobsuser").first():
+        user = User(
+            username="jobsuser", email="jobs@example.com", password_hash=pwd_context.hash("password")
+        )
+        test_db.add(user)
+        test_db.commit()
+
+    login = client.post(
+        "/auth/login", json={"username": "jobsuser", "password": "password"}
+    )
+    token = login.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}", "X-API-Key": "ci-key"}
+
+    response = client.post(
+        "/api/v1/jobs:batch",
+        json={"jobs": [{"title": "first", "priority": 7}, {"title": ""}, {"title": "third"}]},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["code"] for r in results] == [201, 422, 201]
+    first = results[0]
+    assert first["etag"] == resource_etag(
+        "job", first["job"]["id"], updated_at=datetime.fromisoformat(first["job"]["updated_at"])
+    )
+    priorities = {job.id: job.priority for job in test_db.query(Job).all()}
+    assert priorities[first["job"]["id"]] == 7
+    assert priorities[results[2]["job"]["id"]] == 0
+
+    response = client.patch(
+        "/api/v1/jobs/status:batch",
+        json={"updates": [
+            {"id": first["job"]["id"], "status": "running", "if_match": first["etag"]},
+            {"id": results[2]["job"]["id"], "status": "running", "if_match": '"stale"'},
+            {"id": "missing", "status": "failed"},
+        ]},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    updates = [json.loads(line) for line in response.text.splitlines()]
+    assert [u["code"] for u in updates] == [200, 412, 404]
+    assert updates[0]["job"]["status"] == "running"
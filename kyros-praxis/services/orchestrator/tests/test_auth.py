@@ -2,12 +2,14 @@ import pytest
 import os
 from fastapi.testclient import TestClient
 from services.orchestrator.auth import pwd_context
-from services.orchestrator.database import get_db
+from services.orchestrator.database import get_db, get_db_session
 from services.orchestrator.main import app
 from services.orchestrator.models import Base, User
+from services.orchestrator.principal_cache import get_principal_cache
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool, StaticPool
 
 
 # Set environment variables for testing
@@ -16,14 +18,19 @@ os.environ["ENVIRONMENT"] = "local"
 
 
 @pytest.fixture(scope="function")
-def test_db():
+def test_db(tmp_path):
     """Create a test database for each test function."""
+    # File database so the sync session and the async session used by
+    # get_current_user see the same rows
+    db_path = tmp_path / "test.db"
     engine = create_engine(
-        "sqlite:///:memory:",
+        f"sqlite:///{db_path}",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool)
+    TestingAsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
 
     # Create all tables
     Base.metadata.create_all(bind=engine)
@@ -35,8 +42,15 @@ def test_db():
         finally:
             db.close()
 
-    # Override the dependency
+    async def override_get_db_session():
+        async with TestingAsyncSessionLocal() as session:
+            yield session
+
+    # Override both sync and async dependencies
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_session] = override_get_db_session
+    # Principals cached by earlier tests belong to other databases
+    get_principal_cache().clear()
 
     yield TestingSessionLocal()
 
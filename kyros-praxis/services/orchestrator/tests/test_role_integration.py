@@ -9,17 +9,23 @@ authorization flow.
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from services.orchestrator.database import get_db
+from sqlalchemy.pool import NullPool
+from services.orchestrator.database import get_db, get_db_session
 from services.orchestrator.models import Base, User
 from services.orchestrator.auth import pwd_context, create_access_token
 from services.orchestrator.main import app
+from services.orchestrator.principal_cache import get_principal_cache
 
 
 # Create test database
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test_roles.db"
 engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# get_current_user reads users through the async session
+async_engine = create_async_engine("sqlite+aiosqlite:///./test_roles.db", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
 
 
 def get_test_db():
@@ -31,8 +37,15 @@ def get_test_db():
         db.close()
 
 
-# Override dependency
+async def get_test_db_session():
+    """Override get_db_session dependency for testing."""
+    async with TestingAsyncSessionLocal() as session:
+        yield session
+
+
+# Override dependencies
 app.dependency_overrides[get_db] = get_test_db
+app.dependency_overrides[get_db_session] = get_test_db_session
 
 
 class TestRoleBasedEndpoints:
@@ -77,6 +90,8 @@ class TestRoleBasedEndpoints:
         
         db.commit()
         db.close()
+        # Principals cached by other test modules may carry other roles
+        get_principal_cache().clear()
         
         yield users
         
@@ -0,0 +1,114 @@
+import asyncio
+
+from services.orchestrator.assessment_cache import AssessmentCache, task_fingerprint
+from services.orchestrator.context_analysis import ContextAnalyzer
+from services.orchestrator.escalation_store import InMemoryWorkflowStore
+from services.orchestrator.escalation_triggers import EscalationDetector
+from services.orchestrator.escalation_workflow import EscalationEngine
+from services.orchestrator.source_metrics import SourceMetricsCache
+
+
+def _cache(**kwargs):
+    return AssessmentCache(EscalationDetector(), ContextAnalyzer(metrics_cache=SourceMetricsCache()), **kwargs)
+
+
+def test_fingerprint_ignores_formatting_and_order_but_not_contents():
+    base = task_fingerprint("Add JWT auth", ["b.py", "a.py"], file_contents={"a.py": "x = 1"})
+    assert base == task_fingerprint("  Add   JWT\nauth ", ["a.py", "b.py"], file_contents={"a.py": "x = 1"})
+    assert base != task_fingerprint("Add JWT auth", ["a.py", "b.py"], file_contents={"a.py": "x = 2"})
+    assert base != task_fingerprint("Add JWT auth", ["a.py", "b.py"], "review", file_contents={"a.py": "x = 1"})
+
+
+def test_resubmitted_tasks_hit_and_get_their_own_copy():
+    cache = _cache()
+    first = cache.detect("Implement secure JWT authentication", ["auth.py", "models.py"])
+    first.should_escalate = False
+    second = cache.detect("Implement  secure JWT authentication", ["models.py", "auth.py"])
+
+    assert second.should_escalate and second.triggers == first.triggers
+    contents = {"auth.py": "def login():\n    pass\n"}
+    assert cache.analyze("Fix login", ["auth.py"], contents) == cache.analyze("Fix login", ["auth.py"], contents)
+    stats = cache.stats()
+    assert stats["detection"]["hits"] == 1 and stats["detection"]["misses"] == 1
+    assert stats["analysis"]["hits"] == 1 and stats["analysis"]["hit_rate"] == 0.5
+
+
+def test_entries_expire_and_are_evicted():
+    now = [0.0]
+    cache = _cache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+    for description in ["Task one", "Task two", "Task three"]:
+        cache.detect(description, ["a.py"])
+    assert cache.stats()["entries"] == 2 and cache.stats()["detection"]["evicted"] == 1
+
+    now[0] = 11.0
+    cache.detect("Task three", ["a.py"])
+    assert cache.stats()["detection"]["expired"] == 1 and cache.stats()["detection"]["misses"] == 4
+
+
+def test_detector_configuration_change_invalidates():
+    cache = _cache()
+    assert not cache.detect("Escape the sandbox", ["README.md"]).triggers
+    cache.detector.security_direct_keywords.append("sandbox")
+    cache.detector.compile_patterns()
+    assert cache.detect("Escape the sandbox", ["README.md"]).triggers
+    assert cache.stats()["detection"]["misses"] == 2
+
+
+def test_engine_workflows_reuse_cached_assessments():
+    async def scenario():
+        engine = EscalationEngine(store=InMemoryWorkflowStore())
+        for _ in range(2):
+            await engine.submit_escalation_request("Refactor logging", ["app.py"])
+        await asyncio.wait_for(engine.scheduler._queue.join(), 5)
+        return await engine.get_workflow_statistics()
+
+    stats = asyncio.run(scenario())["assessment_cache"]
+    assert stats["detection"]["hits"] == 1 and stats["analysis"]["hits"] == 1
+
+
+def _collect(results):
+    async def scenario():
+        return [item async for item in results]
+
+    return asyncio.run(scenario())
+
+
+def test_detect_batch_scores_every_task_once():
+    cache = _cache()
+    tasks = [
+        {"task_description": f"Implement JWT auth for service {n % 5}", "files_to_modify": [f"svc{n % 5}/auth.py"]}
+        for n in range(40)
+    ]
+    tasks.append({"task_description": "Broken task"})
+
+    results = dict(_collect(cache.detect_batch(tasks, concurrency=3, chunk_size=7)))
+
+    assert sorted(results) == list(range(41))
+    assert isinstance(results[40], KeyError)
+    for index, task in enumerate(tasks[:40]):
+        expected = cache.detector.analyze_task_context(task["task_description"], task["files_to_modify"], [])
+        assert results[index] == expected
+    # Identical tasks after the first five hit the cache (chunks may race on a first miss)
+    assert cache.stats()["detection"]["hits"] >= 40 - 5 * 3
+
+
+def test_analyze_batch_parses_chunk_sources_together():
+    metrics_cache = SourceMetricsCache(workers=2, parallel_min_files=4)
+    cache = AssessmentCache(EscalationDetector(), ContextAnalyzer(metrics_cache=metrics_cache))
+    tasks = [
+        {
+            "task_description": "Refactor handler",
+            "files_to_modify": [f"mod{n}.py"],
+            "file_contents": {f"mod{n}.py": f"def handler_{n}():\n    if x:\n        return {n}\n"},
+        }
+        for n in range(8)
+    ]
+    try:
+        results = dict(_collect(cache.analyze_batch(tasks, chunk_size=4)))
+    finally:
+        metrics_cache.shutdown()
+
+    assert sorted(results) == list(range(8))
+    assert metrics_cache.stats()["parallel_batches"] == 2
+    assert metrics_cache.stats()["misses"] == 8
+    assert results[5] == ContextAnalyzer(metrics_cache=SourceMetricsCache()).analyze_task_context(**tasks[5])
@@ -0,0 +1,103 @@
+import asyncio
+
+from jose import jwt
+
+from services.orchestrator.auth_context import (
+    STATE_KEY,
+    AuthContextMiddleware,
+    TokenVerifier,
+    resolve_auth_context,
+)
+
+SECRET = "test-secret"
+
+
+class _Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _verifier(clock, **kwargs):
+    return TokenVerifier(SECRET, "HS512", "kyros-praxis", "kyros-app", clock=clock, **kwargs)
+
+
+def _token(sub="alice", exp=2000, secret=SECRET, aud="kyros-app"):
+    claims = {"sub": sub, "exp": exp, "iss": "kyros-praxis", "aud": aud}
+    return jwt.encode(claims, secret, algorithm="HS512")
+
+
+def _scope(token=None, scheme="Bearer"):
+    headers = [(b"authorization", f"{scheme} {token}".encode())] if token else []
+    return {"type": "http", "headers": headers}
+
+
+def test_verified_token_is_cached_until_expiry():
+    clock = _Clock()
+    verifier = _verifier(clock)
+    token = _token(exp=1100)
+
+    first = verifier.verify(token)
+    second = verifier.verify(token)
+    assert first.authenticated and second.authenticated
+    assert second.subject == "alice"
+    assert verifier.stats()["hits"] == 1
+
+    clock.now = 1100
+    expired = verifier.verify(token)
+    assert expired.expired and not expired.authenticated
+    # Expired tokens still carry their subject but are not cached
+    assert expired.subject == "alice"
+    assert verifier.stats()["size"] == 0
+
+
+def test_invalid_tokens_are_rejected_and_not_cached():
+    verifier = _verifier(_Clock())
+    for token in (_token(secret="other"), _token(aud="someone-else"), "garbage"):
+        ctx = verifier.verify(token)
+        assert ctx.claims is None
+        assert not ctx.authenticated
+        assert ctx.session_id == ""
+    assert verifier.stats()["size"] == 0
+
+
+def test_cache_is_bounded_lru():
+    verifier = _verifier(_Clock(), maxsize=2)
+    tokens = [_token(sub=f"u{n}") for n in range(3)]
+    for token in tokens:
+        verifier.verify(token)
+    assert verifier.stats()["size"] == 2
+    verifier.verify(tokens[0])
+    assert verifier.stats()["hits"] == 0
+
+
+def test_context_is_resolved_once_per_request():
+    verifier = _verifier(_Clock())
+    scope = _scope(_token())
+
+    ctx = resolve_auth_context(scope, verifier)
+    assert resolve_auth_context(scope, verifier) is ctx
+    assert scope["state"][STATE_KEY] is ctx
+    assert verifier.stats()["misses"] == 1
+    assert ctx.session_id == "alice"
+
+    anonymous = resolve_auth_context(_scope(), verifier)
+    assert anonymous.token is None and not anonymous.authenticated
+
+    # The auth scheme is case-insensitive
+    assert resolve_auth_context(_scope(_token(), scheme="bearer"), verifier).authenticated
+    assert resolve_auth_context(_scope(_token(), scheme="Basic"), verifier).token is None
+
+
+def test_middleware_stores_context_in_scope_state():
+    verifier = _verifier(_Clock())
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen["ctx"] = scope["state"][STATE_KEY]
+
+    middleware = AuthContextMiddleware(app, verifier=verifier)
+    asyncio.run(middleware(_scope(_token(sub="bob")), None, None))
+    assert seen["ctx"].subject == "bob"
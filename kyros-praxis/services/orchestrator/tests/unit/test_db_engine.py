@@ -0,0 +1,53 @@
+import asyncio
+from unittest.mock import MagicMock
+
+from sqlalchemy import text
+
+from services.orchestrator import db_engine
+from services.orchestrator.db_engine import build_async_engine, build_engine, engine_options, get_pool_metrics
+
+
+def test_sqlite_file_connections_get_wal_and_busy_timeout(tmp_path):
+    engine = build_engine(f"sqlite:///{tmp_path / 'wal.db'}", name="test-sqlite")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar().lower() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == db_engine.settings.SQLITE_BUSY_TIMEOUT_MS
+    engine.dispose()
+
+    metrics = get_pool_metrics()["test-sqlite"]
+    assert metrics["connects"] >= 1
+    assert metrics["checkouts"] == metrics["checkins"] >= 1
+
+
+def test_in_memory_sqlite_skips_wal():
+    engine = build_engine("sqlite:///:memory:", name="test-memory")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar().lower() == "memory"
+    engine.dispose()
+
+
+def test_async_sqlite_engine_applies_pragmas(tmp_path):
+    engine = build_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}", name="test-async")
+
+    async def journal_mode():
+        async with engine.connect() as conn:
+            result = await conn.execute(text("PRAGMA journal_mode"))
+            return result.scalar()
+
+    assert asyncio.run(journal_mode()).lower() == "wal"
+    asyncio.run(engine.dispose())
+
+
+def test_server_profile_sizes_and_times_the_pool():
+    metrics = db_engine.PoolMetrics("test-pg")
+    options = engine_options("postgresql+psycopg2://u:p@db/kyros", metrics)
+    assert options["pool_size"] == db_engine.settings.DB_POOL_SIZE
+    assert options["max_overflow"] == db_engine.settings.DB_MAX_OVERFLOW
+    assert options["pool_recycle"] == db_engine.settings.DB_POOL_RECYCLE
+    assert options["pool_pre_ping"] is True
+    assert options["poolclass"]._metrics is metrics
+
+    pool = options["poolclass"](MagicMock, pool_size=1, max_overflow=0)
+    pool.connect().close()
+    assert metrics.snapshot()["wait"]["count"] == 1
@@ -0,0 +1,88 @@
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from services.orchestrator.escalation_store import InMemoryWorkflowStore
+from services.orchestrator.escalation_workflow import EscalationEngine
+from services.orchestrator.routers import escalation
+
+TASKS = [
+    {"id": "step-1", "task_description": "Implement secure JWT authentication", "files_to_modify": ["auth.py"]},
+    {"id": "step-2", "task_description": "Fix typo in README", "files_to_modify": ["README.md"]},
+    {"task_description": "Refactor logging", "files_to_modify": ["app.py"]},
+]
+
+
+@pytest.fixture
+def esc_engine(monkeypatch):
+    engine = EscalationEngine(store=InMemoryWorkflowStore())
+    monkeypatch.setattr(escalation, "get_escalation_engine", lambda: engine)
+    return engine
+
+
+@pytest.fixture
+def client(esc_engine):
+    app = FastAPI()
+    app.include_router(escalation.router)
+    return TestClient(app)
+
+
+def _lines(response):
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def _single(task):
+    return {key: value for key, value in task.items() if key != "id"}
+
+
+def test_detect_batch_streams_one_line_per_task(client):
+    lines = _lines(client.post("/v1/escalation/detect:batch", json={"tasks": TASKS}))
+
+    assert sorted(line["index"] for line in lines) == [0, 1, 2]
+    for line in lines:
+        task = TASKS[line["index"]]
+        assert set(line) == {"index", "id", "code", "result"}
+        assert line["id"] == task.get("id")
+        assert line["code"] == 200
+        assert line["result"] == client.post("/v1/escalation/detect", json=_single(task)).json()
+
+
+def test_analyze_batch_results_match_single_analysis(client):
+    tasks = [
+        {"id": f"t{n}", "task_description": "Refactor handler", "files_to_modify": [f"mod{n}.py"],
+         "file_contents": {f"mod{n}.py": f"def handler_{n}():\n    return {n}\n"}}
+        for n in range(3)
+    ]
+    lines = _lines(client.post("/v1/escalation/analyze:batch", json={"tasks": tasks}))
+
+    assert sorted(line["id"] for line in lines) == ["t0", "t1", "t2"]
+    for line in lines:
+        assert line["code"] == 200
+        assert line["id"] == tasks[line["index"]]["id"]
+        assert line["result"] == client.post("/v1/escalation/analyze", json=_single(tasks[line["index"]])).json()
+
+
+def test_failed_tasks_get_error_lines(client, esc_engine, monkeypatch):
+    detector = esc_engine.assessment_cache.detector
+    analyze = detector.analyze_task_context
+
+    def flaky(task_description, *args, **kwargs):
+        if "README" in task_description:
+            raise RuntimeError("boom")
+        return analyze(task_description, *args, **kwargs)
+
+    monkeypatch.setattr(detector, "analyze_task_context", flaky)
+    lines = {line["index"]: line for line in _lines(client.post("/v1/escalation/detect:batch", json={"tasks": TASKS}))}
+
+    assert lines[1] == {"index": 1, "id": "step-2", "code": 500, "error": "Failed detecting escalation triggers: boom"}
+    assert lines[0]["code"] == lines[2]["code"] == 200
+
+
+def test_batch_size_is_validated(client):
+    assert client.post("/v1/escalation/detect:batch", json={"tasks": []}).status_code == 422
+    too_many = [_single(TASKS[1])] * (escalation.MAX_BATCH_SIZE + 1)
+    assert client.post("/v1/escalation/analyze:batch", json={"tasks": too_many}).status_code == 422
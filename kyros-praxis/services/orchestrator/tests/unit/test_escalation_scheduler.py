@@ -0,0 +1,149 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from services.orchestrator.escalation_scheduler import EscalationScheduler, SchedulerFull
+from services.orchestrator.escalation_store import InMemoryWorkflowStore
+from services.orchestrator.escalation_workflow import EscalationEngine, EscalationOutcome, WorkflowState
+
+
+def _workflow(workflow_id, priority="normal", timeout_seconds=5):
+    return SimpleNamespace(
+        workflow_id=workflow_id,
+        request=SimpleNamespace(priority=priority, timeout_seconds=timeout_seconds),
+    )
+
+
+def test_excess_workflows_queue_and_run_in_priority_order():
+    order = []
+
+    async def scenario():
+        gate = asyncio.Event()
+
+        async def run(workflow):
+            await gate.wait()
+            order.append(workflow.workflow_id)
+
+        scheduler = EscalationScheduler(run, workers=1)
+        scheduler.submit(_workflow("first", "low"))
+        await asyncio.sleep(0)
+        for workflow_id, priority in [("low", "low"), ("normal", "normal"), ("critical", "critical"),
+                                      ("high", "high"), ("high2", "high")]:
+            scheduler.submit(_workflow(workflow_id, priority))
+        await asyncio.sleep(0.01)
+
+        stats = scheduler.stats()
+        assert stats["running"] == 1 and stats["queue_depth"] == 5
+        assert stats["queue_depth_by_priority"] == {"critical": 1, "high": 2, "normal": 1, "low": 1}
+
+        gate.set()
+        await scheduler._queue.join()
+        return scheduler.stats()
+
+    stats = asyncio.run(scenario())
+    assert order == ["first", "critical", "high", "high2", "normal", "low"]
+    assert stats["completed_total"] == 6 and stats["wait"]["count"] == 6 and stats["queue_depth"] == 0
+
+
+def test_pool_bounds_concurrency():
+    peak = running = 0
+
+    async def scenario():
+        async def run(workflow):
+            nonlocal peak, running
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        scheduler = EscalationScheduler(run, workers=3)
+        for n in range(10):
+            scheduler.submit(_workflow(f"w{n}"))
+        await asyncio.sleep(0)
+        await scheduler._queue.join()
+        await scheduler.shutdown()
+
+    asyncio.run(scenario())
+    assert peak == 3
+
+
+def test_deadline_cancels_running_and_expired_queued_workflows():
+    timed_out = []
+
+    async def scenario():
+        async def run(workflow):
+            await asyncio.sleep(10)
+
+        async def on_timeout(workflow):
+            timed_out.append(workflow.workflow_id)
+
+        scheduler = EscalationScheduler(run, workers=1, on_timeout=on_timeout)
+        scheduler.submit(_workflow("slow", timeout_seconds=0.05))
+        scheduler.submit(_workflow("starved", timeout_seconds=0.01))
+        await asyncio.sleep(0)
+        await asyncio.wait_for(scheduler._queue.join(), 1)
+        return scheduler.stats()
+
+    stats = asyncio.run(scenario())
+    assert timed_out == ["slow", "starved"]
+    assert stats["timed_out_total"] == 2 and stats["started_total"] == 1
+
+
+def test_cancel_queued_and_running_workflows():
+    ran = []
+
+    async def scenario():
+        async def run(workflow):
+            ran.append(workflow.workflow_id)
+            await asyncio.sleep(10)
+
+        scheduler = EscalationScheduler(run, workers=1)
+        scheduler.submit(_workflow("running"))
+        scheduler.submit(_workflow("queued"))
+        await asyncio.sleep(0.01)
+        assert scheduler.cancel("queued") and scheduler.cancel("running")
+        assert scheduler.cancel("unknown") is False
+        await asyncio.wait_for(scheduler._queue.join(), 1)
+        return scheduler.stats()
+
+    stats = asyncio.run(scenario())
+    assert ran == ["running"]
+    assert stats["cancelled_total"] == 2 and stats["running"] == 0
+
+
+def test_full_queue_rejects_submission():
+    async def scenario():
+        async def run(workflow):
+            await asyncio.sleep(10)
+
+        scheduler = EscalationScheduler(run, workers=1, max_queue=1)
+        scheduler.submit(_workflow("w1"))
+        with pytest.raises(SchedulerFull):
+            scheduler.submit(_workflow("w2"))
+        await scheduler.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_engine_queues_beyond_pool_size_and_times_out_workflows():
+    async def scenario():
+        engine = EscalationEngine(store=InMemoryWorkflowStore(), max_concurrent_workflows=1)
+
+        async def stall(workflow):
+            await asyncio.sleep(10)
+
+        engine._step_detection = stall
+        workflows = [
+            await engine.submit_escalation_request("Refactor logging", ["app.py"], timeout_seconds=0.05)
+            for _ in range(3)
+        ]
+        await asyncio.wait_for(engine.scheduler._queue.join(), 1)
+        return engine, workflows
+
+    engine, workflows = asyncio.run(scenario())
+    for workflow in workflows:
+        assert workflow.state == WorkflowState.FAILED
+        assert workflow.outcome == EscalationOutcome.TIMEOUT
+    assert engine.active_workflows == {}
+    assert asyncio.run(engine.get_workflow_statistics())["timed_out"] == 3
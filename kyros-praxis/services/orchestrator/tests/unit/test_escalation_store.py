@@ -0,0 +1,94 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from services.orchestrator.escalation_store import InMemoryWorkflowStore
+from services.orchestrator.escalation_workflow import (
+    EscalationEngine,
+    EscalationOutcome,
+    EscalationWorkflow,
+    WorkflowState,
+)
+
+
+def _record(workflow_id, completed_at=None):
+    return {
+        "workflow_id": workflow_id,
+        "state": "completed" if completed_at else "analyzing",
+        "started_at": datetime(2026, 1, 1).isoformat(),
+        "completed_at": completed_at.isoformat() if completed_at else None,
+    }
+
+
+async def _until_done(engine, workflow_id):
+    for _ in range(100):
+        workflow = await engine.get_workflow_status(workflow_id)
+        if workflow.completed_at is not None:
+            return workflow
+        await asyncio.sleep(0.01)
+    raise AssertionError("workflow did not finish")
+
+
+@pytest.mark.asyncio
+async def test_completed_workflows_are_bounded_by_count_and_age():
+    store = InMemoryWorkflowStore(max_completed=2, completed_ttl=60)
+    now = datetime.utcnow()
+    for n in range(3):
+        assert await store.save(_record(f"w{n}", completed_at=now - timedelta(seconds=60 - 30 * n)))
+
+    # Oldest completion evicted by count, then w1 (completed 30s ago) by age
+    assert await store.get("w0") is None and await store.get("w2") is not None
+    assert await store.prune(now + timedelta(seconds=45)) == 1
+    assert (await store.count())["completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_completed_snapshot_is_final():
+    store = InMemoryWorkflowStore()
+    await store.save(_record("w1"))
+    assert await store.save(_record("w1", completed_at=datetime.utcnow()))
+    assert await store.save(_record("w1")) is False
+    assert (await store.count())["active"] == 0
+
+
+@pytest.mark.asyncio
+async def test_status_and_statistics_are_served_from_the_shared_store():
+    store = InMemoryWorkflowStore()
+    worker_a = EscalationEngine(store=store)
+    worker_b = EscalationEngine(store=store)
+
+    workflow = await worker_a.submit_escalation_request("Implement secure JWT authentication", ["auth.py"])
+    finished = await _until_done(worker_b, workflow.workflow_id)
+
+    assert finished.state == WorkflowState.COMPLETED
+    assert finished.outcome == EscalationOutcome.SUCCESS
+    assert finished.assessment.should_escalate == workflow.assessment.should_escalate
+    stats = await worker_b.get_workflow_statistics()
+    assert stats["total_requests"] == 1 and stats["completed"] == 1 and stats["active_workflows"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancel_from_another_worker_finalizes_workflow():
+    store = InMemoryWorkflowStore()
+    worker_a = EscalationEngine(store=store)
+    worker_b = EscalationEngine(store=store)
+
+    workflow = await worker_a.submit_escalation_request("Refactor logging", ["app.py"])
+    assert await worker_b.cancel_workflow(workflow.workflow_id)
+    await asyncio.sleep(0.05)
+
+    stored = EscalationWorkflow.from_dict(await store.get(workflow.workflow_id))
+    assert stored.outcome == EscalationOutcome.CANCELLED
+    assert workflow.workflow_id not in worker_a.active_workflows
+    assert await worker_a.cancel_workflow(workflow.workflow_id) is False
+
+
+def test_workflow_round_trips_through_its_dict_form():
+    async def scenario():
+        engine = EscalationEngine()
+        workflow = await engine.submit_escalation_request("Add payment encryption", ["billing/payments.py"])
+        return await _until_done(engine, workflow.workflow_id)
+
+    workflow = asyncio.run(scenario())
+    assert EscalationWorkflow.from_dict(workflow.to_dict()) == workflow
@@ -0,0 +1,100 @@
+import pytest
+
+from services.orchestrator.escalation_triggers import (
+    DEFAULT_HIGH_RISK_FILES,
+    EscalationDetector,
+    FileRisk,
+    GlobMatcher,
+    KeywordMatcher,
+)
+
+
+@pytest.fixture(scope="module")
+def detector():
+    return EscalationDetector()
+
+
+@pytest.mark.parametrize("text,group,expected", [
+    ("Rotate the signing key", "security.encryption", ["key"]),
+    ("Fix the monkey patch", "security.encryption", None),
+    ("Add encryption at rest", "security.encryption", ["encrypt"]),
+    ("Update user_auth handler", "security.auth", ["auth"]),
+    ("Speed up RAPID builds", "architecture.interface", None),
+])
+def test_keywords_match_at_word_starts_only(detector, text, group, expected):
+    assert detector.keyword_matcher.match(text).get(group) == expected
+
+
+def test_overlapping_keywords_and_shared_keywords_all_reported():
+    matcher = KeywordMatcher({"a": ["complexity", "complex"], "b": ["complex"]})
+    assert matcher.match("Reduce COMPLEXITY; complexity again") == {"a": ["complexity", "complex"], "b": ["complex"]}
+    assert KeywordMatcher({}).match("anything") == {}
+
+
+def test_keyword_hits_drive_triggers(detector):
+    assessment = detector.analyze_task_context("Implement secure JWT authentication", ["models.py"], [])
+    assert assessment.should_escalate
+    assert "Keywords found: auth, jwt" in assessment.triggers[0].evidence
+    assert not detector.analyze_task_context("Fix the monkey patch", ["utils.py"], []).triggers
+
+
+def test_analyze_many_matches_individual_analysis(detector):
+    tasks = [
+        {"task_description": "Optimize database query and index", "files_to_modify": ["db.py"]},
+        {"task_description": "Fix typo in README", "files_to_modify": ["README.md"], "task_type": "docs"},
+        {"task_description": "Optimize database query and index", "files_to_modify": ["auth.py"], "current_files": ["auth.py"]},
+    ]
+    expected = [
+        detector.analyze_task_context(
+            task["task_description"], task["files_to_modify"], task.get("current_files", []),
+            task.get("task_type", "implementation"),
+        )
+        for task in tasks
+    ]
+    assert detector.analyze_many(tasks) == expected
+
+
+def test_compile_patterns_applies_changed_keywords():
+    detector = EscalationDetector()
+    detector.security_direct_keywords.append("sandbox")
+    assert "security_direct" not in detector.keyword_matcher.match("Escape the sandbox")
+    detector.compile_patterns()
+    assert detector.keyword_matcher.match("Escape the sandbox")["security_direct"] == ["sandbox"]
+
+
+@pytest.mark.parametrize("path,expected", [
+    ("auth.py", True),
+    ("services/orchestrator/auth_context.py", True),
+    ("app\\core\\Config.py", True),
+    ("./database.py", True),
+    ("app/authz.ts", False),
+    ("tools/myauth.py", False),
+])
+def test_default_high_risk_globs(path, expected):
+    assert GlobMatcher(DEFAULT_HIGH_RISK_FILES).match(path) is expected
+
+
+@pytest.mark.parametrize("path,expected", [
+    ("services/orc/config/app.yaml", True),
+    ("lib/services/orc/config/app.yaml", False),
+    ("app/deploy/prod.tf", True),
+    ("deploy/staging/x.tf", False),
+    ("infra/k8s/a/b/secret.yaml", True),
+    ("src/driver.c", True),
+    ("src/driver.cc", False),
+])
+def test_glob_semantics(path, expected):
+    matcher = GlobMatcher(["/services/*/config/*.yaml", "deploy/prod.tf", "infra/**/secret.yaml", "*.[ch]"])
+    assert matcher.match(path) is expected
+
+
+def test_classify_paths_labels_each_path():
+    detector = EscalationDetector(high_risk_files=DEFAULT_HIGH_RISK_FILES + ["**/*.tf"])
+    labels = detector.classify_paths(["auth.py", "docs/security.md", "README.md", "infra/main.tf"])
+    assert labels == [FileRisk.HIGH, FileRisk.SENSITIVE, FileRisk.NORMAL, FileRisk.HIGH]
+
+
+def test_high_risk_file_trigger_lists_each_file_once():
+    detector = EscalationDetector(high_risk_files=["**/config*.py", "app/*.py"])
+    triggers = detector._analyze_file_patterns(["app/config.py", "README.md"], [])
+    assert triggers[0].evidence == ["High-risk files: app/config.py"]
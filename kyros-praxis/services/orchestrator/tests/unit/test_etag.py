@@ -0,0 +1,55 @@
+from datetime import datetime
+
+from services.orchestrator.utils import etag as etag_module
+from services.orchestrator.utils.etag import (
+    collection_etag,
+    content_etag,
+    etag_matches,
+    generate_etag,
+    query_stamp,
+    resource_etag,
+)
+
+
+def test_resource_etag_prefers_version():
+    stamp = datetime(2025, 1, 1)
+    assert resource_etag("task", "42", version=3, updated_at=stamp) == '"task-42-v3"'
+    assert resource_etag("task", "42", version=4) != resource_etag("task", "42", version=3)
+    assert resource_etag("job", "1", updated_at=stamp) == resource_etag("job", "1", updated_at=stamp)
+    assert resource_etag("job", "1", updated_at=stamp) != resource_etag("job", "1", updated_at=datetime(2025, 1, 2))
+    assert resource_etag("task", "42", version=3, weak=True) == 'W/"task-42-v3"'
+
+
+def test_collection_etag_is_weak_version_vector():
+    assert collection_etag("tasks", "ab", 7) == 'W/"tasks-ab-7"'
+
+
+def test_query_stamp_distinguishes_pages():
+    first = collection_etag("tasks", "ab", 7, query_stamp(cursor=None, limit=50))
+    assert first == collection_etag("tasks", "ab", 7, query_stamp(limit=50, cursor=None))
+    assert first != collection_etag("tasks", "ab", 7, query_stamp(cursor="c1", limit=50))
+    assert first != collection_etag("tasks", "ab", 7, query_stamp(cursor=None, limit=20))
+
+
+def test_content_etag_is_key_order_independent():
+    a = {"name": "x", "when": datetime(2025, 1, 1), "items": [1, 2]}
+    b = {"items": [1, 2], "when": datetime(2025, 1, 1), "name": "x"}
+    assert content_etag(a) == content_etag(b) == generate_etag(a)
+    assert content_etag(a) != content_etag({**a, "name": "y"})
+    assert len(content_etag(a)) == 18
+
+
+def test_content_etag_without_xxhash(monkeypatch):
+    monkeypatch.setattr(etag_module, "HAVE_XXHASH", False)
+    assert len(content_etag({"a": 1})) == 18
+
+
+def test_etag_matches_uses_weak_comparison():
+    etag = 'W/"tasks-ab-3"'
+    assert etag_matches(etag, etag)
+    assert etag_matches('"tasks-ab-3"', etag)
+    assert etag_matches('"other", W/"tasks-ab-3"', etag)
+    assert etag_matches("tasks-ab-3", etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('W/"tasks-ab-2"', etag)
+    assert not etag_matches(None, etag)
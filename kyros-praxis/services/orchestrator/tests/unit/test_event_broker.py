@@ -0,0 +1,81 @@
+import asyncio
+import json
+import threading
+
+from services.orchestrator.app.core.event_broker import DISCONNECT, EventBroker
+
+
+def _payload(frame):
+    assert frame.startswith("data: ")
+    return json.loads(frame[len("data: "):])
+
+
+def test_subscriber_receives_backlog_then_live_events():
+    broker = EventBroker(buffer_size=2)
+    broker.publish("t1", {"n": 0})
+    broker.publish("t1", {"n": 1})
+    broker.publish("t1", {"n": 2})
+
+    async def scenario():
+        subscription = broker.subscribe("t1")
+        received = []
+        stream = subscription.__aiter__()
+        for _ in range(2):
+            received.append(_payload(await stream.__anext__())["n"])
+        broker.publish("t1", {"n": 3})
+        broker.publish("t2", {"n": 99})
+        received.append(_payload(await asyncio.wait_for(stream.__anext__(), 1))["n"])
+        broker.unsubscribe(subscription)
+        return received
+
+    # Ring buffer keeps only the newest two events
+    assert asyncio.run(scenario()) == [1, 2, 3]
+    assert broker.history("t1") == [{"n": 2}, {"n": 3}]
+
+
+def test_publish_from_worker_thread_is_delivered():
+    broker = EventBroker()
+
+    async def scenario():
+        subscription = broker.subscribe("t1", replay=False)
+        stream = subscription.__aiter__()
+        thread = threading.Thread(target=broker.publish, args=("t1", {"n": 1}))
+        thread.start()
+        frame = await asyncio.wait_for(stream.__anext__(), 1)
+        thread.join()
+        return _payload(frame)
+
+    assert asyncio.run(scenario()) == {"n": 1}
+
+
+def test_slow_consumer_drops_oldest():
+    broker = EventBroker(queue_size=2)
+
+    async def scenario():
+        subscription = broker.subscribe("t1", replay=False)
+        for n in range(5):
+            broker.publish("t1", {"n": n})
+        assert broker.metrics()["queue_depth_max"] == 2
+        stream = subscription.__aiter__()
+        return [_payload(await stream.__anext__())["n"] for _ in range(2)]
+
+    assert asyncio.run(scenario()) == [3, 4]
+    assert broker.metrics()["dropped_total"] == 3
+
+
+def test_slow_consumer_disconnect_policy():
+    broker = EventBroker(queue_size=1, overflow=DISCONNECT)
+
+    async def scenario():
+        subscription = broker.subscribe("t1", replay=False)
+        broker.publish("t1", {"n": 0})
+        broker.publish("t1", {"n": 1})
+        frames = [frame async for frame in subscription]
+        return subscription, frames
+
+    subscription, frames = asyncio.run(scenario())
+    assert subscription.closed is True
+    assert frames == []
+    metrics = broker.metrics()
+    assert metrics["subscribers"] == 0
+    assert metrics["disconnected_total"] == 1
@@ -0,0 +1,144 @@
+import asyncio
+import json
+import time
+
+from services.orchestrator import event_log
+from services.orchestrator.event_log import EventLog, EventLogWatcher, index_path_for
+
+
+def _events(log, after=-1, limit=None):
+    return [(seq, ev["n"]) for seq, ev in log.read(after=after, limit=limit)]
+
+
+def test_append_assigns_sequence_numbers_and_etag(tmp_path):
+    log = EventLog(tmp_path)
+    etag_empty = log.etag
+    assert log.last_seq == -1
+
+    assert log.append({"n": 0}) == 0
+    assert log.append({"n": 1}) == 1
+    assert log.last_seq == 1
+    assert log.etag != etag_empty
+    assert _events(log) == [(0, 0), (1, 1)]
+
+
+def test_read_seeks_to_offset_with_limit(tmp_path):
+    log = EventLog(tmp_path)
+    for n in range(20):
+        log.append({"n": n})
+    assert _events(log, after=14) == [(15, 15), (16, 16), (17, 17), (18, 18), (19, 19)]
+    assert _events(log, after=4, limit=2) == [(5, 5), (6, 6)]
+    assert _events(log, after=19) == []
+
+
+def test_segments_roll_and_reads_span_them(tmp_path):
+    log = EventLog(tmp_path, segment_bytes=64)
+    for n in range(30):
+        log.append({"n": n, "pad": "x" * 10})
+    sealed = [p for p in tmp_path.iterdir() if p.name.startswith("events.0")]
+    assert sealed, "expected sealed segments"
+    assert _events(log) == [(n, n) for n in range(30)]
+    assert _events(log, after=25) == [(n, n) for n in range(26, 30)]
+
+
+def test_reopen_preserves_sequence_and_etag(tmp_path):
+    log = EventLog(tmp_path, segment_bytes=64)
+    for n in range(10):
+        log.append({"n": n})
+    etag = log.etag
+    log.close()
+
+    reopened = EventLog(tmp_path, segment_bytes=64)
+    assert reopened.etag == etag
+    assert reopened.append({"n": 10}) == 10
+    assert _events(reopened, after=8) == [(9, 9), (10, 10)]
+
+
+def test_legacy_file_without_index_is_indexed_on_open(tmp_path):
+    legacy = tmp_path / "events.jsonl"
+    legacy.write_text("".join(json.dumps({"n": n}) + "\n" for n in range(3)) + '{"n": 99')
+
+    log = EventLog(tmp_path)
+    assert index_path_for(legacy).exists()
+    # Torn trailing write is dropped
+    assert _events(log) == [(0, 0), (1, 1), (2, 2)]
+    assert log.append({"n": 3}) == 3
+
+
+def test_legacy_joined_events_get_their_own_sequence_numbers(tmp_path):
+    legacy = tmp_path / "events.jsonl"
+    legacy.write_text('{"n": 0}{"n": 1}{"n": 2}\n{"n": 3, "s": "}{"}\n{"n": 4}\n')
+
+    log = EventLog(tmp_path)
+    assert _events(log) == [(0, 0), (1, 1), (2, 2), (3, 3), (4, 4)]
+    assert _events(log, limit=2) == [(0, 0), (1, 1)]
+    assert _events(log, after=0, limit=2) == [(1, 1), (2, 2)]
+    assert log.append({"n": 5}) == 5
+
+
+def test_external_appends_are_picked_up(tmp_path):
+    log = EventLog(tmp_path)
+    log.append({"n": 0})
+    with open(tmp_path / "events.jsonl", "a") as f:
+        f.write(json.dumps({"n": 1}) + "\n")
+    assert log.append({"n": 2}) == 2
+    assert _events(log) == [(0, 0), (1, 1), (2, 2)]
+
+
+def test_retention_drops_oldest_segments(tmp_path):
+    log = EventLog(tmp_path, segment_bytes=32, retain_segments=1)
+    for n in range(20):
+        log.append({"n": n})
+    assert log.first_seq > 0
+    seqs = [seq for seq, _ in log.read()]
+    assert seqs[0] == log.first_seq
+    assert seqs[-1] == 19
+
+
+def test_watcher_wakes_on_in_process_append(tmp_path):
+    log = EventLog(tmp_path)
+    log.append({"n": 0})
+
+    async def scenario():
+        watcher = EventLogWatcher(log)
+        watcher.subscribe()
+        try:
+            assert await watcher.wait(0, timeout=0.05) is False
+            asyncio.get_running_loop().call_later(0.01, log.append, {"n": 1})
+            assert await watcher.wait(0, timeout=2) is True
+        finally:
+            watcher.unsubscribe()
+
+    asyncio.run(scenario())
+
+
+def test_watcher_polls_for_external_writers(tmp_path, monkeypatch):
+    monkeypatch.setattr(event_log, "HAVE_WATCHFILES", False)
+    log = EventLog(tmp_path)
+
+    async def scenario():
+        watcher = EventLogWatcher(log, poll_interval=0.01)
+        watcher.subscribe()
+        try:
+            with open(tmp_path / "events.jsonl", "a") as f:
+                f.write(json.dumps({"n": 0}) + "\n")
+            assert await watcher.wait(-1, timeout=2) is True
+        finally:
+            watcher.unsubscribe()
+
+    asyncio.run(scenario())
+    assert _events(log) == [(0, 0)]
+
+
+def test_trailing_batch_is_synced_after_interval(tmp_path, monkeypatch):
+    synced = []
+    log = EventLog(tmp_path, fsync_every=100, fsync_interval=0.05)
+    monkeypatch.setattr(event_log.os, "fsync", synced.append)
+    log.append({"n": 0})
+    assert synced == []
+
+    deadline = time.monotonic() + 2
+    while not synced and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(synced) == 2  # data and index
+    log.close()
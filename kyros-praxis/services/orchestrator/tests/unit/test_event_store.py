@@ -0,0 +1,70 @@
+from services.orchestrator.app.core.event_store import EventRecord, EventStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_record_to_dict_matches_public_event_shape():
+    record = EventRecord("task_started", task_id="t1", fields={"attempt": 2})
+    data = record.to_dict()
+    assert data["event"] == "task_started"
+    assert data["task_id"] == "t1"
+    assert data["run_id"] is None
+    assert data["attempt"] == 2
+    assert len(data["id"]) == 36
+    assert "T" in data["timestamp"]
+    assert not hasattr(record, "__dict__")
+
+
+def test_key_budget_evicts_least_recently_used():
+    store = EventStore(max_keys=2)
+    store.append("a", 1)
+    store.append("b", 2)
+    store.append("a", 3)
+    store.append("c", 4)
+    assert "b" not in store
+    assert store.get("a") == [1, 3]
+    assert store.stats()["evicted_keys_lru"] == 1
+
+
+def test_total_event_budget_and_per_key_cap():
+    store = EventStore(max_events_per_key=2, max_events=3)
+    store.append("a", 1)
+    store.append("a", 2)
+    store.append("a", 3)
+    assert store.get("a") == [2, 3]
+    assert len(store) == 2
+    store.append("b", 4)
+    store.append("b", 5)
+    assert "a" not in store
+    assert len(store) == 2
+    stats = store.stats()
+    assert stats["trimmed_events"] == 1
+    assert stats["evicted_events"] == 2
+
+
+def test_idle_keys_expire_unless_pinned():
+    clock = FakeClock()
+    store = EventStore(key_ttl=10, clock=clock)
+    store.append("idle", 1)
+    store.append("watched", 2)
+    clock.now = 11
+    store.append("fresh", 3, pinned=lambda key: key == "watched")
+    assert "idle" not in store
+    assert "watched" in store
+    assert store.stats()["evicted_keys_ttl"] == 1
+
+
+def test_steady_state_under_per_request_keys():
+    store = EventStore(max_keys=100, max_events=150)
+    for n in range(10000):
+        store.append(f"request-{n}", n)
+        store.append(f"request-{n}", n)
+    stats = store.stats()
+    assert stats["keys"] <= 100
+    assert stats["events"] <= 150
@@ -88,3 +88,43 @@ def test_events_tail_stream_delivers_backlog(client, db_session):
                 found = True
                 break
         assert found is True
+
+
+def test_events_tail_resumes_from_last_event_id(client, db_session):
+    if not db_session.query(User).filter(User.username == "eventsuser3").first():
+        user = User(
+            username="eventsuser3", email="events3@example.com", password_hash=pwd_context.hash("password")
+        )
+        db_session.add(user)
+        db_session.commit()
+
+    login = client.post(
+        "/auth/login", json={"username": "eventsuser3", "password": "password"}
+    )
+    token = login.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    for n in range(3):
+        client.post(
+            "/api/v1/events",
+            json={"event": "resume-test", "target": "z", "details": {"n": n}},
+            headers=headers,
+        )
+
+    def tail(extra_headers):
+        ids = []
+        with client.stream(
+            "GET", "/api/v1/events/tail?once=1", headers={**headers, **extra_headers}
+        ) as r:
+            assert r.status_code == 200
+            for chunk in r.iter_lines():
+                if chunk.startswith("id: "):
+                    ids.append(int(chunk[len("id: "):]))
+        return ids
+
+    all_ids = tail({})
+    assert all_ids == sorted(all_ids)
+    assert len(all_ids) >= 3
+
+    resumed = tail({"Last-Event-ID": str(all_ids[-2])})
+    assert resumed == [all_ids[-1]]
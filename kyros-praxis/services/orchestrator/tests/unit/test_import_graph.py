@@ -0,0 +1,139 @@
+import os
+
+import pytest
+
+from services.orchestrator.context_analysis import ContextAnalyzer
+from services.orchestrator.import_graph import INTERNAL, STDLIB, UNRESOLVED, ImportGraph, classify_external
+from services.orchestrator.source_metrics import SourceMetricsCache
+
+WORKSPACE = {
+    "services/api/__init__.py": "",
+    "services/api/main.py": "from app.core.config import settings\nfrom . import routes\nimport json\n",
+    "services/api/routes.py": "from .handlers import handle\n",
+    "services/api/handlers.py": "from .routes import router\nfrom services.shared.util import helper\n",
+    "services/api/app/__init__.py": "",
+    "services/api/app/core/__init__.py": "",
+    "services/api/app/core/config.py": "import os\n",
+    "services/worker/app/core/config.py": "",
+    "services/shared/util.py": "import cosmos_utils\n",
+}
+
+
+def _write(root, files):
+    for path, content in files.items():
+        target = root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content)
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    _write(tmp_path, WORKSPACE)
+    return tmp_path
+
+
+def _graph(root, **kwargs):
+    graph = ImportGraph(str(root), metrics_cache=SourceMetricsCache(), refresh_interval=0, **kwargs)
+    graph.refresh()
+    return graph
+
+
+def test_imports_resolve_to_workspace_modules(workspace):
+    graph = _graph(workspace)
+    assert graph.module_for_path("services/api/__init__.py") == "services.api"
+    # Service-local absolute import prefers the importer's own service
+    assert graph.resolve_import("services.api.main", "app.core.config") == (INTERNAL, "services.api.app.core.config")
+    assert graph.resolve_import("services.api.main", ".routes") == (INTERNAL, "services.api.routes")
+    assert graph.resolve_import("services.api", ".main") == (INTERNAL, "services.api.main")
+    assert graph.resolve_import("services.api.main", "json") == (STDLIB, "json")
+    assert graph.resolve_import("services.shared.util", "cosmos_utils") == (UNRESOLVED, "cosmos_utils")
+
+
+def test_fan_in_depth_cycles_and_cross_service_edges(workspace):
+    graph = _graph(workspace)
+    assert graph.fan_in("services.api.routes") == 2
+    assert graph.depth("services.shared.util") == 0
+    # main -> {routes <-> handlers} -> shared.util
+    assert graph.depth("services.api.main") == 2
+    assert graph.cycles(["services.api.routes"]) == [
+        ("services.api.handlers", "services.api.routes"),
+        ("services.api.routes", "services.api.handlers"),
+    ]
+    assert graph.cycles(["services.api.main"]) == []
+    assert graph.cross_service_edges(["services.shared.util"]) == [
+        ("services.api.handlers", "services.shared.util"),
+    ]
+
+
+def test_refresh_updates_only_changed_files(workspace):
+    cache = SourceMetricsCache()
+    graph = ImportGraph(str(workspace), metrics_cache=cache, refresh_interval=0)
+    assert graph.refresh() == len(WORKSPACE)
+    assert graph.refresh() == 0
+
+    handlers = workspace / "services/api/handlers.py"
+    handlers.write_text("from services.shared.util import helper\n")
+    os.utime(handlers, ns=(1, 1))
+    (workspace / "services/api/extra.py").write_text("from .handlers import handle\n")
+    (workspace / "services/shared/util.py").unlink()
+
+    assert graph.refresh() == 3
+    assert graph.cycles(["services.api.routes"]) == []
+    assert graph.dependents("services.api.handlers") == {"services.api.routes", "services.api.extra"}
+    assert graph.resolve_import("services.api.handlers", "services.shared.util")[0] == UNRESOLVED
+    assert graph.stats()["modules"] == len(WORKSPACE)
+
+    # Re-adding a module resolves the imports that were waiting for it
+    (workspace / "services/shared/util.py").write_text("")
+    graph.refresh()
+    assert graph.dependents("services.shared.util") == {"services.api.handlers"}
+
+
+def test_refresh_is_throttled(workspace):
+    now = [0.0]
+    graph = ImportGraph(str(workspace), metrics_cache=SourceMetricsCache(), refresh_interval=30, clock=lambda: now[0])
+    graph.refresh()
+    (workspace / "services/api/new.py").write_text("")
+    assert graph.refresh() == 0
+    now[0] = 31.0
+    assert graph.refresh() == 1
+
+
+def test_state_persists_across_restarts(workspace, tmp_path_factory):
+    state = tmp_path_factory.mktemp("state") / "imports.json"
+    _graph(workspace, state_path=str(state))
+
+    cache = SourceMetricsCache()
+    restarted = ImportGraph(str(workspace), metrics_cache=cache, state_path=str(state), refresh_interval=0)
+    assert restarted.fan_in("services.api.routes") == 2
+    assert restarted.refresh() == 0
+    assert cache.stats()["misses"] == 0
+
+
+def test_external_packages_use_exact_top_level_names():
+    assert classify_external("os.path") == STDLIB
+    assert classify_external("pytest") == "third_party"
+    assert classify_external("cosmos_utils") is None
+    analyzer = ContextAnalyzer(metrics_cache=SourceMetricsCache())
+    assert analyzer._is_external_package("fastapi.routing")
+    assert not analyzer._is_external_package("cosmos_utils")
+
+
+def test_context_analyzer_uses_workspace_graph(workspace):
+    analyzer = ContextAnalyzer(metrics_cache=SourceMetricsCache(), import_graph=_graph(workspace))
+    dependencies = analyzer._analyze_dependencies(["services/shared/util.py", "README.md"])
+    assert dependencies.fan_in == 1
+    assert dependencies.cross_service_dependencies == ["services.api.handlers"]
+    # Unknown packages imported from workspace files count as internal
+    assert dependencies.internal_dependencies == ["cosmos_utils"]
+
+    dependencies = analyzer._analyze_dependencies(
+        ["services/api/routes.py"], {"services/api/routes.py": "from .handlers import handle\nimport os\n"}
+    )
+    assert dependencies.internal_dependencies == ["services.api.handlers"]
+    assert dependencies.external_dependencies == ["os"]
+    assert dependencies.dependency_depth == 1
+    assert dependencies.circular_dependencies == [
+        ("services.api.handlers", "services.api.routes"),
+        ("services.api.routes", "services.api.handlers"),
+    ]
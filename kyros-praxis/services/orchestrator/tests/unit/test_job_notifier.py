@@ -0,0 +1,56 @@
+import asyncio
+import threading
+
+import pytest
+
+from services.orchestrator.app.core.job_notifier import JobNotifier, parse_duration
+
+
+def test_notify_wakes_only_watches_of_changed_job():
+    notifier = JobNotifier()
+
+    async def scenario():
+        with notifier.watch("j1") as first, notifier.watch("j2") as other:
+            waiter = asyncio.ensure_future(first.wait(1))
+            await asyncio.sleep(0)
+            assert notifier.notify("j1") == 1
+            assert await waiter is True
+            assert await other.wait(0.01) is False
+
+    asyncio.run(scenario())
+    assert notifier.stats() == {"watches": 0, "watched_jobs": 0, "notifications_total": 1, "woken_total": 1}
+
+
+def test_change_before_wait_is_not_lost_and_watch_rearms():
+    notifier = JobNotifier()
+
+    async def scenario():
+        with notifier.watch("j1") as watch:
+            # Change committed between registering the watch and waiting on it
+            notifier.notify("j1")
+            assert await watch.wait(1) is True
+            assert await watch.wait(0.01) is False
+
+    asyncio.run(scenario())
+
+
+def test_notify_from_worker_thread():
+    notifier = JobNotifier()
+
+    async def scenario():
+        with notifier.watch("j1") as watch:
+            threading.Thread(target=notifier.notify, args=("j1",)).start()
+            return await watch.wait(1)
+
+    assert asyncio.run(scenario()) is True
+
+
+@pytest.mark.parametrize("value,seconds", [("30s", 30.0), ("30", 30.0), ("500ms", 0.5), ("2m", 120.0), ("1.5s", 1.5)])
+def test_parse_duration(value, seconds):
+    assert parse_duration(value) == seconds
+
+
+@pytest.mark.parametrize("value", ["", "-1s", "soon", "10h"])
+def test_parse_duration_rejects_invalid(value):
+    with pytest.raises(ValueError):
+        parse_duration(value)
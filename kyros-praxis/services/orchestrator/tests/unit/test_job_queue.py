@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from services.orchestrator.models import Base, Job
+from services.orchestrator.repositories import queue as queue_repo
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+async def _add_jobs(session, *priorities, max_attempts=3):
+    jobs = [Job(name=f"job-{n}", priority=p, max_attempts=max_attempts) for n, p in enumerate(priorities)]
+    session.add_all(jobs)
+    await session.commit()
+    return jobs
+
+
+@pytest.mark.asyncio
+async def test_claims_by_priority_and_never_twice(session):
+    low, high, mid = await _add_jobs(session, 0, 10, 5)
+
+    first = await queue_repo.claim_jobs(session, "w1", 2, 60)
+    second = await queue_repo.claim_jobs(session, "w2", 5, 60)
+
+    assert [job.id for job in first] == [high.id, mid.id]
+    assert [job.id for job in second] == [low.id]
+    assert all(job.status == "running" and job.attempts == 1 for job in first + second)
+    assert await queue_repo.claim_jobs(session, "w3", 5, 60) == []
+
+
+@pytest.mark.asyncio
+async def test_lease_is_owned_by_the_claiming_worker(session):
+    (job,) = await _add_jobs(session, 0)
+    await queue_repo.claim_jobs(session, "w1", 1, 60)
+
+    assert await queue_repo.extend_lease(session, job.id, "w2", 60) is None
+    assert await queue_repo.complete_job(session, job.id, "w2") is None
+    done = await queue_repo.complete_job(session, job.id, "w1")
+    assert done.status == "completed" and done.lease_owner is None
+
+
+@pytest.mark.asyncio
+async def test_failed_jobs_retry_then_dead_letter(session):
+    (job,) = await _add_jobs(session, 0, max_attempts=2)
+
+    await queue_repo.claim_jobs(session, "w1", 1, 60)
+    retried = await queue_repo.fail_job(session, job.id, "w1", "boom")
+    assert retried.status == "pending"
+
+    await queue_repo.claim_jobs(session, "w1", 1, 60)
+    dead = await queue_repo.fail_job(session, job.id, "w1", "boom again")
+    assert dead.status == "dead" and dead.last_error == "boom again"
+    assert [j.id for j in await queue_repo.list_dead_jobs(session)] == [job.id]
+
+    requeued = await queue_repo.requeue_job(session, job.id)
+    assert requeued.status == "pending" and requeued.attempts == 0
+
+
+@pytest.mark.asyncio
+async def test_lapsed_lease_is_reclaimed_or_dead_lettered(session):
+    retry, final = await _add_jobs(session, 1, 0, max_attempts=2)
+    await queue_repo.claim_jobs(session, "w1", 2, 60)
+    await session.execute(update(Job).values(lease_expires_at=datetime.utcnow() - timedelta(seconds=1)))
+    await session.execute(update(Job).where(Job.id == final.id).values(attempts=2))
+    await session.commit()
+
+    reclaimed = await queue_repo.claim_jobs(session, "w2", 5, 60)
+
+    assert [job.id for job in reclaimed] == [retry.id]
+    assert reclaimed[0].lease_owner == "w2" and reclaimed[0].attempts == 2
+    assert (await session.get(Job, final.id, populate_existing=True)).status == "dead"
@@ -0,0 +1,61 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+
+from services.orchestrator.models import Job
+from services.orchestrator.repositories.jobs import jobs_page_query
+from services.orchestrator.routers.jobs import JobSort, _decode_cursor, _encode_cursor
+
+AFTER = {
+    "priority": [5, datetime(2025, 1, 1), "j1"],
+    "created_at": [datetime(2025, 1, 1), "j1"],
+    "-created_at": [datetime(2025, 1, 1), "j1"],
+}
+
+
+@pytest.fixture(scope="module")
+def listing_engine():
+    engine = create_engine("sqlite://")
+    Job.__table__.create(engine)
+    yield engine
+    engine.dispose()
+
+
+def _plan(engine, query):
+    compiled = query.compile(engine)
+    params = tuple(compiled.params[name] for name in compiled.positiontup)
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params).all()
+    return [row[3] for row in rows]
+
+
+@pytest.mark.parametrize("sort", ["priority", "created_at", "-created_at"])
+@pytest.mark.parametrize("status", [None, "pending"])
+@pytest.mark.parametrize("paged", [False, True])
+def test_listing_queries_are_served_by_an_index_in_order(listing_engine, sort, status, paged):
+    query = jobs_page_query(status=status, sort=sort, after=AFTER[sort] if paged else None)
+    plan = _plan(listing_engine, query)
+
+    assert len(plan) == 1, plan
+    assert "USING INDEX ix_jobs_" in plan[0] or "USING COVERING INDEX ix_jobs_" in plan[0], plan
+    # Keyset pages seek to the cursor instead of scanning from the start
+    if paged or status:
+        assert plan[0].startswith("SEARCH"), plan
+    assert not any("TEMP B-TREE" in step for step in plan), plan
+
+
+def test_cursor_round_trip():
+    job = SimpleNamespace(priority=3, created_at=datetime(2025, 1, 2, 3, 4, 5), id="abc")
+    cursor = _encode_cursor(job, JobSort.PRIORITY)
+    assert _decode_cursor(cursor, JobSort.PRIORITY) == [3, job.created_at, "abc"]
+
+
+def test_cursor_from_another_sort_order_is_rejected():
+    job = SimpleNamespace(priority=3, created_at=datetime(2025, 1, 2), id="abc")
+    cursor = _encode_cursor(job, JobSort.CREATED_AT)
+    with pytest.raises(HTTPException) as exc:
+        _decode_cursor(cursor, JobSort.PRIORITY)
+    assert exc.value.status_code == 400
@@ -0,0 +1,38 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from services.orchestrator.repositories.jobs import create_jobs, update_job_statuses
+
+
+def _session():
+    session = Mock()
+    session.execute = AsyncMock(return_value=Mock(rowcount=1))
+    session.connection = AsyncMock(return_value=Mock(dialect=Mock()))
+    session.connection.return_value.dialect.name = "sqlite"
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    return session
+
+
+@pytest.mark.asyncio
+async def test_create_jobs_inserts_all_rows_with_one_statement_and_commit():
+    session = _session()
+    rows = await create_jobs(session, [{"name": "a"}, {"name": "b", "description": "second"}])
+
+    assert [row["name"] for row in rows] == ["a", "b"]
+    assert len({row["id"] for row in rows}) == 2
+    assert all(row["status"] == "pending" and row["updated_at"] == rows[0]["created_at"] for row in rows)
+    # INSERT with all rows as parameters, then the collection version bump
+    insert_call = session.execute.await_args_list[0]
+    assert insert_call.args[1] == rows
+    assert session.execute.await_count == 2
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_update_job_statuses_rolls_back_on_error():
+    session = _session()
+    session.commit = AsyncMock(side_effect=ValueError("locked"))
+    with pytest.raises(ValueError):
+        await update_job_statuses(session, [{"id": "1", "status": "running"}])
+    session.rollback.assert_awaited_once()
@@ -0,0 +1,89 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from services.orchestrator import principal_cache
+from services.orchestrator.models import Base, User
+from services.orchestrator.principal_cache import PrincipalCache, snapshot, watch_user_model
+
+
+class _Clock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    clock = _Clock()
+    cache = PrincipalCache(ttl=10, clock=clock)
+    cache.put("alice", {"id": "1", "role": "user"}, cache.generation)
+
+    assert cache.get("alice") == {"id": "1", "role": "user"}
+    clock.now = 10
+    assert cache.get("alice") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_invalidation_by_user_id_and_stale_put_is_ignored():
+    cache = PrincipalCache()
+    cache.put("alice", {"id": "1"}, cache.generation)
+
+    generation = cache.generation
+    cache.invalidate(user_id="1")
+    assert cache.get("alice") is None
+    # A lookup that started before the invalidation must not repopulate
+    assert cache.put("alice", {"id": "1"}, generation) is False
+    assert cache.get("alice") is None
+
+
+def test_cache_is_bounded_lru():
+    cache = PrincipalCache(maxsize=2)
+    for n in range(3):
+        cache.put(f"u{n}", {"id": str(n)}, cache.generation)
+    assert cache.get("u0") is None
+    assert cache.get("u2") == {"id": "2"}
+    assert cache.stats()["size"] == 2
+
+
+def test_role_change_invalidates_cached_principal(monkeypatch):
+    cache = PrincipalCache()
+    monkeypatch.setattr(principal_cache, "_cache", cache)
+    watch_user_model(User)
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    user = User(username="alice", email="alice@example.com", password_hash="x")
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+
+    cache.put("alice", snapshot(user), cache.generation)
+    user.email = "alice@example.org"
+    session.commit()
+    assert cache.get("alice") is not None
+
+    user.role = "admin"
+    session.commit()
+    assert cache.get("alice") is None
+    session.close()
+
+
+def test_bulk_user_update_clears_cache(monkeypatch):
+    cache = PrincipalCache()
+    monkeypatch.setattr(principal_cache, "_cache", cache)
+    watch_user_model(User)
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add(User(username="alice", email="alice@example.com", password_hash="x"))
+    session.commit()
+
+    cache.put("alice", {"id": 1, "username": "alice"}, cache.generation)
+    session.query(User).filter(User.username == "alice").update({"active": False})
+    session.commit()
+    assert cache.get("alice") is None
+    session.close()
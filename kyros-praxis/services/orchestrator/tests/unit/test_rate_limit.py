@@ -0,0 +1,165 @@
+import asyncio
+
+import pytest
+
+from services.orchestrator.rate_limit import (
+    GCRA_SCRIPT,
+    CircuitBreaker,
+    LeaseCache,
+    LocalGCRALimiter,
+    RateLimitDecision,
+    RedisGCRALimiter,
+    header_seconds,
+)
+
+
+class _Clock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class _ScriptClient:
+    """Records script calls and replies with a fixed result."""
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.calls = []
+
+    def register_script(self, source):
+        assert source == GCRA_SCRIPT
+
+        async def script(keys, args):
+            self.calls.append((keys, args))
+            if isinstance(self.reply, Exception):
+                raise self.reply
+            return self.reply
+
+        return script
+
+
+class _Remote:
+    """Grants leases from a fixed allowance, like the Redis script."""
+
+    capacity = 100
+
+    def __init__(self, available):
+        self.available = available
+        self.calls = 0
+
+    async def acquire(self, client_id, tokens):
+        self.calls += 1
+        granted = min(tokens, self.available)
+        self.available -= granted
+        if not granted:
+            return 0, RateLimitDecision(False, 0, 4.0, 30.0)
+        return granted, RateLimitDecision(True, self.available, 0.0, 30.0)
+
+
+def test_breaker_opens_after_threshold_and_half_opens_after_timeout():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+
+    assert breaker.allow_request()
+    assert breaker.record_failure() is False
+    assert breaker.record_failure() is True
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+    clock.now = 10
+    assert breaker.allow_request()  # single trial call
+    assert not breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_failed_trial_reopens_breaker():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5, clock=clock)
+    breaker.record_failure()
+    clock.now = 5
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now = 9
+    assert not breaker.allow_request()
+
+
+def test_redis_limiter_sends_gcra_parameters_and_parses_reply():
+    client = _ScriptClient([0, 0, 1500, 9000])
+    limiter = RedisGCRALimiter(client, requests=10, window=60, burst=5)
+
+    granted, decision = asyncio.run(limiter.acquire("user:alice", 1))
+
+    assert client.calls == [(["rate_limit:gcra:user:alice"], [6000.0, 15, 1])]
+    assert granted == 0
+    assert decision.allowed is False
+    assert decision.retry_after == 1.5
+    assert decision.reset_after == 9.0
+    assert header_seconds(decision.retry_after) == 2
+
+
+def test_local_limiter_admits_capacity_then_refills_at_sustained_rate():
+    clock = _Clock(100.0)
+    limiter = LocalGCRALimiter(requests=3, window=9, burst=2, clock=clock)
+
+    decisions = [limiter.check("c") for _ in range(6)]
+    assert [d.allowed for d in decisions] == [True] * 5 + [False]
+    assert decisions[4].remaining == 0
+    assert decisions[5].retry_after == pytest.approx(3.0)
+    assert limiter.reset_after("c") == pytest.approx(15.0)
+
+    clock.now += 3
+    assert limiter.check("c").allowed
+    assert not limiter.check("c").allowed
+
+
+def test_local_limiter_table_is_bounded_and_swept():
+    clock = _Clock()
+    limiter = LocalGCRALimiter(requests=2, window=10, maxsize=2, clock=clock)
+    for client in ("a", "b", "c"):
+        limiter.check(client)
+    assert len(limiter) == 2
+    assert limiter.stats()["evictions"] == 1
+    assert limiter.reset_after("a") == 0.0
+
+    clock.now = 5
+    assert limiter.sweep() == 2
+    assert len(limiter) == 0
+
+
+def test_lease_cache_spends_leases_locally_and_caches_rejections():
+    clock = _Clock()
+    remote = _Remote(available=15)
+    leases = LeaseCache(remote, lease_size=10, lease_ttl=5, clock=clock)
+
+    def check():
+        return leases.check_local("c") or asyncio.run(leases.renew("c"))
+
+    assert all(check().allowed for _ in range(15))
+    assert remote.calls == 2  # one lease of 10, one partial lease of 5
+
+    assert not check().allowed
+    assert remote.calls == 3
+    clock.now = 3.9
+    rejected = check()
+    assert not rejected.allowed and rejected.retry_after == pytest.approx(0.1)
+    assert remote.calls == 3  # rejected without calling Redis
+    assert leases.stats()["local_rejections"] == 1
+
+
+def test_expired_lease_is_renewed_and_swept():
+    clock = _Clock()
+    remote = _Remote(available=100)
+    leases = LeaseCache(remote, lease_size=10, lease_ttl=5, clock=clock)
+    asyncio.run(leases.renew("c"))
+    assert leases.check_local("c").allowed
+
+    clock.now = 5
+    assert leases.check_local("c") is None
+    asyncio.run(leases.renew("d"))
+    clock.now = 10
+    assert leases.sweep() == 1
+    assert leases.stats()["leased_clients"] == 0
@@ -0,0 +1,84 @@
+from services.orchestrator.context_analysis import ContextAnalyzer
+from services.orchestrator.source_metrics import SourceMetricsCache, analyze_source
+
+SOURCE = '''
+import os, json
+from .models import Job
+from . import database
+from fastapi import APIRouter
+
+
+class Service:
+    def run(self):
+        for item in []:
+            if item:
+                pass
+
+    async def fetch(self):
+        try:
+            async for row in rows():
+                pass
+        except Exception:
+            pass
+
+
+def helper():
+    while True:
+        break
+'''
+
+
+def test_single_pass_collects_all_facts():
+    metrics = analyze_source(SOURCE)
+    assert metrics.functions == ["run", "fetch", "helper"]
+    assert metrics.classes == ["Service"]
+    assert metrics.branches == 5  # for, if, async for, except, while
+    assert metrics.imports == ["os", "json", ".models", ".database", "fastapi"]
+    assert metrics.lines == len(SOURCE.splitlines())
+    assert analyze_source("def broken(:") is None
+
+
+def test_unchanged_contents_are_parsed_once():
+    cache = SourceMetricsCache()
+    analyzer = ContextAnalyzer(metrics_cache=cache)
+    files = {"svc.py": SOURCE, "copy.py": SOURCE, "bad.py": "def broken(:"}
+
+    first = analyzer.analyze_task_context("Refactor service", list(files), files)
+    second = analyzer.analyze_task_context("Refactor service", list(files), files)
+
+    assert first == second
+    assert first.dependencies.internal_dependencies and ".models" in first.dependencies.internal_dependencies
+    assert "fastapi" in first.dependencies.external_dependencies
+    stats = cache.stats()
+    # Two distinct contents parsed once; every later lookup is a hit
+    assert stats["misses"] == 2 and stats["hits"] == 3 and stats["entries"] == 2
+
+
+def test_lru_evicts_least_recently_used():
+    cache = SourceMetricsCache(max_entries=2)
+    for source in ["a = 1", "b = 2", "a = 1", "c = 3"]:
+        cache.analyze(source)
+    assert cache.stats()["entries"] == 2
+    cache.analyze("a = 1")
+    assert cache.stats()["misses"] == 3
+
+
+def test_entries_persist_to_disk(tmp_path):
+    SourceMetricsCache(directory=str(tmp_path)).analyze_files({"svc.py": SOURCE, "bad.py": "def broken(:"})
+
+    restarted = SourceMetricsCache(directory=str(tmp_path))
+    results = restarted.analyze_files({"svc.py": SOURCE, "bad.py": "def broken(:"})
+
+    assert results["svc.py"] == analyze_source(SOURCE) and results["bad.py"] is None
+    assert restarted.stats()["disk_hits"] == 2 and restarted.stats()["misses"] == 0
+
+
+def test_large_batches_fan_out_to_process_pool():
+    cache = SourceMetricsCache(workers=2, parallel_min_files=4)
+    files = {f"mod{n}.py": f"def f{n}():\n    if x:\n        return {n}\n" for n in range(8)}
+    try:
+        results = cache.analyze_files(files)
+    finally:
+        cache.shutdown()
+    assert cache.stats()["parallel_batches"] == 1
+    assert [results[f"mod{n}.py"].functions for n in range(8)] == [[f"f{n}"] for n in range(8)]
@@ -0,0 +1,32 @@
+import asyncio
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from services.orchestrator.routers.tasks import (
+    _decode_cursor,
+    _encode_cursor,
+    _stream_page,
+)
+
+
+def test_cursor_round_trip():
+    task = SimpleNamespace(created_at=datetime(2025, 1, 2, 3, 4, 5), id="abc")
+    assert _decode_cursor(_encode_cursor(task)) == (task.created_at, "abc")
+
+
+def test_malformed_cursor_is_rejected():
+    with pytest.raises(HTTPException) as exc:
+        _decode_cursor("not-a-cursor")
+    assert exc.value.status_code == 400
+
+
+def test_streamed_page_is_valid_json():
+    async def collect():
+        return b"".join([chunk async for chunk in _stream_page([{"id": "1"}, {"id": "2"}], "c")])
+
+    body = json.loads(asyncio.run(collect()))
+    assert body == {"kind": "tasks", "items": [{"id": "1"}, {"id": "2"}], "next_cursor": "c"}
@@ -0,0 +1,85 @@
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+from sqlalchemy.dialects import sqlite
+from services.orchestrator.repositories.tasks import (
+    create_task,
+    delete_task,
+    get_task,
+    list_tasks,
+    list_tasks_page,
+)
+from services.orchestrator.tests.utils.sqlalchemy_stubs import create_result_stub
+
+
+def _writing_session(dialect):
+    mock_session = Mock()
+    mock_session.execute = AsyncMock(return_value=Mock(rowcount=0))
+    mock_session.connection = AsyncMock(return_value=Mock(dialect=Mock()))
+    mock_session.connection.return_value.dialect.name = dialect
+    mock_session.begin_nested = MagicMock()
+    mock_session.commit = AsyncMock()
+    mock_session.refresh = AsyncMock()
+    return mock_session
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_empty():
+    mock_session = Mock()
+    mock_session.execute = AsyncMock(return_value=create_result_stub([]))
+    tasks = await list_tasks(mock_session)
+    assert len(tasks) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_task_missing():
+    mock_session = Mock()
+    mock_session.get = AsyncMock(return_value=None)
+    assert await get_task(mock_session, "missing") is None
+
+
+@pytest.mark.asyncio
+async def test_create_task_rolls_back_on_error():
+    mock_session = _writing_session("sqlite")
+    mock_session.commit = AsyncMock(side_effect=ValueError("Invalid title"))
+    mock_session.rollback = AsyncMock()
+    with pytest.raises(ValueError):
+        await create_task(mock_session, "")
+    mock_session.rollback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_delete_task_rolls_back_on_error():
+    mock_session = _writing_session("sqlite")
+    mock_session.delete = AsyncMock()
+    mock_session.commit = AsyncMock(side_effect=ValueError("locked"))
+    mock_session.rollback = AsyncMock()
+    with pytest.raises(ValueError):
+        await delete_task(mock_session, Mock())
+    mock_session.rollback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_page_reports_more():
+    mock_session = Mock()
+    mock_session.execute = AsyncMock(return_value=create_result_stub(["a", "b", "c"]))
+    tasks, has_more = await list_tasks_page(mock_session, limit=2)
+    assert tasks == ["a", "b"]
+    assert has_more is True
+
+
+@pytest.mark.asyncio
+async def test_create_task_upserts_collection_version():
+    mock_session = _writing_session("sqlite")
+    await create_task(mock_session, "title")
+    statement = mock_session.execute.call_args.args[0]
+    assert "ON CONFLICT (name) DO UPDATE" in str(statement.compile(dialect=sqlite.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_create_task_bumps_collection_version():
+    mock_session = _writing_session("mssql")
+    await create_task(mock_session, "title")
+    added = [call.args[0] for call in mock_session.add.call_args_list]
+    # First write creates the tasks counter
+    assert any(getattr(obj, "name", None) == "tasks" and obj.version == 1 for obj in added)
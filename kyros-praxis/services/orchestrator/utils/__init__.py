@@ -6,7 +6,7 @@ for HTTP caching and conditional requests, and input validation for task and job
 creation to ensure data integrity.
 
 Modules:
-    etag: Provides ETag generation utilities for HTTP responses
+    etag: Provides the shared ETag subsystem (version-based and content ETags)
     validation: Provides input validation utilities for task and job creation
 """
 
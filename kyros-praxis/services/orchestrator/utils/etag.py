@@ -1,7 +1,7 @@
 """
 ETag Generation Utilities for HTTP Caching
 
-This module provides utilities for generating ETags (Entity Tags) for HTTP responses in the Kyros Orchestrator service.
+This module provides the ETag subsystem shared by all routers of the Kyros Orchestrator service.
 ETags are used for caching and conditional requests to improve performance and reduce bandwidth usage.
 
 In the Kyros Orchestrator service, ETags are particularly important for:
@@ -10,94 +10,218 @@ In the Kyros Orchestrator service, ETags are particularly important for:
 - Supporting conditional requests (If-None-Match, If-Match headers)
 - Improving overall system responsiveness
 
-The module includes a function for generating SHA256-based ETags from data dictionaries, with proper handling
-of datetime objects and other data types. ETags are returned wrapped in quotes as per the HTTP specification.
+ETags are derived from version metadata wherever possible, so computing one does not require
+serializing the response body:
+- Single resources: from the row's ``version`` column, or ``updated_at`` for rows without one
+- Collections: from an aggregate version vector (e.g. the collection's change counter)
+- Content hashing remains available for payloads without version metadata, using a fast
+  non-cryptographic hash (xxh3 when ``xxhash`` is installed, 64-bit BLAKE2b otherwise)
 
 FUNCTIONS:
-1. generate_etag - Generate an ETag from data using SHA256 hashing
+1. resource_etag - ETag for a single resource from its version or update timestamp
+2. collection_etag - Weak ETag for a collection from an aggregate version vector
+3. query_stamp - Short stamp of the query parameters that select a collection page
+4. content_etag - ETag from a fast hash of the JSON-serialized payload
+5. generate_etag - Content ETag for a data dictionary (kept for existing callers)
+6. etag_matches - Weak comparison of an ETag against an If-None-Match header
 """
 
 import hashlib
 import json
-from datetime import datetime
-from typing import Any, Dict
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Optional
 
+try:
+    import xxhash
+    HAVE_XXHASH = True
+except ImportError:
+    xxhash = None
+    HAVE_XXHASH = False
 
-def generate_etag(data: Dict[str, Any]) -> str:
+
+def fast_hash(data: bytes) -> str:
+    """
+    Hash bytes with a fast 64-bit non-cryptographic digest.
+
+    ETags only need to change when the content changes, not to resist forgery,
+    so a 64-bit digest is sufficient and much cheaper than SHA-256.
+
+    Args:
+        data (bytes): Bytes to hash
+
+    Returns:
+        str: 16 hexadecimal characters
+    """
+    if HAVE_XXHASH:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values json does not handle natively."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _quote(opaque: str, weak: bool) -> str:
+    return f'W/"{opaque}"' if weak else f'"{opaque}"'
+
+
+def _stamp(value: Any) -> str:
+    if isinstance(value, datetime):
+        return fast_hash(value.isoformat().encode())
+    return str(value)
+
+
+def resource_etag(
+    kind: str,
+    key: Any,
+    version: Optional[int] = None,
+    updated_at: Optional[datetime] = None,
+    weak: bool = False,
+) -> str:
+    """
+    Build the ETag of a single resource from its version metadata.
+
+    Every write to the resource must bump ``version`` (or ``updated_at``), which is the
+    case for all models that carry these columns. The response body is not read.
+
+    Args:
+        kind (str): Resource type (e.g. "task")
+        key (Any): Resource identifier
+        version (Optional[int]): Row version; preferred when available
+        updated_at (Optional[datetime]): Last update timestamp, used without a version
+        weak (bool): Return a weak validator
+
+    Returns:
+        str: ETag wrapped in quotes (e.g., "task-42-v3")
+
+    Example:
+        >>> resource_etag("task", "42", version=3)
+        '"task-42-v3"'
+    """
+    if version is not None:
+        stamp = f"v{version}"
+    elif updated_at is not None:
+        stamp = f"t{_stamp(updated_at)}"
+    else:
+        stamp = "v0"
+    return _quote(f"{kind}-{key}-{stamp}", weak)
+
+
+def collection_etag(kind: str, *vector: Any) -> str:
+    """
+    Build a weak ETag for a collection from an aggregate version vector.
+
+    The vector holds whatever identifies the state of the collection, such as a
+    change counter and its epoch, or a row count and maximum ``updated_at``.
+    The ETag is weak because the same state may be rendered slightly differently
+    (e.g. streamed or not).
+
+    Args:
+        kind (str): Collection name (e.g. "tasks")
+        *vector (Any): Components of the version vector
+
+    Returns:
+        str: Weak ETag (e.g., W/"tasks-3f2a-17")
+
+    Example:
+        >>> collection_etag("tasks", "3f2a", 17)
+        'W/"tasks-3f2a-17"'
+    """
+    return _quote("-".join([kind, *(_stamp(component) for component in vector)]), weak=True)
+
+
+def query_stamp(**params: Any) -> str:
+    """
+    Stamp the query parameters that select a page of a collection.
+
+    Pages of the same collection version differ, so list endpoints add this
+    stamp to the version vector passed to ``collection_etag``.
+
+    Args:
+        **params (Any): Normalized query parameters (cursor, limit, filters...)
+
+    Returns:
+        str: 16 hexadecimal characters
+
+    Example:
+        >>> query_stamp(cursor=None, limit=50) == query_stamp(limit=50, cursor=None)
+        True
+    """
+    return fast_hash(json.dumps(params, sort_keys=True, default=_json_default).encode())
+
+
+def content_etag(data: Any, weak: bool = False) -> str:
+    """
+    Generate an ETag from the serialized content of a payload.
+
+    Use this only for payloads without version metadata. The payload is
+    serialized once with sorted keys and hashed with ``fast_hash``; datetime
+    and Enum values are serialized during the same pass.
+
+    Args:
+        data (Any): JSON-compatible payload (may contain datetimes and Enums)
+        weak (bool): Return a weak validator
+
+    Returns:
+        str: ETag wrapped in quotes
     """
-    Generate an ETag from the data by sorting keys and using SHA256.
-    
-    This function creates a SHA256 hash of the provided data dictionary to generate
-    an ETag for HTTP caching and conditional requests. The data is first serialized
-    to handle special data types like datetime objects, then sorted to ensure
-    consistent ETag generation regardless of key order. The resulting ETag is
-    wrapped in quotes as per the HTTP specification.
-    
+    serialized = json.dumps(data, sort_keys=True, default=_json_default)
+    return _quote(fast_hash(serialized.encode()), weak)
+
+
+def generate_etag(data: Any) -> str:
+    """
+    Generate an ETag from the data by sorting keys and hashing.
+
+    Equivalent to ``content_etag(data)``; kept for existing callers.
+
     Args:
-        data (Dict[str, Any]): Dictionary containing data to generate ETag from
-        
+        data (Any): Dictionary or list containing data to generate ETag from
+
     Returns:
-        str: ETag wrapped in quotes (e.g., "a1b2c3d4...")
-        
+        str: ETag wrapped in quotes (e.g., "a1b2c3d4e5f60718")
+
     Example:
         >>> from datetime import datetime
         >>> data = {"name": "example", "timestamp": datetime(2023, 1, 1)}
         >>> etag = generate_etag(data)
-        >>> print(etag)
-        "a1b2c3d4e5f6..."
-        
+
     Note:
         - Datetime objects are serialized to ISO format strings
-        - Nested dictionaries and lists are recursively processed
         - Keys are sorted to ensure consistent ETags for equivalent data
     """
-    
-    def serialize_value(value: Any) -> Any:
-        """
-        Recursively serialize values for JSON compatibility.
-        
-        This helper function converts special data types like datetime objects
-        to JSON-compatible formats, and recursively processes dictionaries and
-        lists to ensure all values are properly serialized. This is necessary
-        for consistent ETag generation since the hashing process requires a
-        string representation of the data.
-        
-        In the Kyros Orchestrator service, this function ensures that ETags
-        can be consistently generated regardless of the data types present
-        in the response objects, which may include complex nested structures
-        with datetime objects or other non-JSON-native types.
-        
-        Args:
-            value (Any): Value to serialize
-            
-        Returns:
-            Any: JSON-compatible serialized value
-            
-        Example:
-            >>> from datetime import datetime
-            >>> # Serialize datetime
-            >>> dt = datetime(2023, 1, 1, 12, 0, 0)
-            >>> result = serialize_value(dt)
-            >>> print(result)
-            "2023-01-01T12:00:00"
-            
-            >>> # Serialize nested dictionary
-            >>> data = {"name": "test", "timestamp": datetime(2023, 1, 1)}
-            >>> result = serialize_value(data)
-            >>> print(result)
-            {"name": "test", "timestamp": "2023-01-01T00:00:00"}
-        """
-        if isinstance(value, datetime):
-            return value.isoformat()
-        elif isinstance(value, dict):
-            return {k: serialize_value(v) for k, v in value.items()}
-        elif isinstance(value, list):
-            return [serialize_value(item) for item in value]
-        else:
-            return value
-
-    # Serialize the data to handle datetime objects
-    serialized_data = serialize_value(data)
-    sorted_data = json.dumps(serialized_data, sort_keys=True)
-    etag = hashlib.sha256(sorted_data.encode()).hexdigest()
-    return f'"{etag}"'
+    return content_etag(data)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an ETag against an If-None-Match header using weak comparison.
+
+    Handles lists of ETags, the ``*`` wildcard, weak validators, and bare
+    (unquoted) values sent by lenient clients.
+
+    Args:
+        if_none_match (Optional[str]): Value of the If-None-Match header
+        etag (str): Current ETag of the resource
+
+    Returns:
+        bool: True if the client's cached representation is still current
+    """
+    if not if_none_match:
+        return False
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque or f'"{candidate}"' == opaque:
+            return True
+    return False
@@ -97,7 +97,8 @@ class JobCreate(BaseTaskJobCreate):
     
     This model inherits from BaseTaskJobCreate and is used specifically for validating
     job creation input data. It ensures that all required fields are present and valid
-    before a job is created in the system.
+    before a job is created in the system. Jobs additionally carry a scheduling
+    priority (higher numbers are claimed first from the job queue).
     
     In the Kyros Orchestrator service, this model is used to validate all incoming
     job creation requests, ensuring data consistency and preventing invalid data
@@ -109,8 +110,10 @@ class JobCreate(BaseTaskJobCreate):
         >>> job = JobCreate(title="Generate monthly reports", description="Compile monthly analytics")
         >>> print(job.title)
         "Generate monthly reports"
+        >>> print(job.priority)
+        0
     """
-    pass
+    priority: int = 0
 
 
 def validate_task_input(task_data: dict) -> TaskCreate:
@@ -172,6 +175,7 @@ def validate_job_input(job_data: dict) -> JobCreate:
                 - title (str): Non-empty string with minimum length of 1 character
             Optional keys:
                 - description (str, optional): Description of the job
+                - priority (int, optional): Scheduling priority (default: 0)
         
     Returns:
         JobCreate: Validated job creation model instance